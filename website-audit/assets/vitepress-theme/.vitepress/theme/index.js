@@ -1,4 +1,18 @@
+import { h } from 'vue';
 import DefaultTheme from 'vitepress/theme';
+import AuditSearch from './AuditSearch.vue';
+import DataTable from './DataTable.vue';
+import './fonts.css';
 import './custom.css';
 
-export default DefaultTheme;
+export default {
+  extends: DefaultTheme,
+  Layout() {
+    return h(DefaultTheme.Layout, null, {
+      'nav-bar-content-before': () => h(AuditSearch),
+    });
+  },
+  enhanceApp({ app }) {
+    app.component('DataTable', DataTable);
+  },
+};
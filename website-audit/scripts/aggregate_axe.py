@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+axe-core Results Aggregation for the Accessibility Section
+
+Automated accessibility testing produces one axe-core result per page. On
+a site with a shared header, one missing label shows up on every page: a
+raw count reports it 5,000 times although it is fixed once. This script
+aggregates local axe-core JSON results into unique issues, keyed by rule
+and normalized CSS selector (positional pseudo-classes, numeric IDs and
+class suffixes removed), so template issues count once with the number of
+pages they affect.
+
+Results are read as a stream: files may contain one result object or an
+array of results (axe CLI output) and are decoded element by element.
+Files are processed on a process pool and only aggregates are kept, so
+memory does not grow with the number of pages. Per-page rows are streamed
+to a JSON Lines file for the data tables.
+
+Usage:
+    python aggregate_axe.py <results_dir> [output_dir]
+
+Output (in output_dir, default: the results directory):
+    accessibility.json    WCAG criterion tallies, unique issues, remediation hours
+                          and an `accessibility` section for entities.json
+    axe_pages.jsonl       one row per page: url, violations by impact
+"""
+
+import json
+import re
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional
+
+from calculate_estimate import ACCESSIBILITY_REMEDIATION
+
+
+IMPACTS = ["critical", "serious", "moderate", "minor"]
+
+# Read size for streaming result arrays
+READ_CHUNK = 1024 * 1024
+
+# Unique issues listed in accessibility.json, by pages affected
+TOP_ISSUES = 500
+
+WCAG_LEVEL_TAGS = {
+    "wcag2a": "A", "wcag21a": "A", "wcag22a": "A",
+    "wcag2aa": "AA", "wcag21aa": "AA", "wcag22aa": "AA",
+    "wcag2aaa": "AAA",
+}
+
+_decoder = json.JSONDecoder()
+_separators = re.compile(r"[\s,\[\]]*")
+
+
+def iter_json_values(path: Path) -> Iterator[Dict[str, Any]]:
+    """Stream result objects from a file holding one object, an array or JSON Lines."""
+    with open(path, 'r', encoding="utf-8", errors="replace") as f:
+        buffer = f.read(READ_CHUNK)
+        position = 0
+        while True:
+            # Skip whitespace and array punctuation between values
+            position = _separators.match(buffer, position).end()
+            if position == len(buffer):
+                buffer = f.read(READ_CHUNK)
+                position = 0
+                if not buffer:
+                    return
+                continue
+            try:
+                value, position = _decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                chunk = f.read(READ_CHUNK)
+                if not chunk:
+                    raise
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+            if isinstance(value, dict):
+                yield value
+
+
+def normalize_selector(target: Any) -> str:
+    """Selector with positions, numeric IDs and class suffixes generalized."""
+    if isinstance(target, list):
+        # iframe/shadow DOM paths are nested lists
+        target = " >>> ".join(normalize_selector(t) for t in target)
+    selector = str(target)
+    selector = re.sub(r":nth-(child|of-type|last-child|last-of-type)\([^)]*\)", "", selector)
+    selector = re.sub(r"#[\w-]*\d[\w-]*", "#*", selector)
+    selector = re.sub(r"\.([\w-]*?)[-_]?\d+\b", r".\1", selector)
+    selector = re.sub(r"\[(href|src|id|for|aria-\w+)=[^\]]*\]", r"[\1]", selector)
+    return re.sub(r"\s+", " ", selector).strip()
+
+
+def wcag_criteria(tags: List[str]) -> List[str]:
+    """WCAG success criteria from axe tags (wcag143 -> 1.4.3)."""
+    criteria = []
+    for tag in tags:
+        match = re.fullmatch(r"wcag(\d)(\d)(\d+)", tag)
+        if match:
+            criteria.append(".".join(match.groups()))
+    return criteria
+
+
+def wcag_level(tags: List[str]) -> str:
+    """Conformance level from axe tags; best practices have none."""
+    return next((WCAG_LEVEL_TAGS[t] for t in tags if t in WCAG_LEVEL_TAGS), "Best Practice")
+
+
+def aggregate_file(path: str) -> Dict[str, Any]:
+    """Aggregate one results file (worker): unique issues, criteria and page rows."""
+    issues: Dict[str, Dict[str, Any]] = {}
+    criteria = Counter()
+    criterion_pages = Counter()
+    pages = []
+    results = iter_json_values(Path(path))
+    while True:
+        try:
+            result = next(results)
+        except StopIteration:
+            break
+        except (OSError, ValueError):
+            # Truncated or invalid file: keep the results read so far
+            break
+        url = result.get("url", "")
+        by_impact = Counter()
+        page_issues = set()
+        page_criteria = set()
+        for violation in result.get("violations", []):
+            rule = violation.get("id", "unknown")
+            tags = violation.get("tags", [])
+            for node in violation.get("nodes", []):
+                impact = (node.get("impact") or violation.get("impact") or "moderate").lower()
+                if impact not in IMPACTS:
+                    impact = "moderate"
+                selector = normalize_selector(node.get("target", ""))
+                key = f"{rule}|{selector}"
+                by_impact[impact] += 1
+                issue = issues.get(key)
+                if issue is None:
+                    issue = issues[key] = {
+                        "rule": rule, "selector": selector, "impact": impact,
+                        "help": violation.get("help", ""), "help_url": violation.get("helpUrl", ""),
+                        "criteria": wcag_criteria(tags), "level": wcag_level(tags),
+                        "occurrences": 0, "pages": 0, "example_url": url,
+                    }
+                elif IMPACTS.index(impact) < IMPACTS.index(issue["impact"]):
+                    issue["impact"] = impact
+                issue["occurrences"] += 1
+                if key not in page_issues:
+                    page_issues.add(key)
+                    issue["pages"] += 1
+                for criterion in issue["criteria"]:
+                    criteria[criterion] += 1
+                    page_criteria.add(criterion)
+        criterion_pages.update(page_criteria)
+        pages.append({"url": url, "violations": sum(by_impact.values()),
+                      **{impact: by_impact[impact] for impact in IMPACTS}})
+    return {"issues": issues, "criteria": criteria, "criterion_pages": criterion_pages, "pages": pages}
+
+
+def merge_issue(target: Dict[str, Any], source: Dict[str, Any]) -> None:
+    """Add one file's counts for an issue to the running aggregate."""
+    target["occurrences"] += source["occurrences"]
+    target["pages"] += source["pages"]
+    if IMPACTS.index(source["impact"]) < IMPACTS.index(target["impact"]):
+        target["impact"] = source["impact"]
+
+
+def aggregate_axe(results_dir: Path, output_dir: Path, workers: Optional[int] = None) -> Dict[str, Any]:
+    """Aggregate all axe-core results below a directory; stream page rows to axe_pages.jsonl."""
+    files = [str(p) for p in sorted(results_dir.rglob("*.json"))]
+
+    issues: Dict[str, Dict[str, Any]] = {}
+    criteria = Counter()
+    criterion_pages = Counter()
+    page_count = 0
+    pages_with_violations = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool, \
+            open(output_dir / "axe_pages.jsonl", 'w') as pages_out:
+        for partial in pool.map(aggregate_file, files, chunksize=8):
+            for key, issue in partial["issues"].items():
+                if key in issues:
+                    merge_issue(issues[key], issue)
+                else:
+                    issues[key] = issue
+            criteria.update(partial["criteria"])
+            criterion_pages.update(partial["criterion_pages"])
+            for page in partial["pages"]:
+                page_count += 1
+                pages_with_violations += page["violations"] > 0
+                pages_out.write(json.dumps(page) + "\n")
+
+    by_impact = Counter(issue["impact"] for issue in issues.values())
+    remediation = {impact: by_impact[impact] * ACCESSIBILITY_REMEDIATION[impact] for impact in IMPACTS}
+
+    ranked = sorted(issues.values(), key=lambda i: (IMPACTS.index(i["impact"]), -i["pages"]))
+    wcag = [{"criterion": criterion, "occurrences": count, "pages": criterion_pages[criterion],
+             "issues": sum(criterion in i["criteria"] for i in issues.values())}
+            for criterion, count in sorted(criteria.items(), key=lambda c: [int(n) for n in c[0].split(".")])]
+
+    return {
+        "stats": {
+            "files": len(files),
+            "pages": page_count,
+            "pages_with_violations": pages_with_violations,
+            "occurrences": sum(i["occurrences"] for i in issues.values()),
+            "unique_issues": len(issues),
+        },
+        "wcag": wcag,
+        "levels": dict(Counter(i["level"] for i in issues.values())),
+        "issues": ranked[:TOP_ISSUES],
+        "remediation": {
+            "by_impact": {impact: {"issues": by_impact[impact], "hours": remediation[impact]} for impact in IMPACTS},
+            "total_hours": sum(remediation.values()),
+        },
+        # Paste into entities.json; calculate_estimate.py adds the remediation hours
+        "accessibility": {"issues": {impact: by_impact[impact] for impact in IMPACTS}},
+    }
+
+
+def main():
+    """Main execution function."""
+    if len(sys.argv) < 2:
+        print("Usage: python aggregate_axe.py <results_dir> [output_dir]")
+        print("\nExample:")
+        print("  python aggregate_axe.py ./audit_data/axe ./audit_data")
+        sys.exit(1)
+
+    results_dir = Path(sys.argv[1])
+    output_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else results_dir
+    if not results_dir.is_dir():
+        print(f"Error: Directory not found: {results_dir}")
+        sys.exit(1)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    print(f"♿ Aggregating axe-core results from: {results_dir}")
+    result = aggregate_axe(results_dir, output_dir)
+
+    output_file = output_dir / "accessibility.json"
+    with open(output_file, 'w') as f:
+        json.dump(result, f, indent=2)
+
+    stats = result["stats"]
+    print(f"\n✅ {stats['pages']:,} pages, {stats['occurrences']:,} violations → "
+          f"{stats['unique_issues']:,} unique issues\n")
+    print("| Impact | Unique Issues | Hours |")
+    print("|--------|---------------|-------|")
+    for impact, values in result["remediation"]["by_impact"].items():
+        print(f"| {impact.title()} | {values['issues']:,} | {values['hours']:.1f} |")
+    print(f"| **Total** | | **{result['remediation']['total_hours']:.1f}** |")
+    print(f"\n📄 Saved to: {output_file}")
+    print(f"📄 Page data saved to: {output_dir / 'axe_pages.jsonl'}")
+
+
+if __name__ == "__main__":
+    main()
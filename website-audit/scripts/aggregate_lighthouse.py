@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Lighthouse Report Aggregation for the Performance Section
+
+Audits collect one Lighthouse JSON report per tested URL, often hundreds or
+thousands of them at several MB each (mostly base64 screenshots and trace
+details). This script aggregates them into the data behind the
+performance/* pages of the generated site.
+
+Reports are never fully decoded: each file is memory-mapped and only the
+needed objects (URL, performance score, LCP, CLS, TBT, total byte weight,
+resource summary) are located and decoded, so parsing cost does not grow
+with screenshot size. Files are parsed on a process pool; metrics are
+collected into arrays (NumPy when installed) and summarized as percentiles
+per page type.
+
+Page types come from cluster_urls.py output when given, otherwise from the
+first path segment of each URL.
+
+Usage:
+    python aggregate_lighthouse.py <reports_dir> <output_json> [content_types_json]
+
+Output:
+    {"overall": {...}, "page_types": {"News": {...}}, "resources": {...},
+     "slowest_pages": [...], "stats": {...}}
+"""
+
+import json
+import mmap
+import re
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from cluster_urls import content_type_name, normalize_segments
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Metrics read from each report: output key -> Lighthouse audit id
+METRIC_AUDITS = {
+    "lcp": "largest-contentful-paint",
+    "cls": "cumulative-layout-shift",
+    "tbt": "total-blocking-time",
+    "bytes": "total-byte-weight",
+}
+
+# Core Web Vitals thresholds (good, poor); TBT stands in for INP in lab data
+CWV_THRESHOLDS = {
+    "lcp": (2500, 4000),
+    "cls": (0.1, 0.25),
+    "tbt": (200, 600),
+}
+
+PERCENTILES = [50, 75, 90]
+
+# Resource types from the resource-summary audit
+RESOURCE_TYPES = ["document", "script", "stylesheet", "image", "font", "media", "other", "third-party"]
+
+SLOWEST_PAGES = 20
+
+URL_KEYS = [b"finalDisplayedUrl", b"finalUrl", b"requestedUrl"]
+
+# Initial window decoded after a key; doubled until the object is complete
+DECODE_WINDOW = 64 * 1024
+
+_decoder = json.JSONDecoder()
+
+
+def decode_at(data: mmap.mmap, start: int) -> Any:
+    """Decode the JSON value starting at a byte offset without reading the rest of the file."""
+    window = DECODE_WINDOW
+    while True:
+        chunk = data[start:start + window]
+        try:
+            return _decoder.raw_decode(chunk.decode("utf-8", "replace"))[0]
+        except json.JSONDecodeError:
+            if start + window >= len(data):
+                raise
+            window *= 2
+
+
+def find_value(data: mmap.mmap, key: bytes, opener: bytes = b"") -> Optional[Any]:
+    """Decode the value of the first `"key": <opener>...` in a report."""
+    match = re.search(b'"' + re.escape(key) + rb'"\s*:\s*' + re.escape(opener), data)
+    if not match:
+        return None
+    return decode_at(data, match.end() - len(opener))
+
+
+def read_report(path: str) -> Optional[Dict[str, Any]]:
+    """Extract URL, score, metrics and transfer sizes from one report (worker)."""
+    try:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            url = next((v for v in (find_value(data, key, b'"') for key in URL_KEYS) if v), None)
+            if not url:
+                return None
+
+            metrics = {}
+            for name, audit_id in METRIC_AUDITS.items():
+                # Audit objects start with their own id; this skips references in auditRefs
+                audit = find_value(data, audit_id.encode(), b'{')
+                if isinstance(audit, dict) and audit.get("numericValue") is not None:
+                    metrics[name] = float(audit["numericValue"])
+
+            resources = {}
+            summary = find_value(data, b"resource-summary", b'{')
+            if isinstance(summary, dict):
+                for item in (summary.get("details") or {}).get("items", []):
+                    resources[item.get("resourceType", "other")] = item.get("transferSize", 0)
+
+            categories = find_value(data, b"categories", b'{') or {}
+    except (OSError, ValueError):
+        return None
+
+    score = (categories.get("performance") or {}).get("score")
+    return {"url": url, "score": score, "metrics": metrics, "resources": resources}
+
+
+def load_patterns(content_types_file: Optional[Path]) -> List[Tuple[List[str], str]]:
+    """URL patterns from cluster_urls.py output, most specific first."""
+    if not content_types_file:
+        return []
+    with open(content_types_file, 'r') as f:
+        return cluster_patterns(json.load(f).get("content_types", []))
+
+
+def cluster_patterns(content_types: List[Dict[str, Any]]) -> List[Tuple[List[str], str]]:
+    """(segments, name) per cluster pattern, most specific first."""
+    patterns = [(ct["pattern"].strip("/").split("/") if ct["pattern"] != "/" else [], ct["name"])
+                for ct in content_types if ct["pattern"] != "(other)"]
+    return sorted(patterns, key=lambda p: -sum(s != "*" for s in p[0]))
+
+
+def page_type(url: str, patterns: List[Tuple[List[str], str]]) -> str:
+    """Page type of a URL: matching cluster pattern, else its first path segment."""
+    segments = normalize_segments(url)
+    for pattern, name in patterns:
+        if len(pattern) == len(segments) and all(p == "*" or p == s for p, s in zip(pattern, segments)):
+            return name
+    if patterns:
+        return "Page"
+    return content_type_name("/" + "/".join(segments[:1]))
+
+
+def percentiles(values: array) -> Dict[str, float]:
+    """p50/p75/p90 (linear interpolation, as numpy.percentile)."""
+    if not values:
+        return {}
+    if numpy is not None:
+        result = numpy.percentile(numpy.frombuffer(values, dtype=numpy.float64), PERCENTILES)
+        return {f"p{p}": round(float(v), 3) for p, v in zip(PERCENTILES, result)}
+
+    ordered = sorted(values)
+    result = {}
+    for p in PERCENTILES:
+        position = (len(ordered) - 1) * p / 100
+        low = int(position)
+        high = min(low + 1, len(ordered) - 1)
+        result[f"p{p}"] = round(ordered[low] + (ordered[high] - ordered[low]) * (position - low), 3)
+    return result
+
+
+def summarize(metrics: Dict[str, array], scores: array) -> Dict[str, Any]:
+    """Percentiles and good/poor shares for one group of pages."""
+    summary: Dict[str, Any] = {"pages": len(scores), "score": percentiles(scores)}
+    for name, values in metrics.items():
+        summary[name] = percentiles(values)
+        if name in CWV_THRESHOLDS and values:
+            good, poor = CWV_THRESHOLDS[name]
+            summary[name]["good"] = round(sum(v <= good for v in values) / len(values), 3)
+            summary[name]["poor"] = round(sum(v > poor for v in values) / len(values), 3)
+    return summary
+
+
+def aggregate_lighthouse(reports_dir: Path, content_types_file: Optional[Path] = None,
+                         workers: Optional[int] = None) -> Dict[str, Any]:
+    """Aggregate all Lighthouse reports below a directory."""
+    files = [str(p) for p in sorted(reports_dir.rglob("*.json"))]
+    patterns = load_patterns(content_types_file)
+
+    def new_group() -> Tuple[Dict[str, array], array]:
+        return {name: array('d') for name in METRIC_AUDITS}, array('d')
+
+    overall = new_group()
+    groups: Dict[str, Tuple[Dict[str, array], array]] = {}
+    resource_bytes = {t: array('d') for t in RESOURCE_TYPES}
+    slowest: List[Tuple[float, str, str]] = []
+    skipped = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for report in pool.map(read_report, files, chunksize=16):
+            if report is None:
+                skipped += 1
+                continue
+            name = page_type(report["url"], patterns)
+            group = groups.setdefault(name, new_group())
+            for metrics, scores in (overall, group):
+                if report["score"] is not None:
+                    scores.append(report["score"] * 100)
+                for metric, value in report["metrics"].items():
+                    metrics[metric].append(value)
+            for resource_type, size in report["resources"].items():
+                if resource_type in resource_bytes:
+                    resource_bytes[resource_type].append(size)
+            if "lcp" in report["metrics"]:
+                slowest.append((report["metrics"]["lcp"], report["url"], name))
+                if len(slowest) > SLOWEST_PAGES * 10:
+                    slowest = sorted(slowest, reverse=True)[:SLOWEST_PAGES]
+
+    return {
+        "overall": summarize(*overall),
+        "page_types": {name: summarize(*group)
+                       for name, group in sorted(groups.items(), key=lambda g: -len(g[1][1]))},
+        "resources": {t: {"pages": len(v), "total": sum(v), **percentiles(v)}
+                      for t, v in resource_bytes.items() if v},
+        "slowest_pages": [{"url": url, "page_type": name, "lcp": lcp}
+                          for lcp, url, name in sorted(slowest, reverse=True)[:SLOWEST_PAGES]],
+        "stats": {"reports": len(files), "parsed": len(files) - skipped, "skipped": skipped},
+    }
+
+
+def main():
+    """Main execution function."""
+    if len(sys.argv) < 3:
+        print("Usage: python aggregate_lighthouse.py <reports_dir> <output_json> [content_types_json]")
+        print("\nExample:")
+        print("  python aggregate_lighthouse.py ./audit_data/lighthouse ./audit_data/performance.json "
+              "./audit_data/content_types.json")
+        sys.exit(1)
+
+    reports_dir = Path(sys.argv[1])
+    output_file = Path(sys.argv[2])
+    content_types_file = Path(sys.argv[3]) if len(sys.argv) > 3 else None
+    if not reports_dir.is_dir():
+        print(f"Error: Directory not found: {reports_dir}")
+        sys.exit(1)
+
+    if numpy is None:
+        print("⚠️  Warning: numpy not installed, using pure-Python percentiles (pip install numpy)")
+
+    print(f"⚡ Aggregating Lighthouse reports from: {reports_dir}")
+    result = aggregate_lighthouse(reports_dir, content_types_file)
+
+    with open(output_file, 'w') as f:
+        json.dump(result, f, indent=2)
+
+    stats = result["stats"]
+    print(f"\n✅ {stats['parsed']:,} reports parsed ({stats['skipped']:,} skipped)\n")
+    print("| Page Type | Pages | Score p50 | LCP p75 | CLS p75 | TBT p75 |")
+    print("|-----------|-------|-----------|---------|---------|---------|")
+    for name, summary in result["page_types"].items():
+        print(f"| {name} | {summary['pages']:,} | {summary['score'].get('p50', 0):.0f} | "
+              f"{summary['lcp'].get('p75', 0) / 1000:.2f} s | {summary['cls'].get('p75', 0):.3f} | "
+              f"{summary['tbt'].get('p75', 0):.0f} ms |")
+    print(f"\n📄 Saved to: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
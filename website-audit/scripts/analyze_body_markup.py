@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Body Markup Analysis for Migration Complexity
+
+The migration complexity in entities.json (simple / medium / complex, see
+MIGRATION_MULTIPLIERS in calculate_estimate.py) is usually a gut call:
+medium means HTML cleanup, complex means custom parsing. This script
+measures it. Every rich-text field is tokenized with a single-pass regex
+scanner that counts what makes a migration expensive:
+
+    inline_styles   elements with a style attribute            -> cleanup (medium)
+    legacy_tags     <font>, <center>, Word markup (<o:p>), ...  -> cleanup (medium)
+    iframes         embedded iframes (video, maps, forms)       -> cleanup (medium)
+    shortcodes      [gallery ...], [caption]...[/caption]       -> custom parsing (complex)
+    nested_tables   tables inside tables (layout tables)        -> custom parsing (complex)
+    scripts         <script>, <object>, <embed>, on* handlers   -> custom parsing (complex)
+
+Each record gets the level of its worst field; a content type is complex
+or medium once enough of its records are (COMPLEX_SHARE, MEDIUM_SHARE).
+The migration block counts distinct nodes instead of records: content
+elements and components belong to the page they are placed on, which
+gets the level of its worst record.
+
+Input is either a crawl inventory (crawl_site.py / warc_reader.py; the
+main content area of each page is analyzed, page types come from
+cluster_urls.py output when given) or a CMS export readable by
+read_cms_export.py (rich-text fields per record). Crawl shards are
+analyzed on a process pool; export records are parsed in one stream and
+tokenized on the pool in batches.
+
+Usage:
+    python analyze_body_markup.py <inventory.jsonl | export_file> <output_json> [content_types_json | format]
+
+Output:
+    {"content_types": [{"name", "records", "complexity", "levels", "avg_bytes", "fields": [...]}],
+     "migration": {"nodes", "records", "complexity",
+                   "types": [{"name", "nodes", "records", "complexity", "avg_bytes"}]},
+     "stats": {...}}
+    The migration block can be merged into entities.json; calculate_estimate.py
+    then charges every content type at its own complexity and
+    simulate_cutover.py uses the payload sizes.
+"""
+
+import json
+import os
+import re
+import sys
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+from aggregate_lighthouse import load_patterns, page_type
+from cluster_urls import read_urls, shard_ranges
+from read_cms_export import BodyRecord, detect_format, iter_bodies
+from warc_reader import read_page
+
+
+FEATURES = ["inline_styles", "legacy_tags", "iframes", "shortcodes", "nested_tables", "scripts"]
+
+# Features that need HTML cleanup (medium) or custom parsing (complex)
+MEDIUM_FEATURES = ("inline_styles", "legacy_tags", "iframes")
+COMPLEX_FEATURES = ("shortcodes", "nested_tables", "scripts")
+
+# Share of a type's records at a level that makes the whole type that level
+COMPLEX_SHARE = 0.10
+MEDIUM_SHARE = 0.20
+
+LEVELS = ["simple", "medium", "complex"]
+
+LEGACY_TAGS = {"font", "center", "marquee", "blink", "big", "strike", "tt", "basefont", "acronym",
+               "dir", "applet", "frame", "frameset", "spacer", "nobr", "xmp", "link"}
+
+SCRIPT_TAGS = {"script", "object", "embed", "applet"}
+
+# Tags, comments and shortcodes; tag attributes may contain quoted ">"
+MARKUP_TOKEN = re.compile(
+    r"<(/?)([a-zA-Z][\w:.-]*)((?:[^>\"']|\"[^\"]*\"|'[^']*')*)>"
+    r"|<!--.*?-->"
+    r"|\[(/?)([a-zA-Z_][\w-]*)(?=[\s\]/])[^\[\]<>]*\]",
+    re.DOTALL)
+STYLE_ATTRIBUTE = re.compile(r"\sstyle\s*=", re.IGNORECASE)
+EVENT_HANDLER = re.compile(r"\son[a-z]+\s*=", re.IGNORECASE)
+SCRIPT_END = re.compile(r"</script\s*>", re.IGNORECASE)
+
+# Main content of a crawled page and the page chrome dropped from a <body> fallback
+MAIN_PATTERN = re.compile(r"<(main|article)\b[^>]*>(.*)</\1\s*>", re.IGNORECASE | re.DOTALL)
+BODY_PATTERN = re.compile(r"<body\b[^>]*>(.*)", re.IGNORECASE | re.DOTALL)
+CHROME_PATTERN = re.compile(r"<(header|nav|footer|aside)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+
+# Export records per pool task, and tasks in flight
+BATCH_SIZE = 500
+MAX_PENDING = 4
+
+
+def markup_features(html: str) -> Counter:
+    """Count cleanup-relevant markup in one HTML fragment."""
+    features = Counter()
+    table_depth = 0
+    position = 0
+    while True:
+        match = MARKUP_TOKEN.search(html, position)
+        if not match:
+            break
+        position = match.end()
+        closing, tag, attributes, shortcode_closing, shortcode = match.groups()
+        if shortcode:
+            features["shortcodes"] += not shortcode_closing
+            continue
+        if tag is None:
+            continue  # comment
+        tag = tag.lower()
+        if closing:
+            if tag == "table":
+                table_depth = max(table_depth - 1, 0)
+            continue
+
+        features["tags"] += 1
+        if attributes:
+            features["inline_styles"] += bool(STYLE_ATTRIBUTE.search(attributes))
+            features["scripts"] += len(EVENT_HANDLER.findall(attributes))
+        if tag == "table":
+            table_depth += 1
+            features["nested_tables"] += table_depth > 1
+        elif tag == "iframe":
+            features["iframes"] += 1
+        elif tag in SCRIPT_TAGS:
+            features["scripts"] += 1
+            if tag == "script":
+                end = SCRIPT_END.search(html, position)
+                position = end.end() if end else len(html)
+        elif tag in LEGACY_TAGS or ":" in tag:
+            features["legacy_tags"] += 1
+    return features
+
+
+def level(features: Counter) -> str:
+    """Migration level of one field from its markup features."""
+    if any(features[f] for f in COMPLEX_FEATURES):
+        return "complex"
+    if any(features[f] for f in MEDIUM_FEATURES):
+        return "medium"
+    return "simple"
+
+
+def type_level(levels: Counter) -> str:
+    """Migration level of a content type from its records' levels."""
+    records = sum(levels.values())
+    if not records:
+        return "simple"
+    if levels["complex"] >= COMPLEX_SHARE * records:
+        return "complex"
+    if levels["medium"] + levels["complex"] >= MEDIUM_SHARE * records:
+        return "medium"
+    return "simple"
+
+
+def new_totals() -> Dict[str, Dict]:
+    """Empty totals: per record type, and per migrated node (type, key) -> [worst level, bytes, records]."""
+    return {"types": {}, "nodes": {}}
+
+
+def add_record(totals: Dict[str, Dict], name: str, node: Tuple[str, str], fields: Dict[str, str]) -> None:
+    """Add one record's fields to per-type and per-node totals."""
+    group = totals["types"].setdefault(name, {"records": 0, "levels": Counter(), "fields": {}})
+    worst = 0
+    size = 0
+    for field_name, html in fields.items():
+        features = markup_features(html)
+        stats = group["fields"].setdefault(field_name, Counter())
+        stats["records"] += 1
+        stats["bytes"] += len(html)
+        size += len(html)
+        stats["tags"] += features["tags"]
+        for feature in FEATURES:
+            if features[feature]:
+                stats[feature] += features[feature]
+                stats[f"{feature}_records"] += 1
+        worst = max(worst, LEVELS.index(level(features)))
+    group["records"] += 1
+    group["levels"][LEVELS[worst]] += 1
+    # A node (page, post) is as hard to migrate as its worst record
+    node_totals = totals["nodes"].setdefault(node, [0, 0, 0])
+    node_totals[0] = max(node_totals[0], worst)
+    node_totals[1] += size
+    node_totals[2] += 1
+
+
+def merge_totals(target: Dict[str, Dict], source: Dict[str, Dict]) -> None:
+    """Merge per-type and per-node totals from a worker."""
+    for name, group in source["types"].items():
+        merged = target["types"].setdefault(name, {"records": 0, "levels": Counter(), "fields": {}})
+        merged["records"] += group["records"]
+        merged["levels"].update(group["levels"])
+        for field_name, stats in group["fields"].items():
+            merged["fields"].setdefault(field_name, Counter()).update(stats)
+    for node, (worst, size, records) in source["nodes"].items():
+        merged_node = target["nodes"].setdefault(node, [0, 0, 0])
+        merged_node[0] = max(merged_node[0], worst)
+        merged_node[1] += size
+        merged_node[2] += records
+
+
+def main_content(html: str) -> str:
+    """Main content area of a crawled page: <main>/<article>, else <body> without page chrome."""
+    match = MAIN_PATTERN.search(html)
+    if match:
+        return match.group(2)
+    body = BODY_PATTERN.search(html)
+    return CHROME_PATTERN.sub("", body.group(1) if body else html)
+
+
+def analyze_shard(inventory_file: Path, start: int, end: Optional[int],
+                  patterns: List[Tuple[List[str], str]]) -> Dict[str, Dict]:
+    """Analyze the pages in one byte range of a crawl inventory (worker)."""
+    totals = new_totals()
+    for url, html_file in read_urls(inventory_file, start, end):
+        if not html_file:
+            continue
+        try:
+            html = read_page(html_file).decode("utf-8", "replace")
+        except OSError:
+            continue
+        name = page_type(url, patterns)
+        add_record(totals, name, (name, url), {"body": main_content(html)})
+    return totals
+
+
+def analyze_batch(records: List[BodyRecord]) -> Dict[str, Dict]:
+    """Analyze a batch of export records (worker)."""
+    totals = new_totals()
+    for name, node, fields in records:
+        add_record(totals, name, node, fields)
+    return totals
+
+
+def batches(records: Iterator[BodyRecord]) -> Iterator[List[BodyRecord]]:
+    """Group a record stream into lists of BATCH_SIZE."""
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def analyze_inventory(inventory_file: Path, content_types_file: Optional[Path] = None,
+                      workers: Optional[int] = None) -> Dict[str, Dict]:
+    """Per-type and per-page totals for all HTML pages of a crawl."""
+    workers = workers or os.cpu_count() or 1
+    patterns = load_patterns(content_types_file)
+    ranges = shard_ranges(inventory_file, workers * 4)
+    totals = new_totals()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(analyze_shard, inventory_file, start, end, patterns) for start, end in ranges]
+        for future in futures:
+            merge_totals(totals, future.result())
+    return totals
+
+
+def analyze_export(export_file: Path, cms: Optional[str] = None,
+                   workers: Optional[int] = None) -> Dict[str, Dict]:
+    """Per-type and per-node totals for all rich-text fields of a CMS export."""
+    workers = workers or os.cpu_count() or 1
+    totals = new_totals()
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Bounded submission: the export is parsed no further ahead than the pool can keep up with
+        for batch in batches(iter_bodies(export_file, cms)):
+            pending.append(pool.submit(analyze_batch, batch))
+            if len(pending) >= workers * MAX_PENDING:
+                merge_totals(totals, pending.popleft().result())
+        while pending:
+            merge_totals(totals, pending.popleft().result())
+    return totals
+
+
+def build_result(totals: Dict[str, Dict], source: str) -> Dict[str, Any]:
+    """Per-type levels, per-field statistics and the migration block (counted in distinct nodes)."""
+    content_types = []
+    for name, group in sorted(totals["types"].items(), key=lambda t: -t[1]["records"]):
+        fields = []
+        for field_name, stats in sorted(group["fields"].items(), key=lambda f: -f[1]["records"]):
+            records = stats["records"]
+            fields.append({
+                "field": field_name,
+                "records": records,
+                "avg_bytes": round(stats["bytes"] / records),
+                "avg_tags": round(stats["tags"] / records, 1),
+                **{feature: {"records": stats[f"{feature}_records"],
+                             "share": round(stats[f"{feature}_records"] / records, 3),
+                             "occurrences": stats[feature]}
+                   for feature in FEATURES},
+            })
+        content_types.append({
+            "name": name,
+            "records": group["records"],
+            "complexity": type_level(group["levels"]),
+            "levels": {lvl: group["levels"][lvl] for lvl in LEVELS},
+            "avg_bytes": round(sum(stats["bytes"] for stats in group["fields"].values()) / group["records"]),
+            "fields": fields,
+        })
+
+    overall = Counter()
+    for group in totals["types"].values():
+        overall.update(group["levels"])
+    node_types: Dict[str, Dict[str, Any]] = {}
+    for (node_type, _), (worst, size, records) in totals["nodes"].items():
+        node_group = node_types.setdefault(node_type, {"levels": Counter(), "bytes": 0, "records": 0})
+        node_group["levels"][LEVELS[worst]] += 1
+        node_group["bytes"] += size
+        node_group["records"] += records
+    node_levels = Counter()
+    for node_group in node_types.values():
+        node_levels.update(node_group["levels"])
+
+    return {
+        "source": source,
+        "content_types": content_types,
+        "migration": {
+            "nodes": len(totals["nodes"]),
+            "records": sum(overall.values()),
+            "complexity": type_level(node_levels),
+            "types": [{"name": name, "nodes": sum(group["levels"].values()), "records": group["records"],
+                       "complexity": type_level(group["levels"]),
+                       "avg_bytes": round(group["bytes"] / sum(group["levels"].values()))}
+                      for name, group in sorted(node_types.items(), key=lambda t: -sum(t[1]["levels"].values()))],
+        },
+        "stats": {
+            "records": sum(overall.values()),
+            "nodes": len(totals["nodes"]),
+            "levels": {lvl: overall[lvl] for lvl in LEVELS},
+        },
+    }
+
+
+def main():
+    """Main execution function."""
+    if len(sys.argv) < 3:
+        print("Usage: python analyze_body_markup.py <inventory.jsonl | export_file> <output_json> "
+              "[content_types_json | format]")
+        print("\nExamples:")
+        print("  python analyze_body_markup.py ./audit_data/crawl/inventory.jsonl ./audit_data/markup.json "
+              "./audit_data/content_types.json")
+        print("  python analyze_body_markup.py ./exports/site.WordPress.xml ./audit_data/markup.json")
+        sys.exit(1)
+
+    input_file = Path(sys.argv[1])
+    output_file = Path(sys.argv[2])
+    option = sys.argv[3] if len(sys.argv) > 3 else None
+    if not input_file.exists():
+        print(f"Error: File not found: {input_file}")
+        sys.exit(1)
+
+    print(f"🧹 Analyzing body markup in: {input_file}")
+    if input_file.suffix == ".jsonl":
+        source = "crawl"
+        totals = analyze_inventory(input_file, Path(option) if option else None)
+    else:
+        source = (option or detect_format(input_file) or "").lower()
+        try:
+            totals = analyze_export(input_file, source)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+    result = build_result(totals, source)
+
+    with open(output_file, 'w') as f:
+        json.dump(result, f, indent=2)
+
+    stats = result["stats"]
+    print(f"\n✅ {stats['records']:,} records in {stats['nodes']:,} nodes → migration complexity: "
+          f"{result['migration']['complexity'].title()}\n")
+    print("| Content Type | Records | Simple | Medium | Complex | Complexity |")
+    print("|--------------|---------|--------|--------|---------|------------|")
+    for ct in result["content_types"]:
+        levels = ct["levels"]
+        print(f"| {ct['name']} | {ct['records']:,} | {levels['simple']:,} | {levels['medium']:,} | "
+              f"{levels['complex']:,} | {ct['complexity'].title()} |")
+    print(f"\n📄 Saved to: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
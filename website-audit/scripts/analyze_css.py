@@ -0,0 +1,529 @@
+#!/usr/bin/env python3
+"""
+CSS Design-Token Analysis for Theme Components
+
+The `theme_components` inventory for calculate_estimate.py is usually a
+guess. This script derives it from the site's actual stylesheets, together
+with the design tokens the new Drupal theme will need:
+
+    - colors (hex, rgb, hsl), merged into a suggested palette
+    - font stacks, font sizes and @font-face webfonts
+    - breakpoints from @media queries, merged into a suggested set
+    - spacing values (margin, padding, gap), reduced to a suggested scale
+    - class-name families (BEM blocks, prefixes such as btn-*), which
+      become theme component suggestions; utility classes are set apart
+
+Stylesheets are several MB of minified CSS, so each one is tokenized as a
+stream of statements (prelude `{`, declaration `;`, `}`) from a read
+buffer, with comments and strings skipped. Stylesheets are analyzed in
+parallel on a process pool; results are cached in a SQLite file keyed by
+content hash, so identical stylesheets (the same bundle saved from many
+pages) are analyzed once and unchanged ones are not analyzed again.
+
+Usage:
+    python analyze_css.py <stylesheet_dir> <output_json>
+
+Output:
+    {"design_tokens": {...}, "class_families": [...],
+     "theme_components": [{"name", "complexity", ...}], "stats": {...}}
+    The theme_components block can be merged into entities.json.
+"""
+
+import colorsys
+import hashlib
+import json
+import re
+import sqlite3
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+
+# Characters read per step while tokenizing
+READ_CHUNK = 1024 * 1024
+
+CACHE_NAME = ".css-cache.sqlite"
+
+# Colors closer than this (largest channel difference) share a palette entry
+PALETTE_DISTANCE = 12
+MAX_PALETTE = 24
+
+# Breakpoints closer than this (px) are one breakpoint
+BREAKPOINT_DISTANCE = 32
+MIN_BREAKPOINT_USES = 2
+
+# Spacing scale: most used values covering this share of uses
+SPACING_COVERAGE = 0.9
+MAX_SPACING_SCALE = 12
+
+# Families need this many classes to be a component; utilities have few declarations per rule
+MIN_FAMILY_CLASSES = 3
+UTILITY_MIN_CLASSES = 8
+UTILITY_DECLARATIONS_PER_RULE = 1.5
+MAX_COMPONENTS = 40
+
+# Component score (classes + declarations/10 + responsive/interactive/animated bonus) per level
+COMPONENT_COMPLEXITY = [
+    (12, "simple"),
+    (30, "medium"),
+]
+
+# Design token counts above which the token set itself is medium / complex
+TOKEN_COMPLEXITY = {"colors": (12, 24), "fonts": (2, 4), "breakpoints": (4, 6), "spacing": (8, 12)}
+
+REM_PX = 16
+
+SPECIAL = re.compile(r"""[{};"']|/\*""")
+STRING_END = {'"': re.compile(r'(?:[^"\\\n]|\\.)*"'), "'": re.compile(r"(?:[^'\\\n]|\\.)*'")}
+
+HEX_COLOR = re.compile(r"#([0-9a-fA-F]{8}|[0-9a-fA-F]{6}|[0-9a-fA-F]{3,4})\b")
+FUNCTION_COLOR = re.compile(r"\b(rgba?|hsla?)\(\s*([\d.]+)(deg|%)?[\s,]+([\d.]+)%?[\s,]+([\d.]+)%?"
+                            r"(?:\s*[,/]\s*([\d.]+)(%)?)?\s*\)", re.IGNORECASE)
+URL_VALUE = re.compile(r"url\([^)]*\)", re.IGNORECASE)
+MEDIA_WIDTH = re.compile(r"\((min|max)-width\s*:\s*([\d.]+)(px|em|rem)\s*\)", re.IGNORECASE)
+LENGTH = re.compile(r"(?<![\w.-])(-?[\d.]+)(px|rem|em)\b")
+CLASS_NAME = re.compile(r"\.(-?[_a-zA-Z](?:[\w-]|\\.)*)")
+INTERACTIVE_SELECTOR = re.compile(r":(hover|focus|active|checked)|\.is-|\.active\b|\[aria-", re.IGNORECASE)
+
+SPACING_PROPERTIES = ("margin", "padding", "gap", "row-gap", "column-gap")
+ANIMATION_PROPERTIES = ("transition", "animation")
+GENERIC_FONTS = {"serif", "sans-serif", "monospace", "cursive", "fantasy", "system-ui", "inherit",
+                 "initial", "-apple-system", "blinkmacsystemfont", "ui-sans-serif", "ui-serif"}
+
+
+def iter_statements(f) -> Iterator[Tuple[str, str]]:
+    """Yield (terminator, text) for every statement of a CSS stream.
+
+    The terminator is `{` for selectors and at-rule preludes, `;` or `}` for
+    declarations (text may be empty). Comments are dropped; statements cut
+    by the read buffer are re-read with the next chunk.
+    """
+    buffer = ""
+    while True:
+        chunk = f.read(READ_CHUNK)
+        buffer += chunk
+        pieces = []
+        start = segment = position = 0
+        while True:
+            match = SPECIAL.search(buffer, position)
+            if not match:
+                break
+            token = match.group()
+            if token == "/*":
+                end = buffer.find("*/", match.end())
+                if end < 0:
+                    break
+                pieces.append(buffer[segment:match.start()])
+                segment = position = end + 2
+            elif token in STRING_END:
+                end = STRING_END[token].match(buffer, match.end())
+                if not end:
+                    if chunk:
+                        break
+                    position = match.end()  # unterminated string at end of file
+                    continue
+                position = end.end()
+            else:
+                pieces.append(buffer[segment:match.start()])
+                yield token, "".join(pieces).strip()
+                pieces = []
+                start = segment = position = match.end()
+        buffer = buffer[start:]
+        if not chunk:
+            if buffer.strip():
+                yield ";", buffer.strip()
+            return
+
+
+def color_key(match: re.Match) -> Optional[str]:
+    """Normalized color: #rrggbb for opaque colors, rgba(...) otherwise."""
+    if match.re is HEX_COLOR:
+        value = match.group(1).lower()
+        if len(value) in (3, 4):
+            value = "".join(c * 2 for c in value)
+        rgb, alpha = value[:6], int(value[6:], 16) / 255 if len(value) == 8 else 1.0
+        red, green, blue = (int(rgb[i:i + 2], 16) for i in (0, 2, 4))
+    else:
+        function, first, unit, second, third, alpha_value, alpha_percent = match.groups()
+        try:
+            first, second, third = float(first), float(second), float(third)
+            alpha = float(alpha_value) if alpha_value else 1.0
+        except ValueError:
+            return None
+        if alpha_percent:
+            alpha /= 100
+        if function.lower().startswith("hsl"):
+            red, green, blue = (round(c * 255) for c in
+                                colorsys.hls_to_rgb((first % 360) / 360, third / 100, second / 100))
+        elif unit == "%":
+            red, green, blue = (round(c * 2.55) for c in (first, second, third))
+        else:
+            red, green, blue = (round(c) for c in (first, second, third))
+    red, green, blue = (min(max(c, 0), 255) for c in (red, green, blue))
+    if alpha >= 1:
+        return f"#{red:02x}{green:02x}{blue:02x}"
+    return f"rgba({red},{green},{blue},{round(alpha, 2)})"
+
+
+def to_px(value: str, unit: str) -> float:
+    """Length in px (rem and em at REM_PX)."""
+    return float(value) * (1 if unit.lower() == "px" else REM_PX)
+
+
+def media_breakpoints(prelude: str) -> List[int]:
+    """Breakpoints (px) of an @media prelude; max-width 767.98px counts as 768."""
+    points = []
+    for kind, value, unit in MEDIA_WIDTH.findall(prelude):
+        try:
+            px = to_px(value, unit)
+        except ValueError:
+            continue
+        points.append(int(px) + 1 if kind.lower() == "max" else round(px))
+    return points
+
+
+def class_family(name: str) -> str:
+    """BEM block of a class name, without modifiers and numeric suffixes."""
+    block = re.split(r"__|--", name.replace("\\", ""))[0]
+    return block.rstrip("0123456789-_") or block
+
+
+def font_stack(value: str) -> str:
+    """Normalized font-family value."""
+    families = [f.strip().strip("\"'").lower() for f in value.replace("!important", "").split(",")]
+    return ", ".join(f for f in families if f)
+
+
+def analyze_stylesheet(path: str) -> Dict[str, Any]:
+    """Tokenize one stylesheet and count its design values and class families (worker)."""
+    colors = Counter()
+    fonts = Counter()
+    font_sizes = Counter()
+    breakpoints = Counter()
+    spacing = Counter()
+    webfonts = set()
+    custom_properties = set()
+    families: Dict[str, Dict[str, Any]] = {}
+    rules = declarations = 0
+    stack: List[str] = []
+    current: List[str] = []
+
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for token, text in iter_statements(f):
+            if token == "{":
+                stack.append(text)
+                current = []
+                if text.startswith("@"):
+                    if text[:6].lower() == "@media":
+                        breakpoints.update(media_breakpoints(text))
+                    continue
+                rules += 1
+                responsive = any(p[:6].lower() == "@media" for p in stack[:-1])
+                interactive = bool(INTERACTIVE_SELECTOR.search(text))
+                for name in set(CLASS_NAME.findall(text)):
+                    family = families.setdefault(class_family(name), {
+                        "classes": set(), "rules": 0, "declarations": 0,
+                        "responsive": False, "interactive": False, "animated": False})
+                    family["classes"].add(name.replace("\\", ""))
+                    current.append(class_family(name))
+                current = sorted(set(current))
+                for family_name in current:
+                    family = families[family_name]
+                    family["rules"] += 1
+                    family["responsive"] |= responsive
+                    family["interactive"] |= interactive
+                continue
+
+            if ":" in text and not text.startswith("@"):
+                declarations += 1
+                prop, value = text.split(":", 1)
+                prop = prop.strip().lower()
+                value = value.strip()
+                if prop.startswith("--"):
+                    custom_properties.add(prop)
+                for family_name in current:
+                    families[family_name]["declarations"] += 1
+                    if prop.startswith(ANIMATION_PROPERTIES):
+                        families[family_name]["animated"] = True
+
+                colorless = URL_VALUE.sub("", value)
+                for pattern in (HEX_COLOR, FUNCTION_COLOR):
+                    for match in pattern.finditer(colorless):
+                        key = color_key(match)
+                        if key:
+                            colors[key] += 1
+                if prop == "font-family":
+                    if stack and stack[-1][:10].lower() == "@font-face":
+                        webfonts.add(font_stack(value))
+                    else:
+                        fonts[font_stack(value)] += 1
+                elif prop == "font-size":
+                    for number, unit in LENGTH.findall(value):
+                        try:
+                            font_sizes[round(to_px(number, unit), 1)] += 1
+                        except ValueError:
+                            continue
+                elif prop.startswith(SPACING_PROPERTIES) and not prop.startswith("margin-trim"):
+                    for number, unit in LENGTH.findall(value):
+                        try:
+                            px = abs(round(to_px(number, unit), 1))
+                        except ValueError:
+                            continue
+                        if px:
+                            spacing[px] += 1
+
+            if token == "}":
+                if stack:
+                    stack.pop()
+                current = []
+
+    return {
+        "rules": rules,
+        "declarations": declarations,
+        "colors": dict(colors),
+        "fonts": dict(fonts),
+        "font_sizes": {str(k): v for k, v in font_sizes.items()},
+        "breakpoints": {str(k): v for k, v in breakpoints.items()},
+        "spacing": {str(k): v for k, v in spacing.items()},
+        "webfonts": sorted(webfonts),
+        "custom_properties": sorted(custom_properties),
+        "families": {name: {**family, "classes": sorted(family["classes"])} for name, family in families.items()},
+    }
+
+
+def file_hash(path: Path) -> str:
+    """SHA-1 of a file's contents."""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        while chunk := f.read(READ_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def open_cache(path: Path) -> sqlite3.Connection:
+    """Open (or create) the per-stylesheet result cache."""
+    db = sqlite3.connect(path)
+    db.execute("CREATE TABLE IF NOT EXISTS sheets (hash TEXT PRIMARY KEY, result TEXT)")
+    return db
+
+
+def sheet_results(files: List[Path], cache_path: Path, workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Yield one result per distinct stylesheet, analyzing only uncached ones."""
+    db = open_cache(cache_path)
+    hashes = {}
+    for path in files:
+        hashes.setdefault(file_hash(path), str(path))
+
+    todo = []
+    for digest, path in hashes.items():
+        row = db.execute("SELECT result FROM sheets WHERE hash = ?", (digest,)).fetchone()
+        if row:
+            yield json.loads(row[0])
+        else:
+            todo.append((digest, path))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for (digest, _), result in zip(todo, pool.map(analyze_stylesheet, [p for _, p in todo])):
+            db.execute("INSERT OR REPLACE INTO sheets VALUES (?, ?)", (digest, json.dumps(result)))
+            yield result
+    db.commit()
+    db.close()
+
+
+def suggest_palette(colors: Counter) -> List[Dict[str, Any]]:
+    """Merge near-identical opaque colors, most used first."""
+    palette = []
+    for value, uses in colors.most_common():
+        if not value.startswith("#"):
+            continue
+        rgb = [int(value[i:i + 2], 16) for i in (1, 3, 5)]
+        for entry in palette:
+            if max(abs(a - b) for a, b in zip(rgb, entry["rgb"])) <= PALETTE_DISTANCE:
+                entry["uses"] += uses
+                entry["variants"] += 1
+                break
+        else:
+            palette.append({"value": value, "rgb": rgb, "uses": uses, "variants": 1})
+    palette.sort(key=lambda e: -e["uses"])
+    return [{k: v for k, v in entry.items() if k != "rgb"} for entry in palette[:MAX_PALETTE]]
+
+
+def suggest_breakpoints(breakpoints: Counter) -> List[int]:
+    """Merge nearby breakpoints into the most used value of each group."""
+    groups: List[Counter] = []
+    for value in sorted(breakpoints):
+        if groups and value - max(groups[-1]) <= BREAKPOINT_DISTANCE:
+            groups[-1][value] = breakpoints[value]
+        else:
+            groups.append(Counter({value: breakpoints[value]}))
+    return [group.most_common(1)[0][0] for group in groups if sum(group.values()) >= MIN_BREAKPOINT_USES]
+
+
+def suggest_scale(values: Counter) -> List[float]:
+    """Most used values covering SPACING_COVERAGE of all uses, ascending."""
+    total = sum(values.values())
+    scale = []
+    covered = 0
+    for value, uses in values.most_common(MAX_SPACING_SCALE):
+        if total and covered >= SPACING_COVERAGE * total:
+            break
+        scale.append(value)
+        covered += uses
+    return sorted(scale)
+
+
+def component_complexity(family: Dict[str, Any]) -> str:
+    """Classify a class family from its size, declarations and behavior."""
+    score = (len(family["classes"]) + family["declarations"] / 10
+             + 5 * family["responsive"] + 3 * family["interactive"] + 3 * family["animated"])
+    return next((name for limit, name in COMPONENT_COMPLEXITY if score <= limit), "complex")
+
+
+def token_complexity(counts: Dict[str, int]) -> str:
+    """Complexity of the design token set from its size."""
+    level = 0
+    for key, (medium, complex_) in TOKEN_COMPLEXITY.items():
+        level = max(level, 2 if counts[key] > complex_ else 1 if counts[key] > medium else 0)
+    return ("simple", "medium", "complex")[level]
+
+
+def analyze_css(css_dir: Path, output_file: Path, workers: Optional[int] = None) -> Dict[str, Any]:
+    """Analyze all stylesheets below a directory."""
+    files = sorted(p for p in css_dir.rglob("*.css") if p.is_file())
+    totals = Counter()
+    counters = {key: Counter() for key in ("colors", "fonts", "font_sizes", "breakpoints", "spacing")}
+    webfonts = set()
+    custom_properties = set()
+    families: Dict[str, Dict[str, Any]] = {}
+
+    sheets = 0
+    for result in sheet_results(files, output_file.parent / CACHE_NAME, workers):
+        sheets += 1
+        totals.update(rules=result["rules"], declarations=result["declarations"])
+        for key, counter in counters.items():
+            counter.update(result[key])
+        webfonts.update(result["webfonts"])
+        custom_properties.update(result["custom_properties"])
+        for name, family in result["families"].items():
+            target = families.setdefault(name, {"classes": set(), "rules": 0, "declarations": 0,
+                                                "responsive": False, "interactive": False, "animated": False})
+            target["classes"].update(family["classes"])
+            for key in ("rules", "declarations"):
+                target[key] += family[key]
+            for key in ("responsive", "interactive", "animated"):
+                target[key] |= family[key]
+
+    # Prefix families (btn-primary, btn-lg) join their base class (btn) when it exists
+    for name in sorted(families, key=len, reverse=True):
+        base = name.split("-")[0]
+        if base != name and base in families:
+            source = families.pop(name)
+            target = families[base]
+            target["classes"] |= source["classes"]
+            for key in ("rules", "declarations"):
+                target[key] += source[key]
+            for key in ("responsive", "interactive", "animated"):
+                target[key] |= source[key]
+
+    class_families = []
+    for name, family in sorted(families.items(), key=lambda f: -f[1]["rules"]):
+        if len(family["classes"]) < MIN_FAMILY_CLASSES:
+            continue
+        utility = len(name) <= 2 or (len(family["classes"]) >= UTILITY_MIN_CLASSES
+                                     and family["declarations"] <= UTILITY_DECLARATIONS_PER_RULE * family["rules"])
+        class_families.append({
+            "name": name,
+            "classes": len(family["classes"]),
+            "rules": family["rules"],
+            "declarations": family["declarations"],
+            "responsive": family["responsive"],
+            "interactive": family["interactive"],
+            "animated": family["animated"],
+            "utility": utility,
+            "examples": sorted(family["classes"])[:5],
+        })
+
+    palette = suggest_palette(counters["colors"])
+    font_families = Counter()
+    for stack, uses in counters["fonts"].items():
+        first = next((f for f in stack.split(", ") if f not in GENERIC_FONTS), "")
+        if first and not first.startswith("var("):
+            font_families[first] += uses
+    breakpoints = suggest_breakpoints(Counter({int(k): v for k, v in counters["breakpoints"].items()}))
+    spacing = suggest_scale(Counter({float(k): v for k, v in counters["spacing"].items()}))
+    font_sizes = suggest_scale(Counter({float(k): v for k, v in counters["font_sizes"].items()}))
+
+    token_counts = {"colors": len(palette), "fonts": len(font_families),
+                    "breakpoints": len(breakpoints), "spacing": len(spacing)}
+    theme_components = [{
+        "name": "Design Tokens",
+        "complexity": token_complexity(token_counts),
+        "tokens": token_counts,
+    }]
+    for family in [f for f in class_families if not f["utility"]][:MAX_COMPONENTS]:
+        theme_components.append({
+            "name": family["name"].replace("-", " ").replace("_", " ").strip().title() or family["name"],
+            "complexity": component_complexity(families[family["name"]]),
+            "classes": family["classes"],
+            "rules": family["rules"],
+        })
+
+    return {
+        "design_tokens": {
+            "colors": {"unique": len(counters["colors"]), "palette": palette},
+            "fonts": {"stacks": dict(counters["fonts"].most_common(10)),
+                      "families": [name for name, _ in font_families.most_common()],
+                      "webfonts": sorted(webfonts)},
+            "font_sizes": font_sizes,
+            "breakpoints": breakpoints,
+            "spacing": spacing,
+            "custom_properties": len(custom_properties),
+        },
+        "class_families": class_families,
+        "theme_components": theme_components,
+        "stats": {"files": len(files), "stylesheets": sheets, "rules": totals["rules"],
+                  "declarations": totals["declarations"], "families": len(class_families),
+                  "utility_families": sum(f["utility"] for f in class_families)},
+    }
+
+
+def main():
+    """Main execution function."""
+    if len(sys.argv) < 3:
+        print("Usage: python analyze_css.py <stylesheet_dir> <output_json>")
+        print("\nExample:")
+        print("  python analyze_css.py ./audit_data/css ./audit_data/design_tokens.json")
+        sys.exit(1)
+
+    css_dir = Path(sys.argv[1])
+    output_file = Path(sys.argv[2])
+    if not css_dir.is_dir():
+        print(f"Error: Directory not found: {css_dir}")
+        sys.exit(1)
+
+    print(f"🎨 Analyzing stylesheets in: {css_dir}")
+    result = analyze_css(css_dir, output_file)
+
+    with open(output_file, 'w') as f:
+        json.dump(result, f, indent=2)
+
+    stats = result["stats"]
+    tokens = result["design_tokens"]
+    print(f"\n✅ {stats['stylesheets']:,} distinct stylesheets ({stats['files']:,} files), "
+          f"{stats['rules']:,} rules, {stats['declarations']:,} declarations")
+    print(f"🎨 Palette: {len(tokens['colors']['palette'])} colors ({tokens['colors']['unique']:,} unique values) | "
+          f"Fonts: {', '.join(tokens['fonts']['families'][:4]) or '-'}")
+    print(f"📐 Breakpoints: {', '.join(f'{b}px' for b in tokens['breakpoints']) or '-'} | "
+          f"Spacing scale: {len(tokens['spacing'])} steps\n")
+    print("| Theme Component | Complexity | Classes | Rules |")
+    print("|-----------------|------------|---------|-------|")
+    for component in result["theme_components"][1:26]:
+        print(f"| {component['name']} | {component['complexity'].title()} | "
+              f"{component['classes']:,} | {component['rules']:,} |")
+    print(f"\n📄 Saved to: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
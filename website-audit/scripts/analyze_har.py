@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""
+HAR Analysis for Asset Weight and Third-Party Inventory
+
+Reading network requests page by page does not scale to a full audit. This
+script analyzes HAR files exported from the browser (DevTools "Save all as
+HAR", Puppeteer/Playwright recordings) and aggregates:
+
+    - transfer bytes and requests by resource type and origin
+    - caching headers (none, no-store, short, long, immutable) and
+      uncompressed text responses
+    - third-party services, identified by vendor where known and grouped
+      into integration categories (analytics, consent, CDN, SSO, ...)
+    - render-blocking stylesheets and scripts
+
+HAR files can be hundreds of MB (response bodies are often embedded), so
+they are never loaded whole: the `entries` array is decoded entry by entry
+from a read buffer. Files are processed in parallel on a process pool.
+
+Usage:
+    python analyze_har.py <har_dir> <output_json>
+
+Output feeds the performance/assets and integrationen pages of the
+generated site.
+"""
+
+import json
+import re
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+# Read size for streaming HAR files
+READ_CHUNK = 4 * 1024 * 1024
+
+# Rows kept for origin and render-blocking lists
+TOP_ORIGINS = 50
+TOP_RENDER_BLOCKING = 50
+
+# Cache lifetime of at least this many seconds counts as long-lived
+LONG_CACHE_SECONDS = 86400
+
+# Known third-party domains: domain suffix -> (vendor, category)
+# Categories map to the integrationen pages (sso, apis, cdn, search/analytics)
+KNOWN_THIRD_PARTIES = {
+    "google-analytics.com": ("Google Analytics", "analytics"),
+    "analytics.google.com": ("Google Analytics", "analytics"),
+    "googletagmanager.com": ("Google Tag Manager", "tag-manager"),
+    "doubleclick.net": ("Google Ads", "advertising"),
+    "googlesyndication.com": ("Google Ads", "advertising"),
+    "googleadservices.com": ("Google Ads", "advertising"),
+    "matomo.cloud": ("Matomo", "analytics"),
+    "etracker.com": ("etracker", "analytics"),
+    "etracker.de": ("etracker", "analytics"),
+    "hotjar.com": ("Hotjar", "analytics"),
+    "clarity.ms": ("Microsoft Clarity", "analytics"),
+    "cookiebot.com": ("Cookiebot", "consent"),
+    "usercentrics.eu": ("Usercentrics", "consent"),
+    "onetrust.com": ("OneTrust", "consent"),
+    "cookielaw.org": ("OneTrust", "consent"),
+    "consentmanager.net": ("consentmanager", "consent"),
+    "fonts.googleapis.com": ("Google Fonts", "fonts"),
+    "fonts.gstatic.com": ("Google Fonts", "fonts"),
+    "use.typekit.net": ("Adobe Fonts", "fonts"),
+    "youtube.com": ("YouTube", "video"),
+    "youtube-nocookie.com": ("YouTube", "video"),
+    "ytimg.com": ("YouTube", "video"),
+    "vimeo.com": ("Vimeo", "video"),
+    "vimeocdn.com": ("Vimeo", "video"),
+    "maps.googleapis.com": ("Google Maps", "maps"),
+    "openstreetmap.org": ("OpenStreetMap", "maps"),
+    "recaptcha.net": ("reCAPTCHA", "forms"),
+    "gstatic.com": ("Google Static", "cdn"),
+    "cloudflare.com": ("Cloudflare", "cdn"),
+    "cdnjs.cloudflare.com": ("cdnjs", "cdn"),
+    "jsdelivr.net": ("jsDelivr", "cdn"),
+    "unpkg.com": ("unpkg", "cdn"),
+    "akamaized.net": ("Akamai", "cdn"),
+    "akamaihd.net": ("Akamai", "cdn"),
+    "fastly.net": ("Fastly", "cdn"),
+    "cloudfront.net": ("Amazon CloudFront", "cdn"),
+    "azureedge.net": ("Azure CDN", "cdn"),
+    "login.microsoftonline.com": ("Microsoft Entra ID", "sso"),
+    "okta.com": ("Okta", "sso"),
+    "auth0.com": ("Auth0", "sso"),
+    "algolia.net": ("Algolia", "search"),
+    "algolianet.com": ("Algolia", "search"),
+    "cse.google.com": ("Google Programmable Search", "search"),
+    "facebook.net": ("Meta Pixel", "advertising"),
+    "facebook.com": ("Facebook", "social"),
+    "linkedin.com": ("LinkedIn", "social"),
+    "licdn.com": ("LinkedIn", "social"),
+    "twitter.com": ("X (Twitter)", "social"),
+    "hubspot.com": ("HubSpot", "marketing"),
+    "hs-scripts.com": ("HubSpot", "marketing"),
+    "salesforce.com": ("Salesforce", "marketing"),
+    "zendesk.com": ("Zendesk", "support"),
+    "intercom.io": ("Intercom", "support"),
+    "sentry.io": ("Sentry", "monitoring"),
+    "nr-data.net": ("New Relic", "monitoring"),
+}
+
+# Second-level labels under which registrable domains have three labels (example.co.uk)
+SECOND_LEVEL_LABELS = {"co", "com", "org", "net", "gov", "ac", "edu"}
+
+TEXT_TYPES = {"document", "script", "stylesheet", "xhr", "fetch", "other"}
+TEXT_MIME = re.compile(r"(text/|javascript|json|xml|svg)")
+
+
+def site_domain(host: str) -> str:
+    """Registrable domain of a host (approximation without the public suffix list)."""
+    labels = host.lower().rstrip(".").split(".")
+    if len(labels) >= 3 and labels[-2] in SECOND_LEVEL_LABELS and len(labels[-1]) == 2:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+def third_party_vendor(host: str) -> Tuple[str, str]:
+    """(vendor, category) for a third-party host; unknown hosts use their domain."""
+    host = host.lower()
+    for suffix in sorted(KNOWN_THIRD_PARTIES, key=len, reverse=True):
+        if host == suffix or host.endswith("." + suffix):
+            return KNOWN_THIRD_PARTIES[suffix]
+    domain = site_domain(host)
+    if host.startswith(("api.", "api-")) or ".api." in host:
+        return domain, "apis"
+    return domain, "other"
+
+
+def resource_type(entry: Dict[str, Any]) -> str:
+    """Resource type from Chrome's _resourceType or the response MIME type."""
+    if entry.get("_resourceType"):
+        return entry["_resourceType"].lower()
+    mime = entry.get("response", {}).get("content", {}).get("mimeType", "").lower()
+    if "html" in mime:
+        return "document"
+    if "javascript" in mime or "ecmascript" in mime:
+        return "script"
+    if "css" in mime:
+        return "stylesheet"
+    if mime.startswith("image/"):
+        return "image"
+    if "font" in mime or mime in ("application/vnd.ms-fontobject",):
+        return "font"
+    if mime.startswith(("video/", "audio/")):
+        return "media"
+    if "json" in mime:
+        return "fetch"
+    return "other"
+
+
+def transfer_size(entry: Dict[str, Any]) -> int:
+    """Bytes on the wire (Chrome's _transferSize, else headers + body)."""
+    response = entry.get("response", {})
+    if response.get("_transferSize", -1) >= 0:
+        return response["_transferSize"]
+    return max(0, response.get("headersSize", 0)) + max(0, response.get("bodySize", 0))
+
+
+def header_map(headers: Any) -> Dict[str, str]:
+    """HAR header list as a lower-cased dict."""
+    return {h.get("name", "").lower(): h.get("value", "") for h in headers or []}
+
+
+def cache_bucket(headers: Dict[str, str]) -> str:
+    """Caching policy bucket from response headers."""
+    cache_control = headers.get("cache-control", "").lower()
+    if "no-store" in cache_control:
+        return "no-store"
+    if "immutable" in cache_control:
+        return "immutable"
+    match = re.search(r"(?:s-)?max-age=(\d+)", cache_control)
+    if match:
+        return "long" if int(match.group(1)) >= LONG_CACHE_SECONDS else "short"
+    if "no-cache" in cache_control:
+        return "revalidate"
+    if headers.get("expires"):
+        return "expires"
+    if headers.get("etag") or headers.get("last-modified"):
+        return "revalidate"
+    return "none"
+
+
+def started_ms(value: str) -> Optional[float]:
+    """HAR startedDateTime as epoch milliseconds."""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp() * 1000
+    except (ValueError, AttributeError):
+        return None
+
+
+def is_render_blocking(entry: Dict[str, Any], rtype: str, dom_content_loaded: Optional[float]) -> bool:
+    """Render-blocking stylesheet or script.
+
+    Uses Chrome's `_renderBlocking` field when present; otherwise a parser-
+    initiated stylesheet or high-priority script requested before
+    DOMContentLoaded.
+    """
+    if "_renderBlocking" in entry:
+        return entry["_renderBlocking"] in ("blocking", "in_body_parser_blocking")
+    if rtype not in ("stylesheet", "script"):
+        return False
+    if (entry.get("_initiator") or {}).get("type", "parser") != "parser":
+        return False
+    priority = entry.get("_priority", "")
+    if rtype == "script" and priority and priority not in ("VeryHigh", "High"):
+        return False
+    started = started_ms(entry.get("startedDateTime", ""))
+    if dom_content_loaded is not None and started is not None:
+        return started <= dom_content_loaded
+    return True
+
+
+def iter_har(path: Path) -> Iterator[Tuple[str, Any]]:
+    """Stream ("page", page) and ("entry", entry) items from a HAR file.
+
+    Only the top-level `pages` and `entries` arrays are decoded, one element
+    at a time.
+    """
+    decoder = json.JSONDecoder()
+    array_start = re.compile(r'"(pages|entries)"\s*:\s*\[')
+    separators = re.compile(r"[\s,]*")
+    with open(path, 'r', encoding="utf-8", errors="replace") as f:
+        buffer = ""
+        position = 0
+        current = None
+        while True:
+            if current is None:
+                match = array_start.search(buffer, position)
+                if not match:
+                    chunk = f.read(READ_CHUNK)
+                    if not chunk:
+                        return
+                    # Keep a tail in case the key spans the chunk boundary
+                    buffer = buffer[max(position, len(buffer) - 32):] + chunk
+                    position = 0
+                    continue
+                current = "page" if match.group(1) == "pages" else "entry"
+                position = match.end()
+
+            position = separators.match(buffer, position).end()
+            if position >= len(buffer):
+                chunk = f.read(READ_CHUNK)
+                if not chunk:
+                    return
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+            if buffer[position] == "]":
+                current = None
+                position += 1
+                continue
+            try:
+                value, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                chunk = f.read(READ_CHUNK)
+                if not chunk:
+                    return
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+            yield current, value
+
+
+def analyze_file(path: str) -> Dict[str, Any]:
+    """Aggregate one HAR file (worker)."""
+    by_type: Dict[str, Counter] = {}
+    by_origin: Dict[str, Counter] = {}
+    cache: Dict[str, Counter] = {}
+    uncompressed = Counter()
+    vendors: Dict[str, Dict[str, Any]] = {}
+    render_blocking: Dict[str, Dict[str, Any]] = {}
+    dom_content_loaded: Dict[str, float] = {}
+    pages = set()
+    first_party = ""
+    requests = 0
+    total_bytes = 0
+
+    try:
+        for kind, item in iter_har(Path(path)):
+            if kind == "page":
+                start = started_ms(item.get("startedDateTime", ""))
+                dom_loaded = (item.get("pageTimings") or {}).get("onContentLoad")
+                if start is not None and dom_loaded is not None and dom_loaded >= 0:
+                    dom_content_loaded[item.get("id", "")] = start + dom_loaded
+                continue
+
+            url = item.get("request", {}).get("url", "")
+            parts = urlsplit(url)
+            if parts.scheme not in ("http", "https"):
+                continue
+            rtype = resource_type(item)
+            size = transfer_size(item)
+            headers = header_map(item.get("response", {}).get("headers"))
+            pageref = item.get("pageref", path)
+            pages.add(pageref)
+            if not first_party and rtype == "document":
+                first_party = site_domain(parts.hostname or "")
+
+            requests += 1
+            total_bytes += size
+            origin = f"{parts.scheme}://{parts.netloc}"
+            by_type.setdefault(rtype, Counter()).update(requests=1, bytes=size)
+            by_origin.setdefault(origin, Counter()).update(requests=1, bytes=size)
+            bucket = cache_bucket(headers)
+            cache.setdefault(bucket, Counter()).update(requests=1, bytes=size)
+
+            mime = item.get("response", {}).get("content", {}).get("mimeType", "")
+            if (rtype in TEXT_TYPES and TEXT_MIME.search(mime) and size > 1024
+                    and not headers.get("content-encoding")):
+                uncompressed.update(requests=1, bytes=size)
+
+            if first_party and site_domain(parts.hostname or "") != first_party:
+                vendor, category = third_party_vendor(parts.hostname or "")
+                entry = vendors.setdefault(vendor, {"vendor": vendor, "category": category,
+                                                    "origins": set(), "requests": 0, "bytes": 0,
+                                                    "scripts": 0, "pages": set()})
+                entry["origins"].add(origin)
+                entry["requests"] += 1
+                entry["bytes"] += size
+                entry["scripts"] += rtype == "script"
+                entry["pages"].add(pageref)
+
+            if is_render_blocking(item, rtype, dom_content_loaded.get(pageref)):
+                key = url.split("?")[0]
+                blocking = render_blocking.setdefault(key, {"url": key, "type": rtype, "bytes": size,
+                                                            "pages": set(), "third_party": False})
+                blocking["pages"].add(pageref)
+                blocking["third_party"] = bool(first_party) and site_domain(parts.hostname or "") != first_party
+    except (OSError, ValueError):
+        pass
+
+    # Sets become counts before results cross the process boundary
+    for entry in vendors.values():
+        entry["origins"] = sorted(entry["origins"])
+        entry["pages"] = len(entry["pages"])
+    for entry in render_blocking.values():
+        entry["pages"] = len(entry["pages"])
+
+    return {
+        "pages": len(pages), "requests": requests, "bytes": total_bytes, "first_party": first_party,
+        "by_type": by_type, "by_origin": by_origin, "cache": cache, "uncompressed": uncompressed,
+        "vendors": vendors, "render_blocking": render_blocking,
+    }
+
+
+def merge_counters(target: Dict[str, Counter], source: Dict[str, Counter]) -> None:
+    """Add keyed counters from one file into the totals."""
+    for key, counter in source.items():
+        target.setdefault(key, Counter()).update(counter)
+
+
+def analyze_hars(har_dir: Path, workers: Optional[int] = None) -> Dict[str, Any]:
+    """Analyze all HAR files below a directory."""
+    files = [str(p) for p in sorted(har_dir.rglob("*.har"))]
+
+    by_type: Dict[str, Counter] = {}
+    by_origin: Dict[str, Counter] = {}
+    cache: Dict[str, Counter] = {}
+    uncompressed = Counter()
+    vendors: Dict[str, Dict[str, Any]] = {}
+    render_blocking: Dict[str, Dict[str, Any]] = {}
+    first_parties = Counter()
+    totals = Counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for result in pool.map(analyze_file, files):
+            totals.update(pages=result["pages"], requests=result["requests"], bytes=result["bytes"])
+            if result["first_party"]:
+                first_parties[result["first_party"]] += 1
+            merge_counters(by_type, result["by_type"])
+            merge_counters(by_origin, result["by_origin"])
+            merge_counters(cache, result["cache"])
+            uncompressed.update(result["uncompressed"])
+            for name, entry in result["vendors"].items():
+                if name not in vendors:
+                    vendors[name] = entry
+                    continue
+                target = vendors[name]
+                target["origins"] = sorted(set(target["origins"]) | set(entry["origins"]))
+                for key in ("requests", "bytes", "scripts", "pages"):
+                    target[key] += entry[key]
+            for key, entry in result["render_blocking"].items():
+                if key in render_blocking:
+                    render_blocking[key]["pages"] += entry["pages"]
+                else:
+                    render_blocking[key] = entry
+
+    first_party = first_parties.most_common(1)[0][0] if first_parties else ""
+    origins = []
+    for origin, counter in sorted(by_origin.items(), key=lambda o: -o[1]["bytes"])[:TOP_ORIGINS]:
+        host = urlsplit(origin).hostname or ""
+        third_party = bool(first_party) and site_domain(host) != first_party
+        vendor, category = third_party_vendor(host) if third_party else ("", "first-party")
+        origins.append({"origin": origin, "requests": counter["requests"], "bytes": counter["bytes"],
+                        "third_party": third_party, "vendor": vendor, "category": category})
+
+    return {
+        "stats": {"files": len(files), "pages": totals["pages"], "requests": totals["requests"],
+                  "bytes": totals["bytes"], "first_party": first_party},
+        "by_type": {t: dict(c) for t, c in sorted(by_type.items(), key=lambda t: -t[1]["bytes"])},
+        "cache": {b: dict(c) for b, c in sorted(cache.items(), key=lambda b: -b[1]["bytes"])},
+        "uncompressed_text": dict(uncompressed),
+        "origins": origins,
+        "third_parties": sorted(vendors.values(), key=lambda v: (-v["pages"], -v["bytes"])),
+        "render_blocking": sorted(render_blocking.values(), key=lambda r: (-r["pages"], -r["bytes"]))[:TOP_RENDER_BLOCKING],
+    }
+
+
+def main():
+    """Main execution function."""
+    if len(sys.argv) < 3:
+        print("Usage: python analyze_har.py <har_dir> <output_json>")
+        print("\nExample:")
+        print("  python analyze_har.py ./audit_data/har ./audit_data/network.json")
+        sys.exit(1)
+
+    har_dir = Path(sys.argv[1])
+    output_file = Path(sys.argv[2])
+    if not har_dir.is_dir():
+        print(f"Error: Directory not found: {har_dir}")
+        sys.exit(1)
+
+    print(f"🌐 Analyzing HAR files in: {har_dir}")
+    result = analyze_hars(har_dir)
+
+    with open(output_file, 'w') as f:
+        json.dump(result, f, indent=2)
+
+    stats = result["stats"]
+    print(f"\n✅ {stats['files']:,} HAR files, {stats['pages']:,} pages, {stats['requests']:,} requests, "
+          f"{stats['bytes'] / 1024 / 1024:.1f} MB (first party: {stats['first_party'] or 'unknown'})\n")
+    print("| Third Party | Category | Pages | Requests | KB |")
+    print("|-------------|----------|-------|----------|----|")
+    for vendor in result["third_parties"][:25]:
+        print(f"| {vendor['vendor']} | {vendor['category']} | {vendor['pages']:,} | "
+              f"{vendor['requests']:,} | {vendor['bytes'] / 1024:.0f} |")
+    print(f"\n⛔ Render-blocking resources: {len(result['render_blocking'])}")
+    print(f"📄 Saved to: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Link-Graph Analysis for the Site Structure Page
+
+This script turns the link edges of a crawl (see crawl_site.py) into the
+data behind the Site Structure page:
+
+    - click depth of every page (BFS from the start URLs)
+    - orphaned pages (no inbound links) and pages unreachable from the start
+    - hub pages (most outbound / inbound links)
+    - section sizes (first path segment, language prefixes skipped)
+    - a hierarchy of URL prefixes, collapsed to a diagram-sized tree and
+      rendered as SVG into diagrams/ (copied into the site by copy_assets())
+
+The graph is stored as compressed sparse row (CSR) arrays: one offsets
+array per node and one flat targets array, both typed `array`s, so a
+crawl with millions of links takes 8 bytes per edge and the BFS is a
+single pass over flat arrays. Redirects from the inventory are added as
+edges so links to old URLs still count; every (source, target) edge is
+counted once, also when links.tsv records the redirect as well.
+
+Usage:
+    python analyze_link_graph.py <crawl_dir> <audit_data_dir>
+
+Output:
+    <audit_data_dir>/structure.json
+    <audit_data_dir>/diagrams/site-structure.svg
+"""
+
+import heapq
+import json
+import sys
+from array import array
+from collections import Counter
+from html import escape
+from pathlib import Path
+from typing import Dict, Any, List, Tuple
+from urllib.parse import urlsplit
+
+from cluster_urls import LANGUAGE_SEGMENT
+
+
+# Pages deeper than this many clicks are hard to reach
+MAX_CLICK_DEPTH = 3
+
+# Hub pages and orphans listed in structure.json
+TOP_HUBS = 20
+TOP_ORPHANS = 200
+
+# Collapsed hierarchy: total nodes in the diagram and children shown per node
+MAX_DIAGRAM_NODES = 40
+MAX_DIAGRAM_CHILDREN = 8
+
+UNREACHED = -1
+
+
+class LinkGraph:
+    """Directed link graph in CSR form with URL <-> id mapping."""
+
+    def __init__(self):
+        self.ids: Dict[bytes, int] = {}
+        self.urls: List[bytes] = []
+        self.offsets = array('l', [0])
+        self.targets = array('l')
+
+    def node(self, url: bytes) -> int:
+        node = self.ids.get(url)
+        if node is None:
+            node = self.ids[url] = len(self.urls)
+            self.urls.append(url)
+        return node
+
+    def url(self, node: int) -> str:
+        return self.urls[node].decode("utf-8", "replace")
+
+    def build(self, runs: Dict[int, List[Tuple[int, int]]], targets: array) -> None:
+        """Assemble CSR arrays from per-source runs (start, end) into the edge targets.
+
+        Crawlers write all links of a page together, so each source usually
+        has one run and the row is copied as a whole slice. Rows from several
+        runs (e.g. an inventory redirect that links.tsv records again) keep
+        each (source, target) edge once.
+        """
+        self.offsets = array('l', [0])
+        self.targets = array('l')
+        for node in range(len(self.urls)):
+            node_runs = runs.get(node, ())
+            if len(node_runs) == 1:
+                start, end = node_runs[0]
+                self.targets.extend(targets[start:end])
+            elif node_runs:
+                seen = set()
+                for start, end in node_runs:
+                    for target in targets[start:end]:
+                        if target not in seen:
+                            seen.add(target)
+                            self.targets.append(target)
+            self.offsets.append(len(self.targets))
+
+    def out_degree(self, node: int) -> int:
+        return self.offsets[node + 1] - self.offsets[node]
+
+    def in_degrees(self) -> array:
+        degrees = array('l', bytes(8 * len(self.urls)))
+        for target, count in Counter(self.targets).items():
+            degrees[target] = count
+        return degrees
+
+    def bfs(self, starts: List[int]) -> array:
+        """Click depth from the start nodes (UNREACHED if not reachable)."""
+        depth = array('l', [UNREACHED]) * len(self.urls)
+        frontier = []
+        for start in starts:
+            depth[start] = 0
+            frontier.append(start)
+        offsets, targets = self.offsets, self.targets
+        level = 0
+        while frontier:
+            level += 1
+            next_frontier = []
+            for node in frontier:
+                for target in targets[offsets[node]:offsets[node + 1]]:
+                    if depth[target] == UNREACHED:
+                        depth[target] = level
+                        next_frontier.append(target)
+            frontier = next_frontier
+        return depth
+
+
+def load_graph(crawl_dir: Path) -> Tuple[LinkGraph, List[int], List[bool]]:
+    """Read inventory and links.tsv into a graph; return (graph, start nodes, is-page flags)."""
+    graph = LinkGraph()
+    starts = []
+    pages = []
+    runs: Dict[int, List[Tuple[int, int]]] = {}
+    targets = array('l')
+
+    with open(crawl_dir / "inventory.jsonl", 'r') as f:
+        for line in f:
+            record = json.loads(line)
+            node = graph.node(record["url"].encode())
+            if record.get("redirect_to"):
+                runs.setdefault(node, []).append((len(targets), len(targets) + 1))
+                targets.append(graph.node(record["redirect_to"].encode()))
+            if record.get("depth") == 0:
+                starts.append(node)
+            if record.get("status") == 200 and record.get("content_type", "text/html").endswith("html"):
+                pages.extend([False] * (node + 1 - len(pages)))
+                pages[node] = True
+
+    ids, node_for = graph.ids, graph.node
+    with open(crawl_dir / "links.tsv", 'rb') as f:
+        current_url = None
+        source = run_start = -1
+        seen = set()
+        for line in f:
+            source_url, _, target_url = line.rstrip(b"\n").partition(b"\t")
+            if not target_url:
+                continue
+            if source_url != current_url:
+                if source >= 0 and len(targets) > run_start:
+                    runs.setdefault(source, []).append((run_start, len(targets)))
+                current_url = source_url
+                source = node_for(source_url)
+                run_start = len(targets)
+                # Duplicate links within a page (repeated navigation) are kept once
+                seen = {source}
+            target = ids.get(target_url)
+            if target is None:
+                target = node_for(target_url)
+            if target not in seen:
+                seen.add(target)
+                targets.append(target)
+        if source >= 0 and len(targets) > run_start:
+            runs.setdefault(source, []).append((run_start, len(targets)))
+
+    pages.extend([False] * (len(graph.urls) - len(pages)))
+    graph.build(runs, targets)
+    return graph, starts, pages
+
+
+def url_path_segments(url: str) -> List[str]:
+    """Path segments of a URL, without a leading language prefix."""
+    segments = [s for s in urlsplit(url).path.split("/") if s]
+    if segments and LANGUAGE_SEGMENT.match(segments[0]):
+        segments = segments[1:]
+    return segments
+
+
+def collapse_hierarchy(urls: List[str]) -> Dict[str, Any]:
+    """URL prefix tree collapsed to at most MAX_DIAGRAM_NODES nodes.
+
+    The largest nodes are expanded first; a node shows its biggest children
+    and folds the rest into one "… N more" leaf.
+    """
+    tree: Dict[str, Any] = {"name": "/", "count": 0, "children": {}}
+    for url in urls:
+        node = tree
+        node["count"] += 1
+        for segment in url_path_segments(url)[:4]:
+            node = node["children"].setdefault(segment, {"name": segment, "count": 0, "children": {}})
+            node["count"] += 1
+
+    def shown(node: Dict[str, Any]) -> Dict[str, Any]:
+        return {"name": node["name"], "count": node["count"], "children": []}
+
+    root = shown(tree)
+    budget = MAX_DIAGRAM_NODES - 1
+    heap = [(-tree["count"], 0, tree, root)]
+    counter = 1
+    while heap and budget > 0:
+        _, _, source, target = heapq.heappop(heap)
+        children = sorted(source["children"].values(), key=lambda c: -c["count"])
+        if not children:
+            continue
+        visible = children[:min(MAX_DIAGRAM_CHILDREN, budget)]
+        budget -= len(visible)
+        for child in visible:
+            node = shown(child)
+            target["children"].append(node)
+            heapq.heappush(heap, (-child["count"], counter, child, node))
+            counter += 1
+        hidden = children[len(visible):]
+        if hidden and budget > 0:
+            budget -= 1
+            target["children"].append({"name": f"… {len(hidden)} more",
+                                       "count": sum(c["count"] for c in hidden), "children": []})
+    return root
+
+
+def render_hierarchy_svg(root: Dict[str, Any], path: Path) -> None:
+    """Render the collapsed hierarchy as a left-to-right tree diagram."""
+    box_width, box_height, column_gap, row_gap = 190, 34, 50, 10
+    boxes = []
+    lines = []
+    next_row = [0]
+
+    def place(node: Dict[str, Any], depth: int) -> float:
+        if node["children"]:
+            rows = [place(child, depth + 1) for child in node["children"]]
+            y = (rows[0] + rows[-1]) / 2
+        else:
+            y = next_row[0] * (box_height + row_gap)
+            next_row[0] += 1
+        x = depth * (box_width + column_gap)
+        boxes.append((x, y, node))
+        for child_y in (rows if node["children"] else []):
+            lines.append((x + box_width, y + box_height / 2,
+                          x + box_width + column_gap, child_y + box_height / 2))
+        return y
+
+    place(root, 0)
+    width = max(x for x, _, _ in boxes) + box_width + 20
+    height = next_row[0] * (box_height + row_gap) + 20
+
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:.0f}" height="{height:.0f}" '
+             f'viewBox="-10 -10 {width:.0f} {height:.0f}" font-family="Fira Sans, Arial, sans-serif" font-size="12">']
+    for x1, y1, x2, y2 in lines:
+        middle = (x1 + x2) / 2
+        parts.append(f'<path d="M{x1:.0f},{y1:.0f} C{middle:.0f},{y1:.0f} {middle:.0f},{y2:.0f} {x2:.0f},{y2:.0f}" '
+                     f'fill="none" stroke="#887d75" stroke-width="1"/>')
+    for x, y, node in boxes:
+        folded = node["name"].startswith("…")
+        fill = "#ebf3f0" if folded else "#ffffff"
+        label = node["name"] if len(node["name"]) <= 22 else node["name"][:21] + "…"
+        parts.append(f'<rect x="{x:.0f}" y="{y:.0f}" width="{box_width}" height="{box_height}" rx="4" '
+                     f'fill="{fill}" stroke="#006ec7"/>')
+        parts.append(f'<text x="{x + 8:.0f}" y="{y + 21:.0f}" fill="#461e7d">{escape(label)}</text>')
+        parts.append(f'<text x="{x + box_width - 8:.0f}" y="{y + 21:.0f}" text-anchor="end" '
+                     f'fill="#887d75">{node["count"]:,}</text>')
+    parts.append("</svg>")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(parts))
+
+
+def analyze_link_graph(crawl_dir: Path, audit_data_dir: Path) -> Dict[str, Any]:
+    """Compute click depth, orphans, hubs, sections and the hierarchy diagram."""
+    graph, starts, pages = load_graph(crawl_dir)
+    if not starts and graph.urls:
+        starts = [0]
+    depth = graph.bfs(starts)
+    in_degrees = graph.in_degrees()
+
+    page_nodes = [i for i, is_page in enumerate(pages) if is_page]
+    depth_histogram = Counter(depth[i] for i in page_nodes)
+    start_set = set(starts)
+    orphans = [i for i in page_nodes if in_degrees[i] == 0 and i not in start_set]
+    unreachable = [i for i in page_nodes if depth[i] == UNREACHED]
+
+    sections: Dict[str, Dict[str, Any]] = {}
+    for i in page_nodes:
+        segments = url_path_segments(graph.url(i))
+        name = f"/{segments[0]}" if segments else "/"
+        section = sections.setdefault(name, {"section": name, "pages": 0, "depth_sum": 0,
+                                             "max_depth": 0, "deep_pages": 0})
+        section["pages"] += 1
+        if depth[i] != UNREACHED:
+            section["depth_sum"] += depth[i]
+            section["max_depth"] = max(section["max_depth"], depth[i])
+            section["deep_pages"] += depth[i] > MAX_CLICK_DEPTH
+    for section in sections.values():
+        section["avg_depth"] = round(section.pop("depth_sum") / section["pages"], 2)
+
+    hubs_out = heapq.nlargest(TOP_HUBS, page_nodes, key=graph.out_degree)
+    hubs_in = heapq.nlargest(TOP_HUBS, page_nodes, key=in_degrees.__getitem__)
+
+    hierarchy = collapse_hierarchy(graph.url(i) for i in page_nodes)
+    render_hierarchy_svg(hierarchy, audit_data_dir / "diagrams" / "site-structure.svg")
+
+    reached = [depth[i] for i in page_nodes if depth[i] != UNREACHED]
+    return {
+        "stats": {
+            "pages": len(page_nodes),
+            "nodes": len(graph.urls),
+            "edges": len(graph.targets),
+            "max_depth": max(reached, default=0),
+            "avg_depth": round(sum(reached) / len(reached), 2) if reached else 0,
+            "deep_pages": sum(d > MAX_CLICK_DEPTH for d in reached),
+            "orphans": len(orphans),
+            "unreachable": len(unreachable),
+        },
+        "depth_histogram": {str(d): n for d, n in sorted(depth_histogram.items()) if d != UNREACHED},
+        "orphans": [graph.url(i) for i in orphans[:TOP_ORPHANS]],
+        "unreachable": [graph.url(i) for i in unreachable[:TOP_ORPHANS]],
+        "hubs": {
+            "outbound": [{"url": graph.url(i), "links": graph.out_degree(i)} for i in hubs_out],
+            "inbound": [{"url": graph.url(i), "links": in_degrees[i]} for i in hubs_in],
+        },
+        "sections": sorted(sections.values(), key=lambda s: -s["pages"]),
+        "hierarchy": hierarchy,
+        "diagram": "/diagrams/site-structure.svg",
+    }
+
+
+def main():
+    """Main execution function."""
+    if len(sys.argv) < 3:
+        print("Usage: python analyze_link_graph.py <crawl_dir> <audit_data_dir>")
+        print("\nExample:")
+        print("  python analyze_link_graph.py ./audit_data/crawl ./audit_data")
+        sys.exit(1)
+
+    crawl_dir = Path(sys.argv[1])
+    audit_data_dir = Path(sys.argv[2])
+    if not (crawl_dir / "links.tsv").exists() or not (crawl_dir / "inventory.jsonl").exists():
+        print(f"Error: links.tsv and inventory.jsonl not found in {crawl_dir}")
+        sys.exit(1)
+
+    print(f"🕸️  Analyzing link graph in: {crawl_dir}")
+    result = analyze_link_graph(crawl_dir, audit_data_dir)
+
+    output_file = audit_data_dir / "structure.json"
+    with open(output_file, 'w') as f:
+        json.dump(result, f, indent=2)
+
+    stats = result["stats"]
+    print(f"\n✅ {stats['pages']:,} pages, {stats['edges']:,} unique links")
+    print(f"   Click depth: avg {stats['avg_depth']}, max {stats['max_depth']}, "
+          f"{stats['deep_pages']:,} pages deeper than {MAX_CLICK_DEPTH} clicks")
+    print(f"   Orphans: {stats['orphans']:,} | Unreachable from start: {stats['unreachable']:,}\n")
+    print("| Section | Pages | Avg. Depth | Max. Depth |")
+    print("|---------|-------|------------|------------|")
+    for section in result["sections"][:15]:
+        print(f"| {section['section']} | {section['pages']:,} | {section['avg_depth']} | {section['max_depth']} |")
+    print(f"\n📄 Saved to: {output_file}")
+    print(f"🖼️  Diagram saved to: {audit_data_dir / 'diagrams' / 'site-structure.svg'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Search Index Builder for Website Audit Sites
+
+This script builds a compact, prebuilt search index from the generated
+Markdown pages so VitePress does not have to index every page during the
+Node build. The index is split into one MiniSearch-compatible JSON shard
+per section, which the adesso theme's AuditSearch component lazy-loads.
+
+Terms are tokenized, stop-word filtered and stemmed with a light
+German/English suffix stemmer. The theme applies the same stemmer to
+queries (see STEM_SUFFIXES in AuditSearch.vue).
+
+Usage:
+    python build_search_index.py <docs_dir>
+
+Output:
+    <docs_dir>/public/search/manifest.json   (section list, loaded first)
+    <docs_dir>/public/search/<section>.json  (one MiniSearch shard per section)
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Any, List, Tuple
+
+
+# Fields indexed per document (order defines MiniSearch field ids)
+SEARCH_FIELDS = ["title", "titles", "text"]
+
+# Fields returned with every search hit
+STORED_FIELDS = ["title", "titles"]
+
+# Light suffix stemmer shared by German and English; longest suffix first.
+# Keep in sync with STEM_SUFFIXES in assets/vitepress-theme/.vitepress/theme/AuditSearch.vue
+STEM_SUFFIXES = [
+    "ungen", "ations", "ation", "ingen", "ments", "ment", "heit", "keit",
+    "ung", "ing", "ies", "ern", "est", "em", "en", "er", "es", "ed", "ly", "e", "s", "n",
+]
+MIN_STEM_LENGTH = 3
+
+STOP_WORDS = {
+    # English
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "in", "is",
+    "it", "of", "on", "or", "that", "the", "this", "to", "was", "were", "will", "with",
+    # German
+    "der", "die", "das", "den", "dem", "des", "ein", "eine", "einer", "eines", "und",
+    "oder", "ist", "sind", "mit", "von", "für", "auf", "im", "in", "zu", "zum", "zur",
+    "als", "auch", "bei", "nicht", "wird", "werden", "wie",
+}
+
+TOKEN_PATTERN = re.compile(r"[0-9a-zäöüß]+", re.IGNORECASE)
+HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.*)$")
+
+
+def stem(token: str) -> str:
+    """Strip the longest known suffix, keeping at least MIN_STEM_LENGTH characters."""
+    for suffix in STEM_SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= MIN_STEM_LENGTH:
+            return token[:-len(suffix)]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Tokenize text into lowercased, stemmed terms without stop words."""
+    terms = []
+    for match in TOKEN_PATTERN.finditer(text):
+        token = match.group(0).lower()
+        if len(token) < 2 or token in STOP_WORDS:
+            continue
+        terms.append(stem(token))
+    return terms
+
+
+def slugify(heading: str) -> str:
+    """Approximate the VitePress heading anchor slug."""
+    slug = re.sub(r"[^\w\s-]", "", heading.lower()).strip()
+    return re.sub(r"[\s_]+", "-", slug)
+
+
+def strip_markdown(text: str) -> str:
+    """Remove Markdown syntax that should not be searchable."""
+    text = re.sub(r"!\[[^\]]*\]\([^)]*\)", " ", text)         # images
+    text = re.sub(r"\[([^\]]*)\]\([^)]*\)", r"\1", text)       # links -> label
+    text = re.sub(r"<[^>]+>", " ", text)                       # inline HTML / components
+    text = re.sub(r"^:::.*$", " ", text, flags=re.MULTILINE)   # custom containers
+    return re.sub(r"[*_`|>#-]+", " ", text)
+
+
+def page_route(docs_dir: Path, md_file: Path) -> str:
+    """Map a Markdown file to its VitePress route."""
+    rel = md_file.relative_to(docs_dir).with_suffix("").as_posix()
+    if rel == "index":
+        return "/"
+    if rel.endswith("/index"):
+        return "/" + rel[:-len("index")]
+    return "/" + rel
+
+
+def page_section(docs_dir: Path, md_file: Path) -> str:
+    """Section a page belongs to (first path segment, root pages go to 'main')."""
+    parts = md_file.relative_to(docs_dir).parts
+    return parts[0] if len(parts) > 1 else "main"
+
+
+def split_page(markdown: str) -> Tuple[str, List[Tuple[str, str, str]]]:
+    """Split a page into (page title, [(anchor, heading, body), ...])."""
+    # Drop frontmatter
+    if markdown.startswith("---"):
+        end = markdown.find("\n---", 3)
+        if end != -1:
+            markdown = markdown[end + 4:]
+
+    page_title = ""
+    sections = []
+    anchor, heading, body = "", "", []
+    for line in markdown.splitlines():
+        match = HEADING_PATTERN.match(line)
+        if match:
+            if heading or body:
+                sections.append((anchor, heading, "\n".join(body)))
+            heading = match.group(2).strip()
+            anchor = slugify(heading)
+            body = []
+            if not page_title and len(match.group(1)) == 1:
+                page_title = heading
+        else:
+            body.append(line)
+    if heading or body:
+        sections.append((anchor, heading, "\n".join(body)))
+
+    return page_title, sections
+
+
+def collect_documents(docs_dir: Path) -> Dict[str, List[Dict[str, Any]]]:
+    """Collect one search document per heading, grouped by section."""
+    documents: Dict[str, List[Dict[str, Any]]] = {}
+
+    for md_file in sorted(docs_dir.rglob("*.md")):
+        if any(part.startswith(".") for part in md_file.relative_to(docs_dir).parts):
+            continue
+
+        route = page_route(docs_dir, md_file)
+        page_title, sections = split_page(md_file.read_text())
+        for anchor, heading, body in sections:
+            text = strip_markdown(body)
+            if not heading and not text.strip():
+                continue
+            documents.setdefault(page_section(docs_dir, md_file), []).append({
+                "id": f"{route}#{anchor}" if anchor else route,
+                "title": heading or page_title,
+                "titles": page_title if heading != page_title else "",
+                "text": text,
+            })
+
+    return documents
+
+
+def build_shard(documents: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Serialize documents in the MiniSearch toJSON() format (serializationVersion 2)."""
+    field_ids = {field: i for i, field in enumerate(SEARCH_FIELDS)}
+    index: Dict[str, Dict[int, Dict[int, int]]] = {}
+    field_length = {}
+    stored_fields = {}
+    document_ids = {}
+    total_length = [0] * len(SEARCH_FIELDS)
+
+    for short_id, doc in enumerate(documents):
+        document_ids[short_id] = doc["id"]
+        stored_fields[short_id] = {field: doc[field] for field in STORED_FIELDS}
+        lengths = []
+        for field, field_id in field_ids.items():
+            terms = tokenize(doc[field])
+            lengths.append(len(terms))
+            total_length[field_id] += len(terms)
+            for term in terms:
+                freqs = index.setdefault(term, {}).setdefault(field_id, {})
+                freqs[short_id] = freqs.get(short_id, 0) + 1
+        field_length[short_id] = lengths
+
+    count = len(documents)
+    return {
+        "documentCount": count,
+        "nextId": count,
+        "documentIds": document_ids,
+        "fieldIds": field_ids,
+        "fieldLength": field_length,
+        "averageFieldLength": [length / count if count else 0 for length in total_length],
+        "storedFields": stored_fields,
+        "dirtCount": 0,
+        "index": [[term, index[term]] for term in sorted(index)],
+        "serializationVersion": 2,
+    }
+
+
+def build_search_index(docs_dir: Path) -> Dict[str, int]:
+    """Write one search shard per section plus a manifest; return document counts."""
+    search_dir = docs_dir / "public" / "search"
+    search_dir.mkdir(parents=True, exist_ok=True)
+
+    counts = {}
+    for section, documents in sorted(collect_documents(docs_dir).items()):
+        shard = build_shard(documents)
+        # Compact separators: shards are fetched by the browser
+        (search_dir / f"{section}.json").write_text(
+            json.dumps(shard, ensure_ascii=False, separators=(",", ":")))
+        counts[section] = len(documents)
+
+    manifest = {
+        "fields": SEARCH_FIELDS,
+        "storeFields": STORED_FIELDS,
+        "sections": [{"name": name, "documents": n, "shard": f"/search/{name}.json"}
+                     for name, n in counts.items()],
+    }
+    (search_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
+
+    return counts
+
+
+def main():
+    """Main execution function."""
+    if len(sys.argv) < 2:
+        print("Usage: python build_search_index.py <docs_dir>")
+        print("\nExample:")
+        print("  python build_search_index.py ./site-audit-docs/docs")
+        sys.exit(1)
+
+    docs_dir = Path(sys.argv[1])
+    if not docs_dir.exists():
+        print(f"Error: Directory not found: {docs_dir}")
+        sys.exit(1)
+
+    counts = build_search_index(docs_dir)
+
+    print(f"✅ Search index built: {sum(counts.values())} entries in {len(counts)} shards")
+    for section, n in counts.items():
+        print(f"   {section}: {n}")
+
+
+if __name__ == "__main__":
+    main()
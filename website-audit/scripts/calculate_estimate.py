@@ -27,15 +27,27 @@ Example entities.json:
         "nodes": 500,
         "complexity": "medium"
     },
+    "accessibility": {
+        "issues": {"critical": 4, "serious": 12, "moderate": 20, "minor": 8}
+    },
+    "media": {
+        "files": 42000,
+        "gigabytes": 180,
+        "complexity": "medium"
+    },
     "risk_level": "medium"
 }
 """
 
 import json
+import math
 import sys
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Tuple, Optional
+from dataclasses import dataclass, asdict, field
+
+from data_tables import TABLE_PREVIEW_ROWS, format_data_table
+from schedule_plan import TEAM_COMPOSITIONS, Task, schedule, team_for_hours
 
 
 @dataclass
@@ -61,6 +73,10 @@ class EstimationResult:
     multipliers_applied: Dict[str, float]
     assumptions: List[str]
     risks: List[str]
+    accessibility_hours: float = 0.0
+    media_hours: float = 0.0
+    schedule: Dict[str, Any] = field(default_factory=dict)
+    ranges: Dict[str, float] = field(default_factory=dict)  # total hours of sampled low/high inventories
 
 
 # Estimation tables (hours)
@@ -76,7 +92,8 @@ ESTIMATION_TABLE = {
     "theme_component": {"simple": 3, "medium": 6, "complex": 12},
 }
 
-# Migration effort (per 100 nodes)
+# Migration effort (setup hours, then hours per 100 nodes)
+MIGRATION_SETUP = 30
 MIGRATION_BASE = 10
 MIGRATION_MULTIPLIERS = {
     "simple": 1.0,
@@ -84,12 +101,29 @@ MIGRATION_MULTIPLIERS = {
     "complex": 3.5,
 }
 
+# Media migration: setup hours, hours per 10,000 files (scaled by
+# MIGRATION_MULTIPLIERS) and transfer/verification hours per 100 GB
+MEDIA_MIGRATION_SETUP = 8
+MEDIA_MIGRATION_BASE = 2
+MEDIA_TRANSFER_PER_100_GB = 4
+
+# Accessibility remediation (hours per unique issue, by axe-core impact)
+ACCESSIBILITY_REMEDIATION = {
+    "critical": 4,
+    "serious": 3,
+    "moderate": 1.5,
+    "minor": 0.5,
+}
+
 # Additional effort (fixed hours)
 ADDITIONAL_EFFORT = {
     "infrastructure_setup": 60,
     "training_handover": 30,
 }
 
+# Hourly rate per role without a "rates" block (read from the calculator by calculator_workbook.py)
+DEFAULT_HOURLY_RATE = 100
+
 # Buffer percentages
 BUFFER_PERCENTAGES = {
     "low": 0.15,
@@ -97,6 +131,39 @@ BUFFER_PERCENTAGES = {
     "high": 0.25,
 }
 
+# Scheduling: phase and role shares per entity type (shares run in order,
+# e.g. a paragraph's frontend templating follows its backend configuration)
+ENTITY_PLAN = {
+    "taxonomy": ("Content Model", [("backend", 1.0)]),
+    "media_type": ("Content Model", [("backend", 1.0)]),
+    "paragraph": ("Components", [("backend", 0.6), ("frontend", 0.4)]),
+    "content_type": ("Content Types", [("backend", 0.8), ("frontend", 0.2)]),
+    "view": ("Listings & Forms", [("backend", 0.7), ("frontend", 0.3)]),
+    "webform": ("Listings & Forms", [("backend", 0.8), ("frontend", 0.2)]),
+    "block": ("Listings & Forms", [("backend", 0.6), ("frontend", 0.4)]),
+    "custom_module": ("Custom Code", [("backend", 1.0)]),
+    "theme_component": ("Theme", [("frontend", 1.0)]),
+}
+
+# Scheduling phases and the phases each one waits for
+PLAN_PHASES = {
+    "Setup": [],
+    "Content Model": ["Setup"],
+    "Components": ["Setup"],
+    "Theme": ["Setup"],
+    "Custom Code": ["Setup"],
+    "Content Types": ["Content Model", "Components"],
+    "Listings & Forms": ["Content Types"],
+    "Migration": ["Content Types"],
+    "Media Migration": ["Content Model"],
+    "Accessibility": ["Theme"],
+    "Testing": ["Content Types"],
+    "Handover": ["Listings & Forms", "Custom Code", "Migration", "Media Migration", "Accessibility", "Testing"],
+}
+
+# Migration, media, accessibility and testing work is split into tasks of this size
+PLAN_CHUNK_HOURS = 40
+
 
 def calculate_entity_hours(entity: Dict[str, str], entity_type: str) -> EntityEstimate:
     """Calculate hours for a single entity."""
@@ -144,22 +211,54 @@ def calculate_base_hours(entities: Dict[str, List[Dict]]) -> Tuple[float, List[E
 
 
 def calculate_migration_hours(migration_config: Dict[str, Any]) -> float:
-    """Calculate migration effort."""
+    """Calculate migration effort.
+
+    A `types` list (per content type nodes and complexity, e.g. from
+    analyze_body_markup.py) replaces the single nodes/complexity pair.
+    """
     if not migration_config:
         return 0.0
 
-    base_setup = 30  # Base migration setup hours
-    nodes = migration_config.get("nodes", 0)
     complexity = migration_config.get("complexity", "medium").lower()
+    types = migration_config.get("types") or [{"nodes": migration_config.get("nodes", 0),
+                                               "complexity": complexity}]
+
+    node_hours = 0.0
+    for content_type in types:
+        multiplier = MIGRATION_MULTIPLIERS.get(content_type.get("complexity", complexity).lower(), 2.0)
+        hours_per_100 = MIGRATION_BASE * multiplier
+        node_hours += (content_type.get("nodes", 0) / 100) * hours_per_100
 
-    if nodes == 0:
+    if node_hours == 0:
         return 0.0
 
-    multiplier = MIGRATION_MULTIPLIERS.get(complexity, 2.0)
-    hours_per_100 = MIGRATION_BASE * multiplier
-    node_hours = (nodes / 100) * hours_per_100
+    return MIGRATION_SETUP + node_hours
 
-    return base_setup + node_hours
+
+def calculate_media_hours(media_config: Dict[str, Any]) -> float:
+    """Calculate media library migration effort from file count and volume."""
+    if not media_config:
+        return 0.0
+
+    files = media_config.get("files", 0)
+    if files == 0:
+        return 0.0
+
+    multiplier = MIGRATION_MULTIPLIERS.get(media_config.get("complexity", "medium").lower(), 2.0)
+    file_hours = (files / 10000) * MEDIA_MIGRATION_BASE * multiplier
+    transfer_hours = (media_config.get("gigabytes", 0) / 100) * MEDIA_TRANSFER_PER_100_GB
+
+    return MEDIA_MIGRATION_SETUP + file_hours + transfer_hours
+
+
+def calculate_accessibility_hours(accessibility_config: Dict[str, Any]) -> float:
+    """Calculate accessibility remediation effort from unique issue counts."""
+    if not accessibility_config:
+        return 0.0
+
+    issues = accessibility_config.get("issues", {})
+    return sum(ACCESSIBILITY_REMEDIATION.get(impact.lower(), ACCESSIBILITY_REMEDIATION["moderate"]) * count
+               for impact, count in issues.items())
 
 
 def apply_multipliers(base_hours: float, multipliers: Dict[str, float]) -> Tuple[float, Dict[str, float]]:
@@ -180,6 +279,89 @@ def calculate_pm_hours(subtotal: float, pm_percentage: float = 0.18) -> float:
     return subtotal * pm_percentage
 
 
+def calculate_cost(result: EstimationResult, rates: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Price the scheduled hours per role (project management: the remaining hours)."""
+    rates = rates or {}
+    hourly_rates = rates.get("hourly_rates", {})
+    hours = {role: usage["hours"] for role, usage in result.schedule.get("utilisation", {}).items()}
+    hours["pm"] = max(result.total_hours - sum(hours.values()), 0.0)
+    roles = {role: {"hours": round(role_hours, 1), "rate": hourly_rates.get(role, DEFAULT_HOURLY_RATE),
+                    "cost": round(role_hours * hourly_rates.get(role, DEFAULT_HOURLY_RATE), 2)}
+             for role, role_hours in hours.items()}
+    return {"currency": rates.get("currency") or "€", "total": round(sum(r["cost"] for r in roles.values()), 2),
+            "roles": roles}
+
+
+def chunk_tasks(task_id: str, name: str, role: str, hours: float, phase: str,
+                depends: List[str]) -> List[Task]:
+    """Split work into parallel tasks of at most PLAN_CHUNK_HOURS."""
+    count = max(1, math.ceil(hours / PLAN_CHUNK_HOURS))
+    return [Task(f"{task_id}-{i}", name if count == 1 else f"{name} {i + 1}/{count}", role,
+                 hours / count, phase, list(depends)) for i in range(count)]
+
+
+def build_plan_tasks(result: EstimationResult) -> List[Task]:
+    """Turn the estimate into a task DAG for schedule_plan.schedule().
+
+    Entity hours include the multipliers (except testing, which becomes QA
+    tasks) and every duration includes the buffer. Project management runs
+    alongside the team and is not scheduled.
+    """
+    buffer = 1 + (result.buffer_hours / result.subtotal if result.subtotal else 0.0)
+    testing = result.multipliers_applied.get("testing", 0.0)
+    inflate = buffer
+    if result.base_hours:
+        inflate *= 1 + (result.multiplier_hours - testing) / result.base_hours
+
+    def after(phase: str) -> List[str]:
+        return [f"done:{p}" for p in PLAN_PHASES[phase]]
+
+    work: Dict[str, List[Task]] = {phase: [] for phase in PLAN_PHASES}
+    work["Setup"].append(Task("setup", "Infrastructure Setup", "backend",
+                              ADDITIONAL_EFFORT["infrastructure_setup"] * buffer, "Setup"))
+    for i, entity in enumerate(result.entity_breakdown):
+        phase, shares = ENTITY_PLAN[entity.type]
+        previous = after(phase)
+        for k, (role, share) in enumerate(shares):
+            name = f"{entity.name} ({role})" if len(shares) > 1 else entity.name
+            task = Task(f"{entity.type}-{i}-{k}", name, role, entity.hours * share * inflate, phase, previous)
+            work[phase].append(task)
+            previous = [task.id]
+
+    for phase, setup_hours, hours in (("Migration", MIGRATION_SETUP, result.migration_hours),
+                                      ("Media Migration", MEDIA_MIGRATION_SETUP, result.media_hours)):
+        if hours:
+            task_id = phase.lower().replace(" ", "-")
+            setup = Task(f"{task_id}-setup", f"{phase} Setup", "backend", setup_hours * buffer, phase, after(phase))
+            work[phase] = [setup] + chunk_tasks(task_id, phase, "backend", (hours - setup_hours) * buffer,
+                                                phase, [setup.id])
+    if result.accessibility_hours:
+        work["Accessibility"] = chunk_tasks("accessibility", "Accessibility Remediation", "frontend",
+                                            result.accessibility_hours * buffer, "Accessibility",
+                                            after("Accessibility"))
+    if testing:
+        work["Testing"] = chunk_tasks("testing", "Testing", "qa", testing * buffer, "Testing", after("Testing"))
+    work["Handover"].append(Task("handover", "Training & Handover", "backend",
+                                 ADDITIONAL_EFFORT["training_handover"] * buffer, "Handover", after("Handover")))
+
+    tasks = []
+    for phase, phase_tasks in work.items():
+        tasks.extend(phase_tasks)
+        tasks.append(Task(f"done:{phase}", f"{phase} done", "", 0.0, phase,
+                          [task.id for task in phase_tasks] + after(phase)))
+    return tasks
+
+
+def plan_schedule(result: EstimationResult, team: Any = None) -> Dict[str, Any]:
+    """Schedule the estimate for a team (composition name or people per role)."""
+    if isinstance(team, str) and team not in TEAM_COMPOSITIONS:
+        raise ValueError(f"Unknown team composition: {team} (supported: {', '.join(TEAM_COMPOSITIONS)})")
+    name = team if isinstance(team, str) else "custom" if team else team_for_hours(result.total_hours)
+    people = TEAM_COMPOSITIONS[name] if name in TEAM_COMPOSITIONS else team
+    tasks = build_plan_tasks(result)
+    return {"name": name, **schedule(tasks, people), "tasks": [asdict(task) for task in tasks]}
+
+
 def calculate_estimate(entities_data: Dict[str, Any]) -> EstimationResult:
     """Calculate complete project estimate."""
     # Base hours
@@ -193,12 +375,19 @@ def calculate_estimate(entities_data: Dict[str, Any]) -> EstimationResult:
     migration_config = entities_data.get("migration", {})
     migration_hours = calculate_migration_hours(migration_config)
 
+    # Media library migration
+    media_hours = calculate_media_hours(entities_data.get("media", {}))
+
+    # Accessibility remediation
+    accessibility_hours = calculate_accessibility_hours(entities_data.get("accessibility", {}))
+
     # Additional effort
     infrastructure = ADDITIONAL_EFFORT["infrastructure_setup"]
     training = ADDITIONAL_EFFORT["training_handover"]
 
     # PM hours (calculated on subtotal before buffer)
-    subtotal_before_pm = base_hours + multiplier_hours + migration_hours + infrastructure + training
+    subtotal_before_pm = (base_hours + multiplier_hours + migration_hours + media_hours
+                          + accessibility_hours + infrastructure + training)
     pm_hours = calculate_pm_hours(subtotal_before_pm)
 
     additional_hours = infrastructure + training + pm_hours
@@ -222,13 +411,19 @@ def calculate_estimate(entities_data: Dict[str, Any]) -> EstimationResult:
         "No major scope changes expected"
     ])
 
+    sample = entities_data.get("sample")
+    if sample:
+        assumptions = assumptions + [
+            f"Inventories extrapolated from a {sample['pages']:,}-page sample of {sample['population']:,} pages "
+            f"({sample['confidence']:.0%} confidence ranges)"]
+
     risks = entities_data.get("risks", [
         "Requirements may evolve during development",
         "Migration complexity may be higher than assessed",
         "Third-party integrations may require additional effort"
     ])
 
-    return EstimationResult(
+    result = EstimationResult(
         base_hours=base_hours,
         multiplier_hours=multiplier_hours,
         migration_hours=migration_hours,
@@ -239,12 +434,24 @@ def calculate_estimate(entities_data: Dict[str, Any]) -> EstimationResult:
         entity_breakdown=breakdown,
         multipliers_applied=applied_multipliers,
         assumptions=assumptions,
-        risks=risks
+        risks=risks,
+        accessibility_hours=accessibility_hours,
+        media_hours=media_hours
     )
+    result.schedule = plan_schedule(result, entities_data.get("team"))
 
+    # Low/high inventories of a sampled audit (quick_scan.py) replace the estimated ones
+    for bound, overrides in (entities_data.get("ranges") or {}).items():
+        result.ranges[bound] = calculate_estimate({**entities_data, **overrides, "ranges": {}}).total_hours
+    return result
 
-def format_breakdown_table(breakdown: List[EntityEstimate]) -> str:
-    """Format entity breakdown as markdown table."""
+
+def format_breakdown_table(breakdown: List[EntityEstimate], docs_dir: Optional[Path] = None) -> str:
+    """Format entity breakdown as markdown table.
+
+    With docs_dir set (VitePress output), entity types with more rows than
+    TABLE_PREVIEW_ROWS are written as chunked JSON data tables instead.
+    """
     # Group by type
     by_type = {}
     for entity in breakdown:
@@ -255,20 +462,63 @@ def format_breakdown_table(breakdown: List[EntityEstimate]) -> str:
     output = []
     for entity_type, entities in by_type.items():
         output.append(f"\n### {entity_type.replace('_', ' ').title()}\n")
+        subtotal = sum(e.hours for e in entities)
+
+        if docs_dir is not None and len(entities) > TABLE_PREVIEW_ROWS:
+            rows = ([e.name, e.complexity.title(), f"{e.hours:.1f}"] for e in entities)
+            output.append(format_data_table(docs_dir, f"breakdown-{entity_type.replace('_', '-')}",
+                                            ["Name", "Complexity", "Hours"], rows))
+            output.append(f"**Subtotal:** {subtotal:.1f} hours")
+            continue
+
         output.append("| Name | Complexity | Hours |")
         output.append("|------|-----------|-------|")
         for entity in entities:
             output.append(f"| {entity.name} | {entity.complexity.title()} | {entity.hours:.1f} |")
 
-        subtotal = sum(e.hours for e in entities)
         output.append(f"| **Subtotal** | | **{subtotal:.1f}** |")
 
     return "\n".join(output)
 
 
+def format_schedule(plan: Dict[str, Any]) -> str:
+    """Format the scheduled timeline, utilisation and phases."""
+    team = ", ".join(f"{people} {role}" for role, people in plan["team"].items())
+    output = f"""## Timeline Projections
+
+- **Team:** {plan['name'].title()} ({team}, {plan['hours_per_week']:.0f}h/week each)
+- **Weeks:** {plan['weeks']:.1f}
+- **Months:** {plan['months']:.1f}
+- **Critical Path:** {plan['critical_path']['weeks']:.1f} weeks ({" → ".join(plan['critical_path']['tasks'])})
+
+| Role | People | Hours | Utilisation |
+|------|--------|-------|-------------|
+"""
+    for role, usage in plan["utilisation"].items():
+        output += f"| {role.title()} | {usage['people']} | {usage['hours']:.1f} | {usage['share']:.0%} |\n"
+
+    output += """
+| Phase | Start (week) | End (week) |
+|-------|--------------|------------|
+"""
+    for phase in plan["phases"]:
+        output += f"| {phase['phase']} | {phase['start_week']:.1f} | {phase['end_week']:.1f} |\n"
+    return output
+
+
 def format_estimation_report(result: EstimationResult, entities_data: Dict[str, Any]) -> str:
     """Format complete estimation report."""
     project_name = entities_data.get("project_name", "Website Audit")
+    plan = result.schedule
+    months = plan["months"]
+    confidence = entities_data.get("sample", {}).get("confidence", 0.95)
+    sample_rows = {bound: f"| Sample {bound.title()} ({confidence:.0%} CI) | {hours:.0f} | "
+                          f"{months*hours/result.total_hours:.1f} months |\n"
+                   for bound, hours in result.ranges.items()}
+    optional_rows = "".join(f"| {label} | {hours:.1f} | {(hours/result.total_hours*100):.1f}% |\n"
+                            for label, hours in (("Media Migration", result.media_hours),
+                                                 ("Accessibility Remediation", result.accessibility_hours))
+                            if hours)
 
     report = f"""# Project Estimation Report: {project_name}
 
@@ -279,32 +529,19 @@ def format_estimation_report(result: EstimationResult, entities_data: Dict[str,
 | Base Hours (Entities) | {result.base_hours:.1f} | {(result.base_hours/result.total_hours*100):.1f}% |
 | Multipliers | {result.multiplier_hours:.1f} | {(result.multiplier_hours/result.total_hours*100):.1f}% |
 | Migration | {result.migration_hours:.1f} | {(result.migration_hours/result.total_hours*100):.1f}% |
-| Additional Effort | {result.additional_hours:.1f} | {(result.additional_hours/result.total_hours*100):.1f}% |
+{optional_rows}| Additional Effort | {result.additional_hours:.1f} | {(result.additional_hours/result.total_hours*100):.1f}% |
 | Subtotal | {result.subtotal:.1f} | {(result.subtotal/result.total_hours*100):.1f}% |
 | Buffer ({entities_data.get('risk_level', 'medium').title()}) | {result.buffer_hours:.1f} | {(result.buffer_hours/result.total_hours*100):.1f}% |
 | **TOTAL ESTIMATE** | **{result.total_hours:.1f}** | **100%** |
 
-## Timeline Projections
-
-### Full-time (40h/week)
-- **Weeks:** {result.total_hours/40:.1f}
-- **Months:** {result.total_hours/160:.1f}
-
-### Realistic (30h/week)
-- **Weeks:** {result.total_hours/30:.1f}
-- **Months:** {result.total_hours/120:.1f}
-
-### Part-time (20h/week)
-- **Weeks:** {result.total_hours/20:.1f}
-- **Months:** {result.total_hours/80:.1f}
-
+{format_schedule(result.schedule)}
 ## Estimate Ranges
 
-| Confidence | Hours | Timeline (30h/week) |
+| Confidence | Hours | Timeline ({plan['name'].title()} Team) |
 |-----------|-------|---------------------|
-| Optimistic (Base) | {result.base_hours:.0f} | {result.base_hours/120:.1f} months |
-| Likely (Recommended) | {result.total_hours:.0f} | {result.total_hours/120:.1f} months |
-| Pessimistic (+30%) | {result.total_hours*1.3:.0f} | {result.total_hours*1.3/120:.1f} months |
+| Optimistic (Base) | {result.base_hours:.0f} | {months*result.base_hours/result.total_hours:.1f} months |
+{sample_rows.get("low", "")}| Likely (Recommended) | {result.total_hours:.0f} | {months:.1f} months |
+{sample_rows.get("high", "")}| Pessimistic (+30%) | {result.total_hours*1.3:.0f} | {months*1.3:.1f} months |
 
 **Recommendation:** Use the "Likely" estimate for planning and budgeting.
 
@@ -340,16 +577,51 @@ def format_estimation_report(result: EstimationResult, entities_data: Dict[str,
 """
 
     migration = entities_data.get("migration", {})
-    if migration and migration.get("nodes", 0) > 0:
+    nodes = (sum(t.get("nodes", 0) for t in migration["types"]) if migration.get("types")
+             else migration.get("nodes", 0))
+    if nodes > 0:
         report += f"""
-- **Content Volume:** {migration.get('nodes', 0):,} nodes
+- **Content Volume:** {nodes:,} nodes
 - **Complexity:** {migration.get('complexity', 'medium').title()}
-- **Base Setup:** 30 hours
+- **Base Setup:** {MIGRATION_SETUP} hours
 - **Migration Hours:** {result.migration_hours:.1f} hours
 """
+        if migration.get("types"):
+            report += "\n| Content Type | Nodes | Complexity |\n|--------------|-------|------------|\n"
+            for content_type in migration["types"]:
+                report += (f"| {content_type.get('name', 'Unknown')} | {content_type.get('nodes', 0):,} | "
+                           f"{content_type.get('complexity', 'medium').title()} |\n")
     else:
         report += "No migration required.\n"
 
+    media = entities_data.get("media", {})
+    if media.get("files", 0) > 0:
+        report += f"""
+---
+
+### Media Migration
+
+- **Files:** {media['files']:,} ({media.get('gigabytes', 0):,.1f} GB)
+- **Complexity:** {media.get('complexity', 'medium').title()}
+- **Base Setup:** {MEDIA_MIGRATION_SETUP} hours
+- **Media Migration Hours:** {result.media_hours:.1f} hours
+"""
+
+    accessibility = entities_data.get("accessibility", {})
+    if accessibility.get("issues"):
+        report += """
+---
+
+### Accessibility Remediation
+
+| Impact | Unique Issues | Hours per Issue | Hours |
+|--------|---------------|-----------------|-------|
+"""
+        for impact, count in accessibility["issues"].items():
+            hours = ACCESSIBILITY_REMEDIATION.get(impact.lower(), ACCESSIBILITY_REMEDIATION["moderate"])
+            report += f"| {impact.title()} | {count} | {hours:.1f} | {hours * count:.1f} |\n"
+        report += f"| **Total** | | | **{result.accessibility_hours:.1f}** |\n"
+
     report += f"""
 ---
 
@@ -444,8 +716,11 @@ def main():
 
     print(f"✅ Estimation complete!\n")
     print(f"📊 Total Hours: {result.total_hours:.1f}")
-    print(f"📅 Timeline (30h/week): {result.total_hours/120:.1f} months")
-    print(f"💰 Cost (€100/h): €{result.total_hours*100:,.0f}")
+    print(f"📅 Timeline ({result.schedule['name']} team): {result.schedule['weeks']:.1f} weeks "
+          f"({result.schedule['months']:.1f} months)")
+    cost = calculate_cost(result, entities_data.get("rates"))
+    rate_source = "calculator rates" if entities_data.get("rates") else f"{DEFAULT_HOURLY_RATE}/h"
+    print(f"💰 Cost ({rate_source}): {cost['currency']}{cost['total']:,.0f}")
     print(f"\n📄 Report saved to: {output_file}")
 
     # Also save JSON
@@ -456,6 +731,8 @@ def main():
             "base_hours": result.base_hours,
             "multiplier_hours": result.multiplier_hours,
             "migration_hours": result.migration_hours,
+            "media_hours": result.media_hours,
+            "accessibility_hours": result.accessibility_hours,
             "additional_hours": result.additional_hours,
             "buffer_hours": result.buffer_hours,
         },
@@ -463,6 +740,9 @@ def main():
         "multipliers": result.multipliers_applied,
         "assumptions": result.assumptions,
         "risks": result.risks,
+        "schedule": result.schedule,
+        "ranges": result.ranges,
+        "cost": cost,
     }
     with open(json_output, 'w') as f:
         json.dump(json_data, f, indent=2)
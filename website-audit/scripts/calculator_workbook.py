@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+adesso Calculator Workbook Exchange
+
+Commercial offers are calculated in the adesso calculator workbook
+("adesso calculator 2.01 - Default Template CMS 1.xlsm" in the repository
+root). This script fills a copy of the template from an estimate and reads
+the template's rate sheet back for calculate_estimate.py.
+
+The .xlsm package is patched directly instead of being loaded into a
+spreadsheet library: every part except the few worksheets that change
+(VBA project, ribbon customization, pivot tables, charts, data pool) is
+copied unchanged, so the macros keep working. The unchanged parts are
+compressed once per process and copied as bytes; changed worksheets are
+rewritten in one regex pass per sheet and appended. Values are written
+as numbers and inline strings (the shared string table stays untouched),
+formula cells are never overwritten, and the workbook is flagged to
+recalculate when opened. Portfolio exports run on a process pool that
+loads the template once per worker.
+
+Export (effort in person days of HOURS_PER_DAY hours):
+    Start           proposal title and customer
+    Features        one row per entity type and complexity: development
+                    (entity hours with multipliers) and test effort, plus
+                    accessibility remediation
+    Project tasks   infrastructure setup, data migration (content and
+                    media), customer training
+    Project risks   buffer for unknowns, plus the estimate's risk list
+Project management is left to the calculator's own formula.
+
+Usage:
+    python calculator_workbook.py export <template.xlsm> <output_dir> <entities_json> [...]
+    python calculator_workbook.py rates <workbook.xlsm> [output_json]
+
+Output:
+    export: <output_dir>/<entities name>.xlsm per entities file
+    rates:  {"currency", "roles": [...], "hourly_rates": {"backend", "frontend", "qa", "pm"}}
+            (merge as "rates" into entities.json; calculate_estimate.py prices the hours with it)
+"""
+
+import io
+import json
+import os
+import re
+import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+from xml.etree import ElementTree as ET
+from xml.sax.saxutils import escape
+
+from calculate_estimate import ADDITIONAL_EFFORT, ESTIMATION_TABLE, EstimationResult, calculate_estimate
+
+
+# Productive hours per person day in the calculator
+HOURS_PER_DAY = 8
+
+# Worksheet rows the export may fill (the template's first/last marker rows excluded)
+FEATURE_ROWS = range(11, 56)
+RISK_ROWS = range(8, 33)
+
+# Feature columns: ID, group, title, description, assumptions, development and test effort
+FEATURE_COLUMNS = {"id": "A", "group": "C", "title": "E", "description": "G", "assumptions": "H",
+                   "development": "S", "test": "T"}
+
+# Project task effort cells (column J) per estimate item
+TASK_CELLS = {
+    "infrastructure_setup": "J18",  # P-50 Aufbau Entwicklungsumgebung
+    "training_handover": "J27",     # P-130 Kundenschulung
+    "migration": "J29",             # P-150 Datenmigration
+}
+
+# Start sheet cells
+TITLE_CELL = "B8"
+CUSTOMER_CELL = "B10"
+
+# Calculator project role used to price each estimator role
+ROLE_MAPPING = {
+    "backend": "Developer",
+    "frontend": "Developer",
+    "qa": "Test Engineer",
+    "pm": "Project manager",
+}
+
+# First row of the rate sheet (Project roles) and its columns
+RATE_FIRST_ROW = 9
+RATE_COLUMNS = {"A": "role_id", "B": "role", "E": "sub_role", "F": "share", "L": "seniority",
+                "P": "daily_cost", "R": "daily_rate"}
+
+NAMESPACE = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+RELATIONSHIP = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+
+ROW_PATTERN = re.compile(r'<row r="(\d+)"([^>]*?)(?:/>|>(.*?)</row>)', re.DOTALL)
+CELL_PATTERN = re.compile(r'<c r="([A-Z]+)(\d+)"([^>]*?)(?:/>|>(.*?)</c>)', re.DOTALL)
+STYLE_PATTERN = re.compile(r'\ss="\d+"')
+SPANS_PATTERN = re.compile(r'\sspans="[^"]*"')
+CALC_PATTERN = re.compile(r'<calcPr\b([^>]*?)/>')
+FULL_CALC_PATTERN = re.compile(r'\sfullCalcOnLoad="[^"]*"')
+CURRENCY_PATTERN = re.compile(r"\[(.+?)\]")
+
+
+def column_index(column: str) -> int:
+    """1-based index of a column name (A, B, ..., AA)."""
+    index = 0
+    for char in column:
+        index = index * 26 + ord(char) - 64
+    return index
+
+
+def cell_xml(ref: str, style: str, value: Any) -> str:
+    """Cell element for a number, an inline string or an empty value."""
+    if value is None or value == "":
+        return f'<c r="{ref}"{style}/>'
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return f'<c r="{ref}"{style}><v>{round(value, 4)}</v></c>'
+    return f'<c r="{ref}"{style} t="inlineStr"><is><t xml:space="preserve">{escape(str(value))}</t></is></c>'
+
+
+def patch_row(number: int, attributes: str, body: str, values: Dict[str, Any]) -> str:
+    """Row element with some cells replaced (cell styles kept)."""
+    cells = {}
+    for match in CELL_PATTERN.finditer(body):
+        cells[match.group(1)] = match
+    output = {column: match.group(0) for column, match in cells.items()}
+    for column, value in values.items():
+        existing = cells.get(column)
+        if existing and existing.group(4) and "<f" in existing.group(4):
+            raise ValueError(f"Refusing to overwrite formula cell {column}{number}")
+        style = STYLE_PATTERN.search(existing.group(3)).group(0) if existing and STYLE_PATTERN.search(
+            existing.group(3)) else ""
+        output[column] = cell_xml(f"{column}{number}", style, value)
+    row = "".join(output[column] for column in sorted(output, key=column_index))
+    return f'<row r="{number}"{SPANS_PATTERN.sub("", attributes)}>{row}</row>'
+
+
+def patch_sheet(xml: str, values: Dict[str, Any]) -> str:
+    """Apply {cell ref: value} to a worksheet in one pass over its rows."""
+    rows: Dict[int, Dict[str, Any]] = {}
+    for ref, value in values.items():
+        column, number = re.match(r"([A-Z]+)(\d+)$", ref).groups()
+        rows.setdefault(int(number), {})[column] = value
+
+    def replace(match: re.Match) -> str:
+        number = int(match.group(1))
+        if number not in rows:
+            return match.group(0)
+        return patch_row(number, match.group(2), match.group(3) or "", rows.pop(number))
+
+    xml = ROW_PATTERN.sub(replace, xml)
+    # Rows the template does not contain yet, inserted in order
+    for number in sorted(rows):
+        following = next((m for m in ROW_PATTERN.finditer(xml) if int(m.group(1)) > number), None)
+        position = following.start() if following else xml.index("</sheetData>")
+        xml = xml[:position] + patch_row(number, "", "", rows[number]) + xml[position:]
+    return xml
+
+
+@lru_cache(maxsize=4)
+def load_template(template: str) -> Tuple[List[zipfile.ZipInfo], Dict[str, bytes], Dict[str, str]]:
+    """Package entries, their content and the worksheet part of every sheet name (cached per process)."""
+    with zipfile.ZipFile(template) as package:
+        entries = package.infolist()
+        content = {entry.filename: package.read(entry) for entry in entries}
+    workbook = ET.fromstring(content["xl/workbook.xml"])
+    targets = {rel.get("Id"): rel.get("Target") for rel in ET.fromstring(content["xl/_rels/workbook.xml.rels"])}
+    sheets = {}
+    for sheet in workbook.iter(f"{NAMESPACE}sheet"):
+        target = targets[sheet.get(RELATIONSHIP)].lstrip("/")
+        sheets[sheet.get("name")] = target if target.startswith("xl/") else f"xl/{target}"
+    return entries, content, sheets
+
+
+@lru_cache(maxsize=4)
+def base_package(template: str, excluded: Tuple[str, ...]) -> bytes:
+    """Template package without the excluded parts (cached per process)."""
+    entries, content, _ = load_template(template)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as package:
+        for entry in entries:
+            if entry.filename not in excluded:
+                package.writestr(entry, content[entry.filename], compress_type=entry.compress_type)
+    return buffer.getvalue()
+
+
+def feature_rows(result: EstimationResult) -> List[Dict[str, Any]]:
+    """Feature rows: entities grouped by type and complexity, plus accessibility remediation."""
+    testing = result.multipliers_applied.get("testing", 0.0)
+    development_factor = 1 + (result.multiplier_hours - testing) / result.base_hours if result.base_hours else 1.0
+    test_factor = testing / result.base_hours if result.base_hours else 0.0
+
+    groups: Dict[Tuple[str, str], List] = {}
+    for entity in result.entity_breakdown:
+        groups.setdefault((entity.type, entity.complexity), []).append(entity)
+    order = list(ESTIMATION_TABLE)
+    rows = []
+    for (entity_type, complexity), entities in sorted(
+            groups.items(), key=lambda g: (order.index(g[0][0]) if g[0][0] in order else len(order), g[0][1])):
+        hours = sum(e.hours for e in entities)
+        group = entity_type.replace("_", " ").title()
+        rows.append({
+            "group": group,
+            "title": f"{group}s ({complexity})",
+            "description": ", ".join(e.name for e in entities)[:1000],
+            "assumptions": f"{len(entities)} × {entities[0].hours:g} h ({complexity})",
+            "development": hours * development_factor / HOURS_PER_DAY,
+            "test": hours * test_factor / HOURS_PER_DAY,
+        })
+    if result.accessibility_hours:
+        rows.append({"group": "Frontend", "title": "Accessibility remediation", "description": "",
+                     "assumptions": "Unique axe-core issues by impact",
+                     "development": result.accessibility_hours / HOURS_PER_DAY, "test": 0.0})
+    return rows
+
+
+def workbook_values(result: EstimationResult, entities_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Cell values per worksheet name."""
+    rows = feature_rows(result)
+    if len(rows) > len(FEATURE_ROWS):
+        raise ValueError(f"{len(rows)} feature rows do not fit the template ({len(FEATURE_ROWS)} rows)")
+    features: Dict[str, Any] = {}
+    for i, number in enumerate(FEATURE_ROWS):
+        row = rows[i] if i < len(rows) else {}
+        for key, column in FEATURE_COLUMNS.items():
+            value = row.get(key)
+            if key == "id" and row:
+                value = f"F-{(i + 1) * 10}"
+            elif key in ("development", "test") and value is not None:
+                value = round(value, 2)
+            features[f"{column}{number}"] = value
+
+    start = {TITLE_CELL: entities_data.get("project_name", "Website Relaunch")}
+    if entities_data.get("customer"):
+        start[CUSTOMER_CELL] = entities_data["customer"]
+
+    tasks = {
+        TASK_CELLS["infrastructure_setup"]: round(ADDITIONAL_EFFORT["infrastructure_setup"] / HOURS_PER_DAY, 2),
+        TASK_CELLS["training_handover"]: round(ADDITIONAL_EFFORT["training_handover"] / HOURS_PER_DAY, 2),
+        TASK_CELLS["migration"]: round((result.migration_hours + result.media_hours) / HOURS_PER_DAY, 2),
+    }
+
+    risk_level = entities_data.get("risk_level", "medium").lower()
+    risk_rows = [("Buffer for unknowns", f"{risk_level.title()} risk level", 1, result.buffer_hours / HOURS_PER_DAY)]
+    risk_rows += [(risk, "", None, None) for risk in result.risks]
+    risks: Dict[str, Any] = {}
+    for i, number in enumerate(RISK_ROWS):
+        title, description, likelihood, impact = risk_rows[i] if i < len(risk_rows) else ("", "", None, None)
+        risks.update({f"A{number}": f"R-{(i + 1) * 10}" if title else None, f"B{number}": title,
+                      f"C{number}": description, f"E{number}": likelihood,
+                      f"F{number}": round(impact, 2) if impact is not None else None})
+
+    return {"Start": start, "Features": features, "Project tasks": tasks, "Project risks": risks}
+
+
+def export_workbook(result: EstimationResult, entities_data: Dict[str, Any], template: Path, output: Path) -> Path:
+    """Write a filled copy of the calculator template."""
+    entries, content, sheets = load_template(str(template))
+    patched = {sheets[name]: patch_sheet(content[sheets[name]].decode("utf-8"), values).encode("utf-8")
+               for name, values in workbook_values(result, entities_data).items()}
+    # Cached formula results are stale now: recalculate when the workbook is opened
+    workbook = content["xl/workbook.xml"].decode("utf-8")
+    patched["xl/workbook.xml"] = CALC_PATTERN.sub(
+        lambda m: f'<calcPr{FULL_CALC_PATTERN.sub("", m.group(1))} fullCalcOnLoad="1"/>', workbook, count=1
+    ).encode("utf-8")
+
+    # Unchanged parts are compressed once per process; only the patched parts are compressed per export
+    output.write_bytes(base_package(str(template), tuple(sorted(patched))))
+    with zipfile.ZipFile(output, "a") as package:
+        for entry in entries:
+            if entry.filename in patched:
+                package.writestr(entry, patched[entry.filename], compress_type=entry.compress_type)
+    return output
+
+
+def export_entities(entities_file: str, template: str, output_dir: str) -> Dict[str, Any]:
+    """Estimate one entities.json and export it to the calculator (worker)."""
+    with open(entities_file, 'r') as f:
+        entities_data = json.load(f)
+    result = calculate_estimate(entities_data)
+    name = Path(entities_file).stem if Path(entities_file).stem != "entities" else Path(entities_file).parent.name
+    output = export_workbook(result, entities_data, Path(template), Path(output_dir) / f"{name}.xlsm")
+    return {"project": entities_data.get("project_name", name), "hours": result.total_hours,
+            "days": result.total_hours / HOURS_PER_DAY, "file": str(output)}
+
+
+def export_portfolio(entities_files: List[str], template: Path, output_dir: Path,
+                     workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Export many estimates in parallel (the template is loaded once per worker)."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    workers = min(workers or os.cpu_count() or 1, len(entities_files))
+    if workers <= 1:
+        return [export_entities(f, str(template), str(output_dir)) for f in entities_files]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(export_entities, entities_files, [str(template)] * len(entities_files),
+                             [str(output_dir)] * len(entities_files)))
+
+
+def shared_strings(package: zipfile.ZipFile) -> List[str]:
+    """Shared string table of a workbook."""
+    try:
+        root = ET.fromstring(package.read("xl/sharedStrings.xml"))
+    except KeyError:
+        return []
+    return ["".join(t.text or "" for t in item.iter(f"{NAMESPACE}t")) for item in root]
+
+
+def cell_value(cell: ET.Element, strings: List[str]) -> Any:
+    """Value of a cell by its type (None for empty cells, e.g. formulas returning "")."""
+    cell_type = cell.get("t", "n")
+    if cell_type == "inlineStr":
+        inline = cell.find(f"{NAMESPACE}is")
+        return "".join(t.text or "" for t in inline.iter(f"{NAMESPACE}t")) if inline is not None else None
+    value = cell.find(f"{NAMESPACE}v")
+    if value is None or value.text is None:
+        return None
+    if cell_type == "s":
+        return strings[int(value.text)]
+    if cell_type in ("str", "e"):
+        return value.text
+    if cell_type == "b":
+        return value.text == "1"
+    try:
+        return float(value.text)
+    except (TypeError, ValueError):
+        return value.text
+
+
+def sheet_cells(package: zipfile.ZipFile, part: str, strings: List[str], first_row: int = 1):
+    """Yield (row number, {column: value}) of a worksheet, streamed (empty cells omitted)."""
+    with package.open(part) as f:
+        for _, element in ET.iterparse(f):
+            if element.tag != f"{NAMESPACE}row":
+                continue
+            number = int(element.get("r"))
+            if number >= first_row:
+                values = {}
+                for cell in element.iter(f"{NAMESPACE}c"):
+                    value = cell_value(cell, strings)
+                    if value is not None:
+                        values[re.match(r"[A-Z]+", cell.get("r")).group(0)] = value
+                yield number, values
+            element.clear()
+
+
+def read_rate_sheet(workbook: Path) -> Dict[str, Any]:
+    """Daily rates and costs per project role, and hourly rates per estimator role."""
+    _, _, sheets = load_template(str(workbook))
+    with zipfile.ZipFile(workbook) as package:
+        strings = shared_strings(package)
+        roles = []
+        currency = ""
+        for number, values in sheet_cells(package, sheets["Project roles"], strings):
+            if number == RATE_FIRST_ROW - 2:
+                match = CURRENCY_PATTERN.search(str(values.get("R", "")))
+                currency = match.group(1) if match else ""
+            if number < RATE_FIRST_ROW:
+                continue
+            if not isinstance(values.get("A"), float):
+                break  # "Last row" marker
+            roles.append({key: values.get(column, "") for column, key in RATE_COLUMNS.items()})
+
+    hourly_rates = {}
+    for estimator_role, project_role in ROLE_MAPPING.items():
+        matching = [r for r in roles if r["role"] == project_role and isinstance(r["daily_rate"], float)]
+        shares = sum(r["share"] for r in matching if isinstance(r["share"], float))
+        if not matching:
+            continue
+        if shares:
+            daily = sum(r["daily_rate"] * r["share"] for r in matching if isinstance(r["share"], float)) / shares
+        else:
+            daily = sum(r["daily_rate"] for r in matching) / len(matching)
+        hourly_rates[estimator_role] = round(daily / HOURS_PER_DAY, 2)
+    return {"currency": currency, "roles": roles, "hourly_rates": hourly_rates}
+
+
+def main():
+    """Main execution function."""
+    if len(sys.argv) < 3 or sys.argv[1] not in ("export", "rates") or (sys.argv[1] == "export" and len(sys.argv) < 5):
+        print("Usage: python calculator_workbook.py export <template.xlsm> <output_dir> <entities_json> [...]")
+        print("       python calculator_workbook.py rates <workbook.xlsm> [output_json]")
+        print("\nExample:")
+        print('  python calculator_workbook.py export "../adesso calculator 2.01 - Default Template CMS 1.xlsm" '
+              "./audit_data/offers ./audit_data/entities.json")
+        sys.exit(1)
+
+    workbook = Path(sys.argv[2])
+    if not workbook.exists():
+        print(f"Error: File not found: {workbook}")
+        sys.exit(1)
+
+    if sys.argv[1] == "rates":
+        output_file = Path(sys.argv[3]) if len(sys.argv) > 3 else workbook.with_name("rates.json")
+        print(f"💶 Reading rate sheet from: {workbook}")
+        rates = read_rate_sheet(workbook)
+        with open(output_file, 'w') as f:
+            json.dump(rates, f, indent=2)
+        print(f"\n✅ {len(rates['roles'])} project roles read\n")
+        print(f"| Estimator Role | Calculator Role | Hourly Rate ({rates['currency']}) |")
+        print("|----------------|-----------------|-------------|")
+        for role, rate in rates["hourly_rates"].items():
+            print(f"| {role} | {ROLE_MAPPING[role]} | {rate:.2f} |")
+        print(f"\n📄 Saved to: {output_file}")
+        return
+
+    output_dir = Path(sys.argv[3])
+    entities_files = sys.argv[4:]
+    missing = [f for f in entities_files if not Path(f).exists()]
+    if missing:
+        print(f"Error: File not found: {missing[0]}")
+        sys.exit(1)
+
+    print(f"📊 Exporting {len(entities_files)} estimate(s) to the calculator template")
+    exports = export_portfolio(entities_files, workbook, output_dir)
+
+    print(f"\n✅ {len(exports)} workbook(s) written\n")
+    print("| Project | Hours | Person Days | Workbook |")
+    print("|---------|-------|-------------|----------|")
+    for export in exports:
+        print(f"| {export['project']} | {export['hours']:.1f} | {export['days']:.1f} | {Path(export['file']).name} |")
+    print(f"\n📄 Saved to: {output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+"""
+URL Clustering into Content Types
+
+This script groups a site's URLs into content types for calculate_estimate.py
+instead of guessing `content_types` and `migration.nodes` by hand.
+
+Two signals are combined:
+    1. URL pattern - URLs are streamed into a path-segment trie. IDs, dates
+       and hashes are normalized up front; any node whose fan-out exceeds
+       MAX_FANOUT collapses its children into a single `*` wildcard, so the
+       trie stays small no matter how many URLs come in. A node budget
+       (derived from the memory budget) collapses the widest nodes first
+       when it is exceeded.
+    2. DOM template signature - for crawled pages with stored HTML, a sample
+       of each cluster is reduced to a tag/class skeleton hash on a process
+       pool. Clusters sharing a template are reported together, and the
+       skeleton size drives the suggested complexity.
+
+Usage:
+    python cluster_urls.py <urls> <output_json> [memory_mb]
+
+Input formats:
+    inventory.jsonl  crawl_site.py or warc_reader.py output (uses stored HTML for template signatures)
+    sitemap.xml      XML sitemap (<loc> entries, streamed)
+    urls.txt         one URL per line
+
+Output:
+    {"content_types": [{"name", "complexity", "pattern", "nodes", ...}],
+     "migration": {"nodes": N}}
+    The content_types / migration blocks can be merged into entities.json.
+"""
+
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, List, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+from warc_reader import read_page
+
+
+# Children per trie node before they collapse into a wildcard
+MAX_FANOUT = 25
+
+# Approximate memory per trie node (dict + object overhead)
+BYTES_PER_NODE = 600
+
+# Patterns with fewer URLs are folded into the generic "Page" content type
+MIN_CLUSTER_NODES = 5
+
+# Pages per cluster whose HTML is analyzed for template signatures
+SAMPLE_PER_CLUSTER = 40
+
+# Start tags read per page for the template skeleton
+SKELETON_TAGS = 600
+
+# Distinct skeleton tokens per complexity level (upper bounds)
+TEMPLATE_COMPLEXITY = [
+    (60, "simple"),
+    (160, "medium"),
+]
+
+# Language prefixes are kept in patterns but ignored for naming and grouping
+LANGUAGE_SEGMENT = re.compile(r"^[a-z]{2}([-_][a-z]{2})?$")
+
+SEGMENT_RULES = [
+    (re.compile(r"^(19|20)\d{2}(-\d{2}(-\d{2})?)?$"), "{date}"),
+    (re.compile(r"^\d+$"), "{id}"),
+    (re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.I), "{uuid}"),
+    (re.compile(r"^[0-9a-f]{16,}$", re.I), "{hash}"),
+    (re.compile(r"^.*-\d{3,}$"), "{slug-id}"),
+]
+
+TAG_PATTERN = re.compile(rb"<([a-zA-Z][a-zA-Z0-9-]*)([^>]*)>")
+CLASS_PATTERN = re.compile(rb"""class\s*=\s*["']([^"']*)""", re.IGNORECASE)
+BODY_PATTERN = re.compile(rb"<body[^>]*>", re.IGNORECASE)
+
+
+@dataclass
+class TrieNode:
+    """Path-segment trie node."""
+    children: Dict[str, "TrieNode"] = field(default_factory=dict)
+    count: int = 0
+    samples: List[Tuple[str, str]] = field(default_factory=list)  # (url, html file)
+
+
+class UrlTrie:
+    """Path-segment trie that generalizes wide levels into wildcards."""
+
+    def __init__(self, max_nodes: int, max_fanout: int = MAX_FANOUT,
+                 sample_size: int = SAMPLE_PER_CLUSTER):
+        self.root = TrieNode()
+        self.max_nodes = max_nodes
+        self.max_fanout = max_fanout
+        self.sample_size = sample_size
+        self.nodes = 1
+        self.total = 0
+        self.rng = random.Random(42)
+
+    def insert(self, segments: List[str], url: str, html_file: str = "") -> None:
+        """Add one URL (as normalized segments)."""
+        node = self.root
+        for segment in segments:
+            if "*" in node.children:
+                node = node.children["*"]
+                continue
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = TrieNode()
+                self.nodes += 1
+                if len(node.children) > self.max_fanout:
+                    child = self.collapse(node)
+            node = child
+
+        node.count += 1
+        self.total += 1
+        # Reservoir sample of pages for template analysis
+        if len(node.samples) < self.sample_size:
+            node.samples.append((url, html_file))
+        else:
+            slot = self.rng.randrange(node.count)
+            if slot < self.sample_size:
+                node.samples[slot] = (url, html_file)
+
+        if self.nodes > self.max_nodes:
+            self.enforce_budget()
+
+    def collapse(self, node: TrieNode) -> TrieNode:
+        """Merge all children of a node into one wildcard child."""
+        before = self.count_nodes(node)
+        wildcard = TrieNode()
+        for child in node.children.values():
+            self.merge(wildcard, child)
+        self.generalize(wildcard)
+        node.children = {"*": wildcard}
+        self.nodes += 1 + self.count_nodes(wildcard) - before
+        return wildcard
+
+    def merge(self, target: TrieNode, source: TrieNode) -> None:
+        """Merge source subtree into target (counts, samples, children)."""
+        target.count += source.count
+        target.samples = (target.samples + source.samples)[:self.sample_size]
+        for segment, child in source.children.items():
+            if segment in target.children:
+                self.merge(target.children[segment], child)
+            else:
+                target.children[segment] = child
+
+    def generalize(self, node: TrieNode) -> None:
+        """Re-apply the fan-out rule below a freshly merged subtree."""
+        if len(node.children) > self.max_fanout or ("*" in node.children and len(node.children) > 1):
+            wildcard = TrieNode()
+            for child in node.children.values():
+                self.merge(wildcard, child)
+            node.children = {"*": wildcard}
+        for child in node.children.values():
+            self.generalize(child)
+
+    def count_nodes(self, node: TrieNode) -> int:
+        """Nodes in a subtree (excluding the node itself)."""
+        return sum(1 + self.count_nodes(child) for child in node.children.values())
+
+    def enforce_budget(self) -> None:
+        """Collapse the widest non-wildcard nodes until 80% of the node budget is free."""
+        while self.nodes > self.max_nodes * 0.8:
+            widest, width = None, 1
+            stack = [self.root]
+            while stack:
+                node = stack.pop()
+                if "*" not in node.children and len(node.children) > width:
+                    widest, width = node, len(node.children)
+                stack.extend(node.children.values())
+            if widest is None:
+                break
+            self.collapse(widest)
+
+    def patterns(self) -> Iterator[Tuple[str, TrieNode]]:
+        """Yield (pattern, node) for every node that terminates URLs."""
+        stack = [("", self.root)]
+        while stack:
+            prefix, node = stack.pop()
+            if node.count:
+                yield prefix or "/", node
+            for segment, child in node.children.items():
+                stack.append((f"{prefix}/{segment}", child))
+
+
+def normalize_segments(url: str) -> List[str]:
+    """Split a URL path into segments with IDs, dates and hashes generalized."""
+    path = urlsplit(url).path
+    segments = []
+    for segment in path.strip("/").split("/"):
+        if not segment:
+            continue
+        segment = segment.lower()
+        for pattern, replacement in SEGMENT_RULES:
+            if pattern.match(segment):
+                segment = replacement
+                break
+        segments.append(segment)
+    return segments
+
+
+def read_urls(path: Path, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[str, str]]:
+    """Stream (url, html_file) pairs from an inventory, sitemap or URL list.
+
+    For line-based inputs, start/end select a byte range (a shard); lines are
+    attributed to the shard in which they start.
+    """
+    if path.suffix == ".xml":
+        for _, element in ET.iterparse(path):
+            if element.tag.endswith("loc") and element.text:
+                yield element.text.strip(), ""
+            element.clear()
+        return
+
+    base = path.parent
+    with open(path, 'rb') as f:
+        if start:
+            f.seek(start - 1)
+            f.readline()  # skip the line that began in the previous shard
+        while end is None or f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            if path.suffix == ".jsonl":
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record.get("status") == 200 and record.get("content_type", "").endswith("html"):
+                    html_file = str(base / record["file"]) if record.get("file") else ""
+                    yield record["url"], html_file
+            else:
+                url = line.decode("utf-8", "replace").strip()
+                if url and not url.startswith("#"):
+                    yield url, ""
+
+
+def shard_ranges(path: Path, shards: int) -> List[Tuple[int, Optional[int]]]:
+    """Split a line-based file into byte ranges (XML sitemaps are one shard)."""
+    if path.suffix == ".xml" or shards <= 1:
+        return [(0, None)]
+    size = path.stat().st_size
+    step = max(1, size // shards)
+    return [(i * step, None if i == shards - 1 else (i + 1) * step) for i in range(shards)]
+
+
+def build_shard_trie(path: Path, start: int, end: Optional[int], max_nodes: int) -> UrlTrie:
+    """Build the URL trie for one shard of the input (runs in a worker process)."""
+    trie = UrlTrie(max_nodes=max_nodes)
+    for url, html_file in read_urls(path, start, end):
+        trie.insert(normalize_segments(url), url, html_file)
+    return trie
+
+
+def merge_tries(tries: List[UrlTrie], max_nodes: int) -> UrlTrie:
+    """Merge shard tries and re-apply the fan-out rule and node budget."""
+    merged = UrlTrie(max_nodes=max_nodes)
+    for trie in tries:
+        merged.merge(merged.root, trie.root)
+        merged.total += trie.total
+    merged.generalize(merged.root)
+    merged.nodes = 1 + merged.count_nodes(merged.root)
+    if merged.nodes > max_nodes:
+        merged.enforce_budget()
+    return merged
+
+
+def template_signature(html_file: str) -> Optional[Tuple[str, int]]:
+    """Hash the tag/class skeleton of a page body; return (signature, distinct tokens)."""
+    try:
+        html = read_page(html_file)
+    except OSError:
+        return None
+
+    body = BODY_PATTERN.search(html)
+    start = body.end() if body else 0
+    tokens = []
+    previous = None
+    for match in TAG_PATTERN.finditer(html, start):
+        tag = match.group(1).lower()
+        if tag in (b"script", b"br", b"img", b"span", b"a", b"svg", b"path", b"source"):
+            continue
+        classes = CLASS_PATTERN.search(match.group(2))
+        first_class = classes.group(1).split()[0] if classes and classes.group(1).split() else b""
+        # Drop BEM modifiers and numeric suffixes so content variants share a skeleton
+        first_class = re.sub(rb"(--[\w-]+|\d+)$", b"", first_class)
+        token = tag + b"." + first_class
+        if token != previous:  # collapse repeated siblings (list items, cards)
+            tokens.append(token)
+            previous = token
+        if len(tokens) >= SKELETON_TAGS:
+            break
+
+    return hashlib.sha1(b"|".join(tokens)).hexdigest()[:12], len(set(tokens))
+
+
+def literal_segments(pattern: str) -> List[str]:
+    """Literal (non-placeholder, non-language) segments of a pattern."""
+    return [s for s in pattern.strip("/").split("/")
+            if s and s != "*" and not s.startswith("{") and not LANGUAGE_SEGMENT.match(s)]
+
+
+def content_type_name(pattern: str) -> str:
+    """Readable content type name from a URL pattern."""
+    if pattern == "/":
+        return "Homepage"
+    literals = literal_segments(pattern)
+    if not literals:
+        return "Page"
+    return literals[0].replace("-", " ").replace("_", " ").title()
+
+
+def pattern_shape(pattern: str) -> Tuple[str, ...]:
+    """Pattern skeleton: placeholders kept, literals after the first reduced to 'L'."""
+    shape = []
+    seen_literal = False
+    for segment in pattern.strip("/").split("/"):
+        if segment == "*" or segment.startswith("{") or LANGUAGE_SEGMENT.match(segment):
+            shape.append("*" if LANGUAGE_SEGMENT.match(segment) else segment)
+        elif not seen_literal:
+            shape.append(segment)
+            seen_literal = True
+        else:
+            shape.append("L")
+    return tuple(shape)
+
+
+def merge_pattern(patterns: List[str]) -> str:
+    """Column-wise merge of same-shape patterns (differing segments become '*')."""
+    columns = zip(*(p.strip("/").split("/") for p in patterns))
+    return "/" + "/".join(c[0] if len(set(c)) == 1 else "*" for c in columns)
+
+
+def suggest_complexity(distinct_tokens: List[int], template_count: int) -> str:
+    """Suggest estimator complexity from skeleton size and template variants."""
+    if not distinct_tokens:
+        return "medium"
+    size = sorted(distinct_tokens)[len(distinct_tokens) // 2]
+    level = next((name for limit, name in TEMPLATE_COMPLEXITY if size <= limit), "complex")
+    # Many template variants in one URL pattern mean more display modes to build
+    if template_count > 3 and level == "simple":
+        level = "medium"
+    elif template_count > 3 and level == "medium":
+        level = "complex"
+    return level
+
+
+def cluster_urls(input_file: Path, memory_mb: int = 256, workers: Optional[int] = None) -> Dict[str, Any]:
+    """Cluster URLs into content types with node counts and suggested complexity."""
+    max_nodes = memory_mb * 1024 * 1024 // BYTES_PER_NODE
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Each shard builds its own trie within its share of the memory budget
+        ranges = shard_ranges(input_file, workers)
+        shard_budget = max(1000, max_nodes // len(ranges))
+        futures = [pool.submit(build_shard_trie, input_file, start, end, shard_budget)
+                   for start, end in ranges]
+        trie = merge_tries([f.result() for f in futures], max_nodes)
+
+    # Sibling patterns of the same shape (e.g. /de/produkte/<category>/*) are one type;
+    # tiny patterns are folded into the generic page type
+    groups: Dict[Tuple[str, ...], List[Tuple[str, TrieNode]]] = {}
+    for pattern, node in trie.patterns():
+        key = ("/",) if pattern == "/" else pattern_shape(pattern)
+        groups.setdefault(key, []).append((pattern, node))
+
+    clusters = []
+    leftover = TrieNode()
+    for members in groups.values():
+        node = TrieNode()
+        for _, member in members:
+            trie.merge(node, TrieNode(count=member.count, samples=member.samples))
+        pattern = merge_pattern([p for p, _ in members])
+        if node.count >= MIN_CLUSTER_NODES or pattern == "/":
+            clusters.append((pattern, node))
+        else:
+            trie.merge(leftover, node)
+    if leftover.count:
+        clusters.append(("(other)", leftover))
+
+    # Template signatures for sampled pages, in parallel
+    sample_files = [(i, f) for i, (_, node) in enumerate(clusters) for _, f in node.samples if f]
+    signatures: Dict[int, List[Tuple[str, int]]] = {}
+    if sample_files:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(template_signature, [f for _, f in sample_files], chunksize=16)
+            for (i, _), signature in zip(sample_files, results):
+                if signature:
+                    signatures.setdefault(i, []).append(signature)
+
+    content_types = []
+    for i, (pattern, node) in enumerate(clusters):
+        sigs = signatures.get(i, [])
+        templates = sorted({s for s, _ in sigs})
+        content_types.append({
+            "name": content_type_name(pattern) if pattern != "(other)" else "Page",
+            "complexity": suggest_complexity([n for _, n in sigs], len(templates)),
+            "pattern": pattern,
+            "nodes": node.count,
+            "templates": templates,
+            "examples": [url for url, _ in node.samples[:3]],
+        })
+    content_types.sort(key=lambda ct: ct["nodes"], reverse=True)
+
+    # Patterns rendered by the same template are the same content type
+    by_template: Dict[str, List[str]] = {}
+    for ct in content_types:
+        if len(ct["templates"]) == 1:
+            by_template.setdefault(ct["templates"][0], []).append(ct["pattern"])
+
+    return {
+        "content_types": content_types,
+        "shared_templates": {t: p for t, p in by_template.items() if len(p) > 1},
+        "migration": {"nodes": trie.total},
+        "stats": {"urls": trie.total, "trie_nodes": trie.nodes, "clusters": len(content_types)},
+    }
+
+
+def main():
+    """Main execution function."""
+    if len(sys.argv) < 3:
+        print("Usage: python cluster_urls.py <urls> <output_json> [memory_mb]")
+        print("\nExample:")
+        print("  python cluster_urls.py ./audit_data/crawl/inventory.jsonl ./audit_data/content_types.json")
+        sys.exit(1)
+
+    input_file = Path(sys.argv[1])
+    output_file = Path(sys.argv[2])
+    memory_mb = int(sys.argv[3]) if len(sys.argv) > 3 else 256
+
+    if not input_file.exists():
+        print(f"Error: File not found: {input_file}")
+        sys.exit(1)
+
+    print(f"🧭 Clustering URLs from: {input_file}")
+    result = cluster_urls(input_file, memory_mb)
+
+    with open(output_file, 'w') as f:
+        json.dump(result, f, indent=2)
+
+    stats = result["stats"]
+    print(f"\n✅ {stats['urls']:,} URLs → {stats['clusters']} content types ({stats['trie_nodes']:,} trie nodes)\n")
+    print("| Content Type | Pattern | Nodes | Complexity |")
+    print("|--------------|---------|-------|------------|")
+    for ct in result["content_types"][:25]:
+        print(f"| {ct['name']} | `{ct['pattern']}` | {ct['nodes']:,} | {ct['complexity'].title()} |")
+    print(f"\n📄 Saved to: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
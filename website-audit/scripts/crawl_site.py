@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+"""
+Asyncio Site Crawler for Website Audits
+
+This script crawls a website and produces the inventories the estimator and
+analyzers consume, replacing the click-through of SKILL Phase 1. It uses
+only the standard library: an asyncio HTTP/1.1 client with keep-alive
+connection pooling, per-host concurrency limits, robots.txt handling
+(including Crawl-delay) and conditional requests (ETag / Last-Modified)
+against the previous crawl.
+
+Usage:
+    python crawl_site.py <start_url> <output_dir> [max_pages] [concurrency]
+
+Output (in output_dir):
+    inventory.jsonl   one record per URL (url, status, content_type, bytes, depth, title, file, ...)
+    links.tsv         internal link edges: <source_url>\\t<target_url>
+    pages/ab/<sha1>.html
+                      raw HTML of every fetched page (file path is in the inventory)
+
+Re-running into the same output directory sends conditional requests;
+unchanged pages (304) keep their stored HTML.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import re
+import ssl
+import sys
+import time
+import zlib
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Set, Tuple
+from urllib.parse import urljoin, urlsplit, urldefrag
+from urllib.robotparser import RobotFileParser
+
+
+USER_AGENT = "adesso-website-audit/1.0 (+https://www.adesso.de)"
+
+# Defaults (overridable via CrawlConfig)
+DEFAULT_CONCURRENCY = 64
+DEFAULT_PER_HOST = 16
+DEFAULT_TIMEOUT = 20.0
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+# Linked files that are inventoried as links but never fetched
+SKIP_EXTENSIONS = {
+    ".jpg", ".jpeg", ".png", ".gif", ".webp", ".svg", ".ico", ".pdf", ".zip", ".gz",
+    ".mp4", ".mp3", ".webm", ".woff", ".woff2", ".ttf", ".css", ".js", ".xml", ".doc",
+    ".docx", ".xls", ".xlsx", ".ppt", ".pptx",
+}
+
+HREF_PATTERN = re.compile(rb"""<a\s[^>]*?href\s*=\s*["']([^"'#>]+)""", re.IGNORECASE)
+TITLE_PATTERN = re.compile(rb"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+
+@dataclass
+class CrawlConfig:
+    """Crawler settings."""
+    start_urls: List[str]
+    output_dir: Path
+    max_pages: int = 100_000
+    max_depth: int = 50
+    concurrency: int = DEFAULT_CONCURRENCY
+    per_host: int = DEFAULT_PER_HOST
+    timeout: float = DEFAULT_TIMEOUT
+    respect_robots: bool = True
+    user_agent: str = USER_AGENT
+
+
+@dataclass
+class PageRecord:
+    """Inventory record for one crawled URL."""
+    url: str
+    status: int
+    depth: int
+    content_type: str = ""
+    bytes: int = 0
+    title: str = ""
+    file: str = ""
+    etag: str = ""
+    last_modified: str = ""
+    redirect_to: str = ""
+    links: int = 0
+    error: str = ""
+
+
+@dataclass
+class Response:
+    """Parsed HTTP response."""
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+
+@dataclass
+class CrawlStats:
+    """Crawl counters."""
+    fetched: int = 0
+    not_modified: int = 0
+    errors: int = 0
+    blocked: int = 0
+    bytes: int = 0
+    started: float = field(default_factory=time.perf_counter)
+
+
+class ConnectionPool:
+    """Keep-alive HTTP/1.1 connections, limited per host."""
+
+    def __init__(self, per_host: int, timeout: float):
+        self.per_host = per_host
+        self.timeout = timeout
+        self.idle: Dict[Tuple[str, str, int], List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]]] = {}
+        self.limits: Dict[str, asyncio.Semaphore] = {}
+        self.ssl_context = ssl.create_default_context()
+
+    def limit(self, host: str, per_host: Optional[int] = None) -> asyncio.Semaphore:
+        """Per-host semaphore (created on first use)."""
+        if host not in self.limits:
+            self.limits[host] = asyncio.Semaphore(per_host or self.per_host)
+        return self.limits[host]
+
+    async def acquire(self, scheme: str, host: str, port: int) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter, bool]:
+        """Return (reader, writer, reused) - an idle connection or a new one."""
+        key = (scheme, host, port)
+        idle = self.idle.get(key)
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port, ssl=self.ssl_context if scheme == "https" else None,
+                                    limit=256 * 1024),
+            self.timeout)
+        return reader, writer, False
+
+    def release(self, scheme: str, host: str, port: int, reader: asyncio.StreamReader,
+                writer: asyncio.StreamWriter) -> None:
+        """Return a connection to the idle pool."""
+        self.idle.setdefault((scheme, host, port), []).append((reader, writer))
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        for connections in self.idle.values():
+            for _, writer in connections:
+                writer.close()
+        self.idle.clear()
+
+
+async def read_body(reader: asyncio.StreamReader, headers: Dict[str, str], status: int) -> Tuple[bytes, bool]:
+    """Read a response body; return (body, connection reusable)."""
+    if status in (204, 304) or 100 <= status < 200:
+        return b"", True
+
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        chunks = []
+        total = 0
+        while True:
+            size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+            if size == 0:
+                # Trailer section ends with an empty line
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                break
+            total += size
+            if total > MAX_BODY_BYTES:
+                raise ValueError("response body too large")
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        return b"".join(chunks), True
+
+    if "content-length" in headers:
+        length = int(headers["content-length"])
+        if length > MAX_BODY_BYTES:
+            raise ValueError("response body too large")
+        return await reader.readexactly(length), True
+
+    # No framing: body runs until the server closes the connection
+    return await reader.read(MAX_BODY_BYTES), False
+
+
+def decode_body(body: bytes, encoding: str) -> bytes:
+    """Undo Content-Encoding (gzip/deflate)."""
+    encoding = encoding.lower()
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        return zlib.decompress(body)
+    return body
+
+
+async def fetch(pool: ConnectionPool, url: str, user_agent: str,
+                extra_headers: Optional[Dict[str, str]] = None) -> Response:
+    """GET a URL over a pooled connection (retries once on a stale keep-alive connection)."""
+    parts = urlsplit(url)
+    scheme = parts.scheme
+    host = parts.hostname or ""
+    port = parts.port or (443 if scheme == "https" else 80)
+    target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+    host_header = parts.netloc.split("@")[-1]
+
+    lines = [f"GET {target} HTTP/1.1", f"Host: {host_header}", f"User-Agent: {user_agent}",
+             "Accept: text/html,application/xhtml+xml;q=0.9,*/*;q=0.5",
+             "Accept-Encoding: gzip, deflate", "Connection: keep-alive"]
+    for name, value in (extra_headers or {}).items():
+        lines.append(f"{name}: {value}")
+    request = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    for attempt in range(2):
+        reader, writer, reused = await pool.acquire(scheme, host, port)
+        try:
+            writer.write(request)
+            await writer.drain()
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), pool.timeout)
+            status_line, *header_lines = head.decode("latin-1").split("\r\n")
+            status = int(status_line.split(" ", 2)[1])
+            headers = {}
+            for line in header_lines:
+                if ":" in line:
+                    name, value = line.split(":", 1)
+                    headers[name.strip().lower()] = value.strip()
+            body, reusable = await asyncio.wait_for(read_body(reader, headers, status), pool.timeout)
+        except (asyncio.IncompleteReadError, ConnectionResetError, BrokenPipeError):
+            writer.close()
+            if reused and attempt == 0:
+                continue
+            raise
+        except BaseException:
+            writer.close()
+            raise
+
+        if reusable and headers.get("connection", "").lower() != "close":
+            pool.release(scheme, host, port, reader, writer)
+        else:
+            writer.close()
+        return Response(status, headers, decode_body(body, headers.get("content-encoding", "")))
+
+    raise ConnectionError(f"Could not fetch {url}")
+
+
+def normalize_url(base: str, href: str) -> Optional[str]:
+    """Resolve a link and drop fragments; None for non-HTTP links."""
+    href = href.strip()
+    if href.startswith(("mailto:", "tel:", "javascript:", "data:")):
+        return None
+    url, _ = urldefrag(urljoin(base, href))
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        return None
+    return parts._replace(netloc=parts.netloc.lower(), path=parts.path or "/").geturl()
+
+
+def page_file(url: str) -> str:
+    """Relative storage path for a page's raw HTML."""
+    digest = hashlib.sha1(url.encode()).hexdigest()
+    return f"pages/{digest[:2]}/{digest}.html"
+
+
+def load_previous_inventory(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Validators and stored files from the last crawl (for conditional requests)."""
+    previous = {}
+    if path.exists():
+        with open(path, 'r') as f:
+            for line in f:
+                record = json.loads(line)
+                if record.get("file") and (record.get("etag") or record.get("last_modified")):
+                    previous[record["url"]] = record
+    return previous
+
+
+class Crawler:
+    """Breadth-first crawler writing inventory, link edges and raw HTML."""
+
+    def __init__(self, config: CrawlConfig):
+        self.config = config
+        self.output_dir = config.output_dir
+        self.pool = ConnectionPool(config.per_host, config.timeout)
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.seen: Set[str] = set()
+        self.allowed_hosts = {urlsplit(u).hostname for u in config.start_urls}
+        self.robots: Dict[str, Optional[RobotFileParser]] = {}
+        self.robots_locks: Dict[str, asyncio.Lock] = {}
+        self.crawl_delays: Dict[str, float] = {}
+        self.previous = load_previous_inventory(self.output_dir / "inventory.jsonl")
+        self.stats = CrawlStats()
+        self.inventory_file = None
+        self.links_file = None
+
+    async def robots_for(self, url: str) -> Optional[RobotFileParser]:
+        """Fetch and parse robots.txt once per host."""
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        if origin in self.robots:
+            return self.robots[origin]
+        lock = self.robots_locks.setdefault(origin, asyncio.Lock())
+        async with lock:
+            if origin not in self.robots:
+                parser = None
+                try:
+                    response = await fetch(self.pool, origin + "/robots.txt", self.config.user_agent)
+                    if response.status == 200:
+                        parser = RobotFileParser()
+                        parser.parse(response.body.decode("utf-8", "replace").splitlines())
+                        delay = parser.crawl_delay(self.config.user_agent)
+                        if delay:
+                            # Crawl-delay implies one request at a time for this host
+                            self.crawl_delays[parts.hostname] = float(delay)
+                            self.pool.limit(parts.hostname, per_host=1)
+                except (OSError, asyncio.TimeoutError, ValueError):
+                    parser = None
+                self.robots[origin] = parser
+        return self.robots[origin]
+
+    def enqueue(self, url: str, depth: int) -> None:
+        """Queue a URL once, within host, depth and page limits."""
+        if url in self.seen or len(self.seen) >= self.config.max_pages:
+            return
+        if urlsplit(url).hostname not in self.allowed_hosts or depth > self.config.max_depth:
+            return
+        self.seen.add(url)
+        self.queue.put_nowait((url, depth))
+
+    def write_record(self, record: PageRecord) -> None:
+        """Append one inventory record."""
+        self.inventory_file.write(json.dumps(asdict(record), ensure_ascii=False) + "\n")
+
+    def process_links(self, url: str, depth: int, html: bytes) -> int:
+        """Extract links, write edges and queue internal targets."""
+        count = 0
+        for match in HREF_PATTERN.finditer(html):
+            target = normalize_url(url, match.group(1).decode("utf-8", "replace"))
+            if target is None or urlsplit(target).hostname not in self.allowed_hosts:
+                continue
+            count += 1
+            self.links_file.write(f"{url}\t{target}\n")
+            if Path(urlsplit(target).path).suffix.lower() not in SKIP_EXTENSIONS:
+                self.enqueue(target, depth + 1)
+        return count
+
+    async def crawl_url(self, url: str, depth: int) -> None:
+        """Fetch one URL (following redirects) and record it."""
+        record = PageRecord(url=url, status=0, depth=depth)
+
+        if self.config.respect_robots:
+            robots = await self.robots_for(url)
+            if robots is not None and not robots.can_fetch(self.config.user_agent, url):
+                self.stats.blocked += 1
+                record.error = "blocked by robots.txt"
+                self.write_record(record)
+                return
+
+        headers = {}
+        previous = self.previous.get(url)
+        if previous:
+            if previous.get("etag"):
+                headers["If-None-Match"] = previous["etag"]
+            if previous.get("last_modified"):
+                headers["If-Modified-Since"] = previous["last_modified"]
+
+        host = urlsplit(url).hostname
+        try:
+            async with self.pool.limit(host):
+                response = await fetch(self.pool, url, self.config.user_agent, headers)
+                if host in self.crawl_delays:
+                    await asyncio.sleep(self.crawl_delays[host])
+        except (OSError, asyncio.TimeoutError, ValueError, asyncio.IncompleteReadError) as e:
+            self.stats.errors += 1
+            record.error = f"{type(e).__name__}: {e}"
+            self.write_record(record)
+            return
+
+        record.status = response.status
+        record.content_type = response.headers.get("content-type", "").split(";")[0].strip()
+        record.etag = response.headers.get("etag", "")
+        record.last_modified = response.headers.get("last-modified", "")
+
+        if 300 <= response.status < 400 and "location" in response.headers:
+            target = normalize_url(url, response.headers["location"])
+            record.redirect_to = target or ""
+            if target:
+                self.links_file.write(f"{url}\t{target}\n")
+                self.enqueue(target, depth)
+            self.write_record(record)
+            return
+
+        if response.status == 304 and previous:
+            self.stats.not_modified += 1
+            record.status = previous["status"]
+            record.content_type = previous["content_type"]
+            record.title = previous["title"]
+            record.file = previous["file"]
+            record.etag = record.etag or previous.get("etag", "")
+            record.last_modified = record.last_modified or previous.get("last_modified", "")
+            html = (self.output_dir / record.file).read_bytes()
+        else:
+            self.stats.fetched += 1
+            html = response.body if record.content_type in ("text/html", "application/xhtml+xml") else b""
+            record.bytes = len(response.body)
+            self.stats.bytes += len(response.body)
+            if html and response.status == 200:
+                record.file = page_file(url)
+                path = self.output_dir / record.file
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(html)
+                title = TITLE_PATTERN.search(html)
+                if title:
+                    record.title = " ".join(title.group(1).decode("utf-8", "replace").split())[:300]
+
+        record.bytes = record.bytes or (len(html) if html else 0)
+        if html and record.status == 200:
+            record.links = self.process_links(url, depth, html)
+        self.write_record(record)
+
+    async def worker(self) -> None:
+        """Process queued URLs until cancelled."""
+        while True:
+            url, depth = await self.queue.get()
+            try:
+                await self.crawl_url(url, depth)
+            except Exception as e:
+                # Never let one malformed response stop a worker
+                self.stats.errors += 1
+                self.write_record(PageRecord(url=url, status=0, depth=depth,
+                                             error=f"{type(e).__name__}: {e}"))
+            finally:
+                self.queue.task_done()
+
+    async def run(self) -> CrawlStats:
+        """Crawl from the start URLs until the frontier is empty."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        inventory_tmp = self.output_dir / "inventory.jsonl.tmp"
+        with open(inventory_tmp, 'w') as self.inventory_file, \
+                open(self.output_dir / "links.tsv", 'w') as self.links_file:
+            for url in self.config.start_urls:
+                normalized = normalize_url(url, url)
+                if normalized:
+                    self.enqueue(normalized, 0)
+
+            workers = [asyncio.create_task(self.worker()) for _ in range(self.config.concurrency)]
+            await self.queue.join()
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self.pool.close()
+
+        inventory_tmp.replace(self.output_dir / "inventory.jsonl")
+        return self.stats
+
+
+def crawl(config: CrawlConfig) -> CrawlStats:
+    """Run a crawl synchronously."""
+    return asyncio.run(Crawler(config).run())
+
+
+def main():
+    """Main execution function."""
+    if len(sys.argv) < 3:
+        print("Usage: python crawl_site.py <start_url> <output_dir> [max_pages] [concurrency]")
+        print("\nExample:")
+        print("  python crawl_site.py https://example.com ./audit_data/crawl 5000")
+        sys.exit(1)
+
+    config = CrawlConfig(
+        start_urls=[sys.argv[1]],
+        output_dir=Path(sys.argv[2]),
+        max_pages=int(sys.argv[3]) if len(sys.argv) > 3 else 100_000,
+        concurrency=int(sys.argv[4]) if len(sys.argv) > 4 else DEFAULT_CONCURRENCY,
+    )
+
+    print(f"🕷️  Crawling: {config.start_urls[0]} (max {config.max_pages:,} pages)")
+    stats = crawl(config)
+    elapsed = time.perf_counter() - stats.started
+    total = stats.fetched + stats.not_modified
+
+    print(f"\n✅ Crawl complete: {total:,} pages in {elapsed:.1f}s ({total / max(elapsed, 0.001):.0f} pages/s)")
+    print(f"   Fetched: {stats.fetched:,} | Not modified: {stats.not_modified:,} | "
+          f"Errors: {stats.errors:,} | Blocked by robots.txt: {stats.blocked:,}")
+    print(f"   Downloaded: {stats.bytes / 1_000_000:.1f} MB")
+    print(f"\n📄 Inventory saved to: {config.output_dir / 'inventory.jsonl'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Data Table Writer for Website Audit Sites
+
+Large tables (entity breakdowns, page inventories) are too big to render as
+Markdown: tens of thousands of rows produce multi-MB pages that VitePress
+renders slowly. This module writes such tables as chunked JSON data files
+under docs/public/data/<table_id>/ and returns Markdown containing only a
+summary, the first rows and a <DataTable> tag. The adesso theme's
+DataTable.vue component virtualizes the full table and fetches chunks on
+demand while scrolling.
+
+Small tables (up to the preview size) stay plain Markdown.
+
+Usage:
+    python data_tables.py <rows.jsonl> <docs_dir> <table_id>
+
+Chunk format:
+    manifest.json    {"columns": [...], "rows": N, "chunk_rows": M, "chunks": [...]}
+    chunk-0000.json  [[cell, cell, ...], ...]  (rows as arrays, no repeated keys)
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Dict, Any, List, Iterable, Iterator, Tuple
+
+
+# Rows shown inline in the Markdown page
+TABLE_PREVIEW_ROWS = 50
+
+# Rows per JSON chunk fetched by the DataTable component
+TABLE_CHUNK_ROWS = 2000
+
+
+def escape_cell(value: Any) -> str:
+    """Escape a value for use in a Markdown table cell."""
+    return str(value).replace("|", "\\|").replace("\n", " ")
+
+
+def format_markdown_table(columns: List[str], rows: Iterable[List[Any]]) -> str:
+    """Format rows as a Markdown table."""
+    output = [
+        "| " + " | ".join(columns) + " |",
+        "|" + "|".join("------" for _ in columns) + "|",
+    ]
+    for row in rows:
+        output.append("| " + " | ".join(escape_cell(cell) for cell in row) + " |")
+    return "\n".join(output)
+
+
+def write_table_data(table_dir: Path, columns: List[str], rows: Iterator[List[Any]],
+                     chunk_rows: int = TABLE_CHUNK_ROWS) -> Dict[str, Any]:
+    """Stream rows into chunk files and write the table manifest."""
+    table_dir.mkdir(parents=True, exist_ok=True)
+    for stale in table_dir.glob("chunk-*.json"):
+        stale.unlink()
+
+    chunks = []
+    total = 0
+    buffer: List[List[Any]] = []
+
+    def flush() -> None:
+        name = f"chunk-{len(chunks):04d}.json"
+        (table_dir / name).write_text(json.dumps(buffer, ensure_ascii=False, separators=(",", ":")))
+        chunks.append(name)
+
+    for row in rows:
+        buffer.append(list(row))
+        total += 1
+        if len(buffer) == chunk_rows:
+            flush()
+            buffer = []
+    if buffer:
+        flush()
+
+    manifest = {
+        "columns": columns,
+        "rows": total,
+        "chunk_rows": chunk_rows,
+        "chunks": chunks,
+    }
+    (table_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+
+def split_preview(rows: Iterable[List[Any]], preview_rows: int) -> Tuple[List[List[Any]], Iterator[List[Any]], bool]:
+    """Read up to preview_rows + 1 rows; return (preview, remaining iterator, is_large)."""
+    iterator = iter(rows)
+    head = []
+    for row in iterator:
+        head.append(list(row))
+        if len(head) > preview_rows:
+            break
+    return head[:preview_rows], _chain(head, iterator), len(head) > preview_rows
+
+
+def _chain(head: List[List[Any]], rest: Iterator[List[Any]]) -> Iterator[List[Any]]:
+    yield from head
+    yield from rest
+
+
+def format_data_table(docs_dir: Path, table_id: str, columns: List[str], rows: Iterable[List[Any]],
+                      preview_rows: int = TABLE_PREVIEW_ROWS) -> str:
+    """Return Markdown for a table, moving large tables into chunked JSON data files."""
+    preview, all_rows, is_large = split_preview(rows, preview_rows)
+    if not is_large:
+        return format_markdown_table(columns, preview)
+
+    manifest = write_table_data(docs_dir / "public" / "data" / table_id, columns, all_rows)
+    return f"""**{manifest['rows']:,} rows** – showing the first {len(preview)}. The full table loads below.
+
+{format_markdown_table(columns, preview)}
+
+<DataTable src="/data/{table_id}/manifest.json" />
+"""
+
+
+def read_jsonl_rows(path: Path) -> Tuple[List[str], Iterator[List[Any]]]:
+    """Stream a JSON Lines file as (columns, rows); columns come from the first record."""
+    with open(path, 'r') as f:
+        first = next((line for line in f if line.strip()), "")
+    if not first:
+        return [], iter(())
+    columns = list(json.loads(first).keys())
+
+    def rows() -> Iterator[List[Any]]:
+        with open(path, 'r') as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    yield [record.get(column, "") for column in columns]
+
+    return columns, rows()
+
+
+def main():
+    """Main execution function."""
+    if len(sys.argv) < 4:
+        print("Usage: python data_tables.py <rows.jsonl> <docs_dir> <table_id>")
+        print("\nExample:")
+        print("  python data_tables.py ./audit_data/page_inventory.jsonl ./site-audit-docs/docs page-inventory")
+        sys.exit(1)
+
+    input_file = Path(sys.argv[1])
+    docs_dir = Path(sys.argv[2])
+    table_id = sys.argv[3]
+
+    if not input_file.exists():
+        print(f"Error: File not found: {input_file}")
+        sys.exit(1)
+
+    columns, rows = read_jsonl_rows(input_file)
+    manifest = write_table_data(docs_dir / "public" / "data" / table_id, columns, rows)
+
+    print(f"✅ Wrote {manifest['rows']:,} rows in {len(manifest['chunks'])} chunks")
+    print(f"   Embed with: <DataTable src=\"/data/{table_id}/manifest.json\" />")
+
+
+if __name__ == "__main__":
+    main()
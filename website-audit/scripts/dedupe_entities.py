@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Merging for Entity Inventories
+
+Inventories from automated extraction or merged auditor notes often list the
+same paragraph several times ("Teaser", "Teaser Card", "Card Teaser" with the
+same fields), and calculate_base_hours() then counts each one. This script
+proposes merges before the estimate runs.
+
+Each entity is turned into a shingle set: character 3-grams of its name
+tokens (order-independent) plus its field names. Entities of the same type
+are compared with MinHash signatures and LSH banding, so candidate search
+is sub-quadratic for inventories with tens of thousands of entries
+(identical shingle sets are merged up front and hashed once).
+Candidates are verified with exact Jaccard similarity and grouped with
+union-find. Single linkage chains near-duplicates transitively, so each
+group is then split around kept entities: a member only joins a proposal
+when it is similar to the entity it is merged into. Every proposal shows
+each member's similarity to the kept entity and the base hours it saves.
+
+Usage:
+    python dedupe_entities.py <entities_json> [threshold]
+
+Output (next to the input):
+    dedupe_report.json       merge proposals with similarity scores and hours saved
+    entities.deduped.json    the inventory with all proposals applied
+
+Review the report, then run calculate_estimate.py on the deduped file.
+"""
+
+import hashlib
+import json
+import random
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Any, List, Set, Tuple
+
+from calculate_estimate import calculate_base_hours
+
+
+# MinHash signature length = LSH_BANDS * LSH_ROWS
+LSH_BANDS = 32
+LSH_ROWS = 4
+NUM_PERMUTATIONS = LSH_BANDS * LSH_ROWS
+
+# Default Jaccard similarity for a merge proposal
+DEFAULT_THRESHOLD = 0.6
+
+# Entity list keys in entities.json that can contain duplicates
+ENTITY_KEYS = ["content_types", "paragraphs", "taxonomies", "media_types", "views",
+               "webforms", "blocks", "custom_modules", "theme_components"]
+
+COMPLEXITY_ORDER = ["simple", "medium", "complex"]
+
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+
+def shingles(entity: Dict[str, Any]) -> Set[str]:
+    """Name character 3-grams (word order independent) plus field-signature shingles."""
+    result = set()
+    for token in re.findall(r"[a-z0-9äöüß]+", entity.get("name", "").lower()):
+        padded = f"_{token}_"
+        result.update(padded[i:i + 3] for i in range(len(padded) - 2))
+
+    for field in entity.get("fields", []):
+        name = field.get("name", "") if isinstance(field, dict) else str(field)
+        kind = field.get("type", "") if isinstance(field, dict) else ""
+        result.add(f"field:{name.lower()}:{kind.lower()}")
+    if entity.get("signature"):
+        result.add(f"signature:{entity['signature']}")
+    return result
+
+
+def shingle_hash(shingle: str) -> int:
+    """Stable 32-bit hash of a shingle."""
+    return int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=4).digest(), "big")
+
+
+def permutations(seed: int = 1) -> List[Tuple[int, int]]:
+    """Universal hash parameters (a, b) for the MinHash permutations."""
+    rng = random.Random(seed)
+    return [(rng.randrange(1, MERSENNE_PRIME), rng.randrange(0, MERSENNE_PRIME))
+            for _ in range(NUM_PERMUTATIONS)]
+
+
+def minhash(shingle_set: Set[str], perms: List[Tuple[int, int]],
+            cache: Dict[str, Tuple[int, ...]]) -> List[int]:
+    """MinHash signature of a shingle set.
+
+    Permuted hashes are computed once per distinct shingle (names share most
+    3-grams), the signature is then an element-wise minimum.
+    """
+    vectors = []
+    for shingle in shingle_set:
+        vector = cache.get(shingle)
+        if vector is None:
+            h = shingle_hash(shingle)
+            vector = cache[shingle] = tuple(((a * h + b) % MERSENNE_PRIME) & MAX_HASH for a, b in perms)
+        vectors.append(vector)
+    if not vectors:
+        return [0] * len(perms)
+    if len(vectors) == 1:
+        return list(vectors[0])
+    return list(map(min, *vectors))
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    """Exact Jaccard similarity."""
+    if not a and not b:
+        return 1.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+def find(parent: List[int], i: int) -> int:
+    """Union-find root with path halving."""
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def find_duplicates(entities: List[Dict[str, Any]], threshold: float) -> List[Dict[str, Any]]:
+    """Group near-duplicate entities of one type; return merge proposals."""
+    perms = permutations()
+    cache: Dict[str, Tuple[int, ...]] = {}
+    shingle_sets = [shingles(e) for e in entities]
+    parent = list(range(len(entities)))
+    similarities: Dict[Tuple[int, int], float] = {}
+
+    # Identical shingle sets are merged up front; only one representative enters LSH
+    representatives: Dict[frozenset, int] = {}
+    for i, shingle_set in enumerate(shingle_sets):
+        key = frozenset(shingle_set)
+        if key in representatives:
+            parent[i] = representatives[key]
+            similarities[(representatives[key], i)] = 1.0
+        else:
+            representatives[key] = i
+
+    # LSH: entities sharing any band bucket are candidates
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+    for i in representatives.values():
+        signature = minhash(shingle_sets[i], perms, cache)
+        for band in range(LSH_BANDS):
+            key = (band, tuple(signature[band * LSH_ROWS:(band + 1) * LSH_ROWS]))
+            buckets.setdefault(key, []).append(i)
+
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        for x in range(len(members)):
+            for y in range(x + 1, len(members)):
+                i, j = members[x], members[y]
+                if (i, j) in similarities:
+                    continue
+                # Jaccard can't exceed the size ratio; skip the set intersection
+                small, large = sorted((len(shingle_sets[i]), len(shingle_sets[j])))
+                if small < threshold * large:
+                    similarities[(i, j)] = 0.0
+                    continue
+                similarity = jaccard(shingle_sets[i], shingle_sets[j])
+                similarities[(i, j)] = similarity
+                if similarity >= threshold:
+                    parent[find(parent, i)] = find(parent, j)
+
+    groups: Dict[int, List[int]] = {}
+    for i in range(len(entities)):
+        groups.setdefault(find(parent, i), []).append(i)
+
+    proposals = []
+    for members in groups.values():
+        # Union-find chains pairs transitively (A~B, B~C); split each group
+        # around kept entities so every member is similar to its kept one
+        remaining = sorted(members, key=lambda i: (len(entities[i].get("name", "")), i))
+        while len(remaining) > 1:
+            # Keep the shortest name; the merged entity takes the highest complexity
+            keep = remaining[0]
+            scored = [(i, 1.0 if i == keep else jaccard(shingle_sets[keep], shingle_sets[i])) for i in remaining]
+            cluster = [(i, similarity) for i, similarity in scored if similarity >= threshold]
+            remaining = [i for i, similarity in scored if similarity < threshold]
+            if len(cluster) < 2:
+                continue
+            cluster.sort(key=lambda m: m[0])
+            complexity = max((entities[i].get("complexity", "medium").lower() for i, _ in cluster),
+                             key=lambda c: COMPLEXITY_ORDER.index(c) if c in COMPLEXITY_ORDER else 1)
+            proposals.append({
+                "keep": entities[keep].get("name", "Unknown"),
+                "complexity": complexity,
+                "members": [entities[i].get("name", "Unknown") for i, _ in cluster],
+                "member_similarities": [round(similarity, 3) for _, similarity in cluster],
+                "indexes": [i for i, _ in cluster],
+                "keep_index": keep,
+                "similarity": round(min(similarity for i, similarity in cluster if i != keep), 3),
+            })
+    return sorted(proposals, key=lambda p: -len(p["members"]))
+
+
+def apply_proposals(entities: List[Dict[str, Any]], proposals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Return the entity list with each proposal merged into its kept entity."""
+    drop = set()
+    merged = {}
+    for proposal in proposals:
+        keep = proposal["keep_index"]
+        entity = dict(entities[keep])
+        entity["complexity"] = proposal["complexity"]
+        entity["merged_from"] = [m for m in proposal["members"] if m != entity.get("name")]
+        merged[keep] = entity
+        drop.update(i for i in proposal["indexes"] if i != keep)
+    return [merged.get(i, e) for i, e in enumerate(entities) if i not in drop]
+
+
+def dedupe_entities(entities_data: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> Dict[str, Any]:
+    """Propose merges for every entity list and report the base-hour effect."""
+    deduped = dict(entities_data)
+    proposals = {}
+    for key in ENTITY_KEYS:
+        entities = entities_data.get(key, [])
+        if len(entities) < 2:
+            continue
+        found = find_duplicates(entities, threshold)
+        if found:
+            proposals[key] = found
+            deduped[key] = apply_proposals(entities, found)
+
+    hours_before, _ = calculate_base_hours(entities_data)
+    hours_after, _ = calculate_base_hours(deduped)
+
+    return {
+        "threshold": threshold,
+        "proposals": proposals,
+        "base_hours_before": hours_before,
+        "base_hours_after": hours_after,
+        "base_hours_saved": hours_before - hours_after,
+        "deduped": deduped,
+    }
+
+
+def main():
+    """Main execution function."""
+    if len(sys.argv) < 2:
+        print("Usage: python dedupe_entities.py <entities_json> [threshold]")
+        print("\nExample:")
+        print("  python dedupe_entities.py ./audit_data/entities.json 0.6")
+        sys.exit(1)
+
+    input_file = Path(sys.argv[1])
+    threshold = float(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_THRESHOLD
+    if not input_file.exists():
+        print(f"Error: File not found: {input_file}")
+        sys.exit(1)
+
+    with open(input_file, 'r') as f:
+        entities_data = json.load(f)
+
+    print(f"🔍 Looking for near-duplicate entities (threshold {threshold:.2f})\n")
+    result = dedupe_entities(entities_data, threshold)
+
+    for key, proposals in result["proposals"].items():
+        print(f"### {key.replace('_', ' ').title()}\n")
+        print("| Keep | Merge (similarity to kept) | Min. Similarity | Complexity |")
+        print("|------|----------------------------|-----------------|------------|")
+        for p in proposals:
+            others = ", ".join(f"{name} ({similarity:.2f})" for i, name, similarity
+                               in zip(p["indexes"], p["members"], p["member_similarities"]) if i != p["keep_index"])
+            print(f"| {p['keep']} | {others} | {p['similarity']:.2f} | {p['complexity'].title()} |")
+        print()
+
+    print(f"📊 Base hours: {result['base_hours_before']:.1f} → {result['base_hours_after']:.1f} "
+          f"(-{result['base_hours_saved']:.1f})")
+
+    report_file = input_file.parent / "dedupe_report.json"
+    with open(report_file, 'w') as f:
+        json.dump({k: v for k, v in result.items() if k != "deduped"}, f, indent=2)
+
+    deduped_file = input_file.parent / "entities.deduped.json"
+    with open(deduped_file, 'w') as f:
+        json.dump(result["deduped"], f, indent=2)
+
+    print(f"\n📄 Report saved to: {report_file}")
+    print(f"📄 Deduped inventory saved to: {deduped_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Repeated-Component Extraction from Crawled HTML
+
+This script derives the `paragraphs` and `theme_components` inventories for
+calculate_estimate.py from stored HTML pages instead of manual inspection.
+
+Every page is parsed into a tag/class skeleton. Each candidate subtree
+(section, article, div, ...) of a reasonable size is hashed bottom-up,
+with repeated identical siblings collapsed so a teaser list with 3 or 12
+cards hashes the same. Hashes that recur across pages are components:
+    - on nearly every page  -> theme_components (header, footer, navigation)
+    - on some pages         -> paragraphs, with occurrence and page counts
+
+Components that almost always sit inside another recurring component are
+folded into it. Complexity is classified from structural features (size,
+forms, media, interactive elements, repeated items).
+
+Pages are parsed on a process pool; per-page results are cached in a SQLite
+file keyed by path, size and mtime, so re-runs only parse changed pages.
+Inventories indexed from WARC archives (warc_reader.py) are read straight
+from the archive; their cache entries follow the archive's size and mtime.
+
+Usage:
+    python extract_components.py <inventory.jsonl> <output_json>
+
+Output:
+    {"paragraphs": [{"name", "complexity", "occurrences", "pages", ...}],
+     "theme_components": [...], "stats": {...}}
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from warc_reader import page_source, read_page
+
+
+# Elements that can be the root of a component
+CANDIDATE_TAGS = {"section", "article", "div", "aside", "figure", "form", "ul", "ol", "nav",
+                  "header", "footer", "table", "details", "blockquote"}
+
+# Subtree size range (elements) for component candidates
+MIN_COMPONENT_NODES = 4
+MAX_COMPONENT_NODES = 400
+
+# Pages a component must appear on to count as recurring
+MIN_COMPONENT_PAGES = 3
+
+# Share of pages above which a component is site chrome (theme component)
+THEME_COMPONENT_SHARE = 0.8
+
+# A child folded into its parent when this share of its occurrences is inside it
+NESTED_SHARE = 0.9
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta",
+             "source", "track", "wbr"}
+SKIP_TAGS = {"script", "style", "svg", "noscript", "template"}
+MEDIA_TAGS = {"img", "picture", "video", "audio", "iframe", "embed", "object"}
+INTERACTIVE_TAGS = {"button", "input", "select", "textarea", "details", "dialog"}
+
+CACHE_NAME = ".components-cache.sqlite"
+
+
+class Element:
+    """Skeleton element: tag, first class, children."""
+    __slots__ = ("tag", "cls", "children", "signature", "size", "features")
+
+    def __init__(self, tag: str, cls: str):
+        self.tag = tag
+        self.cls = cls
+        self.children: List["Element"] = []
+        self.signature = ""
+        self.size = 1
+        self.features: Dict[str, int] = {}
+
+
+class SkeletonParser(HTMLParser):
+    """Build a tag/class skeleton of the page body."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.root = Element("body", "")
+        self.stack = [self.root]
+        self.skip_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if self.skip_depth:
+            if tag in SKIP_TAGS:
+                self.skip_depth += 1
+            return
+        if tag in SKIP_TAGS:
+            self.skip_depth = 1
+            return
+        if tag in ("html", "head", "body"):
+            return
+        classes = next((v for k, v in attrs if k == "class" and v), "")
+        element = Element(tag, normalize_class(classes.split()[0]) if classes.split() else "")
+        self.stack[-1].children.append(element)
+        if tag not in VOID_TAGS:
+            self.stack.append(element)
+
+    def handle_endtag(self, tag: str) -> None:
+        if self.skip_depth:
+            if tag in SKIP_TAGS:
+                self.skip_depth -= 1
+            return
+        # Tolerate unclosed elements: pop up to the matching open tag
+        for i in range(len(self.stack) - 1, 0, -1):
+            if self.stack[i].tag == tag:
+                del self.stack[i:]
+                break
+
+
+def normalize_class(cls: str) -> str:
+    """Drop BEM modifiers, state classes and numeric suffixes."""
+    cls = cls.split("--")[0]
+    return cls.rstrip("0123456789-_")
+
+
+def annotate(element: Element) -> None:
+    """Compute signature, size and structural features bottom-up (iterative)."""
+    order = []
+    stack = [element]
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        stack.extend(node.children)
+
+    for node in reversed(order):
+        child_signatures = []
+        features = Counter()
+        repeated = 0
+        previous = None
+        for child in node.children:
+            node.size += child.size
+            features.update(child.features)
+            # Collapse runs of identical siblings (cards in a list, items in a menu)
+            if child.signature == previous:
+                repeated += 1
+                continue
+            child_signatures.append(child.signature)
+            previous = child.signature
+        features["media"] += node.tag in MEDIA_TAGS
+        features["interactive"] += node.tag in INTERACTIVE_TAGS
+        features["form"] += node.tag == "form"
+        features["links"] += node.tag == "a"
+        features["repeated_items"] += repeated
+        node.features = dict(features)
+        token = f"{node.tag}.{node.cls}({','.join(child_signatures)})"
+        node.signature = hashlib.sha1(token.encode()).hexdigest()[:16]
+
+
+def analyze_page(html_file: str) -> Dict[str, Any]:
+    """Parse one page; return component occurrences, nesting and features (worker)."""
+    parser = SkeletonParser()
+    try:
+        parser.feed(read_page(html_file).decode("utf-8", "replace"))
+        parser.close()
+    except (OSError, AssertionError):
+        return {"occurrences": {}, "nesting": {}, "components": {}}
+    annotate(parser.root)
+
+    occurrences = Counter()
+    nesting = Counter()
+    components = {}
+    stack = [(parser.root, "")]
+    while stack:
+        node, parent = stack.pop()
+        is_candidate = (node.tag in CANDIDATE_TAGS
+                        and MIN_COMPONENT_NODES <= node.size <= MAX_COMPONENT_NODES)
+        if is_candidate:
+            occurrences[node.signature] += 1
+            if parent:
+                nesting[f"{node.signature}>{parent}"] += 1
+            if node.signature not in components:
+                components[node.signature] = {"tag": node.tag, "class": node.cls,
+                                              "size": node.size, "features": node.features}
+        for child in node.children:
+            stack.append((child, node.signature if is_candidate else parent))
+
+    return {"occurrences": dict(occurrences), "nesting": dict(nesting), "components": components}
+
+
+def open_cache(path: Path) -> sqlite3.Connection:
+    """Open (or create) the per-page result cache."""
+    db = sqlite3.connect(path)
+    db.execute("CREATE TABLE IF NOT EXISTS pages (file TEXT PRIMARY KEY, size INTEGER, "
+               "mtime REAL, result TEXT)")
+    return db
+
+
+def page_results(html_files: List[str], cache_path: Path, workers: Optional[int] = None):
+    """Yield (html_file, result) per page, parsing only pages that changed since the last run."""
+    db = open_cache(cache_path)
+    cached = {row[0]: row[1:] for row in db.execute("SELECT file, size, mtime, result FROM pages")}
+
+    todo = []
+    for html_file in html_files:
+        try:
+            stat = os.stat(page_source(html_file))
+        except OSError:
+            continue
+        entry = cached.get(html_file)
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime:
+            yield html_file, json.loads(entry[2])
+        else:
+            todo.append((html_file, stat.st_size, stat.st_mtime))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(analyze_page, [f for f, _, _ in todo], chunksize=32)
+        for (html_file, size, mtime), result in zip(todo, results):
+            db.execute("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)",
+                       (html_file, size, mtime, json.dumps(result)))
+            yield html_file, result
+    db.commit()
+    db.close()
+
+
+def component_name(component: Dict[str, Any]) -> str:
+    """Readable name from the root class (or tag)."""
+    label = component["class"] or component["tag"]
+    label = label.replace("-", " ").replace("_", " ").strip()
+    return label.title() if label else "Component"
+
+
+def classify_complexity(component: Dict[str, Any]) -> str:
+    """Classify estimator complexity from structural features."""
+    features = component["features"]
+    if features.get("form") or features.get("interactive", 0) > 1 or component["size"] > 80:
+        return "complex"
+    if (component["size"] <= 12 and not features.get("media")
+            and not features.get("interactive") and not features.get("repeated_items")):
+        return "simple"
+    return "medium"
+
+
+def summarize_components(results: Iterable[Tuple[Dict[str, Any], float]]) -> Dict[str, Any]:
+    """Recurring components from per-page results.
+
+    Each result comes with the number of pages it stands for (1 for a full
+    crawl, the stratum weight for a sample, see quick_scan.py).
+    """
+    occurrences = Counter()
+    pages = Counter()
+    nesting = Counter()
+    components: Dict[str, Dict[str, Any]] = {}
+    page_count = 0
+    for result, weight in results:
+        page_count += weight
+        for signature, count in result["occurrences"].items():
+            occurrences[signature] += count * weight
+            pages[signature] += weight
+        for key, count in result["nesting"].items():
+            nesting[key] += count * weight
+        for signature, component in result["components"].items():
+            components.setdefault(signature, component)
+
+    recurring = {s for s, n in pages.items() if n >= MIN_COMPONENT_PAGES}
+
+    # Fold children that (almost) only occur inside one recurring parent
+    folded = set()
+    for key, count in nesting.items():
+        child, parent = key.split(">")
+        if child in recurring and parent in recurring and count >= NESTED_SHARE * occurrences[child]:
+            folded.add(child)
+    kept = recurring - folded
+
+    paragraphs = []
+    theme_components = []
+    for signature in sorted(kept, key=lambda s: (-pages[s], -occurrences[s])):
+        component = components[signature]
+        entry = {
+            "name": component_name(component),
+            "complexity": classify_complexity(component),
+            "occurrences": round(occurrences[signature]),
+            "pages": round(pages[signature]),
+            "signature": signature,
+            "root": f"{component['tag']}.{component['class']}" if component["class"] else component["tag"],
+            "elements": component["size"],
+            "features": component["features"],
+        }
+        if page_count and pages[signature] >= THEME_COMPONENT_SHARE * page_count:
+            theme_components.append(entry)
+        else:
+            paragraphs.append(entry)
+
+    return {
+        "paragraphs": paragraphs,
+        "theme_components": theme_components,
+        "stats": {"pages": round(page_count), "candidates": len(occurrences),
+                  "recurring": len(recurring), "folded": len(folded)},
+    }
+
+
+def extract_components(inventory_file: Path, workers: Optional[int] = None) -> Dict[str, Any]:
+    """Find recurring components across all crawled pages."""
+    base = inventory_file.parent
+    html_files = []
+    with open(inventory_file, 'r') as f:
+        for line in f:
+            record = json.loads(line)
+            if record.get("file") and record.get("status") == 200:
+                html_files.append(str(base / record["file"]))
+
+    return summarize_components((result, 1) for _, result in page_results(html_files, base / CACHE_NAME, workers))
+
+
+def main():
+    """Main execution function."""
+    if len(sys.argv) < 3:
+        print("Usage: python extract_components.py <inventory.jsonl> <output_json>")
+        print("\nExample:")
+        print("  python extract_components.py ./audit_data/crawl/inventory.jsonl ./audit_data/components.json")
+        sys.exit(1)
+
+    inventory_file = Path(sys.argv[1])
+    output_file = Path(sys.argv[2])
+    if not inventory_file.exists():
+        print(f"Error: File not found: {inventory_file}")
+        sys.exit(1)
+
+    print(f"🧩 Extracting components from: {inventory_file}")
+    result = extract_components(inventory_file)
+
+    with open(output_file, 'w') as f:
+        json.dump(result, f, indent=2)
+
+    stats = result["stats"]
+    print(f"\n✅ {stats['pages']:,} pages → {len(result['paragraphs'])} paragraphs, "
+          f"{len(result['theme_components'])} theme components")
+    print(f"   Candidates: {stats['candidates']:,} | Recurring: {stats['recurring']:,} | "
+          f"Folded into parents: {stats['folded']:,}\n")
+    print("| Paragraph | Complexity | Occurrences | Pages |")
+    print("|-----------|------------|-------------|-------|")
+    for p in result["paragraphs"][:25]:
+        print(f"| {p['name']} | {p['complexity'].title()} | {p['occurrences']:,} | {p['pages']:,} |")
+    print(f"\n📄 Saved to: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
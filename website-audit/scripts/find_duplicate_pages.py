@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Page Detection for Migration Cleanup
+
+calculate_migration_hours() charges per node, but legacy sites often carry
+thousands of pages that should not be migrated at all: print versions, tag
+archives, paginated listings, copied press releases. This script finds them
+in a crawl (see crawl_site.py) so the migration volume can be reduced
+before estimating.
+
+For every HTML page the main text is extracted (the <main>/<article>
+content if present, otherwise the body without navigation, header, footer
+and asides), split into word 4-gram shingles and reduced to a 64-bit
+SimHash. Pages whose SimHashes differ in at most MAX_DISTANCE bits are
+near-duplicates. Candidates are found with block-permuted sorted tables
+(two of five bit blocks must match exactly), so no pairwise comparison
+over the whole crawl is needed. Clusters are split around their canonical
+page: every dropped page is within MAX_DISTANCE of the page it is merged
+into.
+
+Memory stays bounded: workers process byte-range shards of the inventory
+and only return (offset, SimHash) pairs, 16 bytes per page. Clustering
+sorts typed arrays of indexes (numpy argsort when installed, otherwise a
+radix sort), so it adds a few dozen bytes per page and no Python object
+per page. URLs are read back from the inventory for the pages that end up
+in a cluster. Pages of inventories indexed from WARC archives
+(warc_reader.py) are read from the archive by record offset.
+
+Usage:
+    python find_duplicate_pages.py <inventory.jsonl> [output_dir]
+
+Output (in output_dir, default: next to the inventory):
+    duplicate_pages.json   stats, largest clusters and the adjusted `migration` node count
+    cleanup.tsv            one row per page to drop: url, canonical, distance, reason
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+from cluster_urls import shard_ranges
+from warc_reader import read_page
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Maximum differing SimHash bits for two pages to count as near-duplicates
+MAX_DISTANCE = 3
+
+# SimHash split into blocks; MAX_DISTANCE differing bits leave at least two blocks intact
+SIMHASH_BLOCKS = [(0, 13), (13, 13), (26, 13), (39, 13), (52, 12)]
+
+# Key bits sorted per pass of the pure-Python radix sort
+RADIX_BITS = 16
+
+# Words per shingle
+SHINGLE_WORDS = 4
+
+# Pages with less text are too thin to compare (counted, never flagged)
+MIN_WORDS = 30
+
+# Clusters listed in duplicate_pages.json (the full list is in cleanup.tsv)
+TOP_CLUSTERS = 100
+
+# URL patterns that explain why a duplicate exists, checked in order
+CLEANUP_PATTERNS = [
+    ("print version", re.compile(r"[/?&._-](print|drucken|druckansicht)\b", re.I)),
+    ("tag archive", re.compile(r"/(tags?|schlagworte?|category|kategorie|archiv(e)?)/", re.I)),
+    ("pagination", re.compile(r"([?&](page|seite|p)=\d+|/(page|seite)/\d+)", re.I)),
+    ("tracking parameters", re.compile(r"[?&](utm_[a-z]+|sessionid|sid|fbclid|gclid)=", re.I)),
+]
+
+SKIP_TAGS = {"script", "style", "noscript", "template", "svg"}
+CHROME_TAGS = {"nav", "header", "footer", "aside"}
+MAIN_TAGS = {"main", "article"}
+
+# SimHash bit counters: each hash bit gets its own LANE_BITS-wide lane in one big int,
+# so a page's bit counts are a single sum instead of 64 additions per shingle
+LANE_BITS = 24
+LANE_MASK = (1 << LANE_BITS) - 1
+LANE_TABLES = [
+    [sum(1 << ((byte * 8 + bit) * LANE_BITS) for bit in range(8) if value >> bit & 1)
+     for value in range(256)]
+    for byte in range(8)
+]
+
+
+class TextParser(HTMLParser):
+    """Collect main content text, separately from the rest of the body."""
+
+    def __init__(self):
+        super().__init__()
+        self.skip_depth = 0
+        self.chrome_depth = 0
+        self.main_depth = 0
+        self.main_text: List[str] = []
+        self.body_text: List[str] = []
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag in SKIP_TAGS:
+            self.skip_depth += 1
+        elif tag in CHROME_TAGS:
+            self.chrome_depth += 1
+        elif tag in MAIN_TAGS:
+            self.main_depth += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in SKIP_TAGS:
+            self.skip_depth = max(0, self.skip_depth - 1)
+        elif tag in CHROME_TAGS:
+            self.chrome_depth = max(0, self.chrome_depth - 1)
+        elif tag in MAIN_TAGS:
+            self.main_depth = max(0, self.main_depth - 1)
+
+    def handle_data(self, data: str) -> None:
+        if self.skip_depth:
+            return
+        if self.main_depth:
+            self.main_text.append(data)
+        elif not self.chrome_depth:
+            self.body_text.append(data)
+
+    def text(self) -> str:
+        return " ".join(self.main_text if self.main_text else self.body_text)
+
+
+def page_words(html: str) -> List[str]:
+    """Normalized words of a page's main content."""
+    parser = TextParser()
+    try:
+        parser.feed(html)
+        parser.close()
+    except AssertionError:
+        pass
+    return re.findall(r"\w+", parser.text().lower())
+
+
+def simhash(words: List[str]) -> int:
+    """64-bit SimHash over word shingles."""
+    shingles = {" ".join(words[i:i + SHINGLE_WORDS]) for i in range(max(1, len(words) - SHINGLE_WORDS + 1))}
+    lanes = 0
+    for shingle in shingles:
+        h = hashlib.blake2b(shingle.encode(), digest_size=8).digest()
+        for byte, table in zip(h, LANE_TABLES):
+            lanes += table[byte]
+
+    half = len(shingles) / 2
+    result = 0
+    for bit in range(64):
+        if (lanes >> (bit * LANE_BITS)) & LANE_MASK > half:
+            result |= 1 << bit
+    return result
+
+
+def hash_shard(inventory_file: Path, start: int, end: Optional[int]) -> Tuple[array, array, int]:
+    """SimHash every HTML page in one byte range of the inventory (worker).
+
+    Returns (inventory line offsets, SimHashes, thin page count).
+    """
+    base = inventory_file.parent
+    offsets = array('Q')
+    hashes = array('Q')
+    thin = 0
+    with open(inventory_file, 'rb') as f:
+        if start:
+            f.seek(start - 1)
+            f.readline()  # skip the line that began in the previous shard
+        while end is None or f.tell() < end:
+            offset = f.tell()
+            line = f.readline()
+            if not line:
+                break
+            record = json.loads(line)
+            if (record.get("status") != 200 or not record.get("file")
+                    or not record.get("content_type", "text/html").endswith("html")):
+                continue
+            try:
+                words = page_words(read_page(str(base / record["file"])).decode("utf-8", "replace"))
+            except OSError:
+                continue
+            if len(words) < MIN_WORDS:
+                thin += 1
+                continue
+            offsets.append(offset)
+            hashes.append(simhash(words))
+    return offsets, hashes, thin
+
+
+def find(parent: array, i: int) -> int:
+    """Union-find root with path halving."""
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def argsort(keys: array, bits: int) -> array:
+    """Indexes that sort non-negative keys of at most `bits` bits (stable)."""
+    if numpy is not None:
+        order = array('Q')
+        order.frombytes(numpy.argsort(numpy.frombuffer(keys, dtype=numpy.uint64), kind="stable")
+                        .astype(numpy.uint64).tobytes())
+        return order
+
+    # LSD radix sort: one digit array and one index array per pass
+    mask = (1 << RADIX_BITS) - 1
+    order = array('Q', range(len(keys)))
+    for shift in range(0, bits, RADIX_BITS):
+        digits = array('H', ((keys[i] >> shift) & mask for i in order))
+        starts = [0] * (mask + 2)
+        for digit in digits:
+            starts[digit + 1] += 1
+        for digit in range(mask + 1):
+            starts[digit + 1] += starts[digit]
+        result = array('Q', bytes(8 * len(order)))
+        for i, digit in zip(order, digits):
+            result[starts[digit]] = i
+            starts[digit] += 1
+        order = result
+    return order
+
+
+def block_key(value: int, first: Tuple[int, int], second: Tuple[int, int]) -> int:
+    """Two SimHash blocks combined into one sort key."""
+    (shift_a, bits_a), (shift_b, bits_b) = first, second
+    return ((value >> shift_a) & ((1 << bits_a) - 1)) << bits_b | ((value >> shift_b) & ((1 << bits_b) - 1))
+
+
+def cluster_hashes(hashes: array) -> array:
+    """Union-find parents grouping pages with SimHashes within MAX_DISTANCE."""
+    parent = array('q', range(len(hashes)))
+
+    # Identical hashes first; only one representative per distinct hash continues
+    order = argsort(hashes, 64)
+    for position in range(1, len(order)):
+        if hashes[order[position - 1]] == hashes[order[position]]:
+            parent[order[position]] = parent[order[position - 1]]
+    del order
+    representatives = array('Q', (i for i in range(len(hashes)) if parent[i] == i))
+
+    for a in range(len(SIMHASH_BLOCKS)):
+        for b in range(a + 1, len(SIMHASH_BLOCKS)):
+            keys = array('Q', (block_key(hashes[i], SIMHASH_BLOCKS[a], SIMHASH_BLOCKS[b])
+                               for i in representatives))
+            order = argsort(keys, SIMHASH_BLOCKS[a][1] + SIMHASH_BLOCKS[b][1])
+            run_start = 0
+            for position in range(1, len(order) + 1):
+                if position < len(order) and keys[order[position]] == keys[order[run_start]]:
+                    continue
+                if position - run_start > 1:
+                    # Leader clustering within the run: compare against one page per cluster
+                    leaders: List[int] = []
+                    for i in (representatives[k] for k in order[run_start:position]):
+                        for leader in leaders:
+                            if (hashes[i] ^ hashes[leader]).bit_count() <= MAX_DISTANCE:
+                                parent[find(parent, i)] = find(parent, leader)
+                                break
+                        else:
+                            leaders.append(i)
+                run_start = position
+    return parent
+
+
+def read_record(f, offset: int) -> Dict[str, Any]:
+    """Inventory record at a byte offset."""
+    f.seek(offset)
+    return json.loads(f.readline())
+
+
+def split_group(records: List[Tuple[int, Dict[str, Any]]], hashes: array
+                ) -> Iterator[Tuple[Tuple[int, Dict[str, Any]], List[Tuple[int, Dict[str, Any], int]]]]:
+    """Split a union-find group into (canonical, duplicates within MAX_DISTANCE of it).
+
+    Union-find chains pages that are each close to a neighbour (A~B, B~C), so
+    only pages close to the kept page are dropped; the rest are split again.
+    """
+    # Canonical page: shallowest, then without query string, then shortest URL
+    remaining = sorted(records, key=lambda r: (r[1].get("depth", 0), "?" in r[1]["url"],
+                                               len(r[1]["url"]), r[1]["url"]))
+    while len(remaining) > 1:
+        keep, canonical = remaining[0]
+        duplicates = []
+        rest = []
+        for i, record in remaining[1:]:
+            distance = (hashes[i] ^ hashes[keep]).bit_count()
+            if distance <= MAX_DISTANCE:
+                duplicates.append((i, record, distance))
+            else:
+                rest.append((i, record))
+        if duplicates:
+            yield (keep, canonical), duplicates
+        remaining = rest
+
+
+def cleanup_reason(url: str, distance: int) -> str:
+    """Why a page is a cleanup candidate, from its URL (or its distance)."""
+    for reason, pattern in CLEANUP_PATTERNS:
+        if pattern.search(url):
+            return reason
+    return "exact duplicate" if distance == 0 else "near duplicate"
+
+
+def find_duplicate_pages(inventory_file: Path, output_dir: Path,
+                         workers: Optional[int] = None) -> Dict[str, Any]:
+    """Cluster near-duplicate pages; write cleanup.tsv and return the summary."""
+    workers = workers or os.cpu_count() or 1
+    ranges = shard_ranges(inventory_file, workers * 4)
+
+    offsets = array('Q')
+    hashes = array('Q')
+    thin = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for shard_offsets, shard_hashes, shard_thin in pool.map(
+                hash_shard, [inventory_file] * len(ranges), *zip(*ranges)):
+            offsets.extend(shard_offsets)
+            hashes.extend(shard_hashes)
+            thin += shard_thin
+
+    parent = cluster_hashes(hashes)
+    roots = array('Q', (find(parent, i) for i in range(len(hashes))))
+    order = argsort(roots, len(hashes).bit_length())
+    del parent
+
+    clusters = []
+    cluster_count = 0
+    reasons = Counter()
+    removed = 0
+    with open(inventory_file, 'rb') as f, open(output_dir / "cleanup.tsv", 'w') as out:
+        out.write("url\tcanonical\tdistance\treason\n")
+        run_start = 0
+        for position in range(1, len(order) + 1):
+            if position < len(order) and roots[order[position]] == roots[order[run_start]]:
+                continue
+            members = order[run_start:position]
+            run_start = position
+            if len(members) < 2:
+                continue
+
+            records = [(i, read_record(f, offsets[i])) for i in members]
+            for (keep, canonical), duplicates in split_group(records, hashes):
+                for _, record, distance in duplicates:
+                    reason = cleanup_reason(record["url"], distance)
+                    reasons[reason] += 1
+                    out.write(f"{record['url']}\t{canonical['url']}\t{distance}\t{reason}\n")
+                removed += len(duplicates)
+                cluster_count += 1
+
+                clusters.append({
+                    "canonical": canonical["url"],
+                    "title": canonical.get("title", ""),
+                    "pages": len(duplicates) + 1,
+                    "max_distance": max(distance for _, _, distance in duplicates),
+                    "examples": [record["url"] for _, record, _ in duplicates][:5],
+                })
+            if len(clusters) > TOP_CLUSTERS * 2:
+                clusters = sorted(clusters, key=lambda c: -c["pages"])[:TOP_CLUSTERS]
+
+    nodes_before = len(hashes) + thin
+    return {
+        "stats": {
+            "pages": nodes_before,
+            "compared": len(hashes),
+            "thin": thin,
+            "clusters": cluster_count,
+            "removed": removed,
+        },
+        "reasons": dict(reasons.most_common()),
+        "clusters": sorted(clusters, key=lambda c: -c["pages"])[:TOP_CLUSTERS],
+        "migration": {
+            "nodes_before": nodes_before,
+            "nodes": nodes_before - removed,
+        },
+    }
+
+
+def main():
+    """Main execution function."""
+    if len(sys.argv) < 2:
+        print("Usage: python find_duplicate_pages.py <inventory.jsonl> [output_dir]")
+        print("\nExample:")
+        print("  python find_duplicate_pages.py ./audit_data/crawl/inventory.jsonl ./audit_data")
+        sys.exit(1)
+
+    inventory_file = Path(sys.argv[1])
+    output_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else inventory_file.parent
+    if not inventory_file.exists():
+        print(f"Error: File not found: {inventory_file}")
+        sys.exit(1)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    print(f"🔍 Looking for duplicate pages in: {inventory_file}")
+    result = find_duplicate_pages(inventory_file, output_dir)
+
+    output_file = output_dir / "duplicate_pages.json"
+    with open(output_file, 'w') as f:
+        json.dump(result, f, indent=2)
+
+    stats = result["stats"]
+    migration = result["migration"]
+    print(f"\n✅ {stats['pages']:,} pages ({stats['thin']:,} too thin to compare) → "
+          f"{stats['removed']:,} duplicates to drop")
+    print(f"📉 Migration nodes: {migration['nodes_before']:,} → {migration['nodes']:,}\n")
+    print("| Reason | Pages |")
+    print("|--------|-------|")
+    for reason, count in result["reasons"].items():
+        print(f"| {reason} | {count:,} |")
+    print(f"\n📄 Summary saved to: {output_file}")
+    print(f"📄 Cleanup list saved to: {output_dir / 'cleanup.tsv'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Redirect Map Generation for the Relaunch
+
+Every relaunch needs a 301 map from the old site's URLs to the new Drupal
+paths. This script derives it from the crawl or sitemap inventory and the
+content types found by cluster_urls.py.
+
+The new path of a page comes from its content type: add a `target`
+pattern to an entry in content_types.json (e.g. "/aktuelles/{slug}"),
+otherwise DEFAULT_TARGETS and DEFAULT_TARGET (pathauto-like) apply.
+Tokens: {lang} ("/de" or ""), {type}, {slug} (last path segment),
+{title} (page title, falls back to {slug}) and {path} (unchanged path).
+Pages that keep their path need no redirect.
+
+Redirects are streamed into a prefix trie over the old path directories.
+Each trie node tracks whether every redirect below it follows one rewrite
+template (a new prefix in front of the unchanged rest of the path, or a
+fixed segment layout reusing old segments). Such subtrees collapse into a
+single prefix or regex rule; only the rest are written as exact entries,
+which the web server looks up in a hash. The root never collapses, and a
+rule that would match one of the new paths (and redirect it again) is
+dropped in favour of exact entries. Old-site redirects found in the
+inventory are resolved to the new path of their target.
+
+Usage:
+    python generate_redirects.py <urls> <content_types_json> <output_dir>
+
+Input formats:
+    inventory.jsonl  crawl_site.py or warc_reader.py output (titles, old redirects)
+    sitemap.xml      XML sitemap
+    urls.txt         one URL per line
+
+Output (in output_dir):
+    redirects.csv          Drupal redirect import (path_redirect_import module)
+    redirects.nginx.conf   nginx `map` (include in the http block)
+    redirects.caddy        Caddy `map` + `redir` (import in the site block)
+    redirects.json         collapsed rules and stats
+
+Drupal's redirect module matches exact paths only, so redirects.csv holds
+the exact entries; the collapsed rules need the web server map. URLs with
+query strings cannot be matched by path and only go into redirects.csv.
+"""
+
+import csv
+import json
+import os
+import re
+import sys
+import unicodedata
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+from aggregate_lighthouse import load_patterns, page_type
+from cluster_urls import LANGUAGE_SEGMENT, read_urls
+from warc_reader import same_site
+
+
+# Target patterns per content type name, and for all other types
+DEFAULT_TARGETS = {"Homepage": "{lang}/", "Page": "{path}"}
+DEFAULT_TARGET = "{lang}/{type}/{slug}"
+
+# Extensions dropped from the last segment for {slug} (and matched by rules)
+STRIPPED_EXTENSIONS = (".html", ".htm", ".php", ".aspx", ".asp", ".jsp")
+
+# Redirects a subtree needs before it is collapsed into one rule
+MIN_RULE_URLS = 3
+
+# Old-site redirect chains followed to a page
+MAX_HOPS = 5
+
+# Rules listed in redirects.json and the console table
+TOP_RULES = 25
+
+TRANSLITERATION = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+
+# Template of a subtree whose redirects do not share one
+MIXED = ("mixed",)
+
+REGEX_SPECIAL = re.compile(r"([.^$*+?()\[\]{}|\\])")
+
+
+@dataclass
+class DirectoryNode:
+    """Prefix trie node for one old path directory."""
+    children: Dict[str, "DirectoryNode"] = field(default_factory=dict)
+    count: int = 0
+    template: Optional[Tuple] = None
+    rule: bool = False
+
+
+def slugify(text: str) -> str:
+    """Lower-case ASCII slug, as Drupal pathauto builds them."""
+    text = unicodedata.normalize("NFKD", text.lower().translate(TRANSLITERATION))
+    text = text.encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]+", "-", text).strip("-")
+
+
+def strip_extension(segment: str) -> Tuple[str, str]:
+    """Split a segment into stem and one of STRIPPED_EXTENSIONS."""
+    for extension in STRIPPED_EXTENSIONS:
+        if segment.lower().endswith(extension) and len(segment) > len(extension):
+            return segment[:-len(extension)], segment[-len(extension):]
+    return segment, ""
+
+
+def target_path(segments: List[str], title: str, type_name: str, pattern: str) -> str:
+    """New path of a page from its content type's target pattern."""
+    lang = segments[0] if segments and LANGUAGE_SEGMENT.match(segments[0]) else ""
+    slug = slugify(strip_extension(segments[-1])[0]) if segments else ""
+    path = pattern.format(
+        path="/" + "/".join(segments),
+        lang=f"/{lang}" if lang else "",
+        type=slugify(type_name),
+        slug=slug,
+        title=slugify(title) or slug,
+    )
+    return "/" + "/".join(s for s in path.split("/") if s)
+
+
+def rewrite_template(old: List[str], new: List[str], depth: int) -> Optional[Tuple]:
+    """Template that rewrites old into new below the first `depth` segments."""
+    rest = old[depth:]
+    if not rest:
+        return None
+    keep = len(new) - len(rest)
+    if keep >= 0 and new[keep:] == rest:
+        return ("prefix", tuple(new[:keep]))
+
+    parts = []
+    extensions: Dict[int, str] = {}
+    for segment in new:
+        part = ("lit", segment, "")
+        for j, source in enumerate(rest):
+            stem, extension = strip_extension(source)
+            if source == segment:
+                extension = ""
+            elif stem != segment or not extension:
+                continue
+            if extensions.setdefault(j, extension) == extension:
+                part = ("ref", j, extension)
+                break
+        parts.append(part)
+    return ("regex", len(rest), tuple(parts))
+
+
+def iter_pages(path: Path) -> Iterator[Tuple[str, int, str, str]]:
+    """Stream (url, status, title, redirect_to) from an inventory, sitemap or URL list."""
+    if path.suffix != ".jsonl":
+        for url, _ in read_urls(path):
+            yield url, 200, "", ""
+        return
+    with open(path, 'r') as f:
+        for line in f:
+            record = json.loads(line)
+            if record.get("status") == 200 and not record.get("content_type", "").endswith("html"):
+                continue
+            yield record["url"], record.get("status", 0), record.get("title", ""), record.get("redirect_to", "")
+
+
+def old_path(url: str) -> Tuple[str, List[str]]:
+    """Decoded path of an old URL (as the web server sees it) and its segments."""
+    path = unquote(urlsplit(url).path) or "/"
+    return path, [s for s in path.split("/") if s]
+
+
+def build_redirects(input_file: Path, content_types_file: Path, pairs_file: Path) -> Tuple[DirectoryNode, Dict[str, Any]]:
+    """Stream pages into the directory trie; write (old, new, query) pairs to pairs_file."""
+    patterns = load_patterns(content_types_file)
+    with open(content_types_file, 'r') as f:
+        targets = {ct["name"]: ct["target"] for ct in json.load(f).get("content_types", []) if ct.get("target")}
+
+    root = DirectoryNode()
+    legacy: Dict[str, str] = {}
+    stats = {"urls": 0, "redirects": 0, "unchanged": 0, "query_urls": 0, "legacy": 0}
+    host = None
+    with open(pairs_file, 'w') as pairs:
+        for url, status, title, redirect_to in iter_pages(input_file):
+            parts = urlsplit(url)
+            host = host or parts.hostname or ""
+            path, segments = old_path(url)
+            key = f"{path}?{parts.query}" if parts.query else path
+
+            if 300 <= status < 400:
+                if redirect_to and same_site(host, urlsplit(redirect_to).hostname or ""):
+                    legacy[key] = old_path(redirect_to)[0]
+                continue
+            stats["urls"] += 1
+
+            type_name = page_type(url, patterns)
+            pattern = targets.get(type_name) or DEFAULT_TARGETS.get(type_name, DEFAULT_TARGET)
+            new = target_path(segments, title, type_name, pattern)
+            unchanged = new == ("/" + "/".join(segments)) and not parts.query
+            pairs.write(f"{key}\t{new}\t{int(unchanged)}\n")
+            if unchanged:
+                stats["unchanged"] += 1
+            else:
+                stats["redirects"] += 1
+            if parts.query:
+                stats["query_urls"] += 1
+                continue
+
+            # Every directory above the page learns whether the page fits its template
+            new_segments = [s for s in new.split("/") if s]
+            node = root
+            for depth in range(len(segments)):
+                template = MIXED if unchanged else rewrite_template(segments, new_segments, depth)
+                node.count += 1
+                if node.template is None:
+                    node.template = template
+                elif node.template != template:
+                    node.template = MIXED
+                node = node.children.setdefault(segments[depth], DirectoryNode())
+
+    stats["legacy"] = len(legacy)
+    return root, {"stats": stats, "legacy": legacy}
+
+
+def select_rules(root: DirectoryNode) -> List[Tuple[List[str], DirectoryNode]]:
+    """Mark the shallowest uniform subtrees as rules; return (prefix segments, node).
+
+    The root never collapses: a rule without an old prefix would match every
+    path of the new site.
+    """
+    rules = []
+    stack = [([segment], child) for segment, child in root.children.items()]
+    while stack:
+        prefix, node = stack.pop()
+        if node.template not in (None, MIXED) and node.count >= MIN_RULE_URLS:
+            node.rule = True
+            rules.append((prefix, node))
+            continue
+        stack.extend((prefix + [segment], child) for segment, child in node.children.items())
+    return sorted(rules, key=lambda r: -r[1].count)
+
+
+def drop_looping_rules(root: DirectoryNode, rules: List[Tuple[List[str], DirectoryNode]],
+                       pairs_file: Path) -> List[Tuple[List[str], DirectoryNode]]:
+    """Unmark rules whose regex matches a new path; their subtrees get exact entries.
+
+    A rule matching a redirect target would redirect it again (a 301 loop
+    when the target keeps the old prefix, e.g. /news/x -> /news/article/x).
+    """
+    compiled: Dict[int, re.Pattern] = {}
+    with open(pairs_file, 'r') as pairs:
+        for line in pairs:
+            _, destination, _ = line.rstrip("\n").split("\t")
+            node = root
+            segments = [s for s in destination.split("/") if s]
+            for depth, segment in enumerate(segments):
+                node = node.children.get(segment)
+                if node is None:
+                    break
+                if node.rule:
+                    if id(node) not in compiled:
+                        compiled[id(node)] = re.compile(rule_patterns(segments[:depth + 1], node.template,
+                                                                      caddy=True)[0])
+                    if compiled[id(node)].match(destination):
+                        node.rule = False
+                    break
+    return [(prefix, node) for prefix, node in rules if node.rule]
+
+
+def covered(root: DirectoryNode, segments: List[str]) -> bool:
+    """True when a rule handles the path."""
+    if not segments:
+        return False
+    node = root
+    for segment in segments[:-1]:
+        if node.rule:
+            return True
+        node = node.children.get(segment)
+        if node is None:
+            return False
+    return node.rule
+
+
+def rule_patterns(prefix: List[str], template: Tuple, caddy: bool = False) -> Tuple[str, str]:
+    """Regex and target of a rule, in nginx (named groups) or Caddy (numbered) syntax."""
+    groups: List[int] = []
+
+    def group(j: int, body: str) -> str:
+        groups.append(j)
+        return f"({body})" if caddy else f"(?<s{j}>{body})"
+
+    def ref(j: int) -> str:
+        return f"${{{groups.index(j) + 1}}}" if caddy else f"${{s{j}}}"
+
+    head = "^" + "".join("/" + REGEX_SPECIAL.sub(r"\\\1", s) for s in prefix) + "/"
+    if template[0] == "prefix":
+        return head + group(0, ".+") + "$", "/" + "/".join(list(template[1]) + [ref(0)])
+
+    _, width, parts = template
+    extensions = {j: extension for kind, j, extension in parts if kind == "ref"}
+    segments = [group(j, "[^/]+?") + REGEX_SPECIAL.sub(r"\\\1", extensions[j]) if j in extensions else "[^/]+"
+                for j in range(width)]
+    target = "/" + "/".join(ref(value) if kind == "ref" else value for kind, value, _ in parts)
+    return head + "/".join(segments) + "/?$", target
+
+
+def quote(value: str) -> str:
+    """Double-quoted string for nginx and Caddy config files."""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def quote_regex(value: str) -> str:
+    """Backtick-quoted Caddyfile token (kept verbatim, so regex escapes survive)."""
+    return f"`{value}`"
+
+
+def write_outputs(root: DirectoryNode, rules: List[Tuple[List[str], DirectoryNode]], pairs_file: Path,
+                  legacy: Dict[str, str], output_dir: Path) -> Dict[str, int]:
+    """Write the CSV and web server maps; return entry counts."""
+    counts = {"exact": 0, "collapsed": 0, "csv_only": 0, "legacy_resolved": 0}
+    needed = set(legacy.values())
+    resolved: Dict[str, str] = {}
+
+    with open(pairs_file, 'r') as pairs, open(output_dir / "redirects.csv", 'w', newline='') as csv_file, \
+            open(output_dir / ".exact.tsv", 'w') as exact:
+        writer = csv.writer(csv_file)
+        writer.writerow(["source", "destination", "language", "status_code"])
+
+        def add(source: str, destination: str, in_map: bool) -> None:
+            segments = [s for s in source.split("?")[0].split("/") if s]
+            lang = segments[0] if segments and LANGUAGE_SEGMENT.match(segments[0]) else "und"
+            writer.writerow([source.lstrip("/"), destination, lang, 301])
+            if in_map:
+                exact.write(f"{source}\t{destination}\n")
+                counts["exact"] += 1
+            else:
+                counts["csv_only"] += 1
+
+        for line in pairs:
+            source, destination, unchanged = line.rstrip("\n").split("\t")
+            if source in needed:
+                resolved[source] = destination
+            if unchanged == "1":
+                continue
+            if "?" in source:
+                add(source, destination, False)
+            elif covered(root, [s for s in source.split("/") if s]):
+                counts["collapsed"] += 1
+            else:
+                add(source, destination, True)
+
+        # Old-site redirects point to the new path of their final target
+        for source, target in legacy.items():
+            for _ in range(MAX_HOPS):
+                if target in resolved or target not in legacy:
+                    break
+                target = legacy[target]
+            if target in resolved and resolved[target] != source:
+                add(source, resolved[target], "?" not in source)
+                counts["legacy_resolved"] += 1
+
+    entries = counts["exact"] + len(rules)
+    hash_size = max(2048, 1 << entries.bit_length())
+    with open(output_dir / ".exact.tsv", 'r') as exact, \
+            open(output_dir / "redirects.nginx.conf", 'w') as nginx, \
+            open(output_dir / "redirects.caddy", 'w') as caddy:
+        nginx.write("# Generated by generate_redirects.py - include in the http block and add to the server block:\n"
+                    "#     if ($redirect_target) { return 301 $redirect_target; }\n"
+                    f"map_hash_max_size {hash_size};\nmap_hash_bucket_size 256;\n\n"
+                    "map $uri $redirect_target {\n    default \"\";\n")
+        caddy.write("# Generated by generate_redirects.py - import in the site block\n"
+                    "map {path} {redirect_target} {\n")
+        # Exact entries are hashed; regex rules are tried in order afterwards
+        for line in exact:
+            source, destination = line.rstrip("\n").split("\t")
+            nginx.write(f"    {quote(source)} {quote(destination)};\n")
+            caddy.write(f"    {quote(source)} {quote(destination)}\n")
+        for prefix, node in rules:
+            regex, target = rule_patterns(prefix, node.template)
+            nginx.write(f"    {quote('~' + regex)} {quote(target)};\n")
+            regex, target = rule_patterns(prefix, node.template, caddy=True)
+            caddy.write(f"    {quote_regex('~' + regex)} {quote(target)}\n")
+        nginx.write("}\n")
+        caddy.write("}\n\n@redirect expression `{redirect_target} != \"\"`\nredir @redirect {redirect_target} 301\n")
+    os.remove(output_dir / ".exact.tsv")
+    return counts
+
+
+def generate_redirects(input_file: Path, content_types_file: Path, output_dir: Path) -> Dict[str, Any]:
+    """Build the redirect map and write all output files."""
+    pairs_file = output_dir / ".pairs.tsv"
+    root, collected = build_redirects(input_file, content_types_file, pairs_file)
+    rules = drop_looping_rules(root, select_rules(root), pairs_file)
+    counts = write_outputs(root, rules, pairs_file, collected["legacy"], output_dir)
+    os.remove(pairs_file)
+
+    result = {
+        "stats": {**collected["stats"], **counts, "rules": len(rules)},
+        "rules": [],
+    }
+    for prefix, node in rules[:TOP_RULES]:
+        regex, target = rule_patterns(prefix, node.template)
+        result["rules"].append({"prefix": "/" + "/".join(prefix), "kind": node.template[0],
+                                "regex": regex, "target": target, "urls": node.count})
+    return result
+
+
+def main():
+    """Main execution function."""
+    if len(sys.argv) < 4:
+        print("Usage: python generate_redirects.py <urls> <content_types_json> <output_dir>")
+        print("\nExample:")
+        print("  python generate_redirects.py ./audit_data/crawl/inventory.jsonl "
+              "./audit_data/content_types.json ./audit_data/redirects")
+        sys.exit(1)
+
+    input_file = Path(sys.argv[1])
+    content_types_file = Path(sys.argv[2])
+    output_dir = Path(sys.argv[3])
+    for path in (input_file, content_types_file):
+        if not path.exists():
+            print(f"Error: File not found: {path}")
+            sys.exit(1)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    print(f"↪️  Generating redirects for: {input_file}")
+    result = generate_redirects(input_file, content_types_file, output_dir)
+
+    with open(output_dir / "redirects.json", 'w') as f:
+        json.dump(result, f, indent=2)
+
+    stats = result["stats"]
+    print(f"\n✅ {stats['urls']:,} URLs: {stats['redirects']:,} redirects, {stats['unchanged']:,} unchanged")
+    print(f"🗜️  {stats['collapsed']:,} redirects collapsed into {stats['rules']:,} rules, "
+          f"{stats['exact']:,} exact entries ({stats['legacy_resolved']:,} from old-site redirects)")
+    if stats["csv_only"]:
+        print(f"⚠️  {stats['csv_only']:,} URLs with query strings are only in redirects.csv")
+    if result["rules"]:
+        print("\n| Old Prefix | Kind | Target | URLs |")
+        print("|------------|------|--------|------|")
+        for rule in result["rules"]:
+            print(f"| `{rule['prefix']}` | {rule['kind']} | `{rule['target']}` | {rule['urls']:,} |")
+    print(f"\n📄 Saved to: {output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,11 @@ Usage:
 
 Audit data directory should contain:
     - audit_report.json (structured audit data)
+    - duplicate_pages.json, cleanup.tsv (optional, from find_duplicate_pages.py)
+    - performance.json (optional, from aggregate_lighthouse.py)
+    - accessibility.json, axe_pages.jsonl (optional, from aggregate_axe.py)
+    - network.json (optional, from analyze_har.py)
+    - structure.json (optional, from analyze_link_graph.py)
     - screenshots/ (optional)
     - diagrams/ (optional)
 """
@@ -20,7 +25,26 @@ import sys
 import shutil
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+from build_search_index import build_search_index
+from calculate_estimate import EntityEstimate, format_breakdown_table
+from data_tables import format_data_table, read_jsonl_rows
+
+
+# Self-hosted adesso corporate fonts (vendored from assets/fonts/)
+# Critical faces are preloaded: body text and headings above the fold
+FONT_FACES = [
+    {"family": "Fira Sans", "weight": 400, "file": "fira-sans-400.woff2", "preload": True},
+    {"family": "Fira Sans", "weight": 600, "file": "fira-sans-600.woff2", "preload": False},
+    {"family": "Fira Sans", "weight": 700, "file": "fira-sans-700.woff2", "preload": False},
+    {"family": "Fira Sans Condensed", "weight": 400, "file": "fira-sans-condensed-400.woff2", "preload": False},
+    {"family": "Fira Sans Condensed", "weight": 600, "file": "fira-sans-condensed-600.woff2", "preload": True},
+    {"family": "Fira Sans Condensed", "weight": 700, "file": "fira-sans-condensed-700.woff2", "preload": False},
+]
+
+# Latin + Latin-1 + General Punctuation + Euro sign (covers German and English reports)
+FONT_UNICODE_RANGE = "U+0000-00FF, U+0131, U+0152-0153, U+02BB-02BC, U+02C6, U+02DA, U+02DC, U+2000-206F, U+20AC, U+2122, U+2212"
 
 
 def create_vitepress_structure(output_dir: Path) -> None:
@@ -32,6 +56,7 @@ def create_vitepress_structure(output_dir: Path) -> None:
     (docs_dir / "public").mkdir(exist_ok=True)
     (docs_dir / "public" / "screenshots").mkdir(exist_ok=True)
     (docs_dir / "public" / "diagrams").mkdir(exist_ok=True)
+    (docs_dir / "public" / "fonts").mkdir(exist_ok=True)
     (docs_dir / ".vitepress").mkdir(exist_ok=True)
 
     # Create sections
@@ -41,8 +66,57 @@ def create_vitepress_structure(output_dir: Path) -> None:
         (docs_dir / section).mkdir(exist_ok=True)
 
 
-def generate_config(output_dir: Path, project_name: str, audit_date: str) -> None:
+def vendor_fonts(output_dir: Path) -> List[Dict[str, Any]]:
+    """Copy the subsetted font files from assets/fonts/ into docs/public/fonts."""
+    skill_dir = Path(__file__).parent.parent
+    fonts_src = skill_dir / "assets" / "fonts"
+    fonts_dst = output_dir / "docs" / "public" / "fonts"
+    fonts_dst.mkdir(parents=True, exist_ok=True)
+
+    vendored = []
+    for face in FONT_FACES:
+        src = fonts_src / face["file"]
+        if src.exists():
+            shutil.copy2(src, fonts_dst / face["file"])
+            vendored.append(face)
+
+    missing = len(FONT_FACES) - len(vendored)
+    if missing:
+        print(f"⚠️  Warning: {missing} font file(s) missing in {fonts_src}")
+        print("   Affected weights fall back to the system font stack (see assets/fonts/README.md).")
+
+    return vendored
+
+
+def generate_font_css(output_dir: Path, font_faces: List[Dict[str, Any]]) -> None:
+    """Generate @font-face rules for the vendored fonts."""
+    rules = ["/* adesso SE Corporate Fonts - self-hosted, generated by generate_vitepress_site.py */"]
+    for face in font_faces:
+        rules.append(f"""
+@font-face {{
+  font-family: '{face["family"]}';
+  font-style: normal;
+  font-weight: {face["weight"]};
+  font-display: swap;
+  src: url('/fonts/{face["file"]}') format('woff2');
+  unicode-range: {FONT_UNICODE_RANGE};
+}}""")
+
+    theme_dir = output_dir / "docs" / ".vitepress" / "theme"
+    theme_dir.mkdir(parents=True, exist_ok=True)
+    (theme_dir / "fonts.css").write_text("\n".join(rules) + "\n")
+
+
+def generate_config(output_dir: Path, project_name: str, audit_date: str,
+                    font_faces: Optional[List[Dict[str, Any]]] = None) -> None:
     """Generate VitePress config file with adesso branding."""
+    # Preload only the critical weights; the rest load on demand via font-display: swap
+    preload_links = [
+        f"['link', {{ rel: 'preload', href: '/fonts/{face['file']}', as: 'font', type: 'font/woff2', crossorigin: '' }}]"
+        for face in (font_faces or []) if face["preload"]
+    ]
+    head_entries = ",\n    ".join(preload_links)
+
     config_content = f"""import {{ defineConfig }} from 'vitepress'
 
 export default defineConfig({{
@@ -52,14 +126,9 @@ export default defineConfig({{
   // Disable dark mode (adesso theme is light mode only)
   appearance: false,
 
-  // Load Google Fonts for adesso corporate typography
+  // Preload self-hosted adesso fonts (no third-party requests)
   head: [
-    ['link', {{ rel: 'preconnect', href: 'https://fonts.googleapis.com' }}],
-    ['link', {{ rel: 'preconnect', href: 'https://fonts.gstatic.com', crossorigin: '' }}],
-    ['link', {{
-      rel: 'stylesheet',
-      href: 'https://fonts.googleapis.com/css2?family=Fira+Sans:wght@400;600;700&family=Fira+Sans+Condensed:wght@400;600;700&display=swap'
-    }}]
+    {head_entries}
   ],
 
   themeConfig: {{
@@ -208,6 +277,7 @@ def generate_theme_files(output_dir: Path) -> None:
 
         # Fallback: Generate theme inline if template not found
         (theme_dir / "index.js").write_text("""import DefaultTheme from 'vitepress/theme'
+import './fonts.css'
 import './custom.css'
 
 export default DefaultTheme
@@ -216,7 +286,7 @@ export default DefaultTheme
         (theme_dir / "custom.css").write_text("""/* adesso SE Corporate Theme - Fallback */
 :root {
   --vp-c-brand-1: #006EC7;
-  --vp-font-family-base: 'Fira Sans', sans-serif;
+  --vp-font-family-base: 'Fira Sans', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
   font-size: 17px;
 }
 .VPNav, .VPNavBar { background: linear-gradient(135deg, #006EC7 0%, #461EBE 100%) !important; }
@@ -417,6 +487,531 @@ See [Detailed Recommendations](/recommendations) for full analysis.
     path.write_text(content)
 
 
+def generate_data_tables(output_dir: Path, audit_data_dir: Path) -> None:
+    """Generate the Data Tables appendix (page inventory and entity breakdown).
+
+    Sources (both optional, read from the audit data directory):
+        - page_inventory.jsonl (one JSON object per migrated page)
+        - estimation_result.json (written by calculate_estimate.py)
+    """
+    docs_dir = output_dir / "docs"
+    sections = []
+
+    inventory_file = audit_data_dir / "page_inventory.jsonl"
+    if inventory_file.exists():
+        columns, rows = read_jsonl_rows(inventory_file)
+        if columns:
+            sections.append(f"""## Page Inventory
+
+{format_data_table(docs_dir, "page-inventory", columns, rows)}
+""")
+
+    estimation_file = audit_data_dir / "estimation_result.json"
+    if estimation_file.exists():
+        with open(estimation_file, 'r') as f:
+            breakdown = [EntityEstimate(**e) for e in json.load(f).get("breakdown", [])]
+        if breakdown:
+            sections.append(f"""## Entity Breakdown
+{format_breakdown_table(breakdown, docs_dir)}
+""")
+
+    if not sections:
+        sections.append("No data tables available for this audit.\n")
+
+    content = "# Data Tables\n\n" + "\n".join(sections)
+
+    path = docs_dir / "appendices" / "data-tables.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def generate_cleanup_page(output_dir: Path, audit_data_dir: Path) -> None:
+    """Generate the Content Cleanup page from find_duplicate_pages.py output.
+
+    Sources (optional, read from the audit data directory):
+        - duplicate_pages.json (summary, largest clusters, adjusted node count)
+        - cleanup.tsv (one row per page to drop)
+    """
+    docs_dir = output_dir / "docs"
+    summary_file = audit_data_dir / "duplicate_pages.json"
+    if not summary_file.exists():
+        content = "# Content Cleanup\n\nNo duplicate page analysis available for this audit.\n"
+    else:
+        with open(summary_file, 'r') as f:
+            summary = json.load(f)
+        stats = summary["stats"]
+        migration = summary["migration"]
+        share = stats["removed"] / migration["nodes_before"] * 100 if migration["nodes_before"] else 0
+
+        reasons = "\n".join(f"| {reason.capitalize()} | {count:,} |" for reason, count in summary["reasons"].items())
+        clusters = "\n".join(
+            f"| {c['canonical']} | {c['pages']:,} | {c['max_distance']} | {', '.join(c['examples'][:3])} |"
+            for c in summary["clusters"][:20]
+        )
+
+        cleanup_file = audit_data_dir / "cleanup.tsv"
+        cleanup_table = ""
+        if cleanup_file.exists():
+            def cleanup_rows():
+                with open(cleanup_file, 'r') as f:
+                    next(f)
+                    for line in f:
+                        yield line.rstrip("\n").split("\t")
+            cleanup_table = f"""
+## Pages to Drop
+
+{format_data_table(docs_dir, "content-cleanup", ["URL", "Canonical", "Distance", "Reason"], cleanup_rows())}
+"""
+
+        content = f"""# Content Cleanup
+
+Duplicate and near-duplicate pages found in the crawl. They are redirected to
+their canonical page instead of being migrated.
+
+::: tip Migration Volume
+**{migration['nodes_before']:,}** crawled pages → **{migration['nodes']:,}** nodes to migrate
+(**{stats['removed']:,}** duplicates, {share:.1f}%)
+:::
+
+## Reasons
+
+| Reason | Pages |
+|--------|-------|
+{reasons}
+
+## Largest Duplicate Clusters
+
+| Canonical Page | Pages | Max. Distance | Examples |
+|----------------|-------|---------------|----------|
+{clusters}
+{cleanup_table}
+_{stats['thin']:,} pages had too little text to compare and are kept._
+"""
+
+    path = docs_dir / "migration" / "cleanup.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def format_ms(value: float) -> str:
+    """Format a millisecond metric for tables."""
+    return f"{value / 1000:.2f} s" if value >= 1000 else f"{value:.0f} ms"
+
+
+def format_bytes(value: float) -> str:
+    """Format a byte count for tables."""
+    return f"{value / 1024 / 1024:.1f} MB" if value >= 1024 * 1024 else f"{value / 1024:.0f} KB"
+
+
+def generate_performance_pages(output_dir: Path, audit_data_dir: Path) -> None:
+    """Generate the Performance section from aggregate_lighthouse.py output.
+
+    Source (optional, read from the audit data directory):
+        - performance.json (percentiles per page type, resource sizes)
+    """
+    section_dir = output_dir / "docs" / "performance"
+    section_dir.mkdir(parents=True, exist_ok=True)
+
+    performance_file = audit_data_dir / "performance.json"
+    if not performance_file.exists():
+        for page, title in [("index.md", "Performance"), ("core-web-vitals.md", "Core Web Vitals")]:
+            (section_dir / page).write_text(f"# {title}\n\nNo Lighthouse data available for this audit.\n")
+        return
+
+    with open(performance_file, 'r') as f:
+        performance = json.load(f)
+    overall = performance["overall"]
+    stats = performance["stats"]
+
+    def rating(summary: Dict[str, Any], metric: str) -> str:
+        values = summary.get(metric) or {}
+        return f"{values.get('good', 0) * 100:.0f}% good / {values.get('poor', 0) * 100:.0f}% poor"
+
+    index_content = f"""# Performance
+
+Lab data from **{stats['parsed']:,} Lighthouse reports**, aggregated per page type.
+
+| Metric | p50 | p75 | p90 | Rating |
+|--------|-----|-----|-----|--------|
+| Performance Score | {overall['score'].get('p50', 0):.0f} | {overall['score'].get('p75', 0):.0f} | {overall['score'].get('p90', 0):.0f} | |
+| Largest Contentful Paint | {format_ms(overall['lcp'].get('p50', 0))} | {format_ms(overall['lcp'].get('p75', 0))} | {format_ms(overall['lcp'].get('p90', 0))} | {rating(overall, 'lcp')} |
+| Cumulative Layout Shift | {overall['cls'].get('p50', 0):.3f} | {overall['cls'].get('p75', 0):.3f} | {overall['cls'].get('p90', 0):.3f} | {rating(overall, 'cls')} |
+| Total Blocking Time | {format_ms(overall['tbt'].get('p50', 0))} | {format_ms(overall['tbt'].get('p75', 0))} | {format_ms(overall['tbt'].get('p90', 0))} | {rating(overall, 'tbt')} |
+| Page Weight | {format_bytes(overall['bytes'].get('p50', 0))} | {format_bytes(overall['bytes'].get('p75', 0))} | {format_bytes(overall['bytes'].get('p90', 0))} | |
+
+- [Core Web Vitals by page type](./core-web-vitals)
+- [Asset Optimization](./assets)
+"""
+
+    page_types = "\n".join(
+        f"| {name} | {summary['pages']:,} | {summary['score'].get('p50', 0):.0f} | "
+        f"{format_ms(summary['lcp'].get('p75', 0))} | {summary['cls'].get('p75', 0):.3f} | "
+        f"{format_ms(summary['tbt'].get('p75', 0))} | {rating(summary, 'lcp')} |"
+        for name, summary in performance["page_types"].items()
+    )
+    slowest = "\n".join(
+        f"| {page['url']} | {page['page_type']} | {format_ms(page['lcp'])} |"
+        for page in performance["slowest_pages"]
+    )
+    cwv_content = f"""# Core Web Vitals
+
+Thresholds: LCP ≤ 2.5 s, CLS ≤ 0.1, TBT ≤ 200 ms (lab proxy for INP).
+Values are the 75th percentile per page type, as in the Chrome UX Report.
+
+## By Page Type
+
+| Page Type | Pages | Score p50 | LCP p75 | CLS p75 | TBT p75 | LCP Rating |
+|-----------|-------|-----------|---------|---------|---------|------------|
+{page_types}
+
+## Slowest Pages (LCP)
+
+| URL | Page Type | LCP |
+|-----|-----------|-----|
+{slowest}
+"""
+
+    (section_dir / "index.md").write_text(index_content)
+    (section_dir / "core-web-vitals.md").write_text(cwv_content)
+
+
+def generate_assets_page(output_dir: Path, audit_data_dir: Path) -> None:
+    """Generate the Asset Optimization page from Lighthouse and HAR data.
+
+    Sources (optional, read from the audit data directory):
+        - performance.json (aggregate_lighthouse.py: transfer sizes per page)
+        - network.json (analyze_har.py: origins, caching, render-blocking resources)
+    """
+    sections = []
+
+    performance_file = audit_data_dir / "performance.json"
+    if performance_file.exists():
+        with open(performance_file, 'r') as f:
+            performance = json.load(f)
+        resources = "\n".join(
+            f"| {resource_type.replace('-', ' ').title()} | {format_bytes(values.get('p50', 0))} | "
+            f"{format_bytes(values.get('p90', 0))} | {format_bytes(values['total'])} |"
+            for resource_type, values in performance["resources"].items()
+        )
+        sections.append(f"""## Transfer Size per Page
+
+Transfer sizes per page by resource type (Lighthouse resource summary).
+
+| Resource Type | p50 per Page | p90 per Page | Total (all tested pages) |
+|---------------|--------------|--------------|--------------------------|
+{resources}
+""")
+
+    network_file = audit_data_dir / "network.json"
+    if network_file.exists():
+        with open(network_file, 'r') as f:
+            network = json.load(f)
+        stats = network["stats"]
+        total = stats["bytes"] or 1
+        by_type = "\n".join(
+            f"| {rtype.title()} | {values['requests']:,} | {format_bytes(values['bytes'])} | "
+            f"{values['bytes'] / total * 100:.0f}% |"
+            for rtype, values in network["by_type"].items()
+        )
+        cache = "\n".join(
+            f"| {bucket} | {values['requests']:,} | {format_bytes(values['bytes'])} |"
+            for bucket, values in network["cache"].items()
+        )
+        origins = "\n".join(
+            f"| {o['origin']} | {o['vendor'] or 'First party'} | {o['requests']:,} | {format_bytes(o['bytes'])} |"
+            for o in network["origins"][:20]
+        )
+        blocking = "\n".join(
+            f"| {r['url']} | {r['type'].title()} | {format_bytes(r['bytes'])} | {r['pages']:,} | "
+            f"{'Yes' if r['third_party'] else 'No'} |"
+            for r in network["render_blocking"]
+        ) or "| – | | | | |"
+        uncompressed = network["uncompressed_text"]
+        sections.append(f"""## Network Requests
+
+**{stats['requests']:,} requests** ({format_bytes(stats['bytes'])}) on {stats['pages']:,} recorded pages.
+
+| Resource Type | Requests | Transferred | Share |
+|---------------|----------|-------------|-------|
+{by_type}
+
+## Caching
+
+| Cache Policy | Requests | Transferred |
+|--------------|----------|-------------|
+{cache}
+
+Uncompressed text responses: **{uncompressed.get('requests', 0):,}** ({format_bytes(uncompressed.get('bytes', 0))}).
+
+## Origins
+
+| Origin | Vendor | Requests | Transferred |
+|--------|--------|----------|-------------|
+{origins}
+
+## Render-Blocking Resources
+
+| Resource | Type | Size | Pages | Third Party |
+|----------|------|------|-------|-------------|
+{blocking}
+""")
+
+    if not sections:
+        sections.append("No Lighthouse or HAR data available for this audit.\n")
+
+    path = output_dir / "docs" / "performance" / "assets.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("# Asset Optimization\n\n" + "\n".join(sections))
+
+
+def generate_integration_pages(output_dir: Path, audit_data_dir: Path) -> None:
+    """Generate the Integrationen section from the third-party inventory.
+
+    Source (optional, read from the audit data directory):
+        - network.json (analyze_har.py)
+    """
+    section_dir = output_dir / "docs" / "integrationen"
+    section_dir.mkdir(parents=True, exist_ok=True)
+
+    pages = {
+        "index.md": ("Übersicht & Systemlandschaft", None),
+        "sso.md": ("SSO & Authentication", {"sso"}),
+        "apis.md": ("APIs & External Systems", {"apis", "marketing", "support", "forms", "maps"}),
+        "cdn.md": ("CDN & Performance", {"cdn", "fonts", "video", "monitoring"}),
+        "search.md": ("Search & Analytics", {"search", "analytics", "tag-manager", "advertising",
+                                              "consent", "social"}),
+    }
+
+    network_file = audit_data_dir / "network.json"
+    if not network_file.exists():
+        for page, (title, _) in pages.items():
+            (section_dir / page).write_text(f"# {title}\n\nNo HAR recordings available for this audit.\n")
+        return
+
+    with open(network_file, 'r') as f:
+        network = json.load(f)
+    third_parties = network["third_parties"]
+    recorded_pages = network["stats"]["pages"] or 1
+
+    def table(vendors: List[Dict[str, Any]]) -> str:
+        if not vendors:
+            return "No third-party services of this kind were observed."
+        rows = "\n".join(
+            f"| {v['vendor']} | {v['category']} | {', '.join(v['origins'][:3])} | "
+            f"{v['pages'] / recorded_pages * 100:.0f}% | {v['scripts']:,} | {format_bytes(v['bytes'])} |"
+            for v in vendors
+        )
+        return f"""| Service | Category | Origins | Pages | Scripts | Transferred |
+|---------|----------|---------|-------|---------|-------------|
+{rows}"""
+
+    for page, (title, categories) in pages.items():
+        if categories is None:
+            categorized = set().union(*(c for _, c in pages.values() if c))
+            other = [v for v in third_parties if v["category"] not in categorized]
+            content = f"""# {title}
+
+Third-party services observed in {network['stats']['pages']:,} recorded pages
+(first party: `{network['stats']['first_party']}`). Every service must be re-integrated,
+replaced or dropped in the new platform.
+
+{table(third_parties)}
+
+- [SSO & Authentication](./sso)
+- [APIs & External Systems](./apis)
+- [CDN & Performance](./cdn)
+- [Search & Analytics](./search)
+"""
+            if other:
+                content += f"\n## Unclassified\n\n{table(other)}\n"
+        else:
+            content = f"# {title}\n\n{table([v for v in third_parties if v['category'] in categories])}\n"
+        (section_dir / page).write_text(content)
+
+
+def generate_accessibility_pages(output_dir: Path, audit_data_dir: Path) -> None:
+    """Generate the Accessibility section from aggregate_axe.py output.
+
+    Sources (optional, read from the audit data directory):
+        - accessibility.json (WCAG tallies, unique issues, remediation hours)
+        - axe_pages.jsonl (violations per page)
+    """
+    docs_dir = output_dir / "docs"
+    section_dir = docs_dir / "accessibility"
+    section_dir.mkdir(parents=True, exist_ok=True)
+
+    accessibility_file = audit_data_dir / "accessibility.json"
+    if not accessibility_file.exists():
+        for page, title in [("index.md", "Accessibility"), ("wcag-audit.md", "WCAG 2.1 Audit"),
+                            ("issues.md", "Issues Found"), ("remediation.md", "Remediation Plan")]:
+            (section_dir / page).write_text(f"# {title}\n\nNo axe-core results available for this audit.\n")
+        return
+
+    with open(accessibility_file, 'r') as f:
+        accessibility = json.load(f)
+    stats = accessibility["stats"]
+    remediation = accessibility["remediation"]
+
+    levels = "\n".join(f"| {level} | {count:,} |" for level, count in accessibility["levels"].items())
+    index_content = f"""# Accessibility
+
+Automated testing with axe-core on **{stats['pages']:,} pages**.
+
+::: warning Unique Issues
+**{stats['occurrences']:,}** violations on {stats['pages_with_violations']:,} pages come down to
+**{stats['unique_issues']:,} unique issues** (same rule and element across pages, e.g. in the shared header).
+:::
+
+| Level | Unique Issues |
+|-------|---------------|
+{levels}
+
+- [WCAG 2.1 Audit](./wcag-audit) – violations per success criterion
+- [Issues Found](./issues) – unique issues and affected pages
+- [Remediation Plan](./remediation) – effort by impact (**{remediation['total_hours']:.1f} hours**)
+
+Automated tests find roughly a third of WCAG issues; manual testing is still required.
+"""
+
+    criteria = "\n".join(
+        f"| {c['criterion']} | {c['issues']:,} | "
+        f"{c['occurrences']:,} | {c['pages']:,} |"
+        for c in accessibility["wcag"]
+    )
+    wcag_content = f"""# WCAG 2.1 Audit
+
+Violations per WCAG success criterion. Best-practice rules without a criterion are listed under
+[Issues Found](./issues) only.
+
+| Criterion | Unique Issues | Occurrences | Pages |
+|-----------|---------------|-------------|-------|
+{criteria}
+"""
+
+    issue_rows = ([i["impact"].title(), i["rule"], f"`{i['selector']}`", ", ".join(i["criteria"]) or "–",
+                   i["pages"], i["occurrences"], i["help"]] for i in accessibility["issues"])
+    issues_table = format_data_table(docs_dir, "accessibility-issues",
+                                     ["Impact", "Rule", "Element", "WCAG", "Pages", "Occurrences", "Description"],
+                                     issue_rows)
+    pages_table = ""
+    pages_file = audit_data_dir / "axe_pages.jsonl"
+    if pages_file.exists():
+        columns, rows = read_jsonl_rows(pages_file)
+        if columns:
+            pages_table = f"""
+## Violations per Page
+
+{format_data_table(docs_dir, "accessibility-pages", [c.upper() if c == "url" else c.title() for c in columns], rows)}
+"""
+    issues_content = f"""# Issues Found
+
+Unique issues, most severe first. An issue is one rule on one element pattern and is fixed once,
+however many pages show it.
+
+{issues_table}
+{pages_table}"""
+
+    impact_rows = "\n".join(
+        f"| {impact.title()} | {values['issues']:,} | {values['hours']:.1f} |"
+        for impact, values in remediation["by_impact"].items()
+    )
+    remediation_content = f"""# Remediation Plan
+
+Effort per unique issue by impact, as used in the estimate (`accessibility` section of entities.json).
+
+| Impact | Unique Issues | Hours |
+|--------|---------------|-------|
+{impact_rows}
+| **Total** | | **{remediation['total_hours']:.1f}** |
+
+Critical and serious issues block users and are fixed in the new theme components first;
+moderate and minor issues follow with the content migration.
+"""
+
+    (section_dir / "index.md").write_text(index_content)
+    (section_dir / "wcag-audit.md").write_text(wcag_content)
+    (section_dir / "issues.md").write_text(issues_content)
+    (section_dir / "remediation.md").write_text(remediation_content)
+
+
+def generate_structure_page(output_dir: Path, audit_data_dir: Path) -> None:
+    """Generate the Site Structure page from analyze_link_graph.py output.
+
+    Source (optional, read from the audit data directory):
+        - structure.json (click depth, orphans, hubs, sections, hierarchy diagram)
+    """
+    path = output_dir / "docs" / "current-site" / "structure.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    structure_file = audit_data_dir / "structure.json"
+    if not structure_file.exists():
+        path.write_text("# Site Structure\n\nNo link graph analysis available for this audit.\n")
+        return
+
+    with open(structure_file, 'r') as f:
+        structure = json.load(f)
+    stats = structure["stats"]
+
+    depths = "\n".join(f"| {depth} | {count:,} |" for depth, count in structure["depth_histogram"].items())
+    sections = "\n".join(
+        f"| `{s['section']}` | {s['pages']:,} | {s['avg_depth']} | {s['max_depth']} | {s['deep_pages']:,} |"
+        for s in structure["sections"][:25]
+    )
+    hubs = "\n".join(
+        f"| {h['url']} | {h['links']:,} |" for h in structure["hubs"]["inbound"][:10]
+    )
+    orphans = "\n".join(f"- {url}" for url in structure["orphans"][:50]) or "None found."
+
+    content = f"""# Site Structure
+
+Link graph of **{stats['pages']:,} pages** with **{stats['edges']:,} unique internal links**.
+
+![Site hierarchy]({structure['diagram']})
+
+## Click Depth
+
+Average click depth **{stats['avg_depth']}**, maximum **{stats['max_depth']}**.
+**{stats['deep_pages']:,}** pages need more than three clicks from the start page.
+
+| Clicks | Pages |
+|--------|-------|
+{depths}
+
+## Sections
+
+| Section | Pages | Avg. Depth | Max. Depth | Deeper than 3 |
+|---------|-------|------------|------------|---------------|
+{sections}
+
+## Most Linked Pages
+
+| Page | Inbound Links |
+|------|---------------|
+{hubs}
+
+## Orphaned Pages
+
+**{stats['orphans']:,}** pages have no inbound links; **{stats['unreachable']:,}** pages are not
+reachable from the start page. Candidates for the content cleanup.
+
+{orphans}
+"""
+    path.write_text(content)
+
+
+def generate_pages(output_dir: Path, audit_data: Dict[str, Any], audit_data_dir: Path) -> None:
+    """Generate every audit page (shared by the site build and preview_report.py)."""
+    generate_index(output_dir, audit_data)
+    generate_key_findings(output_dir, audit_data)
+    generate_data_tables(output_dir, audit_data_dir)
+    generate_cleanup_page(output_dir, audit_data_dir)
+    generate_structure_page(output_dir, audit_data_dir)
+    generate_performance_pages(output_dir, audit_data_dir)
+    generate_assets_page(output_dir, audit_data_dir)
+    generate_integration_pages(output_dir, audit_data_dir)
+    generate_accessibility_pages(output_dir, audit_data_dir)
+
+
 def generate_package_json(output_dir: Path, project_name: str) -> None:
     """Generate package.json for VitePress."""
     package_content = {
@@ -429,6 +1024,7 @@ def generate_package_json(output_dir: Path, project_name: str) -> None:
             "docs:preview": "vitepress preview docs"
         },
         "devDependencies": {
+            "minisearch": "^7.0.0",
             "vitepress": "^1.0.0"
         }
     }
@@ -506,6 +1102,11 @@ The built site in `docs/.vitepress/dist/` can be deployed to:
 - **Vercel**: Connect repository and deploy
 - **GitHub Pages**: Use GitHub Actions workflow
 - **Any static host**: Upload dist folder contents
+- **Caddy**: Pre-compress first, then import the generated `docs/.vitepress/Caddyfile.precompressed` snippet
+
+```bash
+python <skill_dir>/scripts/precompress_site.py docs/.vitepress/dist
+```
 
 ## Documentation Structure
 
@@ -569,18 +1170,27 @@ def main():
     print("\n📂 Creating directory structure...")
     create_vitepress_structure(output_dir)
 
+    # Vendor fonts
+    print("🔤 Vendoring self-hosted fonts...")
+    font_faces = vendor_fonts(output_dir)
+
     # Generate config
     print("⚙️  Generating VitePress config...")
-    generate_config(output_dir, project_name, audit_date)
+    generate_config(output_dir, project_name, audit_date, font_faces)
 
     # Generate adesso theme
     print("🎨 Generating adesso SE corporate theme...")
     generate_theme_files(output_dir)
+    generate_font_css(output_dir, font_faces)
 
     # Generate pages
     print("📄 Generating pages...")
-    generate_index(output_dir, audit_data)
-    generate_key_findings(output_dir, audit_data)
+    generate_pages(output_dir, audit_data, audit_data_dir)
+
+    # Build search index (after all pages are written)
+    print("🔎 Building search index...")
+    search_counts = build_search_index(output_dir / "docs")
+    print(f"   {sum(search_counts.values())} entries in {len(search_counts)} shards")
 
     # Generate package.json
     print("📦 Generating package.json...")
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Pre-compression for Built Audit Sites
+
+This script post-processes a built VitePress site (docs/.vitepress/dist) so
+Caddy can serve pre-compressed files instead of compressing every response
+on the fly. For each text asset it writes sidecars next to the original:
+
+    app.js -> app.js.gz, app.js.zst, app.js.br
+
+Already-compressed formats (images, fonts, archives) are skipped. Files are
+compressed in parallel on a process pool; sidecars whose source hash is
+unchanged since the last run are reused. The manifest tracking them
+(.precompress-manifest.json) and a matching Caddy snippet using
+`file_server { precompressed }` are written next to the dist directory, so
+neither is served. Sidecars of deleted files and of encodings that are no
+longer available are removed.
+
+Encodings:
+    gzip   - always (standard library)
+    zstd   - requires `zstandard` (pip install zstandard) or Python 3.14+
+    brotli - optional, requires `brotli` (pip install brotli)
+
+Usage:
+    python precompress_site.py <dist_dir>
+
+Example:
+    python precompress_site.py ./site-audit-docs/docs/.vitepress/dist
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    from compression import zstd as stdlib_zstd  # Python 3.14+
+except ImportError:
+    stdlib_zstd = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# Text assets worth compressing (images, fonts and archives are already compressed)
+COMPRESSIBLE_EXTENSIONS = {
+    ".html", ".css", ".js", ".mjs", ".json", ".svg", ".xml", ".txt", ".map", ".md", ".webmanifest",
+}
+
+# Below this size the sidecar saves less than its own request overhead
+MIN_COMPRESS_BYTES = 1024
+
+# Sidecar extension per Caddy encoding name, in server preference order
+SIDECAR_EXTENSIONS = {
+    "br": ".br",
+    "zstd": ".zst",
+    "gzip": ".gz",
+}
+
+# Written next to the dist directory (older runs wrote it inside, where it was served)
+MANIFEST_NAME = ".precompress-manifest.json"
+
+
+def available_encodings() -> List[str]:
+    """Encodings that can be produced with the installed libraries."""
+    encodings = []
+    if brotli is not None:
+        encodings.append("br")
+    if zstandard is not None or stdlib_zstd is not None:
+        encodings.append("zstd")
+    encodings.append("gzip")
+    return encodings
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Compress data at the highest practical level (done once, served many times)."""
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if encoding == "zstd":
+        if zstandard is not None:
+            return zstandard.ZstdCompressor(level=19).compress(data)
+        return stdlib_zstd.compress(data, level=19)
+    if encoding == "br":
+        return brotli.compress(data, quality=11)
+    raise ValueError(f"Unknown encoding: {encoding}")
+
+
+def compress_file(path: str, encodings: List[str]) -> Tuple[str, str, Dict[str, int]]:
+    """Write sidecars for one file; return (path, source hash, sizes per encoding).
+
+    Sidecars that are not smaller than the source are removed so Caddy falls
+    back to the original.
+    """
+    data = Path(path).read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    sizes = {}
+    for encoding in encodings:
+        sidecar = Path(path + SIDECAR_EXTENSIONS[encoding])
+        compressed = compress(data, encoding)
+        if len(compressed) < len(data):
+            sidecar.write_bytes(compressed)
+            sizes[encoding] = len(compressed)
+        elif sidecar.exists():
+            sidecar.unlink()
+    return path, digest, sizes
+
+
+def file_hash(path: Path) -> str:
+    """SHA-256 of a file's contents."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def find_assets(dist_dir: Path) -> List[Path]:
+    """Text assets in the dist directory that are worth compressing."""
+    return [
+        path for path in sorted(dist_dir.rglob("*"))
+        if path.is_file()
+        and path.suffix.lower() in COMPRESSIBLE_EXTENSIONS
+        and path.stat().st_size >= MIN_COMPRESS_BYTES
+    ]
+
+
+def remove_orphan_sidecars(dist_dir: Path, previous: Dict[str, Any], encodings: List[str]) -> int:
+    """Delete sidecars from the last run whose source file no longer exists or whose encoding was dropped."""
+    removed = 0
+    for rel, entry in previous.items():
+        source = dist_dir / rel
+        exists = source.exists()
+        for encoding in entry["sizes"]:
+            if exists and encoding in encodings:
+                continue
+            sidecar = Path(str(source) + SIDECAR_EXTENSIONS[encoding])
+            if sidecar.exists():
+                sidecar.unlink()
+                removed += 1
+    return removed
+
+
+def precompress_site(dist_dir: Path, workers: Optional[int] = None) -> Dict[str, Any]:
+    """Write compressed sidecars for all text assets; return run statistics."""
+    encodings = available_encodings()
+    manifest_path = dist_dir.parent / MANIFEST_NAME
+    legacy_path = dist_dir / MANIFEST_NAME
+    if legacy_path.exists():
+        if not manifest_path.exists():
+            legacy_path.replace(manifest_path)
+        else:
+            legacy_path.unlink()
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+    previous = manifest.get("files", {})
+    if manifest.get("encodings") != encodings:
+        # Different encoding set: recompress everything; sidecars of dropped encodings are removed below
+        reusable = {}
+    else:
+        reusable = previous
+
+    todo = []
+    reused = {}
+    for path in find_assets(dist_dir):
+        rel = path.relative_to(dist_dir).as_posix()
+        entry = reusable.get(rel)
+        if entry and entry["hash"] == file_hash(path) and all(
+                Path(str(path) + SIDECAR_EXTENSIONS[e]).exists() for e in entry["sizes"]):
+            reused[rel] = entry
+        else:
+            todo.append(str(path))
+
+    files = dict(reused)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for path, digest, sizes in pool.map(compress_file, todo, [encodings] * len(todo), chunksize=8):
+            rel = Path(path).relative_to(dist_dir).as_posix()
+            files[rel] = {"hash": digest, "size": os.path.getsize(path), "sizes": sizes}
+
+    manifest_path.write_text(json.dumps({"encodings": encodings, "files": files}, indent=2))
+
+    return {
+        "encodings": encodings,
+        "compressed": len(todo),
+        "reused": len(reused),
+        "orphans_removed": remove_orphan_sidecars(dist_dir, previous, encodings),
+        "original_bytes": sum(f["size"] for f in files.values()),
+        "compressed_bytes": {e: sum(f["sizes"].get(e, f["size"]) for f in files.values()) for e in encodings},
+    }
+
+
+def generate_caddy_snippet(dist_dir: Path, encodings: List[str]) -> Path:
+    """Write a Caddy snippet serving the pre-compressed sidecars."""
+    content = f"""# Generated by precompress_site.py - serve pre-compressed audit site
+#
+# Import in your site block with the dist directory as argument:
+#
+#   audit.example.com {{
+#       import Caddyfile.precompressed {dist_dir.resolve()}
+#   }}
+
+root * {{args[0]}}
+
+# Stream .br/.zst/.gz sidecars directly (no per-request compression)
+file_server {{
+    precompressed {' '.join(encodings)}
+}}
+
+# Hashed build assets never change
+@hashed path /assets/*
+header @hashed Cache-Control "public, max-age=31536000, immutable"
+"""
+
+    path = dist_dir.parent / "Caddyfile.precompressed"
+    path.write_text(content)
+    return path
+
+
+def main():
+    """Main execution function."""
+    if len(sys.argv) < 2:
+        print("Usage: python precompress_site.py <dist_dir>")
+        print("\nExample:")
+        print("  python precompress_site.py ./site-audit-docs/docs/.vitepress/dist")
+        sys.exit(1)
+
+    dist_dir = Path(sys.argv[1])
+    if not dist_dir.is_dir():
+        print(f"Error: Directory not found: {dist_dir}")
+        print("Run `npm run docs:build` first.")
+        sys.exit(1)
+
+    if zstandard is None and stdlib_zstd is None:
+        print("⚠️  Warning: zstandard not installed, skipping .zst sidecars (pip install zstandard)")
+
+    print(f"🗜️  Pre-compressing: {dist_dir}")
+    stats = precompress_site(dist_dir)
+    snippet = generate_caddy_snippet(dist_dir, stats["encodings"])
+
+    print(f"\n✅ Compressed {stats['compressed']} files, reused {stats['reused']} unchanged")
+    if stats["orphans_removed"]:
+        print(f"🧹 Removed {stats['orphans_removed']} orphaned sidecars")
+    original = stats["original_bytes"] or 1
+    for encoding, size in stats["compressed_bytes"].items():
+        print(f"   {encoding}: {stats['original_bytes'] / 1024:.0f} KB → {size / 1024:.0f} KB "
+              f"({size / original * 100:.0f}%)")
+    print(f"\n📄 Caddy snippet saved to: {snippet}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Fast Preview: Single-File HTML Audit Report
+
+This script renders the same audit pages as generate_vitepress_site.py into
+one self-contained HTML file - no npm install, no VitePress build. Useful for
+a quick look or as an email attachment. Python standard library only.
+
+The pages are produced by the generator's own generate_pages() (into a
+temporary directory, so new pages show up in both) and converted with a small Markdown renderer that
+covers the subset the generator emits: headings, paragraphs, lists, tables,
+code blocks, ::: callouts, links and images.
+
+CSS is inlined from the adesso theme assets. Screenshots are embedded as
+lazily decoded images: the standard library cannot resample images, so a
+pre-downscaled variant from screenshots/thumbs/ is used when present, and
+originals are only embedded up to PREVIEW_MAX_IMAGE_BYTES.
+
+Usage:
+    python preview_report.py <audit_data_dir> <output_html>
+"""
+
+import base64
+import html
+import json
+import re
+import struct
+import sys
+import tempfile
+import time
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+from generate_vitepress_site import generate_pages
+
+
+# Originals larger than this are not embedded (use screenshots/thumbs/ instead)
+PREVIEW_MAX_IMAGE_BYTES = 400_000
+
+IMAGE_MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+    ".svg": "image/svg+xml",
+}
+
+PREVIEW_CSS = """
+body { margin: 0; font-family: var(--vp-font-family-base); color: var(--vp-c-text-1); background: var(--vp-c-bg); }
+.preview-header { padding: 24px 48px; color: #ffffff; background: linear-gradient(135deg, #006ec7 0%, #461ebe 100%); }
+.preview-header h1 { margin: 0; font-family: 'Fira Sans Condensed', -apple-system, BlinkMacSystemFont, sans-serif; }
+.preview-layout { display: flex; }
+.preview-nav { flex: 0 0 260px; padding: 24px; color: #ffffff; background: linear-gradient(180deg, #006ec7 0%, #461ebe 100%); }
+.preview-nav a { display: block; padding: 4px 0; color: #ffffff; text-decoration: none; }
+.preview-main { flex: 1; min-width: 0; padding: 24px 48px; }
+.preview-page { padding-bottom: 32px; border-bottom: 1px solid var(--vp-c-divider); }
+.preview-page h1, .preview-page h2, .preview-page h3 { font-family: 'Fira Sans Condensed', -apple-system, BlinkMacSystemFont, sans-serif; color: var(--vp-c-brand-1); }
+.preview-page table { border-collapse: collapse; margin: 16px 0; }
+.preview-page th, .preview-page td { padding: 6px 12px; border: 1px solid var(--vp-c-border); text-align: left; }
+.preview-page th { background: var(--vp-c-bg-soft); }
+.preview-page pre { padding: 12px; overflow-x: auto; background: var(--vp-code-block-bg); }
+.preview-page code { font-family: var(--vp-font-family-mono); }
+.custom-block { margin: 16px 0; padding: 12px 16px; border-left: 4px solid var(--vp-c-brand-1); background: var(--vp-c-bg-soft); }
+.custom-block.tip { border-color: var(--vp-c-tip-1); }
+.custom-block.warning { border-color: var(--vp-c-warning-1); }
+.custom-block.danger { border-color: var(--vp-c-danger-1); }
+.preview-screenshots img { max-width: 100%; height: auto; border: 1px solid var(--vp-c-border); }
+"""
+
+# Swap data-src into src once an image approaches the viewport
+LAZY_IMAGE_SCRIPT = """
+const observer = new IntersectionObserver((entries) => {
+  for (const entry of entries) {
+    if (entry.isIntersecting) {
+      entry.target.src = entry.target.dataset.src;
+      observer.unobserve(entry.target);
+    }
+  }
+}, { rootMargin: '400px' });
+document.querySelectorAll('img[data-src]').forEach((img) => observer.observe(img));
+"""
+
+
+def render_inline(text: str, anchors: Dict[str, str]) -> str:
+    """Render inline Markdown (code, bold, italic, images, links)."""
+    placeholders: List[str] = []
+
+    def keep(fragment: str) -> str:
+        placeholders.append(fragment)
+        return f"\x00{len(placeholders) - 1}\x00"
+
+    def link(match: re.Match) -> str:
+        label, href = match.group(1), match.group(2)
+        route = href.split("#")[0]
+        if route in anchors:
+            href = f"#{anchors[route]}"
+        return keep(f'<a href="{html.escape(href)}">') + label + keep("</a>")
+
+    text = re.sub(r"`([^`]+)`", lambda m: keep(f"<code>{html.escape(m.group(1))}</code>"), text)
+    text = re.sub(r"!\[([^\]]*)\]\(([^)]*)\)",
+                  lambda m: keep(f'<em>[Image: {html.escape(m.group(1) or m.group(2))}]</em>'), text)
+    text = re.sub(r"\[([^\]]*)\]\(([^)]*)\)", link, text)
+    text = html.escape(text, quote=False)
+    text = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", text)
+    text = re.sub(r"(?<!\w)\*(.+?)\*(?!\w)", r"<em>\1</em>", text)
+    return re.sub(r"\x00(\d+)\x00", lambda m: placeholders[int(m.group(1))], text)
+
+
+def render_table(lines: List[str], anchors: Dict[str, str]) -> str:
+    """Render a Markdown table (first line header, second line separator)."""
+    def cells(line: str) -> List[str]:
+        return [c.strip() for c in re.split(r"(?<!\\)\|", line.strip().strip("|"))]
+
+    head = "".join(f"<th>{render_inline(c, anchors)}</th>" for c in cells(lines[0]))
+    body = "".join(
+        "<tr>" + "".join(f"<td>{render_inline(c.replace(chr(92) + '|', '|'), anchors)}</td>"
+                         for c in cells(line)) + "</tr>"
+        for line in lines[2:]
+    )
+    return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+
+def render_list(lines: List[str], anchors: Dict[str, str]) -> str:
+    """Render a (possibly nested) list from indented list lines."""
+    output = []
+    stack: List[Tuple[int, str]] = []
+    for line in lines:
+        match = re.match(r"^(\s*)([-*]|\d+\.)\s+(.*)$", line)
+        if not match:
+            # Continuation line of the previous item
+            output.append(" " + render_inline(line.strip(), anchors))
+            continue
+        indent = len(match.group(1))
+        tag = "ol" if match.group(2)[0].isdigit() else "ul"
+        while stack and stack[-1][0] > indent:
+            output.append(f"</li></{stack.pop()[1]}>")
+        if stack and stack[-1][0] == indent:
+            output.append("</li>")
+        else:
+            output.append(f"<{tag}>")
+            stack.append((indent, tag))
+        output.append(f"<li>{render_inline(match.group(3), anchors)}")
+    while stack:
+        output.append(f"</li></{stack.pop()[1]}>")
+    return "".join(output)
+
+
+def render_markdown(markdown: str, anchors: Dict[str, str]) -> str:
+    """Render the Markdown subset emitted by the page generators to HTML."""
+    if markdown.startswith("---"):
+        end = markdown.find("\n---", 3)
+        if end != -1:
+            markdown = markdown[end + 4:]
+
+    lines = markdown.splitlines()
+    output = []
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+
+        if not stripped:
+            i += 1
+        elif stripped.startswith("```"):
+            code = []
+            i += 1
+            while i < len(lines) and not lines[i].strip().startswith("```"):
+                code.append(lines[i])
+                i += 1
+            output.append(f"<pre><code>{html.escape(chr(10).join(code))}</code></pre>")
+            i += 1
+        elif stripped.startswith(":::"):
+            kind, _, title = stripped[3:].strip().partition(" ")
+            if kind:
+                output.append(f'<div class="custom-block {html.escape(kind)}">')
+                if title:
+                    output.append(f"<p><strong>{render_inline(title, anchors)}</strong></p>")
+            else:
+                output.append("</div>")
+            i += 1
+        elif re.match(r"^#{1,6}\s", stripped):
+            level = len(stripped) - len(stripped.lstrip("#"))
+            output.append(f"<h{level}>{render_inline(stripped[level:].strip(), anchors)}</h{level}>")
+            i += 1
+        elif stripped == "---":
+            output.append("<hr>")
+            i += 1
+        elif stripped.startswith("|"):
+            block = []
+            while i < len(lines) and lines[i].strip().startswith("|"):
+                block.append(lines[i])
+                i += 1
+            output.append(render_table(block, anchors))
+        elif re.match(r"^([-*]|\d+\.)\s", stripped):
+            block = []
+            while i < len(lines) and lines[i].strip() and (
+                    re.match(r"^\s*([-*]|\d+\.)\s", lines[i]) or lines[i].startswith(" ")):
+                block.append(lines[i])
+                i += 1
+            output.append(render_list(block, anchors))
+        elif stripped.startswith("<"):
+            # Vue components (e.g. <DataTable>) need the VitePress build
+            output.append("<p><em>Full table available in the VitePress site.</em></p>")
+            i += 1
+        else:
+            block = []
+            while i < len(lines) and lines[i].strip() and not re.match(r"^\s*(#|\||```|:::|[-*]\s|\d+\.\s|<)", lines[i]):
+                block.append(lines[i].strip())
+                i += 1
+            output.append(f"<p>{render_inline(' '.join(block), anchors)}</p>")
+
+    return "\n".join(output)
+
+
+def image_size(data: bytes) -> Optional[Tuple[int, int]]:
+    """Read width/height from a PNG header (avoids layout shift for lazy images)."""
+    if data[:8] == b"\x89PNG\r\n\x1a\n" and len(data) >= 24:
+        return struct.unpack(">II", data[16:24])
+    return None
+
+
+def render_screenshots(audit_data_dir: Path) -> str:
+    """Render the screenshot gallery with lazily decoded, embedded images."""
+    screenshots_dir = audit_data_dir / "screenshots"
+    if not screenshots_dir.exists():
+        return ""
+
+    thumbs_dir = screenshots_dir / "thumbs"
+    figures = []
+    for image in sorted(p for p in screenshots_dir.iterdir() if p.suffix.lower() in IMAGE_MIME_TYPES):
+        thumbs = sorted(thumbs_dir.glob(f"{image.stem}.*")) if thumbs_dir.exists() else []
+        source = thumbs[0] if thumbs else image
+        caption = html.escape(image.stem.replace("-", " ").title())
+
+        if source.stat().st_size > PREVIEW_MAX_IMAGE_BYTES:
+            size_mb = source.stat().st_size / 1_000_000
+            figures.append(f"<figure><figcaption>{caption} – not embedded ({size_mb:.1f} MB), "
+                           f"add a downscaled copy to screenshots/thumbs/</figcaption></figure>")
+            continue
+
+        data = source.read_bytes()
+        mime = IMAGE_MIME_TYPES[source.suffix.lower()]
+        size = image_size(data)
+        dimensions = f' width="{size[0]}" height="{size[1]}"' if size else ""
+        figures.append(
+            f'<figure><img data-src="data:{mime};base64,{base64.b64encode(data).decode()}" '
+            f'alt="{caption}" decoding="async"{dimensions}><figcaption>{caption}</figcaption></figure>')
+
+    if not figures:
+        return ""
+    return ('<section class="preview-page preview-screenshots" id="page-screenshots">'
+            "<h1>Screenshots</h1>" + "".join(figures) + "</section>")
+
+
+def render_preview(audit_data_dir: Path, audit_data: Dict[str, Any]) -> str:
+    """Render all generated audit pages into one self-contained HTML document."""
+    skill_dir = Path(__file__).parent.parent
+    theme_css = skill_dir / "assets" / "vitepress-theme" / ".vitepress" / "theme" / "custom.css"
+    css = (theme_css.read_text() if theme_css.exists() else "") + PREVIEW_CSS
+
+    with tempfile.TemporaryDirectory() as tmp:
+        site_dir = Path(tmp)
+        (site_dir / "docs").mkdir()
+        generate_pages(site_dir, audit_data, audit_data_dir)
+
+        docs_dir = site_dir / "docs"
+        # Homepage first, then top-level pages, then section pages
+        pages = sorted(docs_dir.rglob("*.md"),
+                       key=lambda p: (p != docs_dir / "index.md", len(p.parts), str(p)))
+        routes = []
+        for page in pages:
+            rel = page.relative_to(docs_dir).with_suffix("").as_posix()
+            route = "/" if rel == "index" else "/" + rel.removesuffix("index")
+            routes.append((route, page))
+        anchors = {route: "page-" + (route.strip("/").replace("/", "-") or "home") for route, _ in routes}
+        anchors["/index"] = anchors["/"]
+
+        nav = []
+        sections = []
+        for route, page in routes:
+            markdown = page.read_text()
+            heading = re.search(r"^#\s+(.+)$", markdown, re.MULTILINE)
+            title = heading.group(1) if heading else "Overview"
+            nav.append(f'<a href="#{anchors[route]}">{html.escape(title)}</a>')
+            sections.append(f'<section class="preview-page" id="{anchors[route]}">'
+                            f"{render_markdown(markdown, anchors)}</section>")
+
+    screenshots = render_screenshots(audit_data_dir)
+    if screenshots:
+        nav.append('<a href="#page-screenshots">Screenshots</a>')
+        sections.append(screenshots)
+
+    project_name = html.escape(audit_data.get("project_name", "Website"))
+    audit_date = html.escape(audit_data.get("audit_date", datetime.now().strftime("%Y-%m-%d")))
+
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{project_name} - Website Audit (Preview)</title>
+<style>{css}</style>
+</head>
+<body>
+<header class="preview-header"><h1>{project_name}</h1><p>Website Audit Report · {audit_date} · Preview</p></header>
+<div class="preview-layout">
+<nav class="preview-nav">{''.join(nav)}</nav>
+<main class="preview-main">{''.join(sections)}</main>
+</div>
+<script>{LAZY_IMAGE_SCRIPT}</script>
+</body>
+</html>
+"""
+
+
+def main():
+    """Main execution function."""
+    if len(sys.argv) < 3:
+        print("Usage: python preview_report.py <audit_data_dir> <output_html>")
+        print("\nExample:")
+        print("  python preview_report.py ./audit_data ./audit-preview.html")
+        sys.exit(1)
+
+    audit_data_dir = Path(sys.argv[1])
+    output_file = Path(sys.argv[2])
+
+    audit_json = audit_data_dir / "audit_report.json"
+    if not audit_json.exists():
+        print(f"Error: audit_report.json not found in {audit_data_dir}")
+        sys.exit(1)
+
+    with open(audit_json, 'r') as f:
+        audit_data = json.load(f)
+
+    started = time.perf_counter()
+    output_file.write_text(render_preview(audit_data_dir, audit_data))
+    elapsed = time.perf_counter() - started
+
+    print(f"✅ Preview written to: {output_file}")
+    print(f"   {output_file.stat().st_size / 1024:.0f} KB in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
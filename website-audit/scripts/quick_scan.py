@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Statistical Quick Scan from a Page Sample
+
+A full audit of a very large site (extract_components.py and
+analyze_body_markup.py over every page) takes days; pre-sales needs a
+number within hours. This script estimates the same inventories from a
+stratified sample:
+
+    1. URLs are clustered into content types (cluster_urls.py); each
+       content type is a stratum with an exact page count.
+    2. A random sample is drawn per stratum (proportional allocation, at
+       least MIN_STRATUM_SAMPLE pages each) in one streaming pass.
+    3. Only the sampled pages are analyzed: components (cached, in
+       parallel, as in extract_components.py) and body markup levels and
+       sizes (as in analyze_body_markup.py).
+    4. Results are extrapolated with 95% confidence intervals:
+       - component page counts are weighted by stratum, so paragraphs vs.
+         theme components are classified as in a full run; the number of
+         paragraph types ranges from those seen on at least two sampled
+         pages to the Chao1 estimate that adds components not sampled yet
+       - per content type, the share of medium/complex bodies (Wilson
+         interval) gives the migration complexity range, and the mean body
+         size the payload and total migration volume (stratified estimator)
+
+The output is an entities.json fragment. Its "ranges" block holds the low
+and high variants of the estimated inventories; calculate_estimate.py turns
+them into an hours range. The precision table shows the margin of error for
+other sample sizes, to trade speed for accuracy.
+
+Usage:
+    python quick_scan.py <inventory.jsonl> <output_json> [sample_size]
+
+Output:
+    {"content_types", "paragraphs", "theme_components", "migration",
+     "ranges": {"low": {...}, "high": {...}}, "sample": {...}, "stats": {...}}
+"""
+
+import json
+import math
+import os
+import random
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from aggregate_lighthouse import cluster_patterns, page_type
+from analyze_body_markup import (COMPLEX_SHARE, LEVELS, MEDIUM_SHARE, level, main_content,
+                                 markup_features, type_level)
+from cluster_urls import cluster_urls, read_urls
+from extract_components import CACHE_NAME, page_results, summarize_components
+from warc_reader import read_page
+
+
+# Pages sampled by default
+DEFAULT_SAMPLE_SIZE = 1000
+
+# Minimum sampled pages per content type (all of its pages when it has fewer)
+MIN_STRATUM_SAMPLE = 10
+
+# z value for 95% confidence intervals
+Z_SCORE = 1.96
+
+# Sample sizes listed in the precision table
+PRECISION_SAMPLE_SIZES = [250, 500, 1000, 2500, 5000, 10000]
+
+# Complexity of paragraph types that were not sampled (upper bound only)
+UNSEEN_COMPLEXITY = "medium"
+
+
+def allocate(population: Dict[str, int], sample_size: int) -> Dict[str, int]:
+    """Pages to sample per stratum: proportional, at least MIN_STRATUM_SAMPLE."""
+    total = sum(population.values()) or 1
+    return {name: min(count, max(MIN_STRATUM_SAMPLE, round(sample_size * count / total)))
+            for name, count in population.items()}
+
+
+def draw_sample(inventory_file: Path, patterns: List[Tuple[List[str], str]],
+                quotas: Dict[str, int]) -> Tuple[Dict[str, int], Dict[str, List[str]]]:
+    """Stream the inventory once: pages per stratum and a reservoir sample of each."""
+    rng = random.Random(42)
+    population: Counter = Counter()
+    seen: Counter = Counter()
+    samples: Dict[str, List[str]] = {}
+    for url, html_file in read_urls(inventory_file):
+        name = page_type(url, patterns)
+        population[name] += 1
+        if not html_file:
+            continue
+        quota = quotas.get(name, MIN_STRATUM_SAMPLE)
+        reservoir = samples.setdefault(name, [])
+        seen[name] += 1
+        if len(reservoir) < quota:
+            reservoir.append(html_file)
+        else:
+            slot = rng.randrange(seen[name])
+            if slot < quota:
+                reservoir[slot] = html_file
+    return dict(population), samples
+
+
+def analyze_body(html_file: str) -> Optional[Tuple[str, int]]:
+    """Migration level and size of one page's main content (worker)."""
+    try:
+        html = main_content(read_page(html_file).decode("utf-8", "replace"))
+    except OSError:
+        return None
+    return level(markup_features(html)), len(html)
+
+
+def wilson(successes: int, n: int, population: int) -> Tuple[float, float]:
+    """Confidence interval of a share (Wilson score, finite population corrected)."""
+    if not n:
+        return 0.0, 1.0
+    share = successes / n
+    fpc = (population - n) / (population - 1) if population > 1 else 0.0
+    if fpc <= 0:
+        return share, share
+    n_eff = n / fpc
+    z2 = Z_SCORE ** 2
+    center = (share + z2 / (2 * n_eff)) / (1 + z2 / n_eff)
+    margin = Z_SCORE * math.sqrt(share * (1 - share) / n_eff + z2 / (4 * n_eff ** 2)) / (1 + z2 / n_eff)
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def share_level(complex_share: float, medium_share: float) -> str:
+    """Migration level from the share of complex and of medium-or-complex bodies."""
+    if complex_share >= COMPLEX_SHARE:
+        return "complex"
+    if medium_share >= MEDIUM_SHARE:
+        return "medium"
+    return "simple"
+
+
+def stratum_summary(name: str, population: int, bodies: List[Tuple[str, int]]) -> Dict[str, Any]:
+    """Complexity and payload of one content type with confidence intervals."""
+    n = len(bodies)
+    levels = Counter(lvl for lvl, _ in bodies)
+    complex_range = wilson(levels["complex"], n, population)
+    medium_range = wilson(levels["medium"] + levels["complex"], n, population)
+    sizes = [size for _, size in bodies]
+    mean = sum(sizes) / n if n else 0.0
+    variance = sum((s - mean) ** 2 for s in sizes) / (n - 1) if n > 1 else 0.0
+    fpc = 1 - n / population if population else 0.0
+    margin = Z_SCORE * math.sqrt(fpc * variance / n) if n else 0.0
+    return {
+        "name": name,
+        "population": population,
+        "sampled": n,
+        "levels": {lvl: levels[lvl] for lvl in LEVELS},
+        "complexity": {"low": share_level(complex_range[0], medium_range[0]),
+                       "estimate": type_level(levels),
+                       "high": share_level(complex_range[1], medium_range[1])},
+        "complex_share": [round(complex_range[0], 3), round(levels["complex"] / n, 3) if n else 0.0,
+                          round(complex_range[1], 3)],
+        "avg_bytes": [round(max(0.0, mean - margin)), round(mean), round(mean + margin)],
+        "size_variance": variance,
+    }
+
+
+def volume_margin(strata: List[Dict[str, Any]], sample_size: Optional[int] = None) -> Tuple[float, float]:
+    """Total body volume and its 95% margin (for the drawn sample, or a proportionally allocated size)."""
+    total_pages = sum(s["population"] for s in strata) or 1
+    volume = sum(s["population"] * s["avg_bytes"][1] for s in strata)
+    variance = 0.0
+    for s in strata:
+        n = s["sampled"] if sample_size is None else min(
+            s["population"], max(MIN_STRATUM_SAMPLE, sample_size * s["population"] / total_pages))
+        if n:
+            variance += s["population"] ** 2 * (1 / n - 1 / s["population"]) * s["size_variance"]
+    return volume, Z_SCORE * math.sqrt(max(variance, 0.0))
+
+
+def precision_table(strata: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Margins of error (share and volume) for PRECISION_SAMPLE_SIZES."""
+    total_pages = sum(s["population"] for s in strata)
+    rows = []
+    for size in PRECISION_SAMPLE_SIZES:
+        n = min(size, total_pages)
+        fpc = (total_pages - n) / (total_pages - 1) if total_pages > 1 else 0.0
+        volume, margin = volume_margin(strata, n)
+        rows.append({"sample": n,
+                     "share_margin": round(Z_SCORE * math.sqrt(0.25 / n * fpc), 4) if n else 1.0,
+                     "volume_margin": round(margin / volume, 4) if volume else 0.0})
+        if n == total_pages:
+            break
+    return rows
+
+
+def quick_scan(inventory_file: Path, sample_size: int = DEFAULT_SAMPLE_SIZE,
+               workers: Optional[int] = None) -> Dict[str, Any]:
+    """Estimate inventories and migration volume from a stratified page sample."""
+    workers = workers or os.cpu_count() or 1
+    clusters = cluster_urls(inventory_file, workers=workers)
+    patterns = cluster_patterns(clusters["content_types"])
+    expected = Counter()
+    for ct in clusters["content_types"]:
+        expected[ct["name"]] += ct["nodes"]
+
+    population, samples = draw_sample(inventory_file, patterns, allocate(expected, sample_size))
+    weights = {}
+    for name, files in samples.items():
+        for html_file in files:
+            weights[html_file] = population[name] / len(files)
+
+    # Components, weighted by the pages each sampled page stands for
+    results = list(page_results(list(weights), inventory_file.parent / CACHE_NAME, workers))
+    components = summarize_components((result, weights[html_file]) for html_file, result in results)
+    sampled_pages = Counter()
+    for _, result in results:
+        sampled_pages.update(result["occurrences"].keys())
+    paragraphs = components["paragraphs"]
+    seen_once = sum(1 for p in paragraphs if sampled_pages[p["signature"]] == 1)
+    seen_twice = sum(1 for p in paragraphs if sampled_pages[p["signature"]] == 2)
+    unseen = round(seen_once * (seen_once - 1) / (2 * (seen_twice + 1)))  # bias-corrected Chao1
+
+    # Body markup per content type
+    files = list(weights)
+    strata_bodies: Dict[str, List[Tuple[str, int]]] = {name: [] for name in population}
+    file_stratum = {html_file: name for name, group in samples.items() for html_file in group}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for html_file, body in zip(files, pool.map(analyze_body, files, chunksize=16)):
+            if body:
+                strata_bodies[file_stratum[html_file]].append(body)
+    strata = sorted((stratum_summary(name, population[name], bodies) for name, bodies in strata_bodies.items()),
+                    key=lambda s: -s["population"])
+
+    volume, margin = volume_margin(strata)
+    all_levels = Counter()
+    for s in strata:
+        all_levels.update({lvl: s["population"] * count / s["sampled"]
+                           for lvl, count in s["levels"].items() if s["sampled"]})
+
+    def migration(bound: str) -> Dict[str, Any]:
+        index = {"low": 0, "estimate": 1, "high": 2}[bound]
+        return {
+            "nodes": sum(population.values()),
+            "complexity": type_level(all_levels),
+            "types": [{"name": s["name"], "nodes": s["population"], "complexity": s["complexity"][bound],
+                       "avg_bytes": s["avg_bytes"][index]} for s in strata],
+        }
+
+    unseen_paragraphs = [{"name": f"Unsampled Component {i + 1}", "complexity": UNSEEN_COMPLEXITY}
+                         for i in range(unseen)]
+    content_types = [{key: ct[key] for key in ("name", "complexity", "pattern", "nodes")}
+                     for ct in clusters["content_types"]]
+
+    precision = precision_table(strata)
+    for s in strata:
+        s.pop("size_variance")
+    return {
+        "content_types": content_types,
+        "paragraphs": paragraphs,
+        "theme_components": components["theme_components"],
+        "migration": migration("estimate"),
+        "ranges": {
+            "low": {"paragraphs": [p for p in paragraphs if sampled_pages[p["signature"]] > 1],
+                    "migration": migration("low")},
+            "high": {"paragraphs": paragraphs + unseen_paragraphs, "migration": migration("high")},
+        },
+        "sample": {
+            "pages": len(weights),
+            "population": sum(population.values()),
+            "confidence": 0.95,
+            "paragraphs": {"low": len(paragraphs) - seen_once, "estimate": len(paragraphs),
+                           "high": len(paragraphs) + unseen, "seen_once": seen_once, "seen_twice": seen_twice},
+            "volume_mb": [round(max(0.0, volume - margin) / 1e6, 1), round(volume / 1e6, 1),
+                          round((volume + margin) / 1e6, 1)],
+            "strata": strata,
+            "precision": precision,
+        },
+        "stats": {"urls": clusters["stats"]["urls"], "clusters": clusters["stats"]["clusters"],
+                  "sampled": len(weights), "analyzed": len(results)},
+    }
+
+
+def main():
+    """Main execution function."""
+    if len(sys.argv) < 3:
+        print("Usage: python quick_scan.py <inventory.jsonl> <output_json> [sample_size]")
+        print("\nExample:")
+        print("  python quick_scan.py ./audit_data/crawl/inventory.jsonl ./audit_data/entities.quick.json 1000")
+        sys.exit(1)
+
+    inventory_file = Path(sys.argv[1])
+    output_file = Path(sys.argv[2])
+    sample_size = int(sys.argv[3]) if len(sys.argv) > 3 else DEFAULT_SAMPLE_SIZE
+    if not inventory_file.exists():
+        print(f"Error: File not found: {inventory_file}")
+        sys.exit(1)
+
+    print(f"🎲 Quick scan of {inventory_file} ({sample_size:,} page sample)")
+    result = quick_scan(inventory_file, sample_size)
+
+    with open(output_file, 'w') as f:
+        json.dump(result, f, indent=2)
+
+    sample = result["sample"]
+    paragraphs = sample["paragraphs"]
+    volume = sample["volume_mb"]
+    print(f"\n✅ {sample['pages']:,} of {sample['population']:,} pages sampled across "
+          f"{len(sample['strata'])} content types\n")
+    print(f"   Paragraph types: {paragraphs['estimate']} (95% range {paragraphs['low']}–{paragraphs['high']})")
+    print(f"   Migration volume: {volume[1]:,.1f} MB (95% CI {volume[0]:,.1f}–{volume[2]:,.1f} MB)\n")
+    print("| Content Type | Pages | Sampled | Complexity (low / est. / high) | Complex Share (95% CI) |")
+    print("|--------------|-------|---------|--------------------------------|------------------------|")
+    for s in sample["strata"][:25]:
+        c = s["complexity"]
+        share = s["complex_share"]
+        print(f"| {s['name']} | {s['population']:,} | {s['sampled']:,} | {c['low']} / {c['estimate']} / {c['high']} | "
+              f"{share[1]:.0%} ({share[0]:.0%}–{share[2]:.0%}) |")
+    print("\n| Sample Size | Share Margin (±) | Volume Margin (±) |")
+    print("|-------------|------------------|-------------------|")
+    for row in sample["precision"]:
+        print(f"| {row['sample']:,} | {row['share_margin']:.1%} | {row['volume_margin']:.1%} |")
+    print(f"\n📄 Saved to: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,681 @@
+#!/usr/bin/env python3
+"""
+Streaming CMS Export Readers for Migration Sizing
+
+calculate_migration_hours() takes a single node count that is usually typed
+in by hand. Clients can instead hand over an export of their current CMS,
+often several GB. This script reads such exports as a stream in constant
+memory (ElementTree iterparse with element clearing, line by line for SQL
+dumps) and counts items per content type, content elements, attachments by
+media type, taxonomy terms and authors.
+
+Supported exports (detected from the first bytes; `.gz` files are read
+transparently):
+    wordpress   WordPress WXR export (Tools > Export)
+    typo3       TYPO3 SQL dump (mysqldump) or T3D export saved as XML
+    magnolia    Magnolia JCR export in system view XML
+
+Readers are plain functions registered in READERS that add to an
+ExportCounts, so another CMS only needs one more function. BODY_READERS
+stream the rich-text fields of the same exports for analyze_body_markup.py.
+
+Usage:
+    python read_cms_export.py <export_file> <output_json> [format]
+
+Output:
+    {"cms": "wordpress", "content_types": [...], "paragraphs": [...],
+     "taxonomies": [...], "media_types": [...],
+     "migration": {"nodes": N, "complexity": "medium", "by_type": {...}}, "stats": {...}}
+    The content_types / paragraphs / taxonomies / media_types / migration
+    blocks can be merged into entities.json.
+"""
+
+import gzip
+import io
+import json
+import mimetypes
+import re
+import sys
+import xml.etree.ElementTree as ET
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, Callable, BinaryIO, Iterator, List, Optional, Set, Tuple
+
+
+# Bytes read to detect the export format
+SNIFF_BYTES = 64 * 1024
+
+# Custom fields per content type: up to (simple, medium), above is complex
+FIELD_COMPLEXITY = (4, 12)
+
+# Namespace prefix of WXR elements (the version segment varies: 1.0 - 1.2)
+WXR_NAMESPACE = "{http://wordpress.org/export/"
+
+# WordPress post types that are configuration, not content
+WP_SYSTEM_TYPES = {
+    "revision", "nav_menu_item", "custom_css", "customize_changeset", "oembed_cache",
+    "user_request", "wp_block", "wp_template", "wp_template_part", "wp_global_styles",
+    "wp_navigation", "wp_font_family", "wp_font_face", "acf-field-group", "acf-field",
+}
+
+# Post statuses that are not migrated
+WP_SKIPPED_STATUSES = {"trash", "auto-draft", "inherit"}
+
+# Taxonomies used for menus and theme internals
+WP_SYSTEM_TAXONOMIES = {"nav_menu", "wp_theme", "wp_template_part_area", "post_format"}
+
+WP_TAXONOMY_NAMES = {"category": "Category", "post_tag": "Tag"}
+
+# Gutenberg block comments: <!-- wp:paragraph --> or <!-- wp:acf/hero {...} -->
+BLOCK_PATTERN = re.compile(r"<!-- wp:([a-z][a-z0-9-]*(?:/[a-z][a-z0-9-]*)?)")
+
+# TYPO3 page doktypes; the ones mapped to None are structure, not content
+TYPO3_DOKTYPES = {"1": "Page", "3": None, "4": None, "6": None, "7": None, "199": None,
+                  "254": None, "255": None}
+
+# TYPO3 core columns that are not content fields
+TYPO3_SYSTEM_COLUMNS = {
+    "uid", "pid", "tstamp", "crdate", "cruser_id", "deleted", "hidden", "starttime", "endtime",
+    "sorting", "fe_group", "editlock", "sys_language_uid", "l10n_parent", "l18n_parent",
+    "l10n_source", "l10n_state", "l10n_diffsource", "l18n_diffsource", "t3_origuid",
+    "rowDescription", "t3ver_oid", "t3ver_wsid", "t3ver_state", "t3ver_stage", "t3ver_count",
+    "t3ver_tstamp", "t3ver_move_id", "t3ver_label",
+}
+
+TYPO3_TABLES = {"pages", "tt_content", "sys_category", "sys_file", "be_users"}
+
+# Extension records: tx_<extension>_domain_model_<model>
+TYPO3_MODEL_TABLE = re.compile(r"^tx_(\w+?)_domain_model_(\w+)$")
+
+# Extension models that are taxonomies rather than content
+TYPO3_TERM_MODELS = {"tag", "category"}
+
+CREATE_PATTERN = re.compile(r"CREATE TABLE (?:IF NOT EXISTS )?[`\"]?(\w+)[`\"]?", re.IGNORECASE)
+COLUMN_PATTERN = re.compile(r"^\s+[`\"](\w+)[`\"]\s")
+INSERT_PATTERN = re.compile(r"INSERT INTO [`\"]?(\w+)[`\"]?\s*(?:\(([^)]*)\))?\s*VALUES\s*",
+                            re.IGNORECASE)
+VALUE_TOKEN = re.compile(r"'((?:[^'\\]|\\.|'')*)'|([()])|([^,()'\s]+)", re.DOTALL)
+SQL_ESCAPE = re.compile(r"\\.|''", re.DOTALL)
+SQL_ESCAPES = {"\\n": "\n", "\\r": "\r", "\\t": "\t", "\\0": "\0", "''": "'"}
+
+# Magnolia node types that are not content items
+MAGNOLIA_STRUCTURE_TYPES = {"mgnl:area", "mgnl:folder", "mgnl:resource", "mgnl:contentNode",
+                            "mgnl:metaData", "mgnl:group", "mgnl:role", "rep:root",
+                            "nt:resource", "nt:unstructured", "rep:AuthorizableFolder"}
+
+# Magnolia node types counted as media, terms or authors
+MAGNOLIA_NON_CONTENT_TYPES = {"mgnl:asset", "mgnl:category", "mgnl:user"}
+
+MEDIA_COMPLEXITY = {"Image": "simple", "Document": "simple", "Audio": "simple",
+                    "Video": "medium", "Other": "simple"}
+
+# Content elements that map onto a basic paragraph type
+SIMPLE_ELEMENTS = {
+    "core/paragraph", "core/heading", "core/list", "core/list-item", "core/image", "core/quote",
+    "core/separator", "core/spacer", "core/buttons", "core/button", "core/html", "core/freeform",
+    "header", "text", "textpic", "textmedia", "image", "bullets", "html", "div",
+}
+
+# Body record: (record type, (node type, node key), {field: HTML})
+BodyRecord = Tuple[str, Tuple[str, str], Dict[str, str]]
+
+
+@dataclass
+class ExportCounts:
+    """Running totals filled by a reader."""
+    items: Counter = field(default_factory=Counter)           # content type -> items
+    fields: Dict[str, Set[str]] = field(default_factory=dict)  # content type -> custom field names
+    elements: Counter = field(default_factory=Counter)        # content element -> occurrences
+    media: Counter = field(default_factory=Counter)           # media type -> files
+    terms: Counter = field(default_factory=Counter)           # taxonomy -> terms
+    hierarchical: Set[str] = field(default_factory=set)       # taxonomies with nested terms
+    authors: Set[str] = field(default_factory=set)
+    skipped: Counter = field(default_factory=Counter)         # reason -> items not migrated
+
+
+@lru_cache(maxsize=None)
+def local_name(tag: str) -> str:
+    """Tag or attribute name without its namespace."""
+    return tag.rsplit("}", 1)[-1]
+
+def type_name(machine_name: str) -> str:
+    """Readable name: `event_date` -> Event Date, `demo:pages/textImage` -> Text Image."""
+    label = re.split(r"[:/]", machine_name)[-1]
+    label = re.sub(r"(?<=[a-z])(?=[A-Z])", " ", label).replace("-", " ").replace("_", " ")
+    return label.strip().title() or machine_name
+
+
+def media_type(mime: str = "", filename: str = "") -> str:
+    """Media type bucket from a MIME type or, failing that, a file name."""
+    mime = (mime or mimetypes.guess_type(filename)[0] or "").lower()
+    for prefix, name in (("image/", "Image"), ("video/", "Video"), ("audio/", "Audio")):
+        if mime.startswith(prefix):
+            return name
+    if mime.startswith("text/") or mime == "application/pdf" or any(
+            word in mime for word in ("msword", "officedocument", "opendocument", "ms-excel", "ms-powerpoint")):
+        return "Document"
+    return "Other"
+
+
+def open_export(path: Path) -> BinaryIO:
+    """Open an export file, decompressing .gz on the fly."""
+    return gzip.open(path, 'rb') if path.suffix == ".gz" else open(path, 'rb')
+
+
+def iter_wxr(path: Path) -> Iterator[Tuple[str, ET.Element]]:
+    """Stream <item> and channel-level author/term elements of a WXR export as (name, element)."""
+    channel = None
+    with open_export(path) as f:
+        for event, element in ET.iterparse(f, events=("start", "end")):
+            if event == "start":
+                if channel is None and element.tag == "channel":
+                    channel = element
+                continue
+            name = local_name(element.tag)
+            if name == "item":
+                yield name, element
+                channel.clear()  # drop processed items
+            elif name in ("author", "category", "tag", "term") and element.tag.startswith(WXR_NAMESPACE):
+                yield name, element
+
+
+def read_wordpress(path: Path, counts: ExportCounts) -> None:
+    """Count a WordPress WXR export."""
+    used_terms: Dict[str, Set[str]] = {}
+    for name, element in iter_wxr(path):
+        if name == "item":
+            read_wxr_item(element, counts, used_terms)
+        elif name == "author":
+            counts.authors.add(element.findtext("{*}author_login") or "")
+        else:
+            read_wxr_term(name, element, counts)
+
+    # Partial exports carry no term list: fall back to the terms the items use
+    for taxonomy, nicenames in used_terms.items():
+        label = WP_TAXONOMY_NAMES.get(taxonomy) or type_name(taxonomy)
+        if label not in counts.terms and taxonomy not in WP_SYSTEM_TAXONOMIES:
+            counts.terms[label] = len(nicenames)
+
+
+def read_wxr_term(name: str, element: ET.Element, counts: ExportCounts) -> None:
+    """Count one term definition (<wp:category>, <wp:tag> or <wp:term>)."""
+    if name == "term":
+        taxonomy = element.findtext("{*}term_taxonomy") or ""
+        parent = element.findtext("{*}term_parent")
+    else:
+        taxonomy = "category" if name == "category" else "post_tag"
+        parent = element.findtext("{*}category_parent")
+    if taxonomy and taxonomy not in WP_SYSTEM_TAXONOMIES:
+        label = WP_TAXONOMY_NAMES.get(taxonomy) or type_name(taxonomy)
+        counts.terms[label] += 1
+        if parent:
+            counts.hierarchical.add(label)
+
+
+def read_wxr_item(item: ET.Element, counts: ExportCounts, used_terms: Dict[str, Set[str]]) -> None:
+    """Count one WXR <item> (post, page, attachment, custom post type)."""
+    post_type = status = attachment_url = content = ""
+    meta_keys = []
+    for child in item:
+        name = local_name(child.tag)
+        if name == "post_type":
+            post_type = child.text or ""
+        elif name == "status":
+            status = child.text or ""
+        elif name == "creator":
+            counts.authors.add(child.text or "")
+        elif name == "category" and child.get("domain"):
+            used_terms.setdefault(child.get("domain"), set()).add(child.get("nicename", ""))
+        elif name == "postmeta":
+            meta_keys.append(child.findtext("{*}meta_key") or "")
+        elif name == "encoded" and "/content/" in child.tag:
+            content = child.text or ""
+        elif name == "attachment_url":
+            attachment_url = child.text or ""
+
+    if post_type == "attachment":
+        counts.media[media_type(filename=attachment_url)] += 1
+    elif post_type in WP_SYSTEM_TYPES:
+        counts.skipped[post_type] += 1
+    elif status in WP_SKIPPED_STATUSES:
+        counts.skipped[status] += 1
+    else:
+        label = type_name(post_type or "post")
+        counts.items[label] += 1
+        counts.fields.setdefault(label, set()).update(k for k in meta_keys if k and not k.startswith("_"))
+        counts.elements.update(m if "/" in m else f"core/{m}" for m in BLOCK_PATTERN.findall(content))
+
+
+def count_typo3_row(table: str, row: Dict[str, Optional[str]], counts: ExportCounts) -> None:
+    """Count one TYPO3 record (from an SQL dump or a T3D export)."""
+    if row.get("deleted") == "1":
+        counts.skipped["deleted"] += 1
+        return
+
+    if table == "pages":
+        doktype = row.get("doktype") or "1"
+        label = TYPO3_DOKTYPES.get(doktype, f"Page (doktype {doktype})")
+        if label:
+            counts.items[label] += 1
+        else:
+            counts.skipped[f"doktype {doktype}"] += 1
+    elif table == "tt_content":
+        ctype = row.get("CType") or "unknown"
+        if ctype == "list" and row.get("list_type"):
+            ctype = f"list:{row['list_type']}"
+        counts.elements[ctype] += 1
+    elif table == "sys_category":
+        counts.terms["Category"] += 1
+        if row.get("parent") not in (None, "", "0"):
+            counts.hierarchical.add("Category")
+    elif table == "sys_file":
+        identifier = row.get("identifier") or ""
+        if identifier.startswith("/_processed_/") or row.get("missing") == "1":
+            counts.skipped["processed or missing file"] += 1
+        else:
+            counts.media[media_type(row.get("mime_type") or "", identifier)] += 1
+    elif table == "be_users":
+        counts.authors.add(row.get("username") or row.get("uid") or "")
+    else:
+        match = TYPO3_MODEL_TABLE.match(table)
+        if not match:
+            return
+        extension, model = match.groups()
+        if model in TYPO3_TERM_MODELS:
+            counts.terms[type_name(f"{extension}_{model}")] += 1
+        else:
+            label = type_name(model)
+            counts.items[label] += 1
+            counts.fields.setdefault(label, set()).update(
+                c for c in row if c not in TYPO3_SYSTEM_COLUMNS and not c.startswith("t3ver_"))
+
+
+def is_typo3_table(table: str) -> bool:
+    """Tables counted from TYPO3 exports."""
+    return table in TYPO3_TABLES or bool(TYPO3_MODEL_TABLE.match(table))
+
+
+def iter_sql_rows(values: str) -> List[List[Optional[str]]]:
+    """Rows of an INSERT ... VALUES (...), (...) list."""
+    rows = []
+    row: List[Optional[str]] = []
+    depth = 0
+    for match in VALUE_TOKEN.finditer(values):
+        quoted, paren, bare = match.groups()
+        if paren == "(":
+            depth += 1
+            row = []
+        elif paren == ")":
+            depth -= 1
+            rows.append(row)
+        elif depth:
+            if quoted is None:
+                row.append(None if bare.upper() == "NULL" else bare)
+            elif "\\" in quoted or "''" in quoted:
+                row.append(SQL_ESCAPE.sub(lambda m: SQL_ESCAPES.get(m.group(0), m.group(0)[-1]), quoted))
+            else:
+                row.append(quoted)
+    return rows
+
+
+def iter_typo3_sql_rows(path: Path) -> Iterator[Tuple[str, Dict[str, Optional[str]]]]:
+    """Records of the TYPO3 tables in a database dump (mysqldump format)."""
+    columns: Dict[str, List[str]] = {}
+    creating = None
+    statement: List[str] = []
+    with io.TextIOWrapper(open_export(path), encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if creating is not None:
+                match = COLUMN_PATTERN.match(line)
+                if match:
+                    columns[creating].append(match.group(1))
+                elif line.startswith(")"):
+                    creating = None
+                continue
+
+            if statement:
+                statement.append(line)
+            elif line.startswith("CREATE TABLE"):
+                table = CREATE_PATTERN.match(line).group(1)
+                if is_typo3_table(table):
+                    creating = table
+                    columns[table] = []
+                continue
+            elif line.startswith("INSERT INTO"):
+                match = INSERT_PATTERN.match(line)
+                if not match or not is_typo3_table(match.group(1)):
+                    # Skip the rest of an uninteresting statement without buffering it
+                    while not line.rstrip().endswith(";"):
+                        line = next(f, ";")
+                    continue
+                statement.append(line)
+            else:
+                continue
+
+            if not line.rstrip().endswith(";"):
+                continue
+            text = "".join(statement)
+            statement = []
+            match = INSERT_PATTERN.match(text)
+            table = match.group(1)
+            names = ([c.strip(" `\"") for c in match.group(2).split(",")] if match.group(2)
+                     else columns.get(table, []))
+            for values in iter_sql_rows(text[match.end():]):
+                yield table, dict(zip(names, values))
+
+
+def iter_t3d_rows(path: Path) -> Iterator[Tuple[str, Dict[str, Optional[str]]]]:
+    """Records of the TYPO3 tables in a T3D export saved as XML."""
+    records = None
+    with open_export(path) as f:
+        for event, element in ET.iterparse(f, events=("start", "end")):
+            name = element.tag
+            if event == "start":
+                if name == "records":
+                    records = element
+                continue
+            if name == "tablerow":
+                table = (element.get("index") or "").split(":")[0]
+                if is_typo3_table(table):
+                    data = next((fl for fl in element.iter("fieldlist") if fl.get("index") == "data"), None)
+                    yield table, {fl.get("index"): fl.text for fl in data} if data is not None else {}
+                if records is not None:
+                    records.clear()
+            elif name == "file":
+                element.clear()  # embedded file contents (base64)
+
+
+def iter_typo3_rows(path: Path) -> Iterator[Tuple[str, Dict[str, Optional[str]]]]:
+    """Records of a TYPO3 export (T3D as XML or an SQL dump) as (table, row)."""
+    with open_export(path) as f:
+        head = f.read(SNIFF_BYTES)
+    if b"T3RecordDocument" in head:
+        return iter_t3d_rows(path)
+    if head.lstrip().startswith(b"<"):
+        raise ValueError("Unrecognized TYPO3 XML export")
+    if b"INSERT INTO" in head or b"CREATE TABLE" in head:
+        return iter_typo3_sql_rows(path)
+    raise ValueError("Binary T3D exports are not supported; export as XML or provide an SQL dump")
+
+
+def read_typo3(path: Path, counts: ExportCounts) -> None:
+    """Count a TYPO3 export."""
+    for table, row in iter_typo3_rows(path):
+        count_typo3_row(table, row, counts)
+
+
+def iter_magnolia_nodes(path: Path) -> Iterator[Tuple[str, Dict[str, str], bool, Tuple[str, str]]]:
+    """Nodes of a Magnolia JCR export (system view XML).
+
+    Yields (name, properties, has subcategories, page) where page is the
+    (path, template) of the closest mgnl:page at or above the node
+    (("", "") outside pages).
+    """
+    # Open nodes: [element, has category children, name, properties]
+    stack: List[list] = []
+    with open_export(path) as f:
+        for event, element in ET.iterparse(f, events=("start", "end")):
+            tag = local_name(element.tag)
+            if tag == "property" and event == "end" and stack:
+                name = next((v for k, v in element.attrib.items() if local_name(k) == "name"), "")
+                stack[-1][3][name] = element.findtext("{*}value") or ""
+                continue
+            if tag != "node":
+                continue
+            if event == "start":
+                node_name = next((v for k, v in element.attrib.items() if local_name(k) == "name"), "")
+                stack.append([element, False, node_name, {}])
+                continue
+
+            page = next((("/" + "/".join(entry[2] for entry in stack[:i + 1]), entry[3].get("mgnl:template", ""))
+                         for i, entry in reversed(list(enumerate(stack)))
+                         if entry[3].get("jcr:primaryType") == "mgnl:page"), ("", ""))
+            _, has_subcategories, node_name, properties = stack.pop()
+            yield node_name, properties, has_subcategories, page
+            if properties.get("jcr:primaryType") == "mgnl:category" and stack:
+                stack[-1][1] = True
+
+            # Detach the closed node; it is the first of its parent's remaining children
+            if stack:
+                stack[-1][0].remove(element)
+            else:
+                element.clear()
+
+
+def read_magnolia(path: Path, counts: ExportCounts) -> None:
+    """Count a Magnolia JCR export."""
+    for name, properties, has_subcategories, _ in iter_magnolia_nodes(path):
+        count_magnolia_node(name, properties, has_subcategories, counts)
+
+
+def count_magnolia_node(name: str, properties: Dict[str, str], has_subcategories: bool,
+                        counts: ExportCounts) -> None:
+    """Count one JCR node by primary type."""
+    primary_type = properties.get("jcr:primaryType", "")
+    if properties.get("mgnl:deleted") or properties.get("mgnl:deletedBy"):
+        counts.skipped["deleted"] += 1
+    elif primary_type == "mgnl:page":
+        label = type_name(properties.get("mgnl:template") or "page")
+        counts.items[label] += 1
+        counts.fields.setdefault(label, set()).update(
+            p for p in properties if ":" not in p and p not in ("title", "navigationTitle"))
+    elif primary_type == "mgnl:component":
+        counts.elements[properties.get("mgnl:template") or "component"] += 1
+    elif primary_type == "mgnl:asset":
+        counts.media[media_type(filename=f"{name}.{properties.get('type', '')}")] += 1
+    elif primary_type == "mgnl:category":
+        counts.terms["Category"] += 1
+        if has_subcategories:
+            counts.hierarchical.add("Category")
+    elif primary_type == "mgnl:user":
+        counts.authors.add(name)
+    elif primary_type and primary_type not in MAGNOLIA_STRUCTURE_TYPES:
+        # Content app items (mgnl:content or custom node types)
+        label = "Content Item" if primary_type == "mgnl:content" else type_name(primary_type)
+        counts.items[label] += 1
+        counts.fields.setdefault(label, set()).update(p for p in properties if ":" not in p)
+
+
+READERS: Dict[str, Callable[[Path, ExportCounts], None]] = {
+    "wordpress": read_wordpress,
+    "typo3": read_typo3,
+    "magnolia": read_magnolia,
+}
+
+
+def iter_wordpress_bodies(path: Path) -> Iterator[BodyRecord]:
+    """Migrated WordPress items as (content type, (content type, post ID), {field: HTML})."""
+    for name, item in iter_wxr(path):
+        if name != "item":
+            continue
+        post_type = item.findtext("{*}post_type") or "post"
+        if (post_type == "attachment" or post_type in WP_SYSTEM_TYPES
+                or item.findtext("{*}status") in WP_SKIPPED_STATUSES):
+            continue
+        fields = {}
+        for child in item:
+            if local_name(child.tag) == "encoded" and child.text:
+                fields["summary" if "/excerpt/" in child.tag else "body"] = child.text
+        label = type_name(post_type)
+        yield label, (label, item.findtext("{*}post_id") or item.findtext("{*}link") or ""), fields
+
+
+def iter_typo3_bodies(path: Path) -> Iterator[BodyRecord]:
+    """Content elements and extension records as (type, node, {column: HTML}).
+
+    Content elements belong to the page they are placed on; extension
+    records are nodes of their own.
+    """
+    for index, (table, row) in enumerate(iter_typo3_rows(path)):
+        if row.get("deleted") == "1":
+            continue
+        if table == "tt_content":
+            label = type_name(row.get("CType") or "unknown")
+            # Without a pid column the page is unknown; the element then counts as a node of its own
+            page = f"pages:{row['pid']}" if row.get("pid") is not None else f"tt_content:{row.get('uid') or index}"
+            node = (TYPO3_DOKTYPES["1"], page)
+        else:
+            match = TYPO3_MODEL_TABLE.match(table)
+            if not match or match.group(2) in TYPO3_TERM_MODELS:
+                continue
+            label = type_name(match.group(2))
+            node = (label, f"{table}:{row.get('uid') or index}")
+        yield label, node, {column: value for column, value in row.items()
+                      if value and "<" in value and column not in TYPO3_SYSTEM_COLUMNS}
+
+
+def iter_magnolia_bodies(path: Path) -> Iterator[BodyRecord]:
+    """Pages, components and content app items as (template or type, node, {property: HTML}).
+
+    Components belong to the page they are placed on.
+    """
+    for name, properties, _, (page_path, page_template) in iter_magnolia_nodes(path):
+        primary_type = properties.get("jcr:primaryType", "")
+        if properties.get("mgnl:deleted") or properties.get("mgnl:deletedBy"):
+            continue
+        if primary_type in ("mgnl:page", "mgnl:component"):
+            label = type_name(properties.get("mgnl:template") or primary_type)
+            node = (type_name(page_template or "page"), page_path or name)
+        elif primary_type == "mgnl:content":
+            label = "Content Item"
+            node = (label, properties.get("jcr:uuid") or name)
+        elif primary_type and primary_type not in MAGNOLIA_STRUCTURE_TYPES | MAGNOLIA_NON_CONTENT_TYPES:
+            label = type_name(primary_type)
+            node = (label, properties.get("jcr:uuid") or name)
+        else:
+            continue
+        yield label, node, {p: v for p, v in properties.items() if ":" not in p and "<" in v}
+
+
+# Body field readers for analyze_body_markup.py
+BODY_READERS: Dict[str, Callable[[Path], Iterator[BodyRecord]]] = {
+    "wordpress": iter_wordpress_bodies,
+    "typo3": iter_typo3_bodies,
+    "magnolia": iter_magnolia_bodies,
+}
+
+
+def iter_bodies(path: Path, cms: Optional[str] = None) -> Iterator[BodyRecord]:
+    """Rich-text fields of every migrated record in an export as (content type, node, {field: HTML}).
+
+    node is the (node type, node key) of the node the record is migrated
+    into; several records (content elements, components) can share one.
+    """
+    cms = cms or detect_format(path)
+    if cms not in BODY_READERS:
+        raise ValueError(f"Unknown export format (supported: {', '.join(BODY_READERS)})")
+    return BODY_READERS[cms](path)
+
+
+def detect_format(path: Path) -> Optional[str]:
+    """Export format from the first bytes of the file."""
+    with open_export(path) as f:
+        head = f.read(SNIFF_BYTES)
+    if WXR_NAMESPACE[1:].encode() in head:
+        return "wordpress"
+    if b"T3RecordDocument" in head or re.search(rb"(CREATE TABLE|INSERT INTO) [`\"]?(pages|tt_content)\b", head):
+        return "typo3"
+    if b"jcr/sv/1.0" in head:
+        return "magnolia"
+    return None
+
+
+def field_complexity(fields: Optional[Set[str]]) -> str:
+    """Content type complexity from its number of custom fields (medium if unknown)."""
+    if fields is None:
+        return "medium"
+    simple, medium = FIELD_COMPLEXITY
+    return "simple" if len(fields) <= simple else "medium" if len(fields) <= medium else "complex"
+
+
+def build_result(cms: str, counts: ExportCounts) -> Dict[str, Any]:
+    """Estimator entries and stats from the counts."""
+    content_types = [{"name": name, "complexity": field_complexity(counts.fields.get(name)),
+                      "nodes": nodes, "fields": len(counts.fields[name]) if name in counts.fields else None}
+                     for name, nodes in counts.items.most_common()]
+    paragraphs = [{"name": type_name(element), "complexity": "simple" if element in SIMPLE_ELEMENTS else "medium",
+                   "occurrences": n, "source": element}
+                  for element, n in counts.elements.most_common()]
+    taxonomies = [{"name": name, "complexity": "medium" if name in counts.hierarchical else "simple",
+                   "terms": n}
+                  for name, n in counts.terms.most_common()]
+    media_types = [{"name": name, "complexity": MEDIA_COMPLEXITY[name], "items": n}
+                   for name, n in counts.media.most_common()]
+    counts.authors.discard("")
+
+    return {
+        "cms": cms,
+        "content_types": content_types,
+        "paragraphs": paragraphs,
+        "taxonomies": taxonomies,
+        "media_types": media_types,
+        "migration": {
+            "nodes": sum(counts.items.values()),
+            "complexity": "medium",
+            "by_type": dict(counts.items.most_common()),
+        },
+        "stats": {
+            "items": sum(counts.items.values()),
+            "elements": sum(counts.elements.values()),
+            "media": sum(counts.media.values()),
+            "terms": sum(counts.terms.values()),
+            "authors": len(counts.authors),
+            "skipped": dict(counts.skipped.most_common()),
+        },
+    }
+
+
+def read_cms_export(path: Path, cms: Optional[str] = None) -> Dict[str, Any]:
+    """Read one CMS export into estimator entries."""
+    cms = cms or detect_format(path)
+    if cms not in READERS:
+        raise ValueError(f"Unknown export format (supported: {', '.join(READERS)})")
+    counts = ExportCounts()
+    READERS[cms](path, counts)
+    return build_result(cms, counts)
+
+
+def main():
+    """Main execution function."""
+    if len(sys.argv) < 3:
+        print("Usage: python read_cms_export.py <export_file> <output_json> [format]")
+        print(f"\nFormats: {', '.join(READERS)} (detected when omitted)")
+        print("\nExample:")
+        print("  python read_cms_export.py ./exports/site.WordPress.xml ./audit_data/cms_export.json")
+        sys.exit(1)
+
+    export_file = Path(sys.argv[1])
+    output_file = Path(sys.argv[2])
+    cms = sys.argv[3].lower() if len(sys.argv) > 3 else None
+    if not export_file.exists():
+        print(f"Error: File not found: {export_file}")
+        sys.exit(1)
+
+    print(f"📦 Reading CMS export: {export_file}")
+    try:
+        result = read_cms_export(export_file, cms)
+    except (ValueError, ET.ParseError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    with open(output_file, 'w') as f:
+        json.dump(result, f, indent=2)
+
+    stats = result["stats"]
+    print(f"\n✅ {result['cms']}: {stats['items']:,} items, {stats['elements']:,} content elements, "
+          f"{stats['media']:,} media files, {stats['terms']:,} terms, {stats['authors']:,} authors\n")
+    print("| Content Type | Items | Fields | Complexity |")
+    print("|--------------|-------|--------|------------|")
+    for content_type in result["content_types"]:
+        fields = content_type["fields"] if content_type["fields"] is not None else "-"
+        print(f"| {content_type['name']} | {content_type['nodes']:,} | {fields} | "
+              f"{content_type['complexity'].title()} |")
+    if stats["skipped"]:
+        print(f"\nNot migrated: {', '.join(f'{k} ({v:,})' for k, v in stats['skipped'].items())}")
+    print(f"\n📄 Saved to: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
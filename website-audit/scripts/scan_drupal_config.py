@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Drupal Config Scanner for Baseline Entity Counts
+
+The adessoCMS baseline (references/baseline_adessocms.md) and the config
+scale factor in the estimation guidelines are counted by hand. This script
+scans an exported Drupal `config/sync` directory and writes the same
+structure as entities.json, so any delivered project can become a new
+baseline or a calibration data point:
+
+    - content types, paragraph types, vocabularies and block types, with
+      complexity from their number of fields
+    - media types, with complexity from their media source
+    - views (displays, exposed filters) and webforms (elements, handlers)
+    - enabled modules; custom modules found next to the config directory
+      (web/modules/custom, docroot/modules/custom) are sized by code lines
+    - config file counts by type and the scale factor against the baseline
+
+Only the config types that are counted are parsed. Files are parsed on a
+process pool with PyYAML's C loader when available, else with a line-based
+reader that covers Drupal's export format. Per-file results are cached in a
+SQLite file keyed by path, size and mtime, so re-runs only parse changed
+files.
+
+Usage:
+    python scan_drupal_config.py <config_sync_dir> <output_json>
+
+Output:
+    entities.json structure (content_types, paragraphs, taxonomies,
+    media_types, views, webforms, blocks, custom_modules) plus a `config`
+    block with file counts, modules, languages and the baseline scale factor.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from read_cms_export import MEDIA_COMPLEXITY, field_complexity
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+
+# Config files of the adessoCMS baseline (references/baseline_adessocms.md)
+BASELINE_CONFIG_FILES = 1136
+
+CACHE_NAME = ".config-cache.sqlite"
+
+# Config types that are parsed (everything else is only counted)
+PARSED_TYPES = ("node.type", "paragraphs.paragraphs_type", "taxonomy.vocabulary", "media.type",
+                "views.view", "webform.webform", "block_content.type", "core.extension",
+                "field.field", "language.entity")
+
+# Bundle entity type of each counted config type -> entities.json key
+BUNDLE_TYPES = {
+    "node.type": ("node", "content_types"),
+    "paragraphs.paragraphs_type": ("paragraph", "paragraphs"),
+    "taxonomy.vocabulary": ("taxonomy_term", "taxonomies"),
+    "block_content.type": ("block_content", "blocks"),
+}
+
+# Media source plugin -> media kind (for MEDIA_COMPLEXITY)
+MEDIA_SOURCES = {"image": "Image", "file": "Document", "audio_file": "Audio", "video_file": "Video",
+                 "oembed:video": "Video"}
+
+# Views: displays and exposed filters per complexity level (upper bounds)
+VIEW_COMPLEXITY = [(2, 1, "simple"), (5, 4, "medium")]
+
+# Webforms: elements and handlers per complexity level (upper bounds)
+WEBFORM_COMPLEXITY = [(8, 1, "simple"), (25, 3, "medium")]
+
+# Custom modules: lines of PHP per complexity level (upper bounds)
+MODULE_COMPLEXITY = [(500, "simple"), (2500, "medium")]
+MODULE_CODE_EXTENSIONS = (".php", ".module", ".inc", ".install", ".theme")
+
+# Languages that are not content languages
+SPECIAL_LANGUAGES = {"und", "zxx"}
+
+TOP_LEVEL_KEY = re.compile(r"^('[^']*'|\"[^\"]*\"|[^\s:'\"][^:]*):(?:\s+(.*))?$")
+
+
+def config_type(name: str) -> str:
+    """Config type of a file name: `views.view.frontpage.yml` -> `views.view`."""
+    return ".".join(name[:-4].split(".")[:2])
+
+
+def unquote(value: str) -> str:
+    """Scalar value of a YAML line."""
+    value = value.strip()
+    if len(value) > 1 and value[0] == value[-1] == "'":
+        return value[1:-1].replace("''", "'")
+    if len(value) > 1 and value[0] == value[-1] == '"':
+        return value[1:-1].replace('\\"', '"')
+    return value
+
+
+def read_shallow(text: str) -> Dict[str, Any]:
+    """Top-level keys and their direct children from Drupal's YAML export (no PyYAML)."""
+    data: Dict[str, Any] = {}
+    parent = None
+    for line in text.splitlines():
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        depth = len(line) - len(line.lstrip(" "))
+        match = TOP_LEVEL_KEY.match(line.strip())
+        if not match or depth not in (0, 2):
+            continue
+        key, value = unquote(match.group(1)), (match.group(2) or "").strip()
+        block = not value or value[0] in "|>"
+        if depth == 0:
+            data[key] = {} if block else unquote(value)
+            parent = key if block else None
+        elif parent is not None and isinstance(data[parent], dict):
+            data[parent][key] = {} if block else unquote(value)
+    return data
+
+
+def parse_config(path: str) -> Dict[str, Any]:
+    """Summarize one config file: the values the counts need (worker)."""
+    name = os.path.basename(path)
+    kind = config_type(name)
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        text = f.read()
+    if yaml is not None:
+        try:
+            data = yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}
+        except yaml.YAMLError:
+            data = read_shallow(text)
+    else:
+        data = read_shallow(text)
+    if not isinstance(data, dict):
+        data = {}
+
+    label = str(data.get("label") or data.get("name") or data.get("title") or data.get("id") or "")
+    summary: Dict[str, Any] = {"kind": kind, "id": name[len(kind) + 1:-4], "label": label}
+    if kind == "media.type":
+        summary["source"] = data.get("source", "")
+    elif kind == "views.view":
+        displays = data.get("display") or {}
+        summary["displays"] = len(displays) if isinstance(displays, dict) else 0
+        summary["exposed_filters"] = len(re.findall(r"^\s+exposed: true\s*$", text, re.MULTILINE))
+        summary["base_table"] = data.get("base_table", "")
+    elif kind == "webform.webform":
+        summary["elements"] = len(re.findall(r"['\"]?#type['\"]?:", text))
+        handlers = data.get("handlers") or {}
+        summary["handlers"] = len(handlers) if isinstance(handlers, dict) else 0
+    elif kind == "core.extension":
+        summary["modules"] = sorted(data.get("module") or {})
+        summary["themes"] = sorted(data.get("theme") or {})
+    elif kind == "field.field":
+        summary["field_type"] = data.get("field_type", "")
+    elif kind == "language.entity":
+        summary["locked"] = str(data.get("locked", "")).lower() == "true"
+    return summary
+
+
+def open_cache(path: Path) -> sqlite3.Connection:
+    """Open (or create) the per-file result cache."""
+    db = sqlite3.connect(path)
+    db.execute("CREATE TABLE IF NOT EXISTS files (file TEXT PRIMARY KEY, size INTEGER, "
+               "mtime REAL, result TEXT)")
+    return db
+
+
+def config_summaries(files: List[Path], cache_path: Path, workers: Optional[int] = None):
+    """Yield per-file summaries, parsing only files that changed since the last run."""
+    db = open_cache(cache_path)
+    cached = {row[0]: row[1:] for row in db.execute("SELECT file, size, mtime, result FROM files")}
+
+    todo = []
+    for path in files:
+        stat = path.stat()
+        entry = cached.get(str(path))
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime:
+            yield json.loads(entry[2])
+        else:
+            todo.append((str(path), stat.st_size, stat.st_mtime))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(parse_config, [f for f, _, _ in todo], chunksize=64)
+        for (path, size, mtime), result in zip(todo, results):
+            db.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                       (path, size, mtime, json.dumps(result)))
+            yield result
+    db.commit()
+    db.close()
+
+
+def level(value: int, limits: List[Tuple[int, str]]) -> str:
+    """Complexity level of a value against (upper bound, level) pairs."""
+    return next((name for limit, name in limits if value <= limit), "complex")
+
+
+def custom_module_dirs(config_dir: Path) -> Dict[str, Path]:
+    """Custom modules (name -> directory) of the project the config belongs to."""
+    modules = {}
+    for root in (config_dir.parent.parent, config_dir.parent):
+        for docroot in ("web", "docroot", "."):
+            custom = root / docroot / "modules" / "custom"
+            if not custom.is_dir():
+                continue
+            for info in custom.rglob("*.info.yml"):
+                modules.setdefault(info.name[:-len(".info.yml")], info.parent)
+        if modules:
+            break
+    return modules
+
+
+def code_lines(directory: Path) -> int:
+    """Lines of PHP code in a module directory."""
+    lines = 0
+    for path in directory.rglob("*"):
+        if path.suffix in MODULE_CODE_EXTENSIONS and path.is_file():
+            with open(path, 'rb') as f:
+                lines += sum(1 for _ in f)
+    return lines
+
+
+def scan_config(config_dir: Path, output_file: Path, workers: Optional[int] = None) -> Dict[str, Any]:
+    """Count entities and config files of a Drupal config export."""
+    files = sorted(config_dir.glob("*.yml"))
+    by_type = Counter(config_type(path.name) for path in files)
+    parsed = [path for path in files if config_type(path.name) in PARSED_TYPES]
+
+    bundles: Dict[str, Dict[str, Dict[str, Any]]] = {key: {} for _, key in BUNDLE_TYPES.values()}
+    fields: Dict[Tuple[str, str], Dict[str, str]] = {}
+    media_types = []
+    views = []
+    webforms = []
+    modules: List[str] = []
+    themes: List[str] = []
+    languages = []
+    for summary in config_summaries(parsed, output_file.parent / CACHE_NAME, workers):
+        kind = summary["kind"]
+        if kind in BUNDLE_TYPES:
+            bundles[BUNDLE_TYPES[kind][1]][summary["id"]] = summary
+        elif kind == "field.field":
+            entity_type, bundle, field_name = summary["id"].split(".", 2)
+            fields.setdefault((entity_type, bundle), {})[field_name] = summary["field_type"]
+        elif kind == "media.type":
+            media_kind = MEDIA_SOURCES.get(summary["source"], "Other")
+            complexity = MEDIA_COMPLEXITY[media_kind] if media_kind != "Other" else "medium"
+            media_types.append({"name": summary["label"], "machine_name": summary["id"],
+                                "complexity": complexity, "source": summary["source"]})
+        elif kind == "views.view":
+            complexity = next((name for displays, exposed, name in VIEW_COMPLEXITY
+                               if summary["displays"] <= displays and summary["exposed_filters"] <= exposed),
+                              "complex")
+            views.append({"name": summary["label"], "machine_name": summary["id"], "complexity": complexity,
+                          "displays": summary["displays"], "exposed_filters": summary["exposed_filters"]})
+        elif kind == "webform.webform":
+            complexity = next((name for elements, handlers, name in WEBFORM_COMPLEXITY
+                               if summary["elements"] <= elements and summary["handlers"] <= handlers),
+                              "complex")
+            webforms.append({"name": summary["label"], "machine_name": summary["id"], "complexity": complexity,
+                             "elements": summary["elements"], "handlers": summary["handlers"]})
+        elif kind == "core.extension":
+            modules, themes = summary["modules"], summary["themes"]
+        elif kind == "language.entity" and not summary["locked"] and summary["id"] not in SPECIAL_LANGUAGES:
+            languages.append(summary["id"])
+
+    result: Dict[str, Any] = {}
+    for kind, (entity_type, key) in BUNDLE_TYPES.items():
+        entries = []
+        for bundle, summary in sorted(bundles[key].items()):
+            bundle_fields = fields.get((entity_type, bundle), {})
+            complexity = field_complexity(set(bundle_fields))
+            # Nested paragraphs (entity_reference_revisions) need more than a flat form
+            if (entity_type == "paragraph" and complexity == "simple"
+                    and "entity_reference_revisions" in bundle_fields.values()):
+                complexity = "medium"
+            entries.append({"name": summary["label"] or bundle, "machine_name": bundle,
+                            "complexity": complexity, "fields": len(bundle_fields)})
+        result[key] = entries
+    result["media_types"] = sorted(media_types, key=lambda m: m["machine_name"])
+    result["views"] = sorted(views, key=lambda v: v["machine_name"])
+    result["webforms"] = sorted(webforms, key=lambda w: w["machine_name"])
+
+    custom_modules = []
+    for name, directory in sorted(custom_module_dirs(config_dir).items()):
+        if modules and name not in modules:
+            continue
+        lines = code_lines(directory)
+        custom_modules.append({"name": name, "complexity": level(lines, MODULE_COMPLEXITY), "lines": lines})
+    result["custom_modules"] = custom_modules
+
+    field_counts = Counter()
+    for (entity_type, _), bundle_fields in fields.items():
+        field_counts[entity_type] += len(bundle_fields)
+    result["config"] = {
+        "files": len(files),
+        "scale_factor": round(len(files) / BASELINE_CONFIG_FILES, 2),
+        "by_type": dict(by_type.most_common()),
+        "fields": dict(field_counts.most_common()),
+        "image_styles": by_type["image.style"],
+        "modules": len(modules),
+        "themes": themes,
+        "languages": sorted(languages),
+        "parser": "pyyaml" if yaml is not None else "line-based",
+    }
+    return result
+
+
+def main():
+    """Main execution function."""
+    if len(sys.argv) < 3:
+        print("Usage: python scan_drupal_config.py <config_sync_dir> <output_json>")
+        print("\nExample:")
+        print("  python scan_drupal_config.py ~/projects/client/config/sync ./audit_data/entities.baseline.json")
+        sys.exit(1)
+
+    config_dir = Path(sys.argv[1])
+    output_file = Path(sys.argv[2])
+    if not config_dir.is_dir():
+        print(f"Error: Directory not found: {config_dir}")
+        sys.exit(1)
+
+    print(f"⚙️  Scanning Drupal config in: {config_dir}")
+    result = scan_config(config_dir, output_file)
+
+    with open(output_file, 'w') as f:
+        json.dump(result, f, indent=2)
+
+    config = result["config"]
+    print(f"\n✅ {config['files']:,} config files ({config['scale_factor']:.2f}× the adessoCMS baseline), "
+          f"{config['modules']:,} modules, languages: {', '.join(config['languages']) or '-'}\n")
+    print("| Entity | Count | Simple | Medium | Complex |")
+    print("|--------|-------|--------|--------|---------|")
+    for key in ("content_types", "paragraphs", "taxonomies", "media_types", "views", "webforms",
+                "blocks", "custom_modules"):
+        levels = Counter(entry["complexity"] for entry in result[key])
+        print(f"| {key.replace('_', ' ').title()} | {len(result[key])} | {levels['simple']} | "
+              f"{levels['medium']} | {levels['complex']} |")
+    print(f"\n📄 Saved to: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
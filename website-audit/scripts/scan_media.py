@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+Media Library Scan for Media Migration Sizing
+
+Media migration effort is easy to overlook: the file count and volume of a
+client's media directory are rarely known, and libraries with millions of
+files on slow NFS mounts are common. This script scans a media directory
+and produces the `media_types` entries and the `media` block that
+calculate_estimate.py turns into a media migration line.
+
+Directories are listed with os.scandir by a pool of threads (directory
+listing on network storage is latency-bound, not CPU-bound). Listings flow
+through a bounded queue to the main thread, which appends them to a scan
+log; workers block when it falls behind, so memory stays flat. Generated
+derivatives directly below the media directory (image styles, _processed_,
+aggregated CSS/JS) are skipped; folders of the same name deeper down are
+regular media folders.
+
+Files are classified by media type and size bucket; images above
+OVERSIZED_IMAGE_BYTES are flagged. Exact duplicates are found in stages:
+only files sharing a size with another file are hashed (on a thread pool).
+
+The scan log and hash log make the scan resumable: re-running after an
+interruption skips directories and files already done. The state records
+the media directory it belongs to and is discarded for another one; it
+is removed once media.json is saved.
+
+Usage:
+    python scan_media.py <media_dir> [output_dir]
+
+Output (in output_dir, default: current directory):
+    media.json    types, size buckets, duplicates, oversized images and the
+                  `media_types` / `media` blocks for entities.json
+"""
+
+import hashlib
+import heapq
+import json
+import os
+import queue
+import shutil
+import sys
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Set, Tuple
+
+from read_cms_export import MEDIA_COMPLEXITY, media_type
+
+
+# Directory listing threads and listings buffered for the main thread
+SCAN_THREADS = 16
+RESULT_QUEUE_SIZE = 256
+
+# Hashing threads and hash jobs in flight
+HASH_THREADS = 8
+MAX_PENDING_HASHES = 256
+HASH_CHUNK = 1024 * 1024
+
+# Generated derivatives and caches that are rebuilt, not migrated: directly
+# below the media directory (Drupal image styles, TYPO3 _processed_, ...)
+# and at any depth
+SKIP_TOP_LEVEL_DIRS = {"styles", "_processed_", "_temp_", "css", "js", "php", "ctools", "tmp"}
+SKIP_DIRS = {".thumbs", ".media_scan"}
+
+# Size buckets (upper bound in bytes, label)
+SIZE_BUCKETS = [
+    (100 * 1024, "< 100 KB"),
+    (1024 * 1024, "100 KB - 1 MB"),
+    (10 * 1024 * 1024, "1 - 10 MB"),
+    (100 * 1024 * 1024, "10 - 100 MB"),
+    (float("inf"), "> 100 MB"),
+]
+
+# Images above this size need resizing before or during migration
+OVERSIZED_IMAGE_BYTES = 5 * 1024 * 1024
+OVERSIZED_EXAMPLES = 100
+
+# Shares that raise media complexity (oversized images, duplicate files)
+OVERSIZED_SHARE = 0.05
+DUPLICATE_SHARE = 0.10
+COMPLEX_SHARE = 0.25
+
+DUPLICATE_EXAMPLES = 20
+
+# Print progress every N directories
+PROGRESS_EVERY = 10000
+
+STATE_DIR = ".media_scan"
+
+
+def scan_directory(path: str) -> Tuple[List[Tuple[str, int, float]], List[str], str]:
+    """List one directory: (files as (name, size, mtime), subdirectory names, error)."""
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    elif entry.is_file(follow_symlinks=False):
+                        stat = entry.stat(follow_symlinks=False)
+                        files.append((entry.name, stat.st_size, stat.st_mtime))
+                except OSError:
+                    continue
+    except OSError as e:
+        return files, subdirs, f"{type(e).__name__}: {e}"
+    return files, subdirs, ""
+
+
+def iter_log(log_path: Path) -> Iterator[Dict[str, Any]]:
+    """Directory records of the scan log."""
+    with open(log_path, 'r') as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def trim_partial_line(path: Path) -> None:
+    """Cut a log back to its last complete line, dropping a write cut off by an interruption."""
+    with open(path, 'rb+') as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        while end:
+            f.seek(max(end - HASH_CHUNK, 0))
+            block = f.read(end - f.tell())
+            newline = block.rfind(b"\n")
+            if newline >= 0:
+                f.truncate(end - len(block) + newline + 1)
+                return
+            end -= len(block)
+        f.truncate(0)
+
+
+def skip_directory(parent: str, name: str) -> bool:
+    """Whether a subdirectory holds generated files (parent is relative to the media directory)."""
+    return name in SKIP_DIRS or (not parent and name in SKIP_TOP_LEVEL_DIRS)
+
+
+def load_scan_log(log_path: Path) -> Tuple[Set[str], List[str]]:
+    """Directories already scanned and the ones still pending (for resuming)."""
+    done: Set[str] = set()
+    found = [""]
+    if log_path.exists():
+        trim_partial_line(log_path)
+        for record in iter_log(log_path):
+            done.add(record["dir"])
+            found.extend(os.path.join(record["dir"], name) for name in record["subdirs"]
+                         if not skip_directory(record["dir"], name))
+    return done, [d for d in found if d not in done]
+
+
+def walk(root: Path, log_path: Path, threads: int = SCAN_THREADS) -> int:
+    """Scan all directories below root into the scan log; return directories scanned."""
+    done, pending = load_scan_log(log_path)
+    if done:
+        print(f"   Resuming: {len(done):,} directories already scanned")
+
+    directories: queue.Queue = queue.Queue()
+    results: queue.Queue = queue.Queue(maxsize=RESULT_QUEUE_SIZE)
+
+    def worker() -> None:
+        while True:
+            relative = directories.get()
+            if relative is None:
+                return
+            results.put((relative, *scan_directory(os.path.join(root, relative))))
+
+    pool = [threading.Thread(target=worker, daemon=True) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+
+    outstanding = 0
+    for relative in pending:
+        directories.put(relative)
+        outstanding += 1
+
+    scanned = 0
+    with open(log_path, 'a') as log:
+        while outstanding:
+            relative, files, subdirs, error = results.get()
+            outstanding -= 1
+            scanned += 1
+            log.write(json.dumps({"dir": relative, "files": files, "subdirs": subdirs, "error": error}) + "\n")
+            for name in subdirs:
+                if not skip_directory(relative, name):
+                    directories.put(os.path.join(relative, name))
+                    outstanding += 1
+            if scanned % PROGRESS_EVERY == 0:
+                log.flush()
+                print(f"   … {len(done) + scanned:,} directories", flush=True)
+
+    for _ in pool:
+        directories.put(None)
+    return len(done) + scanned
+
+
+def iter_files(log_path: Path) -> Iterator[Tuple[str, int, float]]:
+    """All scanned files as (relative path, size, mtime)."""
+    for record in iter_log(log_path):
+        for name, size, mtime in record["files"]:
+            yield os.path.join(record["dir"], name), size, mtime
+
+
+def size_bucket(size: int) -> str:
+    """Label of the size bucket a file falls into."""
+    return next(label for limit, label in SIZE_BUCKETS if size < limit)
+
+
+def file_digest(path: str) -> str:
+    """BLAKE2 digest of a file's contents."""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, 'rb') as f:
+        while chunk := f.read(HASH_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_candidates(root: Path, log_path: Path, sizes: Counter, hash_log_path: Path) -> Iterator[Tuple[str, int, str]]:
+    """Hash files that share their size with another file; yield (path, size, digest)."""
+    hashed: Dict[str, Tuple[int, float, str]] = {}
+    if hash_log_path.exists():
+        trim_partial_line(hash_log_path)
+        with open(hash_log_path, 'r') as f:
+            for line in f:
+                parts = line.rstrip("\n").split("\t")
+                if len(parts) == 4:
+                    hashed[parts[0]] = (int(parts[1]), float(parts[2]), parts[3])
+
+    def job(relative: str, size: int, mtime: float) -> Tuple[str, int, float, str]:
+        try:
+            return relative, size, mtime, file_digest(os.path.join(root, relative))
+        except OSError:
+            return relative, size, mtime, ""
+
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=HASH_THREADS) as pool, open(hash_log_path, 'a') as hash_log:
+        def finish(future) -> Iterator[Tuple[str, int, str]]:
+            relative, size, mtime, digest = future.result()
+            if digest:
+                hash_log.write(f"{relative}\t{size}\t{mtime}\t{digest}\n")
+                yield relative, size, digest
+
+        for relative, size, mtime in iter_files(log_path):
+            if size == 0 or sizes[size] < 2:
+                continue
+            previous = hashed.get(relative)
+            if previous and previous[0] == size and previous[1] == mtime:
+                yield relative, size, previous[2]
+                continue
+            pending.append(pool.submit(job, relative, size, mtime))
+            if len(pending) >= MAX_PENDING_HASHES:
+                yield from finish(pending.popleft())
+        while pending:
+            yield from finish(pending.popleft())
+
+
+def open_state(root: Path, output_dir: Path) -> Path:
+    """State directory for a scan of root; state left by a scan of another root is discarded."""
+    state_dir = output_dir / STATE_DIR
+    root_file = state_dir / "root"
+    if state_dir.exists() and (not root_file.exists() or root_file.read_text() != str(root.resolve())):
+        print(f"   Discarding scan state of another media directory in {state_dir}")
+        shutil.rmtree(state_dir)
+    state_dir.mkdir(parents=True, exist_ok=True)
+    root_file.write_text(str(root.resolve()))
+    return state_dir
+
+
+def clear_state(output_dir: Path) -> None:
+    """Remove the scan state (once the result is saved)."""
+    shutil.rmtree(output_dir / STATE_DIR, ignore_errors=True)
+
+
+def scan_media(root: Path, output_dir: Path) -> Dict[str, Any]:
+    """Scan a media directory (resumable) and summarize it; the state is kept until clear_state()."""
+    state_dir = open_state(root, output_dir)
+    log_path = state_dir / "scan.jsonl"
+    hash_log_path = state_dir / "hashes.tsv"
+
+    print("📂 Listing directories...")
+    directories = walk(root, log_path)
+
+    types: Dict[str, Counter] = {}
+    buckets = Counter()
+    extensions = Counter()
+    sizes = Counter()
+    oversized: List[Tuple[int, str]] = []
+    oversized_count = oversized_bytes = 0
+    errors = sum(1 for record in iter_log(log_path) if record["error"])
+    for relative, size, _ in iter_files(log_path):
+        extension = os.path.splitext(relative)[1].lower() or "(none)"
+        name = media_type(filename=relative)
+        group = types.setdefault(name, Counter())
+        group["files"] += 1
+        group["bytes"] += size
+        buckets[size_bucket(size)] += 1
+        extensions[extension] += 1
+        sizes[size] += 1
+        if name == "Image" and size > OVERSIZED_IMAGE_BYTES:
+            oversized_count += 1
+            oversized_bytes += size
+            group["oversized"] += 1
+            if len(oversized) < OVERSIZED_EXAMPLES:
+                heapq.heappush(oversized, (size, relative))
+            else:
+                heapq.heappushpop(oversized, (size, relative))
+
+    print("🔁 Hashing files with matching sizes...")
+    duplicates: Dict[str, List[Any]] = {}  # digest -> [count, size, first path]
+    for relative, size, digest in hash_candidates(root, log_path, sizes, hash_log_path):
+        entry = duplicates.get(digest)
+        if entry is None:
+            duplicates[digest] = [1, size, relative]
+        else:
+            entry[0] += 1
+    groups = [entry for entry in duplicates.values() if entry[0] > 1]
+    for count, size, relative in groups:
+        group = types[media_type(filename=relative)]
+        group["duplicates"] += count - 1
+        group["duplicate_bytes"] += (count - 1) * size
+
+    total_files = sum(g["files"] for g in types.values())
+    total_bytes = sum(g["bytes"] for g in types.values())
+    duplicate_files = sum(count - 1 for count, _, _ in groups)
+    duplicate_bytes = sum((count - 1) * size for count, size, _ in groups)
+
+    media_types = []
+    for name, group in sorted(types.items(), key=lambda t: -t[1]["files"]):
+        complexity = MEDIA_COMPLEXITY[name]
+        if name == "Image" and group["oversized"] >= OVERSIZED_SHARE * group["files"]:
+            complexity = "medium"
+        media_types.append({"name": name, "complexity": complexity,
+                            "items": group["files"] - group["duplicates"]})
+
+    oversized_share = oversized_count / max(types.get("Image", {}).get("files", 0), 1)
+    duplicate_share = duplicate_files / max(total_files, 1)
+    if duplicate_share >= COMPLEX_SHARE or oversized_share >= COMPLEX_SHARE:
+        complexity = "complex"
+    elif (duplicate_share >= DUPLICATE_SHARE or oversized_share >= OVERSIZED_SHARE
+          or any(t["complexity"] != "simple" for t in media_types)):
+        complexity = "medium"
+    else:
+        complexity = "simple"
+
+    return {
+        "root": str(root),
+        "stats": {"directories": directories, "files": total_files, "bytes": total_bytes, "errors": errors},
+        "types": {name: {"files": g["files"], "bytes": g["bytes"], "duplicates": g["duplicates"],
+                         "duplicate_bytes": g["duplicate_bytes"], "oversized": g["oversized"]}
+                  for name, g in sorted(types.items(), key=lambda t: -t[1]["bytes"])},
+        "size_buckets": {label: buckets[label] for _, label in SIZE_BUCKETS},
+        "extensions": dict(extensions.most_common(20)),
+        "duplicates": {
+            "groups": len(groups),
+            "files": duplicate_files,
+            "bytes": duplicate_bytes,
+            "largest": [{"copies": count, "size": size, "example": relative}
+                        for count, size, relative in sorted(groups, key=lambda g: -(g[0] - 1) * g[1])[:DUPLICATE_EXAMPLES]],
+        },
+        "oversized_images": {
+            "threshold": OVERSIZED_IMAGE_BYTES,
+            "files": oversized_count,
+            "bytes": oversized_bytes,
+            "largest": [{"path": relative, "size": size} for size, relative in sorted(oversized, reverse=True)],
+        },
+        # Paste into entities.json; duplicates are not migrated
+        "media_types": media_types,
+        "media": {
+            "files": total_files - duplicate_files,
+            "gigabytes": round((total_bytes - duplicate_bytes) / 1024 ** 3, 2),
+            "complexity": complexity,
+        },
+    }
+
+
+def format_size(size: float) -> str:
+    """Human-readable byte count."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def main():
+    """Main execution function."""
+    if len(sys.argv) < 2:
+        print("Usage: python scan_media.py <media_dir> [output_dir]")
+        print("\nExample:")
+        print("  python scan_media.py /mnt/nfs/sites/default/files ./audit_data")
+        sys.exit(1)
+
+    root = Path(sys.argv[1])
+    output_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else Path(".")
+    if not root.is_dir():
+        print(f"Error: Directory not found: {root}")
+        sys.exit(1)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    print(f"🖼️  Scanning media library: {root}")
+    result = scan_media(root, output_dir)
+
+    output_file = output_dir / "media.json"
+    with open(output_file, 'w') as f:
+        json.dump(result, f, indent=2)
+    clear_state(output_dir)
+
+    stats = result["stats"]
+    duplicates = result["duplicates"]
+    print(f"\n✅ {stats['files']:,} files ({format_size(stats['bytes'])}) in {stats['directories']:,} directories")
+    print(f"🔁 Duplicates: {duplicates['files']:,} files ({format_size(duplicates['bytes'])}) "
+          f"in {duplicates['groups']:,} groups")
+    print(f"📏 Oversized images: {result['oversized_images']['files']:,}\n")
+    print("| Media Type | Files | Size | Duplicates | Complexity |")
+    print("|------------|-------|------|------------|------------|")
+    complexities = {t["name"]: t["complexity"] for t in result["media_types"]}
+    for name, group in result["types"].items():
+        print(f"| {name} | {group['files']:,} | {format_size(group['bytes'])} | {group['duplicates']:,} | "
+              f"{complexities[name].title()} |")
+    print(f"\n📦 Media migration: {result['media']['files']:,} files, {result['media']['gigabytes']} GB, "
+          f"{result['media']['complexity']}")
+    print(f"\n📄 Saved to: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Resource-Constrained Project Scheduling
+
+Dividing total hours by 40 ignores that content types wait for the
+paragraphs they use, that migration waits for the content model and that
+a small team cannot run everything in parallel. calculate_estimate.py
+turns its entity breakdown into a task DAG (see build_plan_tasks there);
+this module schedules such a DAG onto a team.
+
+Scheduling is list scheduling: every task's priority is its bottom level
+(longest dependency chain from the task to the end of the project). A
+ready heap per role hands the highest-priority task to the next idle team
+member; an event heap advances time to the next finishing task. Tasks
+without a role are milestones and complete as soon as they are ready.
+Roles missing from the team fall back (QA -> backend, frontend ->
+backend). A few thousand tasks schedule in milliseconds, so estimate
+sweeps can call schedule() freely.
+
+Usage:
+    python schedule_plan.py <estimation_result.json>
+
+Reschedules the tasks saved by calculate_estimate.py for every team
+composition in TEAM_COMPOSITIONS and prints the comparison.
+
+Output:
+    <input dir>/schedule_sweep.json   duration, critical path and utilisation per team
+"""
+
+import heapq
+import json
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+
+# Team compositions from the estimation guidelines (people per role)
+TEAM_COMPOSITIONS = {
+    "small": {"backend": 1, "frontend": 1},
+    "medium": {"backend": 2, "frontend": 1},
+    "large": {"backend": 3, "frontend": 2, "qa": 1},
+}
+
+# Total hours up to which a team composition is used (larger: "large")
+TEAM_SIZE_LIMITS = [(450, "small"), (850, "medium")]
+
+# Role that takes over when a team has nobody for a role
+ROLE_FALLBACK = {"qa": "backend", "frontend": "backend"}
+
+# Productive hours per person and week
+HOURS_PER_WEEK = 30
+WEEKS_PER_MONTH = 4.33
+
+
+@dataclass
+class Task:
+    """Schedulable unit of work (a milestone when role is empty)."""
+    id: str
+    name: str
+    role: str
+    hours: float
+    phase: str = ""
+    depends: List[str] = field(default_factory=list)
+
+
+def team_for_hours(total_hours: float) -> str:
+    """Team composition for a project of this size."""
+    return next((name for limit, name in TEAM_SIZE_LIMITS if total_hours <= limit), "large")
+
+
+def resolve_role(role: str, team: Dict[str, int]) -> str:
+    """Role that works on a task with this team ("" for milestones)."""
+    while role and not team.get(role):
+        if role not in ROLE_FALLBACK:
+            raise ValueError(f"No team member for role: {role}")
+        role = ROLE_FALLBACK[role]
+    return role
+
+
+def schedule(tasks: List[Task], team: Dict[str, int], hours_per_week: float = HOURS_PER_WEEK) -> Dict[str, Any]:
+    """Schedule a task DAG onto a team; return duration, critical path, utilisation and Gantt data."""
+    index = {task.id: i for i, task in enumerate(tasks)}
+    count = len(tasks)
+    successors: List[List[int]] = [[] for _ in range(count)]
+    remaining = [0] * count
+    for i, task in enumerate(tasks):
+        for dependency in task.depends:
+            successors[index[dependency]].append(i)
+            remaining[i] += 1
+    roles = [resolve_role(task.role, team) for task in tasks]
+
+    # Topological order, then bottom levels (longest remaining chain, own hours included)
+    order = [i for i in range(count) if not remaining[i]]
+    indegree = remaining[:]
+    for i in order:
+        for successor in successors[i]:
+            indegree[successor] -= 1
+            if not indegree[successor]:
+                order.append(successor)
+    if len(order) < count:
+        raise ValueError("Task dependencies contain a cycle")
+    bottom = [0.0] * count
+    for i in reversed(order):
+        bottom[i] = tasks[i].hours + max((bottom[s] for s in successors[i]), default=0.0)
+
+    start = [0.0] * count
+    finish = [0.0] * count
+    worker = [-1] * count
+    ready: Dict[str, List] = {role: [] for role in team}
+    idle: Dict[str, List[int]] = {role: list(range(people)) for role, people in team.items()}
+    events: List = []
+    busy = {role: 0.0 for role in team}
+    released = [False] * count
+
+    def release(first: int, now: float) -> None:
+        stack = [first]
+        while stack:
+            i = stack.pop()
+            if released[i]:
+                continue
+            released[i] = True
+            if roles[i] and tasks[i].hours > 0:
+                heapq.heappush(ready[roles[i]], (-bottom[i], i))
+                continue
+            start[i] = finish[i] = now  # milestone
+            for successor in successors[i]:
+                remaining[successor] -= 1
+                if not remaining[successor]:
+                    stack.append(successor)
+
+    roots = [i for i in range(count) if not remaining[i]]
+    for i in roots:
+        release(i, 0.0)
+
+    now = 0.0
+    while True:
+        for role, queue in ready.items():
+            while queue and idle[role]:
+                _, i = heapq.heappop(queue)
+                worker[i] = heapq.heappop(idle[role])
+                start[i] = now
+                finish[i] = now + tasks[i].hours
+                busy[role] += tasks[i].hours
+                heapq.heappush(events, (finish[i], i))
+        if not events:
+            break
+        now, i = heapq.heappop(events)
+        done = [i]
+        while events and events[0][0] == now:
+            done.append(heapq.heappop(events)[1])
+        for i in done:
+            heapq.heappush(idle[roles[i]], worker[i])
+            for successor in successors[i]:
+                remaining[successor] -= 1
+                if not remaining[successor]:
+                    release(successor, now)
+
+    makespan = max(finish, default=0.0)
+
+    # Critical path: follow the longest chain from the longest start
+    path = []
+    current: Optional[int] = max(range(count), key=lambda i: bottom[i], default=None)
+    while current is not None:
+        if tasks[current].role:
+            path.append(tasks[current].name)
+        current = max(successors[current], key=lambda s: bottom[s], default=None)
+    critical_hours = max(bottom, default=0.0)
+
+    phases: Dict[str, List[float]] = {}
+    gantt = []
+    for i, task in enumerate(tasks):
+        if not roles[i] or task.hours <= 0:
+            continue
+        span = phases.setdefault(task.phase or "Other", [start[i], finish[i]])
+        span[0] = min(span[0], start[i])
+        span[1] = max(span[1], finish[i])
+        gantt.append({"task": task.name, "phase": task.phase, "role": roles[i],
+                      "worker": f"{roles[i]}-{worker[i] + 1}",
+                      "start": round(start[i], 1), "end": round(finish[i], 1)})
+
+    return {
+        "team": dict(team),
+        "hours_per_week": hours_per_week,
+        "hours": round(makespan, 1),
+        "weeks": round(makespan / hours_per_week, 1),
+        "months": round(makespan / hours_per_week / WEEKS_PER_MONTH, 1),
+        "critical_path": {"hours": round(critical_hours, 1),
+                          "weeks": round(critical_hours / hours_per_week, 1), "tasks": path},
+        "utilisation": {role: {"people": people, "hours": round(busy[role], 1),
+                               "share": round(busy[role] / (people * makespan), 2) if makespan else 0.0}
+                        for role, people in team.items()},
+        "phases": [{"phase": phase, "start_week": round(span[0] / hours_per_week, 1),
+                    "end_week": round(span[1] / hours_per_week, 1)}
+                   for phase, span in sorted(phases.items(), key=lambda p: tuple(p[1]))],
+        "gantt": gantt,
+    }
+
+
+def main():
+    """Main execution function."""
+    if len(sys.argv) < 2:
+        print("Usage: python schedule_plan.py <estimation_result.json>")
+        print("\nExample:")
+        print("  python schedule_plan.py ./audit_data/estimation_result.json")
+        sys.exit(1)
+
+    input_file = Path(sys.argv[1])
+    if not input_file.exists():
+        print(f"Error: File not found: {input_file}")
+        sys.exit(1)
+    with open(input_file, 'r') as f:
+        tasks = [Task(**task) for task in json.load(f).get("schedule", {}).get("tasks", [])]
+    if not tasks:
+        print(f"Error: No schedule tasks in {input_file} (run calculate_estimate.py first)")
+        sys.exit(1)
+
+    print(f"🗓️  Scheduling {len(tasks):,} tasks for {len(TEAM_COMPOSITIONS)} team compositions")
+    sweep = {}
+    for name, team in TEAM_COMPOSITIONS.items():
+        result = schedule(tasks, team)
+        result.pop("gantt")
+        sweep[name] = result
+
+    output_file = input_file.parent / "schedule_sweep.json"
+    with open(output_file, 'w') as f:
+        json.dump(sweep, f, indent=2)
+
+    print("\n| Team | People | Weeks | Critical Path (weeks) | Utilisation |")
+    print("|------|--------|-------|-----------------------|-------------|")
+    for name, result in sweep.items():
+        utilisation = ", ".join(f"{role} {u['share']:.0%}" for role, u in result["utilisation"].items())
+        print(f"| {name.title()} | {sum(result['team'].values())} | {result['weeks']:.1f} | "
+              f"{result['critical_path']['weeks']:.1f} | {utilisation} |")
+    print(f"\n📄 Saved to: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
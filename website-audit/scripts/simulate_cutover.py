@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Migration Cutover Simulation
+
+calculate_estimate.py estimates the development hours of the migration;
+clients also ask how long the final migration run takes during cutover.
+This script models the wall-clock duration of the Drupal migrate runs from
+the per-type node counts and payload sizes (migration.types, e.g. from
+analyze_body_markup.py) and the media library (media block, e.g. from
+scan_media.py):
+
+- full import: migrations run one after another (media first), each split
+  into batches that the workers process in rounds; every batch pays a fixed
+  bootstrap cost and its items slow down as the entity static cache fills
+  up, and every extra worker adds database write contention. File copies
+  are also limited by the shared bandwidth.
+- rollback: deleting everything the full import created.
+- delta: re-importing the content changed since the full import; unchanged
+  rows still pass the ID map / change tracking check.
+
+By default the full import runs before the content freeze and only the
+delta pass falls into the cutover window. A plan is feasible when a batch
+fits the PHP memory limit and the window plus a full rollback fits the
+maximum window. The whole grid of batch sizes x worker counts is computed
+at once as arrays (NumPy when installed), so large sweeps stay fast.
+
+All settings can be overridden by a "cutover" block in entities.json:
+    {"batch_sizes": [...], "workers": [...], "delta_share": 0.05,
+     "pre_migrate": true, "window_hours": 48, "memory_limit_mb": 512,
+     "bandwidth_mbps": 400}
+
+Usage:
+    python simulate_cutover.py <entities_json>
+
+Output:
+    <input dir>/cutover_plan.json   {"settings", "best", "plans": [...]}
+"""
+
+import json
+import math
+import sys
+from pathlib import Path
+from typing import Dict, Any, List
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Batch sizes and worker counts swept by default
+DEFAULT_BATCH_SIZES = [25, 50, 100, 250, 500, 1000, 2500, 5000]
+DEFAULT_WORKERS = [1, 2, 3, 4, 6, 8, 12, 16]
+
+# Processing seconds per node by migration complexity (source read, process, save)
+ITEM_SECONDS = {
+    "simple": 0.05,
+    "medium": 0.12,
+    "complex": 0.3,
+}
+
+# Body markup processed per second (HTML transforms, link rewriting)
+PAYLOAD_BYTES_PER_SECOND = 1_000_000
+DEFAULT_PAYLOAD_BYTES = 8_000
+
+# Fixed cost per batch (bootstrap, source query, ID map flush)
+BATCH_OVERHEAD_SECONDS = 4.0
+
+# Per-item slowdown per item already in the entity static cache of a batch
+STATIC_CACHE_PENALTY = 0.0004
+
+# Slowdown of every worker per additional worker (database write contention)
+WORKER_CONTENTION = 0.08
+
+# Rollback cost relative to import, and per-row cost of skipping unchanged rows
+ROLLBACK_FACTOR = 0.4
+ID_MAP_SECONDS = 0.004
+
+# Media files: seconds per file entity plus copy time per worker
+FILE_SECONDS = 0.08
+WORKER_BYTES_PER_SECOND = 20_000_000
+
+# Memory per worker: PHP baseline plus per item in a batch
+BASE_MEMORY_MB = 96
+ITEM_MEMORY_KB = 40
+PAYLOAD_MEMORY_FACTOR = 6
+
+DEFAULT_SETTINGS = {
+    "delta_share": 0.05,
+    "pre_migrate": True,
+    "window_hours": 48,
+    "memory_limit_mb": 512,
+    "bandwidth_mbps": 400,
+}
+
+
+def pass_seconds(items: float, item_seconds: float, batch, workers):
+    """Wall-clock seconds of one migration run (scalars or arrays of batch/workers)."""
+    if not items:
+        return 0.0
+    batches = -(-items // batch)
+    rounds = -(-batches // workers)
+    fill = items / batches
+    batch_seconds = BATCH_OVERHEAD_SECONDS + fill * item_seconds * (1 + fill * STATIC_CACHE_PENALTY)
+    return rounds * batch_seconds * (1 + WORKER_CONTENTION * (workers - 1))
+
+
+def migration_units(entities_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Migrations in run order (media first): items, seconds per item, payload and volume."""
+    units = []
+    media = entities_data.get("media") or {}
+    if media.get("files"):
+        total_bytes = media.get("gigabytes", 0) * 1024 ** 3
+        file_bytes = total_bytes / media["files"]
+        units.append({"name": "Media files", "items": media["files"],
+                      "item_seconds": FILE_SECONDS + file_bytes / WORKER_BYTES_PER_SECOND,
+                      "payload": 0, "bytes": total_bytes})
+
+    migration = entities_data.get("migration") or {}
+    types = migration.get("types") or [{"name": "Content", "nodes": migration.get("nodes", 0),
+                                        "complexity": migration.get("complexity", "medium")}]
+    for content_type in types:
+        payload = content_type.get("avg_bytes", DEFAULT_PAYLOAD_BYTES)
+        complexity = content_type.get("complexity", "medium").lower()
+        units.append({"name": content_type.get("name", "Content"), "items": content_type.get("nodes", 0),
+                      "item_seconds": ITEM_SECONDS.get(complexity, ITEM_SECONDS["medium"])
+                      + payload / PAYLOAD_BYTES_PER_SECOND,
+                      "payload": payload, "bytes": 0})
+    return [unit for unit in units if unit["items"]]
+
+
+def simulate(units: List[Dict[str, Any]], settings: Dict[str, Any], batch, workers) -> Dict[str, Any]:
+    """Hours of each pass and memory per worker for batch sizes and worker counts.
+
+    batch and workers are scalars or broadcastable NumPy arrays.
+    """
+    maximum = numpy.maximum if numpy is not None else max
+    bandwidth = settings["bandwidth_mbps"] * 1_000_000 / 8
+    full = rollback = delta = 0.0
+    for unit in units:
+        items, seconds = unit["items"], unit["item_seconds"]
+        changed = math.ceil(items * settings["delta_share"])
+        full_run = pass_seconds(items, seconds, batch, workers)
+        delta_run = pass_seconds(changed, seconds, batch, workers)
+        if unit["bytes"]:
+            full_run = maximum(full_run, unit["bytes"] / bandwidth)
+            delta_run = maximum(delta_run, unit["bytes"] * changed / items / bandwidth)
+        full = full + full_run
+        rollback = rollback + pass_seconds(items, seconds * ROLLBACK_FACTOR, batch, workers)
+        delta = delta + delta_run + pass_seconds(items - changed, ID_MAP_SECONDS, batch, workers)
+
+    largest_item_kb = max((ITEM_MEMORY_KB + unit["payload"] * PAYLOAD_MEMORY_FACTOR / 1024 for unit in units),
+                          default=ITEM_MEMORY_KB)
+    window = delta if settings["pre_migrate"] else full + delta
+    return {
+        "full_hours": full / 3600,
+        "delta_hours": delta / 3600,
+        "rollback_hours": rollback / 3600,
+        "window_hours": window / 3600,
+        "memory_mb": BASE_MEMORY_MB + batch * largest_item_kb / 1024,
+    }
+
+
+def sweep(entities_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Simulate every batch size / worker combination and rank the feasible plans."""
+    settings = {**DEFAULT_SETTINGS, **(entities_data.get("cutover") or {})}
+    batch_sizes = settings.pop("batch_sizes", DEFAULT_BATCH_SIZES)
+    worker_counts = settings.pop("workers", DEFAULT_WORKERS)
+    units = migration_units(entities_data)
+
+    if numpy is not None:
+        batch = numpy.array(batch_sizes, dtype=numpy.float64)[:, None]
+        workers = numpy.array(worker_counts, dtype=numpy.float64)[None, :]
+        grid = simulate(units, settings, batch, workers)
+        columns = {key: numpy.broadcast_to(values, (len(batch_sizes), len(worker_counts))).ravel().tolist()
+                   for key, values in grid.items()}
+        rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+    else:
+        rows = [simulate(units, settings, b, w) for b in batch_sizes for w in worker_counts]
+
+    plans = []
+    for (batch_size, workers), row in zip(((b, w) for b in batch_sizes for w in worker_counts), rows):
+        plan = {"batch_size": batch_size, "workers": workers, **{key: round(value, 2) for key, value in row.items()}}
+        plan["feasible"] = (row["memory_mb"] <= settings["memory_limit_mb"]
+                            and row["window_hours"] + row["rollback_hours"] <= settings["window_hours"])
+        plans.append(plan)
+    plans.sort(key=lambda p: (not p["feasible"], p["window_hours"], p["full_hours"], p["workers"]))
+
+    return {
+        "settings": {**settings, "batch_sizes": batch_sizes, "workers": worker_counts},
+        "migrations": [{"name": unit["name"], "items": unit["items"]} for unit in units],
+        "best": plans[0] if plans and plans[0]["feasible"] else None,
+        "plans": plans,
+    }
+
+
+def main():
+    """Main execution function."""
+    if len(sys.argv) < 2:
+        print("Usage: python simulate_cutover.py <entities_json>")
+        print("\nExample:")
+        print("  python simulate_cutover.py ./audit_data/entities.json")
+        sys.exit(1)
+
+    input_file = Path(sys.argv[1])
+    if not input_file.exists():
+        print(f"Error: File not found: {input_file}")
+        sys.exit(1)
+    with open(input_file, 'r') as f:
+        entities_data = json.load(f)
+
+    if numpy is None:
+        print("⚠️  Warning: numpy not installed, simulating plans one by one (pip install numpy)")
+
+    result = sweep(entities_data)
+    if not result["migrations"]:
+        print(f"Error: No migration nodes or media files in {input_file}")
+        sys.exit(1)
+
+    print(f"🚚 Simulating {len(result['plans']):,} cutover plans for "
+          f"{sum(m['items'] for m in result['migrations']):,} items")
+
+    output_file = input_file.parent / "cutover_plan.json"
+    with open(output_file, 'w') as f:
+        json.dump(result, f, indent=2)
+
+    best = result["best"]
+    if best:
+        print(f"\n✅ Fastest feasible plan: batch size {best['batch_size']}, {best['workers']} workers, "
+              f"{best['window_hours']:.2f} h cutover window\n")
+    else:
+        print(f"\n⚠️  No plan fits the {result['settings']['window_hours']} h window with a rollback\n")
+    print("| Batch Size | Workers | Full Import (h) | Delta (h) | Rollback (h) | Window (h) | Memory (MB) | Feasible |")
+    print("|------------|---------|-----------------|-----------|--------------|------------|-------------|----------|")
+    for plan in result["plans"][:10]:
+        print(f"| {plan['batch_size']} | {plan['workers']} | {plan['full_hours']:.1f} | {plan['delta_hours']:.2f} | "
+              f"{plan['rollback_hours']:.1f} | {plan['window_hours']:.2f} | {plan['memory_mb']:.0f} | "
+              f"{'yes' if plan['feasible'] else 'no'} |")
+    print(f"\n📄 Saved to: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
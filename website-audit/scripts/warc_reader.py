@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+WARC Archive Reader as Crawl Input
+
+Crawls are often archived as WARC files (Heritrix, wget --warc-file,
+Browsertrix). Re-exporting them to one HTML file per page for the analyzers
+means millions of small files on disk. This script turns local `.warc` and
+`.warc.gz` archives into crawl input instead, compatible with crawl_site.py
+output.
+
+Indexing streams each archive once and writes an inventory in which the
+`file` field of every HTML page is a record reference,
+`<archive>#<offset>:<length>`. Archives are memory-mapped, and `.warc.gz`
+files are expected in the standard per-record layout (one gzip member per
+record), so every record can be decompressed on its own. Several archives
+are indexed in parallel on a process pool.
+
+The analyzers read pages through read_page(), which resolves plain files
+and record references alike. Each worker process keeps its archives
+mapped, so extract_components.py, find_duplicate_pages.py and
+cluster_urls.py shard the inventory as before and fetch each page by
+random access instead of scanning the archive.
+
+Usage:
+    python warc_reader.py <output_dir> <archive.warc[.gz]> [more archives ...]
+
+Output (in output_dir):
+    inventory.jsonl   one record per response (url, status, content_type, bytes, title, file, ...)
+    links.tsv         internal link edges: <source_url>\\t<target_url>
+
+Archives do not record crawl depth; the URL path depth stands in (home
+pages are 0, so analyze_link_graph.py starts its BFS there).
+"""
+
+import json
+import mmap
+import os
+import re
+import shutil
+import sys
+import zlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+from urllib.parse import urlsplit
+
+from crawl_site import HREF_PATTERN, TITLE_PATTERN, PageRecord, decode_body, normalize_url
+
+
+# Record reference stored in the inventory `file` field
+RECORD_REF = re.compile(r"^(.+\.warc(?:\.gz)?)#(\d+):(\d+)$")
+
+# Compressed bytes fed to the decompressor per step while scanning an archive
+READ_CHUNK = 1024 * 1024
+
+HTML_TYPES = ("text/html", "application/xhtml+xml")
+
+# Errors raised by malformed records or payloads
+RECORD_ERRORS = (ValueError, IndexError, OSError, EOFError, zlib.error)
+
+# Archives mapped by this process; pool workers reuse them across pages
+_archives: Dict[str, mmap.mmap] = {}
+
+
+def parse_headers(lines: List[bytes]) -> Dict[str, str]:
+    """Header lines to a dict with lower-case names."""
+    headers = {}
+    for line in lines:
+        if b":" in line:
+            name, value = line.split(b":", 1)
+            headers[name.strip().lower().decode("latin-1")] = value.strip().decode("latin-1")
+    return headers
+
+
+def parse_record(record: bytes) -> Tuple[Dict[str, str], bytes]:
+    """Split one uncompressed WARC record into its headers and content block."""
+    head_end = record.find(b"\r\n\r\n")
+    if not record.startswith(b"WARC/") or head_end < 0:
+        raise ValueError("not a WARC record")
+    headers = parse_headers(record[:head_end].split(b"\r\n")[1:])
+    start = head_end + 4
+    return headers, record[start:start + int(headers.get("content-length", 0))]
+
+
+def dechunk(body: bytes) -> bytes:
+    """Undo HTTP chunked transfer encoding of a stored payload."""
+    parts = []
+    position = 0
+    while True:
+        line_end = body.find(b"\r\n", position)
+        if line_end < 0:
+            break
+        size = int(body[position:line_end].split(b";")[0].strip() or b"0", 16)
+        if size == 0:
+            break
+        start = line_end + 2
+        parts.append(body[start:start + size])
+        position = start + size + 2
+    return b"".join(parts)
+
+
+def parse_response(block: bytes) -> Tuple[int, Dict[str, str], bytes]:
+    """Status, headers and decoded body of a stored HTTP response."""
+    head_end = block.find(b"\r\n\r\n")
+    if head_end < 0:
+        raise ValueError("incomplete HTTP response")
+    status_line, *lines = block[:head_end].split(b"\r\n")
+    status = int(status_line.split(b" ", 2)[1])
+    headers = parse_headers(lines)
+    body = block[head_end + 4:]
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        body = dechunk(body)
+    return status, headers, decode_body(body, headers.get("content-encoding", ""))
+
+
+def iter_records(data: mmap.mmap, gzipped: bool) -> Iterator[Tuple[int, int, bytes]]:
+    """Yield (offset, stored length, uncompressed record) for every record of an archive."""
+    position = 0
+    size = len(data)
+    while position < size:
+        if gzipped:
+            if data[position:position + 2] != b"\x1f\x8b":
+                break  # trailing padding
+            decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+            parts = []
+            end = position
+            while not decompressor.eof:
+                chunk = data[end:end + READ_CHUNK]
+                if not chunk:
+                    raise ValueError(f"truncated gzip member at offset {position}")
+                parts.append(decompressor.decompress(chunk))
+                end += len(chunk)
+            end -= len(decompressor.unused_data)
+            record = b"".join(parts)
+            block = parse_record(record)[1]
+            if record.find(b"\r\nWARC/", record.find(b"\r\n\r\n") + 4 + len(block)) >= 0:
+                raise ValueError("archive is gzipped as one stream, not per record "
+                                 "(recompress it, e.g. with `warcio recompress`)")
+        else:
+            while data[position:position + 1] in (b"\r", b"\n"):
+                position += 1
+            head_end = data.find(b"\r\n\r\n", position)
+            if head_end < 0:
+                break
+            headers = parse_headers(data[position:head_end].split(b"\r\n")[1:])
+            end = head_end + 4 + int(headers.get("content-length", 0))
+            record = data[position:end]
+        yield position, end - position, record
+        position = end
+
+
+def archive_data(path: str) -> mmap.mmap:
+    """Memory map of an archive, opened once per process."""
+    data = _archives.get(path)
+    if data is None:
+        with open(path, 'rb') as f:
+            data = _archives[path] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return data
+
+
+def page_source(path: str) -> str:
+    """File holding a page: the archive for record references, else the path itself."""
+    match = RECORD_REF.match(path)
+    return match.group(1) if match else path
+
+
+def read_page(path: str) -> bytes:
+    """Raw HTML of a page stored as a file or as a WARC record reference."""
+    match = RECORD_REF.match(path)
+    if not match:
+        return Path(path).read_bytes()
+    archive, offset, length = match.group(1), int(match.group(2)), int(match.group(3))
+    try:
+        record = archive_data(archive)[offset:offset + length]
+        if archive.endswith(".gz"):
+            record = zlib.decompress(record, zlib.MAX_WBITS | 16)
+        return parse_response(parse_record(record)[1])[2]
+    except RECORD_ERRORS as e:
+        raise OSError(f"Unreadable WARC record {path}: {e}") from e
+
+
+def same_site(host: str, other: str) -> bool:
+    """True for the same host, with or without www."""
+    return host.removeprefix("www.") == other.removeprefix("www.")
+
+
+def path_depth(url: str) -> int:
+    """Stand-in for crawl depth: number of path segments."""
+    return sum(1 for segment in urlsplit(url).path.split("/") if segment)
+
+
+def index_archive(archive: str, ref_path: str, part: str) -> Dict[str, int]:
+    """Write inventory and link records for one archive to part files (worker)."""
+    stats = Counter()
+    if os.path.getsize(archive) == 0:
+        return stats
+    seen = set()
+    with open(archive, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data, \
+            open(part + ".jsonl", 'w') as inventory, open(part + ".tsv", 'w') as links:
+        for offset, length, record in iter_records(data, archive.endswith(".gz")):
+            stats["records"] += 1
+            headers, block = parse_record(record)
+            if (headers.get("warc-type") != "response"
+                    or "application/http" not in headers.get("content-type", "")):
+                continue
+            url = headers.get("warc-target-uri", "").strip("<>")
+            if not url or url in seen:
+                stats["duplicates"] += bool(url)
+                continue
+            seen.add(url)
+            stats["responses"] += 1
+
+            page = PageRecord(url=url, status=0, depth=path_depth(url))
+            try:
+                page.status, http_headers, body = parse_response(block)
+            except RECORD_ERRORS as e:
+                stats["errors"] += 1
+                page.error = f"{type(e).__name__}: {e}"
+                inventory.write(json.dumps(asdict(page), ensure_ascii=False) + "\n")
+                continue
+
+            page.content_type = http_headers.get("content-type", "").split(";")[0].strip()
+            page.etag = http_headers.get("etag", "")
+            page.last_modified = http_headers.get("last-modified", "")
+            page.bytes = len(body)
+            if 300 <= page.status < 400 and "location" in http_headers:
+                target = normalize_url(url, http_headers["location"])
+                page.redirect_to = target or ""
+                if target:
+                    links.write(f"{url}\t{target}\n")
+            elif page.status == 200 and page.content_type in HTML_TYPES:
+                stats["pages"] += 1
+                page.file = f"{ref_path}#{offset}:{length}"
+                title = TITLE_PATTERN.search(body)
+                if title:
+                    page.title = " ".join(title.group(1).decode("utf-8", "replace").split())[:300]
+                host = urlsplit(url).hostname or ""
+                for match in HREF_PATTERN.finditer(body):
+                    target = normalize_url(url, match.group(1).decode("utf-8", "replace"))
+                    if target and same_site(host, urlsplit(target).hostname or ""):
+                        page.links += 1
+                        links.write(f"{url}\t{target}\n")
+            inventory.write(json.dumps(asdict(page), ensure_ascii=False) + "\n")
+    return stats
+
+
+def index_archives(archives: List[Path], output_dir: Path) -> Dict[str, int]:
+    """Index archives in parallel into output_dir/inventory.jsonl and links.tsv."""
+    parts_dir = output_dir / ".warc_index"
+    parts_dir.mkdir(exist_ok=True)
+    refs = [os.path.relpath(a.resolve(), output_dir.resolve()) for a in archives]
+    parts = [str(parts_dir / f"{i:05d}") for i in range(len(archives))]
+
+    totals = Counter()
+    with ProcessPoolExecutor() as pool:
+        for archive, stats in zip(archives, pool.map(index_archive, map(str, archives), refs, parts)):
+            print(f"  {archive.name}: {stats['pages']:,} pages / {stats['records']:,} records")
+            totals.update(stats)
+
+    # Concatenate in archive order
+    with open(output_dir / "inventory.jsonl", 'wb') as inventory, \
+            open(output_dir / "links.tsv", 'wb') as links:
+        for part in parts:
+            for suffix, target in ((".jsonl", inventory), (".tsv", links)):
+                if os.path.exists(part + suffix):
+                    with open(part + suffix, 'rb') as f:
+                        shutil.copyfileobj(f, target)
+    shutil.rmtree(parts_dir)
+    return dict(totals)
+
+
+def main():
+    """Main execution function."""
+    if len(sys.argv) < 3:
+        print("Usage: python warc_reader.py <output_dir> <archive.warc[.gz]> [more archives ...]")
+        print("\nExample:")
+        print("  python warc_reader.py ./audit_data/crawl ./archives/*.warc.gz")
+        sys.exit(1)
+
+    output_dir = Path(sys.argv[1])
+    archives = [Path(p) for p in sys.argv[2:]]
+    for archive in archives:
+        if not archive.is_file():
+            print(f"Error: File not found: {archive}")
+            sys.exit(1)
+        if not archive.name.endswith((".warc", ".warc.gz")):
+            print(f"Error: Not a .warc or .warc.gz file: {archive}")
+            sys.exit(1)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    print(f"🗄️  Indexing {len(archives)} WARC archive(s) into: {output_dir}")
+    try:
+        stats = index_archives(archives, output_dir)
+    except RECORD_ERRORS as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    print(f"\n✅ {stats.get('responses', 0):,} responses, {stats.get('pages', 0):,} HTML pages "
+          f"({stats.get('duplicates', 0):,} duplicate captures skipped, {stats.get('errors', 0):,} unreadable)")
+    print(f"\n📄 Saved to: {output_dir / 'inventory.jsonl'}")
+    print(f"📄 Links saved to: {output_dir / 'links.tsv'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Aggregation of axe-core results into unique issues."""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from aggregate_axe import aggregate_file  # noqa: E402
+
+
+def violation(impact):
+    """One color-contrast violation on the same element."""
+    return {"id": "color-contrast", "tags": ["wcag2aa", "wcag143"],
+            "nodes": [{"impact": impact, "target": ["#main > p.intro"]}]}
+
+
+class AggregateAxeTest(unittest.TestCase):
+
+    def test_issue_takes_the_most_severe_impact_within_a_file(self):
+        results = [{"url": f"https://example.com/{n}", "violations": [violation(impact)]}
+                   for n, impact in enumerate(["minor", "serious", "moderate"])]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "axe.json"
+            path.write_text(json.dumps(results))
+            partial = aggregate_file(str(path))
+
+        (issue,) = partial["issues"].values()
+        self.assertEqual(issue["impact"], "serious")
+        self.assertEqual((issue["occurrences"], issue["pages"]), (3, 3))
+        self.assertEqual(issue["criteria"], ["1.4.3"])
+        self.assertEqual([page["minor"] for page in partial["pages"]], [1, 0, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""Body markup analysis of CMS exports, counted in migrated nodes."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from analyze_body_markup import analyze_export, build_result  # noqa: E402
+
+
+# Seven content elements on three pages; page 11 holds a script (complex)
+TYPO3_DUMP = """CREATE TABLE `tt_content` (
+  `uid` int(11) NOT NULL,
+  `pid` int(11) NOT NULL,
+  `CType` varchar(255) NOT NULL,
+  `bodytext` mediumtext
+);
+INSERT INTO `tt_content` VALUES (1,10,'text','<p>a</p>'),(2,10,'text','<p style="color:red">b</p>'),\
+(3,11,'text','<p>c</p>'),(4,11,'html','<script>x()</script>'),(5,12,'text','<p>d</p>'),\
+(6,12,'text','<p>e</p>'),(7,12,'text','<p>f</p>');
+"""
+
+# One page with two components and one content app item
+MAGNOLIA_EXPORT = """<?xml version="1.0" encoding="UTF-8"?>
+<sv:node xmlns:sv="http://www.jcp.org/jcr/sv/1.0" sv:name="site">
+  <sv:property sv:name="jcr:primaryType"><sv:value>mgnl:page</sv:value></sv:property>
+  <sv:property sv:name="mgnl:template"><sv:value>demo:pages/home</sv:value></sv:property>
+  <sv:node sv:name="main">
+    <sv:property sv:name="jcr:primaryType"><sv:value>mgnl:area</sv:value></sv:property>
+    <sv:node sv:name="0">
+      <sv:property sv:name="jcr:primaryType"><sv:value>mgnl:component</sv:value></sv:property>
+      <sv:property sv:name="mgnl:template"><sv:value>demo:components/text</sv:value></sv:property>
+      <sv:property sv:name="text"><sv:value>&lt;p&gt;Hello&lt;/p&gt;</sv:value></sv:property>
+    </sv:node>
+    <sv:node sv:name="1">
+      <sv:property sv:name="jcr:primaryType"><sv:value>mgnl:component</sv:value></sv:property>
+      <sv:property sv:name="mgnl:template"><sv:value>demo:components/text</sv:value></sv:property>
+      <sv:property sv:name="text"><sv:value>&lt;font&gt;Old&lt;/font&gt;</sv:value></sv:property>
+    </sv:node>
+  </sv:node>
+  <sv:node sv:name="faq">
+    <sv:property sv:name="jcr:primaryType"><sv:value>mgnl:content</sv:value></sv:property>
+    <sv:property sv:name="jcr:uuid"><sv:value>1234</sv:value></sv:property>
+    <sv:property sv:name="answer"><sv:value>&lt;p&gt;Yes&lt;/p&gt;</sv:value></sv:property>
+  </sv:node>
+</sv:node>
+"""
+
+
+class BodyMarkupTest(unittest.TestCase):
+
+    def analyze(self, name, content, cms):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / name
+            path.write_text(content)
+            return build_result(analyze_export(path, cms, workers=1), cms)
+
+    def test_typo3_elements_count_as_their_pages(self):
+        migration = self.analyze("dump.sql", TYPO3_DUMP, "typo3")["migration"]
+        self.assertEqual(migration["nodes"], 3)
+        self.assertEqual(migration["records"], 7)
+        self.assertEqual(migration["types"], [{"name": "Page", "nodes": 3, "records": 7,
+                                               "complexity": "complex", "avg_bytes": 29}])
+
+    def test_magnolia_components_count_as_their_page(self):
+        result = self.analyze("site.xml", MAGNOLIA_EXPORT, "magnolia")
+        types = {t["name"]: t for t in result["migration"]["types"]}
+        self.assertEqual(result["migration"]["nodes"], 2)
+        self.assertEqual(types["Home"]["nodes"], 1)
+        self.assertEqual(types["Home"]["records"], 3)  # the page and its two components
+        self.assertEqual(types["Home"]["complexity"], "medium")
+        self.assertEqual(types["Content Item"]["nodes"], 1)
+        self.assertEqual({ct["name"]: ct["records"] for ct in result["content_types"]},
+                         {"Text": 2, "Home": 1, "Content Item": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+"""Link graph edges from a crawl inventory and links.tsv."""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from analyze_link_graph import load_graph  # noqa: E402
+
+
+INVENTORY = [
+    {"url": "http://site/", "status": 200, "depth": 0, "content_type": "text/html"},
+    {"url": "http://site/old", "status": 301, "depth": 1, "redirect_to": "http://site/new"},
+    {"url": "http://site/new", "status": 200, "depth": 1, "content_type": "text/html"},
+]
+
+# crawl_site.py records the redirect in links.tsv as well; the home page links /new twice in two runs
+LINKS = [
+    ("http://site/", "http://site/old"),
+    ("http://site/", "http://site/new"),
+    ("http://site/old", "http://site/new"),
+    ("http://site/new", "http://site/"),
+    ("http://site/", "http://site/new"),
+]
+
+
+class LinkGraphTest(unittest.TestCase):
+
+    def test_edges_counted_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            crawl_dir = Path(tmp)
+            (crawl_dir / "inventory.jsonl").write_text("".join(json.dumps(r) + "\n" for r in INVENTORY))
+            (crawl_dir / "links.tsv").write_text("".join(f"{s}\t{t}\n" for s, t in LINKS))
+            graph, starts, pages = load_graph(crawl_dir)
+
+        node = {url.decode(): i for i, url in enumerate(graph.urls)}
+        in_degrees = graph.in_degrees()
+        self.assertEqual(in_degrees[node["http://site/new"]], 2)  # from / and from /old
+        self.assertEqual(graph.out_degree(node["http://site/old"]), 1)
+        self.assertEqual(graph.out_degree(node["http://site/"]), 2)
+        self.assertEqual(starts, [node["http://site/"]])
+        self.assertEqual(list(graph.bfs(starts)), [0, 1, 1])
+        self.assertEqual(pages, [True, False, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
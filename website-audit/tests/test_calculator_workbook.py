@@ -0,0 +1,72 @@
+"""Round trip through the adesso calculator template shipped in the repository root."""
+
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from calculate_estimate import calculate_estimate  # noqa: E402
+from calculator_workbook import (export_workbook, load_template, read_rate_sheet,  # noqa: E402
+                                 shared_strings, sheet_cells)
+
+
+TEMPLATE = Path(__file__).resolve().parents[2] / "adesso calculator 2.01 - Default Template CMS 1.xlsm"
+
+ENTITIES = {
+    "project_name": "Relaunch",
+    "customer": "ACME & Co",
+    "content_types": [{"name": "Page", "complexity": "simple"}, {"name": "Article", "complexity": "medium"}],
+    "paragraphs": [{"name": "Text", "complexity": "simple"}, {"name": "Hero", "complexity": "complex"}],
+    "multipliers": {"testing": 0.25},
+    "migration": {"nodes": 800, "complexity": "medium"},
+    "risk_level": "medium",
+}
+
+
+@unittest.skipUnless(TEMPLATE.exists(), "calculator template not found")
+class CalculatorWorkbookTest(unittest.TestCase):
+
+    def cells(self, workbook, sheet):
+        _, _, sheets = load_template(str(workbook))
+        with zipfile.ZipFile(workbook) as package:
+            strings = shared_strings(package)
+            return {f"{column}{number}": value
+                    for number, values in sheet_cells(package, sheets[sheet], strings)
+                    for column, value in values.items()}
+
+    def test_reads_every_sheet(self):
+        _, _, sheets = load_template(str(TEMPLATE))
+        for sheet in sheets:
+            self.cells(TEMPLATE, sheet)
+
+    def test_rate_sheet(self):
+        rates = read_rate_sheet(TEMPLATE)
+        self.assertEqual(rates["currency"], "€")
+        self.assertIn("Developer", {role["role"] for role in rates["roles"]})
+        self.assertEqual(set(rates["hourly_rates"]), {"backend", "frontend", "qa", "pm"})
+
+    def test_export_keeps_macros_and_writes_cells(self):
+        result = calculate_estimate(ENTITIES)
+        with tempfile.TemporaryDirectory() as tmp:
+            output = export_workbook(result, ENTITIES, TEMPLATE, Path(tmp) / "offer.xlsm")
+            with zipfile.ZipFile(TEMPLATE) as original, zipfile.ZipFile(output) as exported:
+                self.assertIsNone(exported.testzip())
+                self.assertEqual(sorted(original.namelist()), sorted(exported.namelist()))
+                self.assertEqual(original.read("xl/vbaProject.bin"), exported.read("xl/vbaProject.bin"))
+                self.assertIn(b'fullCalcOnLoad="1"', exported.read("xl/workbook.xml"))
+
+            start = self.cells(output, "Start")
+            self.assertEqual(start["B10"], "ACME & Co")
+            features = self.cells(output, "Features")
+            self.assertEqual(features["A11"], "F-10")
+            self.assertGreater(features["S11"], 0)
+            self.assertNotIn("E55", features)
+            tasks = self.cells(output, "Project tasks")
+            self.assertAlmostEqual(tasks["J29"], round(result.migration_hours / 8, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
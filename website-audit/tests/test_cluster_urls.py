@@ -0,0 +1,37 @@
+"""Streaming URL inputs for clustering and the scripts that reuse read_urls."""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from cluster_urls import read_urls  # noqa: E402
+
+
+RECORDS = [
+    {"url": "https://example.com/", "status": 200, "content_type": "text/html", "file": "pages/a.html"},
+    {"url": "https://example.com/logo.png", "status": 200, "content_type": "image/png"},
+    {"url": "https://example.com/news", "status": 200, "content_type": "text/html"},
+]
+
+
+class ReadUrlsTest(unittest.TestCase):
+
+    def test_blank_inventory_lines_are_skipped(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "inventory.jsonl"
+            lines = [json.dumps(RECORDS[0]), "", json.dumps(RECORDS[1]), "   ", json.dumps(RECORDS[2]), "", ""]
+            path.write_text("\n".join(lines))
+            urls = list(read_urls(path))
+            middle = len(lines[0]) + 3
+            shards = list(read_urls(path, 0, middle)) + list(read_urls(path, middle))
+
+        self.assertEqual(urls, [("https://example.com/", str(Path(tmp) / "pages/a.html")), ("https://example.com/news", "")])
+        self.assertEqual(shards, urls)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,191 @@
+"""Crawl a local stand-in site served by http.server.
+
+The 100k-page throughput test is opt-in: CRAWL_BENCHMARK=1 python -m pytest tests/test_crawl_site.py
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from crawl_site import CrawlConfig, crawl  # noqa: E402
+
+
+PAGES = {
+    "/": b'<html><head><title>Home</title></head><body>'
+         b'<a href="/a">A</a> <a href="/a#top">A again</a> <a href="/A/../a">A normalized</a>'
+         b'<a href="/old">Old</a> <a href="/private/secret">Private</a>'
+         b'<a href="https://external.example/">External</a> <a href="mailto:x@example.com">Mail</a>'
+         b'</body></html>',
+    "/a": b'<html><head><title>Page A</title></head><body><a href="/">Home</a></body></html>',
+    "/private/secret": b'<html><head><title>Secret</title></head></html>',
+}
+ETAG = '"v1"'
+
+# Synthetic site for the throughput test: page n links home and to pages 10n+1 .. 10n+10
+BENCHMARK_PAGES = 100_000
+BENCHMARK_FANOUT = 10
+BENCHMARK_MIN_PAGES_PER_SECOND = 500
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Robots, a redirect, pages with an ETag and 304 revalidation."""
+    protocol_version = "HTTP/1.1"
+    requests = []
+
+    def do_GET(self):
+        self.requests.append(self.path)
+        if self.path == "/robots.txt":
+            self.respond(200, b"User-agent: *\nDisallow: /private/\n", "text/plain")
+        elif self.path == "/old":
+            self.respond(301, b"", "text/html", {"Location": "/a"})
+        elif self.path in PAGES:
+            if self.headers.get("If-None-Match") == ETAG:
+                self.respond(304, b"", "text/html", {"ETag": ETAG})
+            else:
+                self.respond(200, PAGES[self.path], "text/html; charset=utf-8", {"ETag": ETAG})
+        else:
+            self.respond(404, b"not found", "text/plain")
+
+    def respond(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class CrawlSiteTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        StandInHandler.requests = []
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.output_dir = Path(tmp.name)
+
+    def run_crawl(self):
+        stats = crawl(CrawlConfig(start_urls=[self.base + "/"], output_dir=self.output_dir,
+                                  concurrency=4, per_host=2, timeout=5.0))
+        with open(self.output_dir / "inventory.jsonl") as f:
+            records = {r["url"].removeprefix(self.base): r for r in map(json.loads, f)}
+        return stats, records
+
+    def test_robots_redirects_and_dedupe(self):
+        stats, records = self.run_crawl()
+
+        self.assertEqual(set(records), {"/", "/a", "/old", "/private/secret"})
+        self.assertEqual(records["/private/secret"]["error"], "blocked by robots.txt")
+        self.assertNotIn("/private/secret", StandInHandler.requests)
+        self.assertEqual(stats.blocked, 1)
+
+        self.assertEqual(records["/old"]["status"], 301)
+        self.assertEqual(records["/old"]["redirect_to"], self.base + "/a")
+        # /a is linked three ways and redirected to once, but fetched once
+        self.assertEqual(StandInHandler.requests.count("/a"), 1)
+
+        self.assertEqual(records["/a"]["title"], "Page A")
+        self.assertTrue((self.output_dir / records["/a"]["file"]).exists())
+        edges = (self.output_dir / "links.tsv").read_text().splitlines()
+        self.assertIn(f"{self.base}/old\t{self.base}/a", edges)
+        self.assertFalse(any("external.example" in edge for edge in edges))
+
+    def test_resume_revalidates_unchanged_pages(self):
+        _, first = self.run_crawl()
+        StandInHandler.requests = []
+        stats, second = self.run_crawl()
+
+        self.assertEqual(stats.not_modified, 2)
+        self.assertEqual(stats.fetched, 0)
+        self.assertEqual(second["/a"]["status"], 200)
+        self.assertEqual(second["/a"]["file"], first["/a"]["file"])
+        self.assertEqual(second["/a"]["title"], "Page A")
+        self.assertEqual(set(second), set(first))
+
+
+def synthetic_page(path):
+    """Status and body of a synthetic site path."""
+    if path == "/robots.txt":
+        return 200, b"User-agent: *\nAllow: /\n"
+    number = path[3:] if path.startswith("/p/") else ""
+    if not number.isdigit() or int(number) >= BENCHMARK_PAGES:
+        return 404, b"not found"
+    n = int(number)
+    children = range(n * BENCHMARK_FANOUT + 1, min(BENCHMARK_PAGES, (n + 1) * BENCHMARK_FANOUT + 1))
+    links = "".join(f'<a href="/p/{child}">Page {child}</a>' for child in children)
+    return 200, f'<html><head><title>Page {n}</title></head><body><a href="/p/0">Home</a>{links}</body></html>'.encode()
+
+
+async def serve_synthetic(reader, writer):
+    """Minimal keep-alive HTTP/1.1 server (http.server's thread per connection is slower than the crawler)."""
+    try:
+        while True:
+            request = await reader.readuntil(b"\r\n\r\n")
+            status, body = synthetic_page(request.split(b" ", 2)[1].decode())
+            writer.write(b"HTTP/1.1 %d OK\r\nContent-Type: text/html; charset=utf-8\r\nContent-Length: %d\r\n\r\n%s"
+                         % (status, len(body), body))
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+@unittest.skipUnless(os.environ.get("CRAWL_BENCHMARK"), "set CRAWL_BENCHMARK=1 to crawl 100k pages")
+class CrawlThroughputTest(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.server = self.loop.run_until_complete(asyncio.start_server(serve_synthetic, "127.0.0.1", 0))
+        thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.loop.close)
+        self.addCleanup(thread.join)
+        self.addCleanup(self.loop.call_soon_threadsafe, self.loop.stop)
+        self.addCleanup(self.loop.call_soon_threadsafe, self.server.close)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.output_dir = Path(tmp.name)
+
+    def test_crawls_100k_pages(self):
+        base = f"http://127.0.0.1:{self.server.sockets[0].getsockname()[1]}"
+        started = time.perf_counter()
+        stats = crawl(CrawlConfig(start_urls=[base + "/p/0"], output_dir=self.output_dir,
+                                  max_pages=BENCHMARK_PAGES, concurrency=64, per_host=32))
+        elapsed = time.perf_counter() - started
+
+        with open(self.output_dir / "inventory.jsonl") as f:
+            statuses = [json.loads(line)["status"] for line in f]
+        self.assertEqual(stats.fetched, BENCHMARK_PAGES)
+        self.assertEqual(statuses.count(200), BENCHMARK_PAGES)
+        self.assertGreaterEqual(stats.fetched / elapsed, BENCHMARK_MIN_PAGES_PER_SECOND)
+
+
+if __name__ == "__main__":
+    unittest.main()
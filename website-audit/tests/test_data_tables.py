@@ -0,0 +1,32 @@
+"""JSON Lines input for the paginated data tables."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from data_tables import read_jsonl_rows  # noqa: E402
+
+
+class ReadJsonlRowsTest(unittest.TestCase):
+
+    def read(self, text):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "rows.jsonl"
+            path.write_text(text)
+            columns, rows = read_jsonl_rows(path)
+            return columns, list(rows)
+
+    def test_columns_from_first_non_blank_record(self):
+        columns, rows = self.read('\n  \n{"url": "/a", "status": 200}\n\n{"url": "/b"}\n')
+        self.assertEqual(columns, ["url", "status"])
+        self.assertEqual(rows, [["/a", 200], ["/b", ""]])
+
+    def test_blank_file_has_no_table(self):
+        self.assertEqual(self.read("\n\n"), ([], []))
+
+
+if __name__ == "__main__":
+    unittest.main()
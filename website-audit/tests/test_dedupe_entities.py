@@ -0,0 +1,45 @@
+"""Near-duplicate merge proposals for entity inventories."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from dedupe_entities import apply_proposals, find_duplicates  # noqa: E402
+
+
+def card(letter, first_field, complexity="simple"):
+    """A "Card" paragraph with six consecutive fields."""
+    return {"name": f"Card {letter}", "complexity": complexity,
+            "fields": [f"field_{n}" for n in range(first_field, first_field + 6)]}
+
+
+# A~B and B~C (0.69) but A~C only 0.57: single linkage would chain all three
+CHAIN = [card("A", 1), card("B", 2, "complex"), card("C", 3), {"name": "Hero", "fields": ["image"]}]
+
+
+class DedupeEntitiesTest(unittest.TestCase):
+
+    def test_chained_group_is_split_around_the_kept_entity(self):
+        proposals = find_duplicates(CHAIN, 0.6)
+        self.assertEqual(len(proposals), 1)
+        proposal = proposals[0]
+        self.assertEqual(proposal["keep"], "Card A")
+        self.assertEqual(proposal["members"], ["Card A", "Card B"])
+        self.assertEqual(proposal["member_similarities"], [1.0, 0.692])
+        self.assertEqual(proposal["similarity"], 0.692)
+        self.assertEqual(proposal["complexity"], "complex")
+
+        deduped = apply_proposals(CHAIN, proposals)
+        self.assertEqual([e["name"] for e in deduped], ["Card A", "Card C", "Hero"])
+        self.assertEqual(deduped[0]["merged_from"], ["Card B"])
+
+    def test_every_member_meets_the_threshold(self):
+        entities = [card(letter, i) for i, letter in enumerate("ABCDEFGH")]
+        for proposal in find_duplicates(entities, 0.6):
+            self.assertTrue(all(s >= 0.6 for s in proposal["member_similarities"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
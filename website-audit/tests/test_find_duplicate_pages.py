@@ -0,0 +1,56 @@
+"""SimHash clustering of near-duplicate pages."""
+
+import random
+import sys
+import unittest
+from array import array
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from find_duplicate_pages import MAX_DISTANCE, argsort, cluster_hashes, find, split_group  # noqa: E402
+
+
+def flip(value, *bits):
+    """SimHash with the given bits flipped."""
+    for bit in bits:
+        value ^= 1 << bit
+    return value
+
+
+class ClusterHashesTest(unittest.TestCase):
+
+    def test_argsort_is_stable(self):
+        rng = random.Random(7)
+        for bits in (5, 26, 64):
+            keys = array('Q', (rng.getrandbits(bits) for _ in range(2000)))
+            self.assertEqual(list(argsort(keys, bits)), sorted(range(len(keys)), key=keys.__getitem__))
+        self.assertEqual(list(argsort(array('Q'), 0)), [])
+
+    def test_near_hashes_share_a_cluster(self):
+        rng = random.Random(3)
+        first, second = rng.getrandbits(64), rng.getrandbits(64)
+        hashes = array('Q', [first, flip(first, 1, 40), second, first, flip(second, *range(MAX_DISTANCE + 1))])
+        parent = cluster_hashes(hashes)
+        roots = [find(parent, i) for i in range(len(hashes))]
+
+        self.assertEqual(roots[0], roots[1])
+        self.assertEqual(roots[0], roots[3])
+        self.assertNotEqual(roots[0], roots[2])
+        self.assertNotEqual(roots[2], roots[4])
+
+    def test_chained_group_is_split_around_the_canonical_page(self):
+        # The first page is two bits from both others, which are four bits apart
+        start = 0x0123456789ABCDEF
+        hashes = array('Q', [flip(start, 1, 2), start, flip(start, 1, 2, 3, 4), flip(start, 1, 2, 3, 4, 9)])
+        parent = cluster_hashes(hashes)
+        self.assertEqual(len({find(parent, i) for i in range(len(hashes))}), 1)
+
+        depths = [1, 0, 2, 3]
+        records = [(i, {"url": f"https://example.com/page-{i}", "depth": depths[i]}) for i in range(len(hashes))]
+        groups = [(keep, [(i, distance) for i, _, distance in duplicates])
+                  for (keep, _), duplicates in split_group(records, hashes)]
+        self.assertEqual(groups, [(1, [(0, 2)]), (2, [(3, 1)])])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""Redirect maps: collapsed rules must never match a new path."""
+
+import csv
+import json
+import re
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from generate_redirects import generate_redirects  # noqa: E402
+
+
+EXACT_ENTRY = re.compile(r'^    "([^"]*)" "([^"]*)"$')
+RULE_ENTRY = re.compile(r'^    `~([^`]*)` "([^"]*)"$')
+
+
+class GenerateRedirectsTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+
+    def generate(self, urls, content_types):
+        (self.dir / "urls.txt").write_text("".join(f"https://old.example{url}\n" for url in urls))
+        (self.dir / "content_types.json").write_text(json.dumps({"content_types": content_types}))
+        with redirect_stdout(StringIO()):
+            result = generate_redirects(self.dir / "urls.txt", self.dir / "content_types.json", self.dir)
+
+        exact, rules = {}, []
+        for line in (self.dir / "redirects.caddy").read_text().splitlines():
+            if match := EXACT_ENTRY.match(line):
+                exact[match.group(1)] = match.group(2)
+            elif match := RULE_ENTRY.match(line):
+                rules.append((re.compile(match.group(1)), match.group(2)))
+        with open(self.dir / "redirects.csv") as f:
+            targets = {row["destination"] for row in csv.DictReader(f)}
+        return result, exact, rules, targets
+
+    def assertNoTargetRedirects(self, exact, rules, targets):
+        for target in targets:
+            self.assertNotIn(target, exact)
+            for regex, _ in rules:
+                self.assertIsNone(regex.match(target), f"{regex.pattern} matches {target}")
+
+    def test_rule_below_the_root_only(self):
+        urls = [f"/news/story-{n}" for n in range(50)]
+        result, exact, rules, targets = self.generate(
+            urls, [{"name": "News", "pattern": "/news/*", "target": "/article/{slug}"}])
+
+        self.assertNoTargetRedirects(exact, rules, targets)
+        self.assertEqual([rule["prefix"] for rule in result["rules"]], ["/news"])
+        self.assertEqual(result["stats"]["collapsed"], 50)
+        for regex, _ in rules:
+            self.assertIsNone(regex.match("/user/login"))
+
+    def test_rule_matching_its_own_targets_is_dropped(self):
+        urls = [f"/news/{n}" for n in "abcdef"] + [f"/blog/{n}" for n in "abcdef"]
+        result, exact, rules, targets = self.generate(
+            urls, [{"name": "News", "pattern": "/news/*", "target": "/news/article/{slug}"},
+                   {"name": "Blog", "pattern": "/blog/*", "target": "/posts/{slug}"}])
+
+        self.assertNoTargetRedirects(exact, rules, targets)
+        self.assertEqual([rule["prefix"] for rule in result["rules"]], ["/blog"])
+        self.assertEqual(exact["/news/a"], "/news/article/a")
+        self.assertEqual(result["stats"]["exact"], 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
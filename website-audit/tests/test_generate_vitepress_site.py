@@ -0,0 +1,41 @@
+"""Generated VitePress sites use only the self-hosted fonts."""
+
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from generate_vitepress_site import (create_vitepress_structure, generate_config,  # noqa: E402
+                                     generate_font_css, vendor_fonts)
+
+
+class SelfHostedFontsTest(unittest.TestCase):
+
+    def test_no_third_party_font_requests(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output_dir = Path(tmp)
+            create_vitepress_structure(output_dir)
+            with redirect_stdout(StringIO()):
+                font_faces = vendor_fonts(output_dir)
+            generate_config(output_dir, "Relaunch", "2026-01-01", font_faces)
+            generate_font_css(output_dir, font_faces)
+
+            vendored = {p.name for p in (output_dir / "docs" / "public" / "fonts").iterdir()}
+            config = (output_dir / "docs" / ".vitepress" / "config.ts").read_text()
+            fonts_css = (output_dir / "docs" / ".vitepress" / "theme" / "fonts.css").read_text()
+
+        self.assertIn("fira-sans-400.woff2", vendored)
+        self.assertEqual(vendored, {face["file"] for face in font_faces})
+        self.assertIn("/fonts/fira-sans-400.woff2", config)
+        for host in ("fonts.googleapis.com", "fonts.gstatic.com"):
+            self.assertNotIn(host, config)
+        self.assertNotIn("https://", fonts_css)
+        self.assertEqual(fonts_css.count("@font-face"), len(vendored))
+
+
+if __name__ == "__main__":
+    unittest.main()
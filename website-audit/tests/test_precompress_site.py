@@ -0,0 +1,59 @@
+"""Pre-compressed sidecars and their manifest."""
+
+import json
+import sys
+import tempfile
+import unittest
+import unittest.mock
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from precompress_site import MANIFEST_NAME, available_encodings, precompress_site  # noqa: E402
+
+
+class PrecompressSiteTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dist = Path(tmp.name) / "dist"
+        (self.dist / "assets").mkdir(parents=True)
+        (self.dist / "index.html").write_text("<p>audit</p>\n" * 500)
+        (self.dist / "assets" / "app.js").write_text("console.log('audit');\n" * 500)
+
+    def test_manifest_is_not_served(self):
+        (self.dist / MANIFEST_NAME).write_text(json.dumps({"encodings": [], "files": {}}))
+        stats = precompress_site(self.dist, workers=1)
+
+        self.assertEqual(stats["compressed"], 2)
+        self.assertFalse(list(self.dist.glob(MANIFEST_NAME + "*")))
+        manifest = json.loads((self.dist.parent / MANIFEST_NAME).read_text())
+        self.assertEqual(set(manifest["files"]), {"index.html", "assets/app.js"})
+        self.assertTrue((self.dist / "index.html.gz").exists())
+
+        stats = precompress_site(self.dist, workers=1)
+        self.assertEqual((stats["compressed"], stats["reused"]), (0, 2))
+
+    def test_sidecars_of_dropped_encodings_are_removed(self):
+        precompress_site(self.dist, workers=1)
+        manifest_path = self.dist.parent / MANIFEST_NAME
+        manifest = json.loads(manifest_path.read_text())
+        # A previous run with an encoding that is no longer available
+        manifest["encodings"] = ["test"] + manifest["encodings"]
+        manifest["files"]["assets/app.js"]["sizes"]["test"] = 10
+        manifest_path.write_text(json.dumps(manifest))
+        stale = self.dist / "assets" / "app.js.test"
+        stale.write_bytes(b"stale")
+
+        with unittest.mock.patch.dict("precompress_site.SIDECAR_EXTENSIONS", {"test": ".test"}):
+            stats = precompress_site(self.dist, workers=1)
+
+        self.assertFalse(stale.exists())
+        self.assertEqual(stats["orphans_removed"], 1)
+        self.assertEqual(stats["compressed"], 2)
+        self.assertEqual(json.loads(manifest_path.read_text())["encodings"], available_encodings())
+
+
+if __name__ == "__main__":
+    unittest.main()
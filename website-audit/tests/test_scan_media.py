@@ -0,0 +1,63 @@
+"""Media directory scans: skipped derivatives, duplicates and resume state."""
+
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from scan_media import STATE_DIR, clear_state, scan_media  # noqa: E402
+
+
+FILES = {
+    "styles/thumbnail/a.jpg": b"derivative",
+    "css/site.css": b"aggregated",
+    "tmp/upload.png": b"temporary",
+    "news/css/diagram.png": b"regular image",
+    "2020/tmp/photo.jpg": b"another image",
+    "2020/photo-copy.jpg": b"another image",
+    "docs/report.pdf": b"%PDF",
+    "docs/.thumbs/report.jpg": b"thumbnail",
+}
+
+
+class ScanMediaTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name) / "files"
+        self.output_dir = Path(tmp.name) / "audit"
+        for relative, content in FILES.items():
+            path = self.root / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
+
+    def scan(self, root):
+        with redirect_stdout(StringIO()):
+            return scan_media(root, self.output_dir)
+
+    def test_skips_top_level_derivatives_only(self):
+        result = self.scan(self.root)
+        self.assertEqual(result["stats"]["files"], 4)
+        self.assertEqual(result["types"]["Image"]["files"], 3)
+        self.assertEqual(result["duplicates"]["files"], 1)
+        self.assertEqual(result["media"]["files"], 3)
+
+    def test_state_kept_until_cleared_and_tied_to_root(self):
+        self.scan(self.root)
+        self.assertTrue((self.output_dir / STATE_DIR / "scan.jsonl").exists())
+
+        other = self.root / "docs"
+        result = self.scan(other)
+        self.assertEqual(result["stats"]["files"], 1)  # not the stale listing of the first root
+
+        clear_state(self.output_dir)
+        self.assertFalse((self.output_dir / STATE_DIR).exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+"""List scheduling of task DAGs onto a team."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from calculate_estimate import calculate_estimate  # noqa: E402
+from schedule_plan import Task, schedule  # noqa: E402
+
+
+class ScheduleTest(unittest.TestCase):
+
+    def spans(self, tasks, team):
+        result = schedule(tasks, team)
+        return result, {row["task"]: (row["start"], row["end"]) for row in result["gantt"]}
+
+    def test_task_behind_milestone_waits_for_its_dependency(self):
+        tasks = [
+            Task("x", "X", "backend", 10),
+            Task("done:x", "X done", "", 0, depends=["x"]),
+            Task("start", "Start", "", 0),
+            Task("t", "T", "backend", 5, depends=["done:x"]),
+            Task("u", "U", "backend", 5, depends=["start"]),
+        ]
+        result, spans = self.spans(tasks, {"backend": 2})
+        self.assertEqual(spans["X"], (0.0, 10.0))
+        self.assertEqual(spans["T"], (10.0, 15.0))
+        self.assertEqual(spans["U"], (0.0, 5.0))
+        self.assertEqual(result["hours"], 15.0)
+
+    def test_roles_fall_back_and_critical_path_first(self):
+        tasks = [
+            Task("a", "A", "backend", 4),
+            Task("b", "B", "qa", 2, depends=["a"]),
+            Task("c", "C", "backend", 3),
+        ]
+        result, spans = self.spans(tasks, {"backend": 1})
+        # A heads the longer chain, so it starts before C; QA work falls back to backend
+        self.assertEqual(spans["A"], (0.0, 4.0))
+        self.assertEqual(spans["C"], (4.0, 7.0))
+        self.assertEqual(spans["B"], (7.0, 9.0))
+        self.assertEqual(result["critical_path"]["tasks"], ["A", "B"])
+
+    def test_cycle_is_rejected(self):
+        tasks = [Task("a", "A", "backend", 1, depends=["b"]), Task("b", "B", "backend", 1, depends=["a"])]
+        with self.assertRaises(ValueError):
+            schedule(tasks, {"backend": 1})
+
+    def test_estimate_team_by_name_or_composition(self):
+        entities = {"content_types": [{"name": "Page", "complexity": "simple"}]}
+        self.assertEqual(calculate_estimate({**entities, "team": "large"}).schedule["name"], "large")
+        self.assertEqual(calculate_estimate({**entities, "team": {"backend": 2}}).schedule["name"], "custom")
+        with self.assertRaisesRegex(ValueError, "small, medium, large"):
+            calculate_estimate({**entities, "team": "xlarge"})
+
+
+if __name__ == "__main__":
+    unittest.main()